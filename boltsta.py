@@ -26,14 +26,53 @@
 Run Static Timing Analysis.
 
 Usage:
-  boltsta.py  --library=<library_path> --design=<design_path> --sdc=<sdc_path> [--run_dir=<run_dir_path>]
+  boltsta.py --library=<library_path> --design=<design_path> --sdc=<sdc_path>
+      [--run_dir=<run_dir_path>] [--algorithm=<algorithm>] [--top_k=<top_k>] [--analysis=<analysis>]
+      [--from=<nodes>] [--through=<nodes>] [--to=<nodes>] [--slack_lesser_than=<slack>]
+      [--functional] [--jobs=<jobs>] [--sweep_periods=<periods>]
+      [--sweep_uncertainties=<uncertainties>] [--delay_cache=<entries>] [--slew_tolerance=<slew>]
+      [--pocv_sigma=<sigma>] [--pocv_coefficients=<file>] [--monte_carlo=<samples>]
+      [--mc_sigma=<sigmas>] [--mc_seed=<seed>] [--mc_block=<samples>] [--aocv=<file>]
+      [--spef=<file>] [--sdf=<file>]
 
 Options:
     --help -h                    Print this help message.
-    --library=<param>            Path to the library file.
+    --library=<param>            Path to the library file, or comma separated library files of
+                                 several corners.
     --design=<param>             Path to the design file.
-    --sdc=<param>                Path to the SDC file.
+    --sdc=<param>                Path to the SDC file, or comma separated SDC files of several
+                                 modes.
     --run_dir=<run_dir_path>     Directory to save all the results [default: pwd]
+    --algorithm=<algorithm>      Timing algorithm: auto, exhaustive or propagation [default: auto]
+    --top_k=<top_k>              Number of worst paths reported by propagation [default: 100]
+    --analysis=<analysis>        Timing checks: setup or setup_hold [default: setup]
+    --from=<nodes>               Comma separated startpoint flip-flops of the reported paths.
+    --through=<nodes>            Comma separated nodes every reported path goes through.
+    --to=<nodes>                 Comma separated endpoint flip-flops of the reported paths.
+    --slack_lesser_than=<slack>  Only search and report the setup paths with a lower slack.
+    --functional                 Functional mode analysis, without the scan shift arcs.
+    --jobs=<jobs>                Worker processes analyzing the clock domains or the modes
+                                 [default: 1]
+    --sweep_periods=<periods>    Comma separated clock periods of a setup slack sweep.
+    --sweep_uncertainties=<uncertainties>  Comma separated setup uncertainties of the sweep.
+    --delay_cache=<entries>      Cache up to this many arc evaluations across cell instances.
+    --slew_tolerance=<slew>      Slew quantization of the delay cache, approximate delays
+                                 [default: 0]
+    --pocv_sigma=<sigma>         Parametric OCV analysis, reporting the slacks at this many sigmas
+                                 (3 by default).
+    --pocv_coefficients=<file>   POCV coefficient file of the cells without Liberty variation
+                                 tables.
+    --monte_carlo=<samples>      Monte Carlo analysis of the setup slack distributions with this
+                                 many samples.
+    --mc_sigma=<sigmas>          Global and local relative delay sigmas of the samples
+                                 [default: 0.03,0.05]
+    --mc_seed=<seed>             Seed of the Monte Carlo samples [default: 1]
+    --mc_block=<samples>         Samples propagated together, bounding the memory [default: 1000]
+    --aocv=<file>                AOCV table file, derating the cell delays by their logic depth.
+    --spef=<file>                SPEF parasitics file (.spef or .spef.gz), adding the wire delays
+                                 of the nets.
+    --sdf=<file>                 SDF delay file (.sdf or .sdf.gz), replacing the Liberty delays
+                                 it annotates.
 """
 
 import logging
@@ -41,9 +80,116 @@ import os
 from datetime import datetime
 import time
 from docopt import docopt
-import pandas as pd
-from typing import Any
-from boltsta.sta import run_sta # TODO need to be fixed later
+from boltsta.sta import run_sta  # TODO need to be fixed later
+from boltsta.model import new_delay_cache, delay_cache_stats, new_monte_carlo
+
+
+def split_nodes(nodes):
+    # comma separated node names of the path query options
+    return [node.strip() for node in nodes.split(",") if node.strip()] if nodes else None
+
+
+def split_values(values):
+    # comma separated numbers of the sweep options
+    return [float(value) for value in split_nodes(values)] if values else None
+
+
+def check_files(paths, description):
+    # the input files must exist, None paths are not given
+    for path in paths:
+        if path is not None and not os.path.exists(path):
+            logging.error(f"The {description} file {path} doesn't exist, please check")
+            exit(1)
+
+
+def check_timing_options(arguments):
+    # the timing algorithm and analysis, the slack threshold of the path search and the
+    # number of worker processes
+    algorithm = arguments["--algorithm"]
+    if algorithm not in ("auto", "exhaustive", "propagation"):
+        logging.error(f"Unknown timing algorithm {algorithm}, please use auto, exhaustive or "
+                      "propagation")
+        exit(1)
+
+    analysis = arguments["--analysis"]
+    if analysis not in ("setup", "setup_hold"):
+        logging.error(f"Unknown timing analysis {analysis}, please use setup or setup_hold")
+        exit(1)
+
+    slack_lesser_than = arguments["--slack_lesser_than"]
+    if slack_lesser_than is not None:
+        try:
+            slack_lesser_than = float(slack_lesser_than)
+        except ValueError:
+            logging.error(f"Invalid slack threshold {slack_lesser_than}, please use a number")
+            exit(1)
+
+    jobs = arguments["--jobs"]
+    if not jobs.isdigit() or int(jobs) < 1:
+        logging.error(f"Invalid number of jobs {jobs}, please use a positive integer")
+        exit(1)
+    return {"algorithm": algorithm, "analysis": analysis, "slack_lesser_than": slack_lesser_than,
+            "jobs": int(jobs)}
+
+
+def check_sweep_options(arguments):
+    # the sweep points
+    try:
+        sweep_periods = split_values(arguments["--sweep_periods"])
+        sweep_uncertainties = split_values(arguments["--sweep_uncertainties"])
+    except ValueError:
+        logging.error("Invalid sweep values, please use comma separated numbers")
+        exit(1)
+    if sweep_periods is not None and min(sweep_periods) <= 0:
+        logging.error("Invalid sweep periods, please use positive periods")
+        exit(1)
+    return {"sweep_periods": sweep_periods, "sweep_uncertainties": sweep_uncertainties}
+
+
+def check_delay_cache(arguments):
+    # the delay cache, None when not requested
+    try:
+        slew_tolerance = float(arguments["--slew_tolerance"])
+    except ValueError:
+        slew_tolerance = -1.0
+    if slew_tolerance < 0:
+        logging.error(f"Invalid slew tolerance {arguments['--slew_tolerance']}, please use a "
+                      "non-negative number")
+        exit(1)
+    cache_entries = arguments["--delay_cache"]
+    if cache_entries is not None and (not cache_entries.isdigit() or int(cache_entries) < 1):
+        logging.error(f"Invalid delay cache size {cache_entries}, please use a positive integer")
+        exit(1)
+    if cache_entries is None and slew_tolerance == 0:
+        return None
+    return new_delay_cache(int(cache_entries or 100000), slew_tolerance)
+
+
+def check_variation_options(arguments):
+    # the POCV and Monte Carlo settings
+    pocv_sigma = arguments["--pocv_sigma"]
+    if pocv_sigma is not None:
+        try:
+            pocv_sigma = float(pocv_sigma)
+        except ValueError:
+            pocv_sigma = -1.0
+        if pocv_sigma < 0:
+            logging.error(f"Invalid POCV sigma {arguments['--pocv_sigma']}, please use a "
+                          "non-negative number")
+            exit(1)
+
+    monte_carlo = None
+    if arguments["--monte_carlo"] is not None:
+        try:
+            global_sigma, local_sigma = split_values(arguments["--mc_sigma"])
+            monte_carlo = new_monte_carlo(int(arguments["--monte_carlo"]), global_sigma,
+                                          local_sigma, int(arguments["--mc_seed"]),
+                                          int(arguments["--mc_block"]))
+        except ValueError:
+            logging.error("Invalid Monte Carlo settings, please use positive sample counts and two "
+                          "non-negative comma separated sigmas")
+            exit(1)
+    return {"pocv_sigma": pocv_sigma, "monte_carlo": monte_carlo}
 
 
 if __name__ == "__main__":
@@ -53,23 +199,13 @@ if __name__ == "__main__":
     # logs format
     now_str = datetime.utcnow().strftime("sta_run_%Y_%m_%d_%H_%M_%S")
 
-    # checking library file existence
-    library_in = arguments["--library"]
-    if not os.path.exists(library_in):
-        logging.error(f"The library file {library_in} doesn't exist, please check")
-        exit(1)
-
-    # checking design file existence
+    # checking the library (one per corner), design and SDC (one per mode) files existence
+    library_in = split_nodes(arguments["--library"]) or [arguments["--library"]]
+    check_files(library_in, "library")
     design_in = arguments["--design"]
-    if not os.path.exists(design_in):
-        logging.error(f"The design file {design_in} doesn't exist, please check")
-        exit(1)
-
-    # checking SDC file existence
-    sdc_in = arguments["--sdc"]
-    if not os.path.exists(sdc_in):
-        logging.error(f"The SDC file {sdc_in} doesn't exist, please check")
-        exit(1)
+    check_files([design_in], "design")
+    sdc_in = split_nodes(arguments["--sdc"]) or [arguments["--sdc"]]
+    check_files(sdc_in, "SDC")
 
     if (
         arguments["--run_dir"] == "pwd"
@@ -97,17 +233,43 @@ if __name__ == "__main__":
         datefmt="%d-%b-%Y %H:%M:%S",
     )
 
-    # set pandas options
-    pd.set_option("display.max_rows", None)
+    # checking the timing settings and the POCV, AOCV, SPEF and SDF files existence
+    options = {
+        **check_timing_options(arguments),
+        **check_sweep_options(arguments),
+        "delay_cache": check_delay_cache(arguments),
+        **check_variation_options(arguments),
+    }
+    check_files([arguments["--pocv_coefficients"]], "POCV coefficient")
+    check_files([arguments["--aocv"]], "AOCV")
+    check_files([arguments["--spef"]], "SPEF")
+    check_files([arguments["--sdf"]], "SDF")
 
     # Calling the main function
     time_start = time.time()
-    sta_results = run_sta(library_in, design_in, sdc_in)
+
+    sta_results = run_sta(library_in, design_in, sdc_in, run_dir,
+                          top_k=int(arguments["--top_k"]),
+                          from_nodes=split_nodes(arguments["--from"]),
+                          through_nodes=split_nodes(arguments["--through"]),
+                          to_nodes=split_nodes(arguments["--to"]),
+                          functional=arguments["--functional"],
+                          pocv_coefficients=arguments["--pocv_coefficients"],
+                          aocv_tables=arguments["--aocv"],
+                          spef_path=arguments["--spef"],
+                          sdf_path=arguments["--sdf"],
+                          **options)
     exc_time = time.time() - time_start
 
+    delay_cache = options["delay_cache"]
+    if delay_cache is not None:
+        stats = delay_cache_stats(delay_cache)
+        logging.info(f"Delay cache: {stats['hits']} hits, {stats['misses']} misses "
+                     f"({stats['hit_rate']:.1%}), {stats['evictions']} evictions, "
+                     f"{stats['entries']} entries")
+
     # Save results
-    sta_results.to_csv(os.path.join(run_dir, "final_report_sta.csv"), index=False)
-    logging.info(f"STA report: \n {sta_results}")
+    logging.info(f"STA report: {sta_results}")
 
     # Reporting execution time
     logging.info(f"Static Timing Analysis execution time: {exc_time} sec")
@@ -1 +1,15 @@
-from .model import *
\ No newline at end of file
+from .model import *
+from .delay_cache import *
+from .propagation import *
+from .path_search import *
+from .domain_analysis import *
+from .clock_latency import *
+from .cppr import *
+from .period_sweep import *
+from .corners import *
+from .modes import *
+from .pocv import *
+from .monte_carlo import *
+from .derates import *
+from .net_delays import *
+from .sdf_annotation import *
@@ -0,0 +1,212 @@
+import networkx as nx
+import numpy as np
+from ..network.levelizer import build_timing_graph, is_sequential_cell, load_sequential_names
+from ..network.cone_extractor import get_cone_fanout_dict
+from ..network.scan_pruning import _arc_pin
+from .propagation import LATE, EARLY, ANALYSIS_INDEX, TRANSITION_INDEX, get_node_load, propagate_arc
+from .cppr import build_cppr_index, cppr_credit
+
+
+def find_clock_tree(G, sources: list, sequential_names: list) -> list:
+    """
+    Find the nodes of a clock tree: its sources and the combinational cells (buffers,
+    inverters, clock gates) they reach before the sequential cells.
+
+    Parameters:
+        G (networkx.DiGraph): The graph representing the design, with its clock network.
+        sources (list): The source nodes of the clock.
+        sequential_names (list): Substrings identifying sequential cells.
+
+    Returns:
+        list: The clock tree nodes, in topological order.
+    """
+    tree = set(sources)
+    queue = list(sources)
+    while queue:
+        node = queue.pop()
+        for successor in G.successors(node):
+            cell = G.nodes[successor]["cell"]
+            if successor in tree or cell in ("Input", "Output") or \
+                    is_sequential_cell(cell, sequential_names):
+                continue
+            tree.add(successor)
+            queue.append(successor)
+    return list(nx.topological_sort(G.subgraph(tree)))
+
+
+def propagate_clock_tree(
+    G,
+    tree_nodes: list,
+    sources: list,
+    cell_pin_mapping: dict,
+    library,
+    clock_transition: float,
+) -> dict:
+    """
+    Time a clock tree in one topological pass, from the clock edges at its sources.
+
+    The tree is levelized like the data paths, and both clock edges leave the sources at
+    time 0 with the clock transition, so the latest and earliest arrivals of each edge
+    at a node are its clock latencies. The loads include every pin of the design the
+    tree drives.
+
+    Parameters:
+        G (networkx.DiGraph): The graph representing the design, with its clock network.
+        tree_nodes (list): The result of find_clock_tree.
+        sources (list): The source nodes of the clock.
+        cell_pin_mapping (dict): A dictionary containing timing data for each cell.
+        library: The parsed liberty library.
+        clock_transition (float): The transition of the clock at its sources.
+
+    Returns:
+        dict: The timing_graph of the tree (see build_timing_graph) and its propagated
+              arrays (see propagate_arrival_times).
+    """
+    subgraph = G.subgraph(tree_nodes)
+    timing_graph = build_timing_graph(subgraph)
+    fanout = get_cone_fanout_dict(G, subgraph)
+
+    num_nodes = len(timing_graph["names"])
+    arrival = np.empty((2, 2, num_nodes))
+    arrival[LATE] = -np.inf
+    arrival[EARLY] = np.inf
+    propagated = {
+        "arrival": arrival,
+        "slew": np.zeros((2, 2, num_nodes)),
+        "pred_arc": np.full((2, 2, num_nodes), -1, dtype=np.int64),
+        "pred_transition": np.full((2, 2, num_nodes), -1, dtype=np.int64),
+        "launch": np.full((2, 2, num_nodes), -1, dtype=np.int64),
+        "tagged": {},
+        "exception_index": None,
+    }
+    for source in sources:
+        propagated["arrival"][:, :, timing_graph["index"][source]] = 0.0
+        propagated["slew"][:, :, timing_graph["index"][source]] = clock_transition
+
+    source_nodes = {timing_graph["index"][source] for source in sources}
+    for node in range(num_nodes):
+        if node in source_nodes:
+            continue
+        out_cap = get_node_load(fanout[timing_graph["keys"][node]], library)
+        for arc in timing_graph["fanin"][node]:
+            propagate_arc(propagated, timing_graph, arc, cell_pin_mapping, out_cap)
+    return {"timing_graph": timing_graph, "propagated": propagated}
+
+
+def compute_clock_latencies(
+    G,
+    timing_graph: dict,
+    clocks: list,
+    clock_pins: dict,
+    cell_pin_mapping: dict,
+    library,
+    clock_transition: float,
+    sequential_names: list = None,
+    derates: tuple = (1.0, 1.0),
+) -> dict:
+    """
+    Compute the propagated clock latency of every flip-flop, timing each clock tree once.
+
+    The latency of a flip-flop is the arrival of the rising clock edge at its clock pin,
+    the latest one for the launch of setup paths and the capture of hold paths, and the
+    earliest one for the capture of setup paths and the launch of hold paths. Storing
+    them per timing graph node makes the skew of any path two array lookups. The late
+    and early derates scale the late and early clock arrivals, and the pessimism they
+    add on the clock tree segments shared by a launch and a capture flip-flop is
+    indexed for removal (see build_cppr_index).
+
+    Parameters:
+        G (networkx.DiGraph): The graph representing the design, with its clock network.
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        clocks (list): The propagated clocks, as returned by parse_clocks.
+        clock_pins (dict): The clock pins of each cell, as returned by extract_clock_pins.
+        cell_pin_mapping (dict): A dictionary containing timing data for each cell.
+        library: The parsed liberty library.
+        clock_transition (float): The transition of the clocks at their sources.
+        sequential_names (list, optional): Substrings identifying sequential cells.
+        derates (tuple): The late and early timing derates of the clock tree delays.
+
+    Returns:
+        dict: A dictionary containing:
+            - latency (np.ndarray): (2, nodes) late and early clock latency of the timing
+              graph nodes, 0 for the nodes without a propagated clock.
+            - slew (np.ndarray): (2, nodes) clock transition at the clock pins.
+            - trees (dict): For each clock, its timed tree (see propagate_clock_tree),
+              the derated late and early rise arrival of its nodes (arrival) and the
+              tree node driving the clock pin of each flip-flop (driver).
+            - cppr (dict): The result of build_cppr_index.
+    """
+    if sequential_names is None:
+        sequential_names = load_sequential_names()
+    num_nodes = len(timing_graph["names"])
+    latency = np.zeros((2, num_nodes))
+    slew = np.full((2, num_nodes), float(clock_transition))
+
+    trees = {}
+    for clock in clocks:
+        sources = list(dict.fromkeys(
+            source.split("/")[0] for source in clock["sources"] if source.split("/")[0] in G
+        ))
+        if not sources:
+            continue
+        tree = propagate_clock_tree(
+            G, find_clock_tree(G, sources, sequential_names), sources,
+            cell_pin_mapping, library, clock_transition,
+        )
+        tree_index = tree["timing_graph"]["index"]
+        rise = TRANSITION_INDEX["rise"]
+        tree["arrival"] = tree["propagated"]["arrival"][:, rise] * np.reshape(derates, (2, 1))
+        tree["driver"] = {}
+        for driver in tree_index:
+            for flop, input_pin in G[driver].items():
+                cell = G.nodes[flop]["cell"]
+                if flop not in timing_graph["index"] or \
+                        _arc_pin(input_pin.get("input_pin"), clock_pins.get(cell, ())) is None:
+                    continue
+                tree["driver"][flop] = tree_index[driver]
+                node = timing_graph["index"][flop]
+                latency[:, node] = tree["arrival"][:, tree_index[driver]]
+                slew[:, node] = tree["propagated"]["slew"][:, rise, tree_index[driver]]
+        trees[clock["name"]] = tree
+
+    return {
+        "latency": latency, "slew": slew, "trees": trees,
+        "cppr": build_cppr_index(timing_graph, trees),
+    }
+
+
+def extract_path_latencies(
+    timing_graph: dict,
+    paths_delay: dict,
+    clock_latency: dict,
+    analysis: str = "late",
+) -> dict:
+    """
+    Look up the launch and capture clock latencies and the clock reconvergence
+    pessimism of the paths returned by extract_worst_paths.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        paths_delay (dict): The result of extract_worst_paths.
+        clock_latency (dict): The result of compute_clock_latencies.
+        analysis (str): 'late' for the setup paths, 'early' for the hold paths.
+
+    Returns:
+        dict: The (launch latency, capture latency, pessimism) of each path identifier,
+              for generate_timing_report.
+    """
+    launch = ANALYSIS_INDEX[analysis]
+    capture = EARLY if launch == LATE else LATE
+    index = timing_graph["index"]
+    latencies = {}
+    for path_key, cells_delay in paths_delay.items():
+        names = [key.split(",")[0] for key in cells_delay]
+        if not names:
+            continue
+        start, end = index[names[0]], index[names[-1]]
+        latencies[path_key] = (
+            float(clock_latency["latency"][launch, start]),
+            float(clock_latency["latency"][capture, end]),
+            cppr_credit(clock_latency.get("cppr"), start, end),
+        )
+    return latencies
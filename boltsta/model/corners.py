@@ -0,0 +1,429 @@
+import os
+import numpy as np
+from ..utils import interpolate_2d_points, get_timing_sense, LOOKUP_TABLES
+from .model import get_output_transitions
+from .propagation import (
+    LATE, EARLY, TRANSITIONS, TRANSITION_INDEX, ENTRY_ARRAYS, get_clk2q_timing,
+    get_arrival_entries, get_arrival_entry, get_launch_tag, get_node_derates,
+    get_propagated_load, get_sdf_delays, get_sink_tag, get_wire_delay, extract_worst_paths,
+    extract_capture_edges, select_worst_endpoints,
+)
+
+
+def corner_name(library_path: str) -> str:
+    """
+    Name a corner after its Liberty file, e.g. 'sky130_fd_sc_hd__ss_100C_1v60'.
+
+    Parameters:
+        library_path (str): The path of the Liberty file of the corner.
+
+    Returns:
+        str: The file name without its directory and extension.
+    """
+    return os.path.splitext(os.path.basename(library_path))[0]
+
+
+def stack_corner_tables(cell_pin_mappings: list) -> dict:
+    """
+    Stack the compiled timing arcs of several corners into (corner, index_1, index_2)
+    arrays, so that an arc is evaluated for every corner with one interpolation.
+
+    Parameters:
+        cell_pin_mappings (list): The compile_cell_pin_mapping result of each corner.
+
+    Returns:
+        dict: For each cell and arc of the first corner, its timing_sense, timing_type
+              and related_pin and, for each table, index_1 (corners, n1), index_2
+              (corners, n2) and values (corners, n1, n2).
+
+    Raises:
+        ValueError: If an arc is missing from a corner or its tables differ in shape.
+    """
+    stacked = {}
+    for cell_name, pins in cell_pin_mappings[0].items():
+        stacked[cell_name] = {}
+        for pin, arc in pins.items():
+            corner_arcs = [mapping.get(cell_name, {}).get(pin) for mapping in cell_pin_mappings]
+            if any(corner_arc is None for corner_arc in corner_arcs):
+                raise ValueError(f"Arc '{pin}' of cell '{cell_name}' is missing from a corner.")
+            stacked_arc = {
+                name: arc[name] for name in ("timing_sense", "timing_type", "related_pin")
+            }
+            for table_name in LOOKUP_TABLES:
+                if table_name not in arc:
+                    continue
+                tables = [corner_arc.get(table_name) for corner_arc in corner_arcs]
+                if any(table is None or table["values"].shape != arc[table_name]["values"].shape
+                       for table in tables):
+                    raise ValueError(
+                        f"Table '{table_name}' of arc '{pin}' of cell '{cell_name}' differs "
+                        "in shape between corners."
+                    )
+                stacked_arc[table_name] = {
+                    "index_1": np.concatenate([table["index_1"] for table in tables]),
+                    "index_2": np.concatenate([table["index_2"] for table in tables]),
+                    "values": np.stack([table["values"] for table in tables]),
+                }
+            stacked[cell_name][pin] = stacked_arc
+    return stacked
+
+
+def calculate_corner_arc_delays(
+    stacked_arc: dict,
+    output_transition: str,
+    input_transition_times: np.ndarray,
+    output_capacitances: np.ndarray,
+) -> tuple:
+    """
+    Evaluate one output transition of an arc for every corner and input slew at once.
+
+    The transition and delay tables of every corner are interpolated together in a
+    single interpolate_2d_points call over the (2 x corners) stacked tables, or one call
+    each when they differ in shape.
+
+    Parameters:
+        stacked_arc (dict): An arc of stack_corner_tables.
+        output_transition (str): 'rise' or 'fall'.
+        input_transition_times (np.ndarray): (corners, points) input slews.
+        output_capacitances (np.ndarray): (corners,) output loads.
+
+    Returns:
+        tuple: The (corners, points) output transition times and delays.
+    """
+    transition = stacked_arc[f"{output_transition}_transition"]
+    cell = stacked_arc[f"cell_{output_transition}"]
+    slews = np.asarray(input_transition_times, dtype=float)
+    loads = np.broadcast_to(np.asarray(output_capacitances, dtype=float)[:, None], slews.shape)
+    if transition["values"].shape != cell["values"].shape:
+        return tuple(
+            interpolate_2d_points(table["index_1"], table["index_2"], table["values"],
+                                  slews, loads)
+            for table in (transition, cell)
+        )
+    values = interpolate_2d_points(
+        np.concatenate([transition["index_1"], cell["index_1"]]),
+        np.concatenate([transition["index_2"], cell["index_2"]]),
+        np.concatenate([transition["values"], cell["values"]]),
+        np.concatenate([slews, slews]),
+        np.concatenate([loads, loads]),
+    )
+    return values[:len(slews)], values[len(slews):]
+
+
+def propagate_corner_arrivals(
+    timing_graph: dict,
+    fanout: dict,
+    stacked_mapping: dict,
+    libraries: list,
+    input_transition_time: float = 1.5,
+    cone: dict = None,
+    derates: np.ndarray = None,
+    exception_index: dict = None,
+    clock_latencies: list = None,
+    net_delays: dict = None,
+    sdf_delays: dict = None,
+) -> dict:
+    """
+    Propagate the latest and earliest arrival times of every corner in one pass.
+
+    The graph, its levelization and the arc order are shared by the corners, and every
+    arc is evaluated for all the corners, analyses and input transitions with one
+    calculate_corner_arc_delays call per output transition and tag. The arrivals of
+    each corner are those of propagate_arrival_times with its own library and clock
+    latencies; the exception tags, derates, net delays and SDF delays are shared by the
+    corners.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        fanout (dict): The fanout dictionary returned by get_fanout_dict.
+        stacked_mapping (dict): The result of stack_corner_tables.
+        libraries (list): The parsed liberty library of each corner.
+        input_transition_time (float): The clock transition time at the flip-flops.
+        cone (dict, optional): The result of select_path_cone.
+        derates (np.ndarray, optional): The result of build_node_derates.
+        exception_index (dict, optional): The result of build_exception_index.
+        clock_latencies (list, optional): The compute_clock_latencies result of each
+                                          corner, None for ideal clocks.
+        net_delays (dict, optional): The result of compute_net_delays.
+        sdf_delays (dict, optional): The result of annotate_sdf_delays.
+
+    Returns:
+        dict: (corners, 2, 2, nodes) arrival, slew, pred_arc, pred_transition and launch
+              arrays and tagged entries of (corners, 2, 2) arrays, laid out for each
+              corner as the result of propagate_arrival_times (see select_corner).
+    """
+    if input_transition_time < 0:
+        raise ValueError("Input transition time must be non-negative.")
+
+    num_corners = len(libraries)
+    num_nodes = len(timing_graph["names"])
+    arrival = np.empty((num_corners, 2, 2, num_nodes))
+    arrival[:, LATE] = -np.inf
+    arrival[:, EARLY] = np.inf
+    propagated = {
+        "arrival": arrival,
+        "slew": np.zeros((num_corners, 2, 2, num_nodes)),
+        "pred_arc": np.full((num_corners, 2, 2, num_nodes), -1, dtype=np.int64),
+        "pred_transition": np.full((num_corners, 2, 2, num_nodes), -1, dtype=np.int64),
+        "launch": np.full((num_corners, 2, 2, num_nodes), -1, dtype=np.int64),
+        "tagged": {},
+        "exception_index": exception_index,
+        "derates": derates,
+        "net_delays": net_delays,
+        "sdf_delays": sdf_delays,
+    }
+    # the launch latencies and clock slews of every corner
+    latency = np.zeros((num_corners, 2, num_nodes))
+    clock_slew = np.full((num_corners, num_nodes), float(input_transition_time))
+    for corner, clock_latency in enumerate(clock_latencies or []):
+        if clock_latency is not None:
+            latency[corner] = clock_latency["latency"]
+            clock_slew[corner] = clock_latency["slew"][LATE]
+
+    sequential = timing_graph["sequential"]
+    skipped = timing_graph["inputs"] | timing_graph["outputs"]
+    if cone is not None:
+        skipped = skipped | ~cone["nodes"] | (sequential & ~cone["startpoints"])
+
+    for node in range(num_nodes):
+        if skipped[node]:
+            continue
+        loads = np.array([
+            get_propagated_load(propagated, timing_graph, fanout, library, node)
+            for library in libraries
+        ])
+
+        if sequential[node]:
+            launch_corner_arrival(propagated, timing_graph, node, stacked_mapping,
+                                  clock_slew[:, node], loads, latency[:, :, node])
+            continue
+
+        for arc in timing_graph["fanin"][node]:
+            if cone is None or cone["arcs"][arc]:
+                propagate_corner_arc(propagated, timing_graph, arc, stacked_mapping, loads)
+
+    return propagated
+
+
+def launch_corner_arrival(
+    corner_propagated: dict,
+    timing_graph: dict,
+    node: int,
+    stacked_mapping: dict,
+    input_transition_times: np.ndarray,
+    output_capacitances: np.ndarray,
+    latency: np.ndarray,
+) -> None:
+    """
+    Launch both transitions of a sequential node in every corner, as launch_arrival
+    does for one corner.
+
+    Parameters:
+        corner_propagated (dict): The arrays being filled by propagate_corner_arrivals.
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        node (int): The sequential node.
+        stacked_mapping (dict): The result of stack_corner_tables.
+        input_transition_times (np.ndarray): The (corners,) clock slews of the node.
+        output_capacitances (np.ndarray): The (corners,) loads of the node.
+        latency (np.ndarray): The (corners, 2) late and early clock latencies of the node.
+    """
+    tag, blocked = get_launch_tag(corner_propagated, node)
+    rows = [analysis for analysis in (LATE, EARLY) if analysis not in blocked]
+    if not rows:
+        return
+    entry = get_arrival_entry(corner_propagated, node, tag, create=True)
+    annotated = get_sdf_delays(corner_propagated, "launch_delay", node)
+    scale = get_node_derates(corner_propagated, node)
+    clk2q = get_clk2q_timing(stacked_mapping, timing_graph["cells"][node])
+    for trans_type in TRANSITIONS:
+        out_slew, delay = calculate_corner_arc_delays(
+            clk2q, trans_type, np.asarray(input_transition_times)[:, None], output_capacitances
+        )
+        trans_out = TRANSITION_INDEX[trans_type]
+        for analysis in rows:
+            value = delay[:, 0]
+            if annotated is not None and np.isfinite(annotated[analysis, trans_out]):
+                value = np.full_like(value, annotated[analysis, trans_out])
+            entry["arrival"][:, analysis, trans_out] = latency[:, analysis] \
+                + value * scale[analysis]
+            entry["slew"][:, analysis, trans_out] = out_slew[:, 0]
+            entry["launch"][:, analysis, trans_out] = node
+
+
+def propagate_corner_arc(
+    corner_propagated: dict,
+    timing_graph: dict,
+    arc: int,
+    stacked_mapping: dict,
+    output_capacitances: np.ndarray,
+) -> None:
+    """
+    Update the arrivals of every corner at the sink of an arc, as propagate_arc does for
+    one corner.
+
+    Parameters:
+        corner_propagated (dict): The arrays being filled by propagate_corner_arrivals.
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        arc (int): The arc to propagate through.
+        stacked_mapping (dict): The result of stack_corner_tables.
+        output_capacitances (np.ndarray): The (corners,) loads of the arc sink.
+
+    Raises:
+        ValueError: If the arc input pin is not found for the sink cell.
+    """
+    source = timing_graph["arc_from"][arc]
+    node = timing_graph["arc_to"][arc]
+    cell_name = timing_graph["cells"][node]
+    input_pin = timing_graph["arc_pin"][arc]
+    if input_pin not in stacked_mapping.get(cell_name, {}):
+        raise ValueError(f"Input pin name '{input_pin}' not found for cell '{cell_name}'.")
+    time_sense = get_timing_sense(stacked_mapping, cell_name, input_pin)
+    wire_delay, wire_slew = get_wire_delay(corner_propagated, arc)
+    annotated = get_sdf_delays(corner_propagated, "cell_delay", arc)
+    scale = get_node_derates(corner_propagated, node)
+
+    for tag, entry in get_arrival_entries(corner_propagated, source):
+        sink_tag, blocked = get_sink_tag(corner_propagated, tag, node)
+        arrival = entry["arrival"]
+        # the (analysis, input transition) pairs reaching every output transition
+        for trans_type in TRANSITIONS:
+            pairs = [
+                (analysis, trans_in)
+                for analysis in (LATE, EARLY) if analysis not in blocked
+                for trans_in in range(2)
+                if trans_type in get_output_transitions(TRANSITIONS[trans_in], time_sense)
+                and np.isfinite(arrival[:, analysis, trans_in]).any()
+            ]
+            if not pairs:
+                continue
+            out_slew, delay = calculate_corner_arc_delays(
+                stacked_mapping[cell_name][input_pin], trans_type,
+                np.stack([np.hypot(entry["slew"][:, analysis, trans_in], wire_slew)
+                          for analysis, trans_in in pairs], axis=1),
+                output_capacitances,
+            )
+            trans_out = TRANSITION_INDEX[trans_type]
+            sink = get_arrival_entry(corner_propagated, node, sink_tag, create=True)
+            for position, (analysis, trans_in) in enumerate(pairs):
+                if annotated is not None and np.isfinite(annotated[analysis, trans_out]):
+                    delay[:, position] = annotated[analysis, trans_out]
+                candidate = arrival[:, analysis, trans_in] + wire_delay[analysis, trans_in] \
+                    + delay[:, position] * scale[analysis]
+                current = sink["arrival"][:, analysis, trans_out]
+                better = np.flatnonzero(
+                    (candidate > current) if analysis == LATE else (candidate < current)
+                )
+                sink["arrival"][better, analysis, trans_out] = candidate[better]
+                sink["slew"][better, analysis, trans_out] = out_slew[better, position]
+                sink["pred_arc"][better, analysis, trans_out] = arc
+                sink["pred_transition"][better, analysis, trans_out] = trans_in
+                sink["launch"][better, analysis, trans_out] = \
+                    entry["launch"][better, analysis, trans_in]
+                if sink_tag:
+                    for corner in better:
+                        sink["pred_tag"][corner, analysis, trans_out] = tag
+
+
+def select_corner(corner_propagated: dict, corner: int) -> dict:
+    """
+    View the arrivals of one corner as a result of propagate_arrival_times.
+
+    Parameters:
+        corner_propagated (dict): The result of propagate_corner_arrivals.
+        corner (int): The corner position.
+
+    Returns:
+        dict: The propagated arrays and tagged entries of the corner, for
+              evaluate_endpoints and extract_worst_paths.
+    """
+    propagated = {name: corner_propagated[name][corner] for name in ENTRY_ARRAYS}
+    propagated.update({
+        name: corner_propagated[name]
+        for name in ("exception_index", "derates", "net_delays", "sdf_delays")
+    })
+    propagated["tagged"] = {
+        node: {
+            tag: {name: values[corner] for name, values in entry.items()}
+            for tag, entry in tags.items()
+        }
+        for node, tags in corner_propagated["tagged"].items()
+    }
+    propagated["delay_cache"] = None
+    return propagated
+
+
+def merge_corner_endpoints(corner_endpoints: list) -> dict:
+    """
+    Merge the endpoints of every corner into their worst case.
+
+    Parameters:
+        corner_endpoints (list): The evaluate_endpoints result of each corner, for the
+                                 same timing graph and cone.
+
+    Returns:
+        dict: The check arcs (arc), the (corners, arcs) setup and hold slacks of every
+              corner (corner_slack, corner_hold_slack), and the worst slack of each
+              check arc with the corner it occurs in (slack, corner, hold_slack,
+              hold_corner).
+
+    Raises:
+        ValueError: If the corners do not check the same arcs.
+    """
+    arcs = corner_endpoints[0]["arc"]
+    if any(not np.array_equal(endpoints["arc"], arcs) for endpoints in corner_endpoints):
+        raise ValueError("The corners do not check the same arcs.")
+    merged = {"arc": arcs}
+    for prefix in ("", "hold_"):
+        slack = np.array([endpoints[f"{prefix}slack"] for endpoints in corner_endpoints])
+        slack = slack.reshape(len(corner_endpoints), len(arcs))
+        merged[f"corner_{prefix}slack"] = slack
+        merged[f"{prefix}corner"] = slack.argmin(axis=0) if len(arcs) else \
+            np.zeros(0, dtype=np.int64)
+        merged[f"{prefix}slack"] = slack.min(axis=0) if len(arcs) else np.zeros(0)
+    return merged
+
+
+def extract_corner_worst_paths(
+    timing_graph: dict,
+    corner_propagated: list,
+    corner_endpoints: list,
+    merged: dict,
+    top_k: int = 100,
+    analysis: str = "late",
+    corner_latencies: list = None,
+) -> tuple:
+    """
+    Extract the K worst endpoint paths over all the corners, each endpoint being
+    reported in the corner where its slack is the worst.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        corner_propagated (list): The propagated arrivals of each corner.
+        corner_endpoints (list): The evaluate_endpoints result of each corner.
+        merged (dict): The result of merge_corner_endpoints.
+        top_k (int): The number of paths to extract, worst slack first.
+        analysis (str): 'late' for the setup paths, 'early' for the hold paths.
+        corner_latencies (list, optional): The compute_clock_latencies result of each
+                                           corner, None for ideal clocks.
+
+    Returns:
+        tuple: The paths (see extract_worst_paths), their capture edges (see
+               extract_capture_edges) and the corner position of each path identifier.
+    """
+    prefix = "" if analysis == "late" else "hold_"
+    paths_delay, capture_edges, path_corners = {}, {}, {}
+    for path_index, endpoint in enumerate(select_worst_endpoints(merged, top_k, analysis)):
+        corner = int(merged[f"{prefix}corner"][endpoint])
+        # the endpoint alone, in the corner where it is the worst
+        single = {
+            name: values[endpoint:endpoint + 1]
+            for name, values in corner_endpoints[corner].items()
+        }
+        path_key = f"path{path_index + 1}"
+        paths_delay[path_key] = extract_worst_paths(
+            timing_graph, corner_propagated[corner], single, 1, analysis,
+            None if corner_latencies is None else corner_latencies[corner],
+        )["path1"]
+        capture_edges[path_key] = extract_capture_edges(single, 1, analysis)["path1"]
+        path_corners[path_key] = corner
+    return paths_delay, capture_edges, path_corners
@@ -0,0 +1,84 @@
+import numpy as np
+from ..network.lca import build_lca_index, query_lca
+
+
+def clock_tree_parents(tree_timing_graph: dict) -> np.ndarray:
+    """
+    Find the parent of every node of a clock tree.
+
+    A node driven by several clock tree nodes (a clock mux) reconverges: it becomes a
+    root, so that no common segment is credited above it.
+
+    Parameters:
+        tree_timing_graph (dict): The timing graph of a clock tree (see
+                                  propagate_clock_tree).
+
+    Returns:
+        np.ndarray: The parent node index of each tree node, -1 for the roots.
+    """
+    parents = np.full(len(tree_timing_graph["names"]), -1, dtype=np.int64)
+    for node, fanin in enumerate(tree_timing_graph["fanin"]):
+        sources = {int(tree_timing_graph["arc_from"][arc]) for arc in fanin}
+        if len(sources) == 1:
+            parents[node] = sources.pop()
+    return parents
+
+
+def build_cppr_index(timing_graph: dict, trees: dict) -> dict:
+    """
+    Index the clock trees for clock reconvergence pessimism removal.
+
+    The launch and capture clocks of a path share the clock tree segment from the source
+    to the lowest common ancestor of their clock pin drivers. The late and early
+    arrivals on that segment are the same physical edge, so their difference at the
+    common ancestor is pessimism the check gives back.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        trees (dict): The timed clock trees of compute_clock_latencies, with the late and
+                      early rise arrival of their nodes (arrival) and the tree node
+                      driving the clock pin of each flip-flop (driver).
+
+    Returns:
+        dict: A dictionary containing:
+            - tree (np.ndarray): The position of the clock tree of each timing graph
+              node in the lca and pessimism lists, -1 for unclocked nodes.
+            - leaf (np.ndarray): The tree node driving the clock pin of each node.
+            - lca (list): The build_lca_index of each clock tree.
+            - pessimism (list): The late minus early arrival of each clock tree node.
+    """
+    num_nodes = len(timing_graph["names"])
+    tree_of = np.full(num_nodes, -1, dtype=np.int64)
+    leaf = np.full(num_nodes, -1, dtype=np.int64)
+    lca, pessimism = [], []
+    for tree in trees.values():
+        position = len(lca)
+        lca.append(build_lca_index(clock_tree_parents(tree["timing_graph"])))
+        pessimism.append(np.maximum(tree["arrival"][0] - tree["arrival"][1], 0.0))
+        for flop, driver in tree["driver"].items():
+            tree_of[timing_graph["index"][flop]] = position
+            leaf[timing_graph["index"][flop]] = driver
+    return {"tree": tree_of, "leaf": leaf, "lca": lca, "pessimism": pessimism}
+
+
+def cppr_credit(cppr_index: dict, launch: int, capture: int) -> float:
+    """
+    Compute the clock reconvergence pessimism of a path in constant time.
+
+    Parameters:
+        cppr_index (dict): The result of build_cppr_index, or None.
+        launch (int): The launching flip-flop node.
+        capture (int): The capturing flip-flop node.
+
+    Returns:
+        float: The late minus early clock arrival at the last clock tree node shared by
+               the launch and capture clocks, 0 when they share none.
+    """
+    if cppr_index is None:
+        return 0.0
+    tree = cppr_index["tree"][launch]
+    if tree < 0 or tree != cppr_index["tree"][capture]:
+        return 0.0
+    common = query_lca(cppr_index["lca"][tree], cppr_index["leaf"][launch],
+                       cppr_index["leaf"][capture])
+    return 0.0 if common < 0 else float(cppr_index["pessimism"][tree][common])
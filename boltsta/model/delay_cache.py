@@ -0,0 +1,113 @@
+from collections import OrderedDict
+import numpy as np
+
+
+def new_delay_cache(max_entries: int = 100000, slew_tolerance: float = 0.0) -> dict:
+    """
+    Create a bounded cache of arc evaluations, shared by every instance of a cell.
+
+    An entry holds the output transition times and delays of one input edge of an arc,
+    keyed by (cell, input pin, input transition, input slew, load). Regular
+    structures evaluate the same arcs with the same loads and slews again and again, so
+    most evaluations become a lookup. When full, the least recently used entry is
+    evicted. With a slew tolerance, the input slews are rounded to a multiple of it
+    before the lookup and the evaluation: the delays become approximate, within the
+    delay change over one tolerance step, and many more evaluations are shared.
+
+    Parameters:
+        max_entries (int): The maximum number of cached input edges.
+        slew_tolerance (float): The slew quantization step, 0 for exact delays.
+
+    Returns:
+        dict: The cache, with its entries, settings and hits, misses and evictions
+              counters (see delay_cache_stats).
+
+    Raises:
+        ValueError: If max_entries is not positive or slew_tolerance is negative.
+    """
+    if max_entries < 1:
+        raise ValueError("The delay cache must hold at least one entry.")
+    if slew_tolerance < 0:
+        raise ValueError("The slew tolerance must be non-negative.")
+    return {
+        "entries": OrderedDict(),
+        "max_entries": int(max_entries),
+        "slew_tolerance": float(slew_tolerance),
+        "hits": 0,
+        "misses": 0,
+        "evictions": 0,
+    }
+
+
+def quantize_slew(delay_cache: dict, slew: float) -> float:
+    """
+    Round an input slew to the slew tolerance of the cache.
+
+    Parameters:
+        delay_cache (dict): The result of new_delay_cache.
+        slew (float): The input slew.
+
+    Returns:
+        float: The nearest multiple of the tolerance, the slew itself without tolerance.
+    """
+    tolerance = delay_cache["slew_tolerance"]
+    slew = float(np.asarray(slew).item())
+    if tolerance == 0.0:
+        return slew
+    return round(slew / tolerance) * tolerance
+
+
+def lookup_delay(delay_cache: dict, key: tuple):
+    """
+    Look up an entry of the delay cache, counting the hit or the miss.
+
+    Parameters:
+        delay_cache (dict): The result of new_delay_cache.
+        key (tuple): The entry key.
+
+    Returns:
+        The cached value, None on a miss.
+    """
+    entries = delay_cache["entries"]
+    if key in entries:
+        entries.move_to_end(key)
+        delay_cache["hits"] += 1
+        return entries[key]
+    delay_cache["misses"] += 1
+    return None
+
+
+def store_delay(delay_cache: dict, key: tuple, value) -> None:
+    """
+    Store an entry in the delay cache, evicting the least recently used entry when full.
+
+    Parameters:
+        delay_cache (dict): The result of new_delay_cache.
+        key (tuple): The entry key.
+        value: The evaluated delays.
+    """
+    entries = delay_cache["entries"]
+    entries[key] = value
+    if len(entries) > delay_cache["max_entries"]:
+        entries.popitem(last=False)
+        delay_cache["evictions"] += 1
+
+
+def delay_cache_stats(delay_cache: dict) -> dict:
+    """
+    Summarize the effect of a delay cache.
+
+    Parameters:
+        delay_cache (dict): The result of new_delay_cache.
+
+    Returns:
+        dict: The hits, misses, evictions and entries of the cache and its hit_rate.
+    """
+    lookups = delay_cache["hits"] + delay_cache["misses"]
+    return {
+        "hits": delay_cache["hits"],
+        "misses": delay_cache["misses"],
+        "evictions": delay_cache["evictions"],
+        "entries": len(delay_cache["entries"]),
+        "hit_rate": delay_cache["hits"] / lookups if lookups else 0.0,
+    }
@@ -0,0 +1,71 @@
+import numpy as np
+from ..readers.aocv_reader import aocv_table
+from .propagation import ANALYSES
+
+
+def aocv_derate(table: dict, depth, distance: float = 0.0):
+    """
+    Interpolate the derates of an AOCV table at some logic depths and a distance.
+
+    The derate is linear between the table indices and clamped outside of them, so the
+    depths beyond the deepest one keep its derate.
+
+    Parameters:
+        table (dict): An AOCV table returned by parse_aocv_tables.
+        depth (np.ndarray): The logic depths to look up.
+        distance (float): The distance spanned by the paths.
+
+    Returns:
+        np.ndarray: The derate at each depth.
+    """
+    row = [np.interp(distance, table["distance"], column) for column in table["table"].T]
+    return np.interp(depth, table["depth"], row)
+
+
+def build_node_derates(
+    timing_graph: dict,
+    derates: tuple = (1.0, 1.0),
+    aocv_tables: list = None,
+    distance: float = 0.0,
+) -> np.ndarray:
+    """
+    Build the late and early derate of the cell delays of every node.
+
+    The flat SDC derates (set_timing_derate -late/-early) apply to every cell, except the
+    cells covered by an AOCV table for the analysis, whose derate is looked up at the
+    logic depth the levelization computed for the node. The derates are then applied as
+    a plain multiply on the arc delays during the propagation.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        derates (tuple): The late and early flat derates.
+        aocv_tables (list, optional): The tables returned by parse_aocv_tables.
+        distance (float): The distance spanned by the paths, 0 without placement data.
+
+    Returns:
+        np.ndarray: A (2, nodes) array of derates, indexed by ANALYSIS_INDEX on the first
+                    axis, 1 on the ports.
+
+    Raises:
+        ValueError: If a derate is not positive.
+    """
+    if min(derates) <= 0:
+        raise ValueError("Timing derates must be positive.")
+
+    ports = timing_graph["inputs"] | timing_graph["outputs"]
+    node_derates = np.where(ports, 1.0, np.array(derates, dtype=float)[:, None])
+    if not aocv_tables:
+        return node_derates
+
+    depth = timing_graph["depth"]
+    cells = np.array(timing_graph["cells"], dtype=object)
+    for cell_name in set(cells[~ports]):
+        nodes = np.flatnonzero(cells == cell_name)
+        for analysis_index, analysis in enumerate(ANALYSES):
+            table = aocv_table(aocv_tables, cell_name, analysis)
+            if table is not None:
+                node_derates[analysis_index, nodes] = aocv_derate(table, depth[nodes], distance)
+
+    if np.any(node_derates <= 0):
+        raise ValueError("AOCV derates must be positive.")
+    return node_derates
@@ -0,0 +1,266 @@
+import logging
+import math
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+import numpy as np
+from ..network.reachability import select_path_cone
+from .propagation import (
+    propagate_arrival_times, evaluate_endpoints, extract_worst_paths, extract_capture_edges
+)
+from .clock_latency import extract_path_latencies
+from .pocv import propagate_pocv_arrivals
+
+# Data shared by the paths of every clock domain, set once in each worker process
+_domain_worker_state = {}
+
+
+def _clock_fraction(value: float) -> Fraction:
+    return Fraction(str(value)).limit_denominator(10000)
+
+
+def clock_relationship(launch_clock: dict, capture_clock: dict, max_edges: int = 10000) -> tuple:
+    """
+    Compute the setup and hold capture edges of the paths between two clocks, relative
+    to their launch edge.
+
+    Every rising launch edge over the common period of the clocks is paired with the
+    next rising capture edge, keeping for each capture edge its latest launch edge. The
+    setup edge is the tightest of these pairs. The hold edge is the tightest of the
+    capture edge before each pair and of the pair capture edge seen from the next
+    launch edge. For a single clock they are the clock period and 0.
+
+    Parameters:
+        launch_clock (dict): The clock of the startpoints, as returned by parse_clock.
+        capture_clock (dict): The clock of the endpoints, as returned by parse_clock.
+        max_edges (int): The maximum number of launch edges examined when the periods
+                         have a very long common period.
+
+    Returns:
+        tuple: The setup and the hold capture edges.
+    """
+    launch_period = _clock_fraction(launch_clock["period"])
+    capture_period = _clock_fraction(capture_clock["period"])
+    if launch_period <= 0 or capture_period <= 0:
+        raise ValueError("Clock periods must be positive.")
+    launch_rise = _clock_fraction(launch_clock["waveform"][0])
+    capture_rise = _clock_fraction(capture_clock["waveform"][0])
+
+    # the least common multiple of the periods, as fractions
+    numerator = math.lcm(launch_period.numerator, capture_period.numerator)
+    denominator = math.gcd(launch_period.denominator, capture_period.denominator)
+    num_edges = min(int(Fraction(numerator, denominator) / launch_period), max_edges)
+
+    latest_launch = {}
+    for edge in range(num_edges):
+        launch = launch_rise + edge * launch_period
+        cycles = math.floor((launch - capture_rise) / capture_period) + 1
+        capture = capture_rise + cycles * capture_period
+        latest_launch[capture] = max(latest_launch.get(capture, launch), launch)
+
+    setup_edge = min(capture - launch for capture, launch in latest_launch.items())
+    hold_edge = max(
+        max(capture - capture_period - launch, capture - launch - launch_period)
+        for capture, launch in latest_launch.items()
+    )
+    return float(setup_edge), float(hold_edge)
+
+
+def _init_domain_worker(shared: dict) -> None:
+    _domain_worker_state.clear()
+    _domain_worker_state.update(shared)
+
+
+def _extract_group(timing_graph, propagated, endpoints, top_k, analyses, slack_lesser_than,
+                   clock_latency=None):
+    # the worst paths of a launch / capture domain pair, for generate_timing_report
+    group = {}
+    for analysis in analyses:
+        slack = endpoints["slack" if analysis == "late" else "hold_slack"]
+        count = top_k
+        if slack_lesser_than is not None:
+            count = min(top_k, int(np.count_nonzero(slack < slack_lesser_than)))
+        finite = slack[np.isfinite(slack)]
+        paths = extract_worst_paths(
+            timing_graph, propagated, endpoints, count, analysis, clock_latency
+        )
+        group[analysis] = {
+            "paths": paths,
+            "capture_edges": extract_capture_edges(endpoints, count, analysis),
+            "clock_latencies": None if clock_latency is None else
+            extract_path_latencies(timing_graph, paths, clock_latency, analysis),
+            "worst_slack": float(finite.min()) if len(finite) else np.inf,
+            "endpoints": len(finite),
+        }
+    return group
+
+
+def propagate_domain_arrivals(task: dict, shared: dict) -> dict:
+    """
+    Propagate the arrivals launched by the flip-flops of one clock domain.
+
+    Parameters:
+        task (dict): The task of the launch clock, see build_domain_tasks.
+        shared (dict): The data shared by the clock domains, see analyze_launch_domain.
+                       With its optional pocv settings (n_sigma and coefficients of
+                       propagate_pocv_arrivals) the n-sigma arrivals are propagated.
+
+    Returns:
+        dict: The result of propagate_arrival_times, or of propagate_pocv_arrivals.
+    """
+    arguments = (shared["timing_graph"], shared["fanout"], shared["cell_pin_mapping"],
+                 shared["library"], shared["clock_transition"])
+    pocv = shared.get("pocv")
+    if pocv is not None:
+        return propagate_pocv_arrivals(
+            *arguments, pocv["n_sigma"], pocv["coefficients"], task["cone"],
+            shared.get("clock_latency"), shared["exception_index"], shared.get("derates"),
+            shared.get("net_delays"), shared.get("sdf_delays"),
+        )
+    return propagate_arrival_times(
+        *arguments, task["cone"], shared["exception_index"], shared.get("clock_latency"),
+        shared.get("delay_cache"), shared.get("derates"), shared.get("net_delays"),
+        shared.get("sdf_delays"),
+    )
+
+
+def analyze_launch_domain(task: dict, shared: dict = None) -> dict:
+    """
+    Propagate the arrivals launched by the flip-flops of one clock domain and evaluate
+    their endpoints, grouped by the clock domain capturing them.
+
+    Parameters:
+        task (dict): The launch cone (see select_path_cone), the capture masks (boolean
+                     endpoint masks of each capture clock) and the relationships (setup
+                     and hold edges of each capture clock) of the launch domain.
+        shared (dict, optional): The timing graph, fanout, cell_pin_mapping, library and
+                                 analysis settings shared by every launch domain. The
+                                 data of the worker process is used when not given.
+
+    Returns:
+        dict: For each capture clock reached, the worst paths of each analysis, as
+              returned by extract_worst_paths, with their capture edges, clock latencies
+              (None for ideal clocks), worst slack and number of checked endpoints.
+    """
+    shared = shared if shared is not None else _domain_worker_state
+    timing_graph = shared["timing_graph"]
+    library = shared["library"]
+    propagated = propagate_domain_arrivals(task, shared)
+
+    groups = {}
+    for capture, capture_mask in task["capture_masks"].items():
+        cone = dict(task["cone"], endpoints=task["cone"]["endpoints"] & capture_mask)
+        if not cone["endpoints"].any():
+            continue
+        setup_edge, hold_edge = task["relationships"][capture]
+        endpoints = evaluate_endpoints(
+            timing_graph, propagated, library, shared["related_pin_time"],
+            clock_network_delay=0,
+            clock_uncertainty=shared["clock_setup_uncertainty"],
+            clock_period=setup_edge,
+            clock_hold_uncertainty=shared["clock_hold_uncertainty"],
+            cone=cone,
+            clock_hold_edge=hold_edge,
+            clock_latency=shared.get("clock_latency"),
+        )
+        if len(endpoints["arc"]):
+            groups[capture] = _extract_group(
+                timing_graph, propagated, endpoints, shared["top_k"], shared["analyses"],
+                shared["slack_lesser_than"], shared.get("clock_latency"),
+            )
+    return groups
+
+
+def build_domain_tasks(timing_graph, reachability, domains, clocks, from_nodes=None,
+                       through_nodes=None, to_nodes=None):
+    """
+    Build the analysis task of every launch clock domain: the cone of the paths its
+    flip-flops launch, restricted by the -from/-through/-to query, and the endpoint
+    mask and clock relationship of every capture clock domain.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        reachability (dict): The index returned by build_reachability_index.
+        domains (dict): The clock of each sequential cell, from assign_clock_domains.
+        clocks (list): The clocks returned by parse_clocks.
+        from_nodes, through_nodes, to_nodes (list, optional): The path query.
+
+    Returns:
+        dict: The task of each launch clock name, for analyze_launch_domain.
+    """
+    index = timing_graph["index"]
+    num_nodes = len(timing_graph["names"])
+    clocks = {clock["name"]: clock for clock in clocks}
+
+    capture_masks = {}
+    for node, clock in domains.items():
+        if clock is not None and node in index:
+            capture_masks.setdefault(clock, np.zeros(num_nodes, dtype=bool))[index[node]] = True
+
+    tasks = {}
+    for launch in capture_masks:
+        startpoints = [
+            node for node, clock in domains.items()
+            if clock == launch and node in index and (not from_nodes or node in from_nodes)
+        ]
+        if not startpoints:
+            continue
+        cone = select_path_cone(timing_graph, reachability, startpoints, through_nodes, to_nodes)
+        if not cone["startpoints"].any():
+            continue
+        tasks[launch] = {
+            "cone": cone,
+            "capture_masks": capture_masks,
+            "relationships": {
+                capture: clock_relationship(clocks[launch], clocks[capture])
+                for capture in capture_masks
+            },
+        }
+    return tasks
+
+
+def analyze_clock_domains(tasks: dict, shared: dict, jobs: int = 1) -> dict:
+    """
+    Analyze every launch clock domain, in parallel worker processes when jobs > 1.
+
+    The arrival times launched by each clock domain are propagated separately, so the
+    paths of every launch / capture domain pair are checked against the edges of their
+    own clocks and reported as their own path group.
+
+    Parameters:
+        tasks (dict): The tasks returned by build_domain_tasks.
+        shared (dict): The data shared by every task (see analyze_launch_domain): the
+                       timing_graph, fanout, cell_pin_mapping, library,
+                       exception_index, clock_transition, related_pin_time,
+                       clock_setup_uncertainty, clock_hold_uncertainty, top_k,
+                       analyses ('late' and/or 'early'), slack_lesser_than, the
+                       optional clock_latency of compute_clock_latencies and the
+                       optional delay_cache of new_delay_cache (each worker process
+                       fills its own copy), derates of build_node_derates,
+                       net_delays of compute_net_delays, sdf_delays of
+                       annotate_sdf_delays and pocv settings (see
+                       propagate_domain_arrivals).
+        jobs (int): The number of worker processes.
+
+    Returns:
+        dict: The groups of each (launch clock, capture clock) pair, see
+              analyze_launch_domain.
+    """
+    if jobs < 1:
+        raise ValueError("The number of jobs must be at least 1.")
+
+    launches = list(tasks)
+    if jobs > 1 and len(launches) > 1:
+        workers = min(jobs, len(launches))
+        logging.info(f"Analyzing {len(launches)} clock domains in {workers} worker processes")
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_domain_worker,
+                                 initargs=(shared,)) as executor:
+            results = list(executor.map(analyze_launch_domain,
+                                        [tasks[launch] for launch in launches]))
+    else:
+        results = [analyze_launch_domain(tasks[launch], shared) for launch in launches]
+
+    return {
+        (launch, capture): group
+        for launch, groups in zip(launches, results)
+        for capture, group in groups.items()
+    }
@@ -3,6 +3,7 @@ from ..utils import *
 from ..network import fanout
 from ..readers import parse_liberty_file
 from boltsta.utils import *
+from .delay_cache import lookup_delay, store_delay, quantize_slew
 
 
 def calculate_combinational_delay(
@@ -69,6 +70,233 @@ def calculate_combinational_delay(
         return rise_transition_delay, cell_rise_delay, "rise"
 
 
+def get_output_transitions(transition_type: str, timing_sense: str) -> tuple:
+    """
+    Maps an input transition to the output transitions it can cause.
+
+    Parameters:
+        transition_type (str): The input transition ('rise' or 'fall').
+        timing_sense (str): The timing sense of the arc.
+
+    Returns:
+        tuple: The output transitions, both of them for non-unate arcs.
+    """
+    if timing_sense == "positive_unate":
+        return (transition_type,)
+    if timing_sense == "negative_unate":
+        return ("fall" if transition_type == "rise" else "rise",)
+    return ("rise", "fall")
+
+
+def calculate_arc_delays(
+    timing_data,
+    input_transitions: list,
+    output_capacitance: float,
+    timing_sense: str,
+) -> dict:
+    """
+    Calculates the delay and output transition time of every edge of a timing arc with
+    one batched interpolation call.
+
+    Parameters:
+        timing_data: The arc compiled by compile_timing_arc, or its timing group.
+        input_transitions (list): (transition_type, input_transition_time) pairs arriving
+                                  at the input pin.
+        output_capacitance (float): The output load capacitance.
+        timing_sense (str): The timing sense of the arc.
+
+    Returns:
+        dict: Maps (transition_type, input_transition_time, output_transition) to the
+              (output transition time, delay) of that edge.
+
+    Raises:
+        ValueError: If an input transition time or output_capacitance is negative.
+    """
+    if output_capacitance < 0 or any(slew < 0 for _, slew in input_transitions):
+        raise ValueError(
+            "Input transition time and output capacitance must be non-negative."
+        )
+
+    edges = [
+        (transition_type, slew, output_transition)
+        for transition_type, slew in input_transitions
+        for output_transition in get_output_transitions(transition_type, timing_sense)
+    ]
+    tables = []
+    for _, _, output_transition in edges:
+        for group_name in (f"{output_transition}_transition", f"cell_{output_transition}"):
+            table = get_lookup_table(timing_data, group_name)
+            tables.append((table["index_1"], table["index_2"], table["values"]))
+    slews = np.repeat([slew for _, slew, _ in edges], 2)
+    values = interpolate_2d_batch(tables, slews, output_capacitance)
+
+    return {
+        edge: (values[2 * position], values[2 * position + 1])
+        for position, edge in enumerate(edges)
+    }
+
+
+def cached_arc_delays(
+    delay_cache: dict,
+    cell_name: str,
+    input_pin: str,
+    timing_data,
+    input_transitions: list,
+    output_capacitance: float,
+    timing_sense: str,
+) -> dict:
+    """
+    calculate_arc_delays through the delay cache: only the edges missing from the cache
+    are interpolated, together in one call.
+
+    Parameters:
+        delay_cache (dict): The result of new_delay_cache, or None to evaluate every edge.
+        cell_name (str): The cell of the arc.
+        input_pin (str): The input pin of the arc.
+        timing_data: The timing data of the arc (see calculate_arc_delays).
+        input_transitions (list): (transition_type, input_transition_time) pairs arriving
+                                  at the input pin.
+        output_capacitance (float): The output load capacitance.
+        timing_sense (str): The timing sense of the arc.
+
+    Returns:
+        dict: The result of calculate_arc_delays, keyed by the requested input slews.
+    """
+    if delay_cache is None:
+        return calculate_arc_delays(timing_data, input_transitions, output_capacitance,
+                                    timing_sense)
+
+    load = float(output_capacitance)
+    quantized = [
+        (transition_type, quantize_slew(delay_cache, slew))
+        for transition_type, slew in input_transitions
+    ]
+    found, missing = {}, []
+    for edge in dict.fromkeys(quantized):
+        found[edge] = lookup_delay(delay_cache, (cell_name, input_pin) + edge + (load,))
+        if found[edge] is None:
+            missing.append(edge)
+
+    if missing:
+        evaluated = calculate_arc_delays(timing_data, missing, output_capacitance, timing_sense)
+        for edge in missing:
+            found[edge] = {
+                outcome[2]: value for outcome, value in evaluated.items() if outcome[:2] == edge
+            }
+            store_delay(delay_cache, (cell_name, input_pin) + edge + (load,), found[edge])
+
+    return {
+        (transition_type, slew, output_transition): value
+        for (transition_type, slew), edge in zip(input_transitions, quantized)
+        for output_transition, value in found[edge].items()
+    }
+
+
+def cached_combinational_delay(
+    delay_cache: dict,
+    cell_pin_mapping: dict,
+    cell_name: str,
+    input_pin_name: str,
+    input_transition_time: float,
+    transition_type: str,
+    output_capacitance: float,
+    timing_sense: str,
+) -> tuple:
+    """
+    calculate_combinational_delay through the delay cache.
+
+    Parameters:
+        delay_cache (dict): The result of new_delay_cache, or None to evaluate the stage.
+        cell_pin_mapping, cell_name, input_pin_name, input_transition_time,
+        transition_type, output_capacitance, timing_sense: See
+            calculate_combinational_delay.
+
+    Returns:
+        tuple: The result of calculate_combinational_delay.
+    """
+    if delay_cache is None:
+        return calculate_combinational_delay(
+            cell_pin_mapping=cell_pin_mapping,
+            cell_name=cell_name,
+            input_pin_name=input_pin_name,
+            input_transition_time=input_transition_time,
+            transition_type=transition_type,
+            output_capacitance=output_capacitance,
+            timing_sense=timing_sense,
+        )
+
+    key = (cell_name, input_pin_name, transition_type,
+           quantize_slew(delay_cache, input_transition_time), float(output_capacitance),
+           timing_sense)
+    value = lookup_delay(delay_cache, key)
+    if value is not None:
+        return value
+    value = calculate_combinational_delay(
+        cell_pin_mapping=cell_pin_mapping,
+        cell_name=cell_name,
+        input_pin_name=input_pin_name,
+        input_transition_time=key[3],
+        transition_type=transition_type,
+        output_capacitance=output_capacitance,
+        timing_sense=timing_sense,
+    )
+    store_delay(delay_cache, key, value)
+    return value
+
+
+def cached_stage_result(stage_cache: dict, key, function, **kwargs):
+    """
+    Evaluate a stage of the enumerated paths once for all the paths sharing it.
+
+    Parameters:
+        stage_cache (dict): The results already evaluated, filled by the call.
+        key: The stage identifier, see build_paths_delay_dict.
+        function: The function evaluating the stage.
+        **kwargs: The arguments of the function.
+
+    Returns:
+        The result of function(**kwargs), evaluated on the first call for the key.
+    """
+    if key not in stage_cache:
+        stage_cache[key] = function(**kwargs)
+    return stage_cache[key]
+
+
+def sensed_combinational_delay(
+    delay_cache: dict,
+    cell_pin_mapping: dict,
+    cell_name: str,
+    input_pin_name: str,
+    input_transition_time: float,
+    transition_type: str,
+    output_capacitance: float,
+) -> tuple:
+    """
+    cached_combinational_delay with the timing sense of the arc read from the cell data.
+
+    Parameters:
+        delay_cache, cell_pin_mapping, cell_name, input_pin_name, input_transition_time,
+        transition_type, output_capacitance: See cached_combinational_delay.
+
+    Returns:
+        tuple: The result of calculate_combinational_delay.
+    """
+    return cached_combinational_delay(
+        delay_cache=delay_cache,
+        cell_pin_mapping=cell_pin_mapping,
+        cell_name=cell_name,
+        input_pin_name=input_pin_name,
+        input_transition_time=input_transition_time,
+        transition_type=transition_type,
+        output_capacitance=output_capacitance,
+        timing_sense=get_timing_sense(
+            cell_name=cell_name,
+            input_pin_name=input_pin_name,
+            cells_info=cell_pin_mapping,
+        ),
+    )
+
+
 def calculate_stage_delay(
     path: list,
     path_attribute: list,
@@ -238,48 +466,53 @@ def calculate_constraint_time(
 
     Parameters:
         cell_name (str): The name of the cell for which constraints are being calculated.
-        checking_type (str): The type of checking ('setup_checking' or 'hold_checking').
+        checking_type (str): The type of checking ('setup_checking', 'hold_checking' or
+            'setup_hold_checking' for both at once).
         input_pin (str): The name of the input pin of the cell (D_CLK, D_CLK_N).
-        library_name (str): The name of the library containing the cell.
-        constrained_pin_transition (float): Transition time of the constrained pin.
+        library_name (str): The parsed library containing the cell. Its setup and hold
+            tables are compiled on the first call (see compile_constraint_arcs).
+        constrained_pin_transition (float): Transition time of the constrained pin. With
+            'setup_hold_checking' it can also be a (late, early) pair, the late
+            transition being used for the setup time and the early one for the hold time.
         related_pin_transition (float): Transition time of the related pin.
 
     Returns:
-        float: The setup or hold time for the given cell.
+        float: The setup or hold time for the given cell, or a numpy array holding
+            the setup and hold times with 'setup_hold_checking'.
 
     Raises:
         ValueError: If the cell name or input pin name is not found.
     """
-    if constrained_pin_transition < 0 or related_pin_transition < 0:
+    if np.any(np.asarray(constrained_pin_transition) < 0) or related_pin_transition < 0:
         raise ValueError(
             "Constrained pin transition time and related pin transition time must be non-negative."
         )
-    
-    if checking_type not in {"setup_checking", "hold_checking"}:
-        raise ValueError("Invalid checking type. Please use 'setup_checking' or 'hold_checking'.")
 
-    # Retrieve timing information for the specified cell, input pin, and checking type
-    timing_information = get_constraint_timing(
-        input_pin_name=input_pin,
-        cell_name=cell_name,
-        library_name=library_name,
-        checking_type=checking_type,
-    )
+    if checking_type not in {"setup_checking", "hold_checking", "setup_hold_checking"}:
+        raise ValueError(
+            "Invalid checking type. Please use 'setup_checking', 'hold_checking' "
+            "or 'setup_hold_checking'."
+        )
+
+    if checking_type == "setup_hold_checking":
+        late_transition, early_transition = np.broadcast_to(constrained_pin_transition, 2)
+        return np.array([
+            np.asarray(calculate_constraint_time(
+                cell_name, check, input_pin, library_name, transition, related_pin_transition
+            )).item()
+            for check, transition in (
+                ("setup_checking", late_transition),
+                ("hold_checking", early_transition),
+            )
+        ])
 
-    # Get the timing type (e.g., setup_rising, hold_rising)
-    timing_type = timing_information["timing_type"]
-
-    # Determine the appropriate constraint data group based on checking type and timing type
-    if checking_type == "hold_checking":
-        if timing_type == "hold_rising":
-            constraint_data = timing_information.get_group("rise_constraint")
-        else:
-            constraint_data = timing_information.get_group("fall_constraint")
-    else:  # setup_checking
-        if timing_type == "setup_rising":
-            constraint_data = timing_information.get_group("rise_constraint")
-        else:
-            constraint_data = timing_information.get_group("fall_constraint")
+    # The setup / hold table of the pin, compiled once per library
+    try:
+        constraint_data = compile_constraint_arcs(library_name)[cell_name][input_pin][checking_type]
+    except KeyError:
+        raise ValueError(
+            f"No {checking_type} timing for input pin '{input_pin}' of cell '{cell_name}'."
+        ) from None
 
     # Interpolate the constraint time based on transition times
     constraint_time = interpolate_constraint_time(
@@ -374,6 +607,8 @@ def build_paths_delay_dict(
     library: str,
     related_pin_time: float = 0.04,
     input_transition_time: float = 1.5,
+    delay_cache: dict = None,
+    derates: dict = None,
 ) -> dict:
     """
     Constructs a dictionary mapping paths to their corresponding delays.
@@ -386,6 +621,10 @@ def build_paths_delay_dict(
         library (str): The library used.
         related_pin_time (float): The related pin transition time used for setup constraint calculation.
         input_transition_time (float): The initial input transition time.
+        delay_cache (dict, optional): The result of new_delay_cache, shared by the stages
+            of every instance of a cell.
+        derates (dict, optional): The late derate of the cell delays of each cell string,
+            see build_node_derates. The setup times are not derated.
 
     Returns:
         dict: A dictionary where keys are path identifiers (e.g., "path1") and values are dictionaries
@@ -400,6 +639,16 @@ def build_paths_delay_dict(
     # Initialize the dictionary to store delays for each path
     paths_delay = {}
 
+    # Paths launched by the same register share their prefixes, so every stage
+    # result is cached and evaluated once for all the paths going through it:
+    # loads by cell, clk-to-q by cell, combinational stages by
+    # (cell, incoming pin, transition type, input slew) and setup times by
+    # (cell, constrained pin slew).
+    load_cache = {}
+    launch_cache = {}
+    stage_cache = {}
+    constraint_cache = {}
+
     # Iterate over each path and its attributes
     for path_index, path in enumerate(paths):
         path_attr = paths_attributes[path_index]
@@ -421,22 +670,26 @@ def build_paths_delay_dict(
                 continue
 
             # Calculate the output capacitance for the current cell
-            out_cap = get_output_capacitance(
-                fanout=fanout[cell],
-                library=library,
+            out_cap = cached_stage_result(
+                load_cache, cell, get_output_capacitance, fanout=fanout[cell], library=library
             )
 
             if cell_index == 0:
                 # Calculate clk-to-q delay for the first cell in the path
-                transition_delay, delay = calculate_clk2q_delay(
+                transition_delay, delay = cached_stage_result(
+                    launch_cache, cell, calculate_clk2q_delay,
                     cell_timing_data=cell_pin_mapping,
                     cell_name=cell_name,
                     input_transition_time=input_transition_time,
                     output_capacitance=out_cap,
                 )
+                # flip-flop to flip-flop paths (scan chains) end with the launch slew
+                last_cell_trans = transition_delay
             elif cell_index == len(path) - 1:
                 # Calculate setup constraint time for the last cell in the path
-                delay = calculate_constraint_time(
+                delay = cached_stage_result(
+                    constraint_cache, (cell, float(np.asarray(last_cell_trans).item())),
+                    calculate_constraint_time,
                     cell_name=cell_name,
                     checking_type="setup_checking",
                     input_pin="D",
@@ -449,28 +702,27 @@ def build_paths_delay_dict(
                 if cell_index == 1:
                     trans_type = "rise"
                     transition_time = transition_delay
-                time_sense = get_timing_sense(
-                    cell_name=cell_name,
-                    input_pin_name=path_attr[cell_index - 1],
-                    cells_info=cell_pin_mapping,
-                )
-
-                transition_time, delay, trans_type = calculate_combinational_delay(
+                transition_time, delay, trans_type = cached_stage_result(
+                    stage_cache,
+                    (cell, path_attr[cell_index - 1], trans_type,
+                     float(np.asarray(transition_time).item())),
+                    sensed_combinational_delay,
+                    delay_cache=delay_cache,
                     cell_pin_mapping=cell_pin_mapping,
                     cell_name=cell_name,
                     input_pin_name=path_attr[cell_index - 1],
+                    input_transition_time=transition_time,
                     transition_type=trans_type,
-                    timing_sense=time_sense,
                     output_capacitance=out_cap,
-                    input_transition_time=transition_time,
                 )
 
                 if cell_index == len(path) - 2:
                     last_cell_trans = transition_time
 
-            # Ensure delay is a scalar value
-            if isinstance(delay, np.ndarray):
-                delay = delay.item()
+            # Ensure delay is a scalar value, derated but for the setup time
+            delay = np.asarray(delay).item()
+            if derates is not None and cell_index < len(path) - 1:
+                delay = delay * derates.get(cell, 1.0)
 
             delay = round(delay, 6)
 
@@ -488,6 +740,7 @@ def Model(
     pdk_path: str,
     paths: list[list],
     paths_attribute: list[list],
+    fanout: dict[str, list[str]],
     input_transition_time: float,
     related_pin_time: float,
     output_file_path: str,
@@ -495,6 +748,9 @@ def Model(
     clock_network_delay: float = 0.0,
     clock_uncertainty: float = 0.3,
     clock_period: float = 10.0,
+    clock_name: str = "core_clock",
+    delay_cache: dict = None,
+    derates: dict = None,
 ) -> None:
     """
     Model the timing analysis for a given design using the specified PDK and paths.
@@ -503,6 +759,7 @@ def Model(
     pdk_path (str): Path to the liberty file of the PDK.
     paths (list[list]): A list of lists, where each inner list represents a sequence of cells and pins in a path.
     paths_attribute (list[list]): A list of lists representing the attributes of each pin in the paths.
+    fanout (dict[str, list[str]]): The fanout dictionary returned by get_fanout_dict.
     input_transition_time (float): The input transition time.
     related_pin_time (float): The related pin time.
     output_file_path (str): The path where the timing report will be generated.
@@ -510,6 +767,9 @@ def Model(
     clock_network_delay (float, optional): The clock network delay. Defaults to 0.0.
     clock_uncertainty (float, optional): The clock uncertainty. Defaults to 0.3.
     clock_period (float, optional): The clock period. Defaults to 10.0.
+    clock_name (str, optional): The clock of the paths. Defaults to core_clock.
+    delay_cache (dict, optional): The result of new_delay_cache.
+    derates (dict, optional): The late derate of the cell delays of each cell string.
 
     Returns:
     None
@@ -517,17 +777,20 @@ def Model(
     # Parse the liberty file
     pdk = pdk_path
 
-    # Extract cell pin mapping from the parsed liberty file
-    cell_mapping = extract_cell_pin_mapping(pdk)
+    # Extract and compile the cell pin mapping from the parsed liberty file
+    cell_mapping = compile_cell_pin_mapping(extract_cell_pin_mapping(pdk))
 
     # Build the path delays dictionary
     path_delays = build_paths_delay_dict(
         paths,
         paths_attribute,
+        fanout,
         cell_mapping,
         pdk,
         related_pin_time,
         input_transition_time,
+        delay_cache,
+        derates,
     )
 
     # Generate the timing report
@@ -538,6 +801,8 @@ def Model(
         clock_network_delay,
         clock_uncertainty,
         clock_period,
+        launch_clock=clock_name,
+        capture_clock=clock_name,
     )
 
     # Print the output file path
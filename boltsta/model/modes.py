@@ -0,0 +1,102 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from .propagation import propagate_arrival_times, evaluate_endpoints
+from .domain_analysis import _extract_group
+
+# Graph, library and cell arc tables shared by the modes, set once in each worker process
+_mode_worker_state = {}
+
+
+def mode_name(sdc_path: str) -> str:
+    """
+    Name an analysis mode after its SDC file, e.g. 'scan_shift'.
+
+    Parameters:
+        sdc_path (str): The path of the SDC file of the mode.
+
+    Returns:
+        str: The file name without its directory and extension.
+    """
+    return os.path.splitext(os.path.basename(sdc_path))[0]
+
+
+def _init_mode_worker(shared: dict) -> None:
+    _mode_worker_state.clear()
+    _mode_worker_state.update(shared)
+
+
+def analyze_mode(task: dict, shared: dict = None) -> dict:
+    """
+    Propagate the arrivals of one analysis mode over the shared timing graph and
+    extract its worst paths.
+
+    Parameters:
+        task (dict): The constraints of the mode: its overlay (cone, see
+                     build_mode_overlay), fanout, clock, clock_transition,
+                     clock_setup_uncertainty, clock_hold_uncertainty, exception_index,
+                     clock_latency and the optional derates of build_node_derates and
+                     net_delays of compute_net_delays.
+        shared (dict, optional): The timing_graph, cell_pin_mapping, library,
+                                 related_pin_time, top_k, analyses ('late' and/or
+                                 'early'), slack_lesser_than and optional delay_cache
+                                 and sdf_delays of annotate_sdf_delays shared by every
+                                 mode.
+                                 The data of the worker process is used when not given.
+
+    Returns:
+        dict: The worst paths of each analysis, with their capture edges, clock
+              latencies, worst slack and number of checked endpoints (see
+              analyze_launch_domain).
+    """
+    shared = shared if shared is not None else _mode_worker_state
+    timing_graph = shared["timing_graph"]
+    propagated = propagate_arrival_times(
+        timing_graph, task["fanout"], shared["cell_pin_mapping"], shared["library"],
+        task["clock_transition"], task["cone"], task["exception_index"], task["clock_latency"],
+        shared.get("delay_cache"), task.get("derates"), task.get("net_delays"),
+        shared.get("sdf_delays"),
+    )
+    endpoints = evaluate_endpoints(
+        timing_graph, propagated, shared["library"], shared["related_pin_time"],
+        clock_network_delay=0,
+        clock_uncertainty=task["clock_setup_uncertainty"],
+        clock_period=task["clock"]["period"],
+        clock_hold_uncertainty=task["clock_hold_uncertainty"],
+        cone=task["cone"],
+        clock_latency=task["clock_latency"],
+    )
+    return _extract_group(
+        timing_graph, propagated, endpoints, shared["top_k"], shared["analyses"],
+        shared["slack_lesser_than"], task["clock_latency"],
+    )
+
+
+def analyze_modes(tasks: dict, shared: dict, jobs: int = 1) -> dict:
+    """
+    Analyze every mode, concurrently in worker processes when jobs > 1.
+
+    The read-only timing graph, library and cell arc tables are sent once to each
+    worker process, and every task only carries the overlay and constraints of its mode.
+
+    Parameters:
+        tasks (dict): The task of each mode name (see analyze_mode).
+        shared (dict): The data shared by every mode (see analyze_mode).
+        jobs (int): The number of worker processes.
+
+    Returns:
+        dict: The result of analyze_mode for each mode name.
+    """
+    if jobs < 1:
+        raise ValueError("The number of jobs must be at least 1.")
+
+    modes = list(tasks)
+    if jobs > 1 and len(modes) > 1:
+        workers = min(jobs, len(modes))
+        logging.info(f"Analyzing {len(modes)} modes in {workers} worker processes")
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_mode_worker,
+                                 initargs=(shared,)) as executor:
+            results = list(executor.map(analyze_mode, [tasks[mode] for mode in modes]))
+    else:
+        results = [analyze_mode(tasks[mode], shared) for mode in modes]
+    return dict(zip(modes, results))
@@ -0,0 +1,552 @@
+import numpy as np
+from ..utils import get_timing_sense
+from ..network.exceptions import advance_tag
+from .model import get_output_transitions
+from .cppr import cppr_credit
+from .propagation import (
+    LATE, EARLY, TRANSITIONS, TRANSITION_INDEX, blocked_analyses, get_arrival_entries,
+    get_check_edges, get_constraint_times, get_propagated_load, get_wire_delay,
+    lookup_arc_edges, select_arc_delay,
+)
+
+# Slack histogram of every check: its bins, spread over the nominal slack plus or minus
+# HISTOGRAM_SIGMAS times the sigma of the delay scaling applied to the nominal arrival
+HISTOGRAM_BINS = 1024
+HISTOGRAM_SIGMAS = 6.0
+
+
+def new_monte_carlo(
+    samples: int,
+    global_sigma: float = 0.03,
+    local_sigma: float = 0.05,
+    seed: int = 1,
+    block_size: int = 1000,
+) -> dict:
+    """
+    Create the settings of a Monte Carlo timing run.
+
+    Every sample scales the delay of each arc by 1 + global_sigma * g + local_sigma * l,
+    where g is drawn once per sample (die to die variation) and l once per sample and
+    arc (within die variation), both from a standard normal distribution.
+
+    Parameters:
+        samples (int): The number of samples.
+        global_sigma (float): The relative sigma of the global delay scaling.
+        local_sigma (float): The relative sigma of the local delay scaling of each arc.
+        seed (int): The seed of the random generators, for reproducible samples.
+        block_size (int): The number of samples propagated together, which bounds the
+                          memory of the propagation.
+
+    Returns:
+        dict: The settings, for monte_carlo_slacks.
+
+    Raises:
+        ValueError: If the number of samples or the block size is not positive, or a
+                    sigma is negative.
+    """
+    if samples < 1 or block_size < 1:
+        raise ValueError("The number of samples and the block size must be at least 1.")
+    if global_sigma < 0 or local_sigma < 0:
+        raise ValueError("The delay sigmas must be non-negative.")
+    return {
+        "samples": int(samples),
+        "global_sigma": float(global_sigma),
+        "local_sigma": float(local_sigma),
+        "seed": seed,
+        "block_size": int(block_size),
+    }
+
+
+def monte_carlo_rows(nominal: dict) -> dict:
+    """
+    Number the arrivals the Monte Carlo samples propagate: one row per node for its
+    untagged paths, followed by one row per node and timing exception tag.
+
+    Parameters:
+        nominal (dict): The result of propagate_arrival_times.
+
+    Returns:
+        dict: The row of each (node, tag) pair.
+    """
+    rows = {(node, ()): node for node in range(nominal["arrival"].shape[2])}
+    for node, tags in nominal["tagged"].items():
+        for tag in tags:
+            rows[(node, tag)] = len(rows)
+    return rows
+
+
+def monte_carlo_arc_delays(
+    timing_graph: dict,
+    nominal: dict,
+    fanout: dict,
+    cell_pin_mapping: dict,
+    library,
+    cone: dict = None,
+    clock_latency: dict = None,
+) -> dict:
+    """
+    Evaluate the nominal delay of every edge the Monte Carlo samples scale, as
+    propagate_arc times the latest arrivals.
+
+    The arrivals are the rows of monte_carlo_rows, and every arc links the rows of the
+    tags reaching its source to the rows of their tags at its sink, skipping the false
+    paths. The edges are evaluated at the slews of the nominal latest arrivals, so the
+    samples vary the delays but not the slews. The cell delays (SDF annotated or
+    interpolated at the load of the propagation) are derated as the nominal arrivals,
+    and the wire delays are added without variation.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        nominal (dict): The result of propagate_arrival_times.
+        fanout (dict): The fanout dictionary returned by get_fanout_dict.
+        cell_pin_mapping (dict): A dictionary containing timing data for each cell.
+        library: The parsed liberty library.
+        cone (dict, optional): The result of select_path_cone.
+        clock_latency (dict, optional): The result of compute_clock_latencies.
+
+    Returns:
+        dict: rows and columns (the number of scaling factors of a sample); the edges
+              sorted by the level of their sink: arc, source and sink rows, (edges, 2, 2)
+              delay from an input to an output transition (NaN for the edges not
+              timed) and (edges, 2) wire delay of each input transition; the levels,
+              (start, end, group starts, sink rows) of the edges of each level; and the
+              launch_row, launch_column, (launches, 2) launch_delay and launch_latency
+              of the clk-to-q arcs.
+    """
+    rows = monte_carlo_rows(nominal)
+    # the arcs into the flip-flops are checks, the ports are not timed
+    skipped = timing_graph["sequential"] | timing_graph["inputs"] | timing_graph["outputs"]
+    edges = {"arc": [], "source": [], "sink": [], "delay": [], "wire": []}
+    for arc, (source, node) in enumerate(zip(timing_graph["arc_from"], timing_graph["arc_to"])):
+        if skipped[node] or (cone is not None and not cone["arcs"][arc]):
+            continue
+        wire_delay, _ = get_wire_delay(nominal, arc)
+        load = get_propagated_load(nominal, timing_graph, fanout, library, node)
+        for (tag, sink_tag), delay in monte_carlo_edge_delays(
+            timing_graph, nominal, arc, cell_pin_mapping, load
+        ).items():
+            edges["arc"].append(arc)
+            edges["source"].append(rows[(source, tag)])
+            edges["sink"].append(rows[(node, sink_tag)])
+            edges["delay"].append(delay)
+            edges["wire"].append(wire_delay[LATE])
+
+    # the edges into each level only depend on the arrivals of the levels before
+    row_level = timing_graph["level"][[node for node, _ in rows]]
+    sinks = np.array(edges["sink"], dtype=np.int64)
+    order = np.lexsort((sinks, row_level[sinks]))
+    arc_delays = {
+        "rows": len(rows),
+        "columns": len(timing_graph["arc_from"]) + int(timing_graph["sequential"].sum()),
+        "arc": np.array(edges["arc"], dtype=np.int64)[order],
+        "source": np.array(edges["source"], dtype=np.int64)[order],
+        "sink": sinks[order],
+        "delay": np.array(edges["delay"], dtype=float).reshape(-1, 2, 2)[order],
+        "wire": np.array(edges["wire"], dtype=float).reshape(-1, 2)[order],
+        "levels": [],
+        **monte_carlo_launches(timing_graph, nominal, rows, clock_latency),
+    }
+    levels = row_level[arc_delays["sink"]]
+    bounds = np.flatnonzero(np.diff(levels)) + 1
+    for start, end in zip(np.r_[0, bounds], np.r_[bounds, len(levels)]):
+        level_sinks = arc_delays["sink"][start:end]
+        groups = np.r_[0, np.flatnonzero(np.diff(level_sinks)) + 1]
+        arc_delays["levels"].append((start, end, groups, level_sinks[groups]))
+    return arc_delays
+
+
+def monte_carlo_launches(
+    timing_graph: dict,
+    nominal: dict,
+    rows: dict,
+    clock_latency: dict = None,
+) -> dict:
+    """
+    Collect the clk-to-q arcs of every tag launched by the flip-flops.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        nominal (dict): The result of propagate_arrival_times.
+        rows (dict): The result of monte_carlo_rows.
+        clock_latency (dict, optional): The result of compute_clock_latencies.
+
+    Returns:
+        dict: The launch_row, launch_column (scaling factor), (launches, 2) derated
+              launch_delay and launch_latency of each launched row.
+    """
+    sequential = timing_graph["sequential"]
+    latency = np.zeros(len(sequential))
+    if clock_latency is not None:
+        latency = clock_latency["latency"][LATE]
+    launches = {"launch_row": [], "launch_column": [], "launch_delay": [], "launch_latency": []}
+    for column, node in enumerate(np.flatnonzero(sequential), len(timing_graph["arc_from"])):
+        for tag, entry in get_arrival_entries(nominal, node):
+            if np.isfinite(entry["arrival"][LATE]).all():
+                launches["launch_row"].append(rows[(node, tag)])
+                launches["launch_column"].append(column)
+                launches["launch_delay"].append(entry["arrival"][LATE] - latency[node])
+                launches["launch_latency"].append(latency[node])
+    return {
+        "launch_row": np.array(launches["launch_row"], dtype=np.int64),
+        "launch_column": np.array(launches["launch_column"], dtype=np.int64),
+        "launch_delay": np.array(launches["launch_delay"], dtype=float).reshape(-1, 2),
+        "launch_latency": np.array(launches["launch_latency"], dtype=float),
+    }
+
+
+def monte_carlo_edge_delays(
+    timing_graph: dict,
+    nominal: dict,
+    arc: int,
+    cell_pin_mapping: dict,
+    output_capacitance: float,
+) -> dict:
+    """
+    Evaluate the derated cell delays of an arc for every tag reaching its source, at
+    the slews of the nominal latest arrivals.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        nominal (dict): The result of propagate_arrival_times.
+        arc (int): The arc.
+        cell_pin_mapping (dict): A dictionary containing timing data for each cell.
+        output_capacitance (float): The load of the arc sink during the propagation.
+
+    Returns:
+        dict: The (2, 2) delay from each input to each output transition (NaN for the
+              edges not timed) of every (source tag, sink tag) pair, the false paths
+              for setup being left out.
+    """
+    source, node = timing_graph["arc_from"][arc], timing_graph["arc_to"][arc]
+    reached = [
+        (tag, entry, trans_in) for tag, entry in get_arrival_entries(nominal, source)
+        for trans_in in np.flatnonzero(np.isfinite(entry["arrival"][LATE]))
+    ]
+    if not reached:
+        return {}
+    exception_index = nominal.get("exception_index")
+    derates = nominal.get("derates")
+    scale = 1.0 if derates is None else derates[LATE, node]
+    time_sense = get_timing_sense(
+        cell_pin_mapping, timing_graph["cells"][node], timing_graph["arc_pin"][arc]
+    )
+    _, wire_slew = get_wire_delay(nominal, arc)
+    input_edges = [
+        (TRANSITIONS[trans_in], np.hypot(entry["slew"][LATE, trans_in], wire_slew))
+        for _, entry, trans_in in reached
+    ]
+    evaluated, annotated = lookup_arc_edges(
+        nominal, timing_graph, arc, cell_pin_mapping, output_capacitance, time_sense,
+        input_edges,
+    )
+    delays = {}
+    for (tag, _, trans_in), edge in zip(reached, input_edges):
+        sink_tag = advance_tag(exception_index, tag, node) if exception_index else tag
+        if LATE in blocked_analyses(exception_index, sink_tag):
+            continue
+        delay = delays.setdefault((tag, sink_tag), np.full((2, 2), np.nan))
+        for trans_type in get_output_transitions(TRANSITIONS[trans_in], time_sense):
+            trans_out = TRANSITION_INDEX[trans_type]
+            delay[trans_in, trans_out] = select_arc_delay(
+                evaluated, edge + (trans_type,), annotated, LATE, trans_out
+            )[1] * scale
+    return delays
+
+
+def monte_carlo_required_times(
+    timing_graph: dict,
+    nominal: dict,
+    library,
+    related_pin_time: float,
+    clock_period: float,
+    clock_uncertainty: float,
+    cone: dict = None,
+    clock_latency: dict = None,
+) -> dict:
+    """
+    Compute the setup required time of every check arc, tag and transition, as
+    evaluate_endpoints does for the nominal arrivals.
+
+    The setup times are evaluated at the nominal slews, the capture edges follow the
+    timing exceptions of each tag, and the clock reconvergence pessimism credit is the
+    one of the nominal launching flip-flop. The wire delay of the check arc is
+    subtracted from the required times, which then apply to the source arrivals.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        nominal (dict): The result of propagate_arrival_times.
+        library: The parsed liberty library.
+        related_pin_time (float): The related pin transition time of the checks.
+        clock_period (float): The clock period.
+        clock_uncertainty (float): The setup clock uncertainty.
+        cone (dict, optional): The result of select_path_cone.
+        clock_latency (dict, optional): The result of compute_clock_latencies.
+
+    Returns:
+        dict: The check arcs (arc) with their nominal worst slack (slack) and latest
+              arrival (arrival), and for each (check, tag) pair its check index, its
+              source row (see monte_carlo_rows) and its (pairs, 2) required time of each
+              transition (NaN where the transition does not arrive).
+    """
+    rows = monte_carlo_rows(nominal)
+    exception_index = nominal.get("exception_index")
+    cppr_index = None if clock_latency is None else clock_latency.get("cppr")
+    checks = {"arc": [], "slack": [], "arrival": []}
+    pairs = {"check": [], "row": [], "required": []}
+    for arc, (source, sink) in enumerate(zip(timing_graph["arc_from"], timing_graph["arc_to"])):
+        if not timing_graph["sequential"][sink]:
+            continue
+        if cone is not None and not (cone["arcs"][arc] and cone["endpoints"][sink]):
+            continue
+        capture_latency = 0.0 if clock_latency is None else clock_latency["latency"][EARLY, sink]
+        wire_delay, wire_slew = get_wire_delay(nominal, arc)
+        slack, latest = np.inf, -np.inf
+        for tag, entry in get_arrival_entries(nominal, source):
+            setup_edge, _ = get_check_edges(exception_index, tag, sink, clock_period)
+            reached = np.flatnonzero(np.isfinite(entry["arrival"][LATE]))
+            if setup_edge is None or not len(reached):
+                continue
+            times = np.full(2, np.nan)
+            for trans in reached:
+                setup, _ = get_constraint_times(
+                    timing_graph, nominal, arc, library, trans,
+                    np.hypot(entry["slew"][:, trans], wire_slew), related_pin_time,
+                )
+                times[trans] = setup_edge + capture_latency - clock_uncertainty - setup \
+                    - wire_delay[LATE, trans] \
+                    + cppr_credit(cppr_index, entry["launch"][LATE, trans], sink)
+            pairs["check"].append(len(checks["arc"]))
+            pairs["row"].append(rows[(source, tag)])
+            pairs["required"].append(times)
+            slack = min(slack, np.nanmin(times - entry["arrival"][LATE]))
+            latest = max(latest, entry["arrival"][LATE].max())
+        if np.isfinite(slack):
+            checks["arc"].append(arc)
+            checks["slack"].append(slack)
+            checks["arrival"].append(latest)
+    return {
+        "arc": np.array(checks["arc"], dtype=np.int64),
+        "slack": np.array(checks["slack"], dtype=float),
+        "arrival": np.array(checks["arrival"], dtype=float),
+        "check": np.array(pairs["check"], dtype=np.int64),
+        "row": np.array(pairs["row"], dtype=np.int64),
+        "required": np.array(pairs["required"], dtype=float).reshape(-1, 2),
+    }
+
+
+def sample_delay_scales(generators: tuple, samples: int, columns: int, monte_carlo: dict):
+    """
+    Draw the delay scaling factors of a block of samples.
+
+    The global and local components come from their own generator, so the samples do
+    not depend on the block size.
+
+    Parameters:
+        generators (tuple): The global and local numpy random generators.
+        samples (int): The number of samples of the block.
+        columns (int): The number of scaled delays (arcs and clk-to-q arcs).
+        monte_carlo (dict): The result of new_monte_carlo.
+
+    Returns:
+        np.ndarray: The (samples, columns) non-negative delay scaling factors.
+    """
+    global_rng, local_rng = generators
+    scales = 1.0 + monte_carlo["global_sigma"] * global_rng.standard_normal(samples)[:, None]
+    scales = scales + monte_carlo["local_sigma"] * local_rng.standard_normal((samples, columns))
+    return np.maximum(scales, 0.0)
+
+
+def propagate_monte_carlo_block(arc_delays: dict, scales: np.ndarray) -> np.ndarray:
+    """
+    Propagate the latest arrival times of a block of samples together, level by level.
+
+    Each sample scales the nominal delays of monte_carlo_arc_delays by its own factors:
+    the column of an arc for its edges, and the column following the arcs of each
+    sequential node, in node order, for its clk-to-q arc. The edges of a level are
+    timed at once, and the latest of the edges into each row is kept.
+
+    Parameters:
+        arc_delays (dict): The result of monte_carlo_arc_delays.
+        scales (np.ndarray): The (samples, columns) result of sample_delay_scales.
+
+    Returns:
+        np.ndarray: The (samples, 2, rows) latest arrival time of each transition,
+                    -inf where the transition never arrives.
+    """
+    delay, timed = arc_delays["delay"], np.isfinite(arc_delays["delay"])
+    arrival = np.full((len(scales), 2, arc_delays["rows"]), -np.inf)
+    arrival[:, :, arc_delays["launch_row"]] = arc_delays["launch_latency"] + \
+        arc_delays["launch_delay"].T * scales[:, None, arc_delays["launch_column"]]
+
+    for start, end, groups, sinks in arc_delays["levels"]:
+        # (samples, edges, input transition, output transition) candidates
+        source = np.moveaxis(arrival[:, :, arc_delays["source"][start:end]], 1, 2)
+        candidate = (source + arc_delays["wire"][start:end])[..., None] + \
+            delay[start:end] * scales[:, arc_delays["arc"][start:end], None, None]
+        latest = np.where(timed[start:end], candidate, -np.inf).max(axis=2)
+        # the latest edge into each sink row of the level
+        latest = np.maximum.reduceat(latest, groups, axis=1)
+        arrival[:, :, sinks] = np.maximum(arrival[:, :, sinks], np.moveaxis(latest, 1, 2))
+    return arrival
+
+
+def monte_carlo_slacks(arc_delays: dict, required: dict, monte_carlo: dict) -> dict:
+    """
+    Accumulate the setup slack distribution of every check arc over the samples,
+    propagating the samples in blocks of monte_carlo['block_size'].
+
+    Each block is reduced to the slack accumulators (see accumulate_slacks) before the
+    next one is drawn, so the memory is bounded by the block size and the histograms
+    (HISTOGRAM_BINS counts per check), not by the number of samples. The samples vary
+    the delays at the nominal slews, and only the setup checks are timed.
+
+    Parameters:
+        arc_delays (dict): The result of monte_carlo_arc_delays.
+        required (dict): The result of monte_carlo_required_times.
+        monte_carlo (dict): The result of new_monte_carlo.
+
+    Returns:
+        dict: The slack accumulators of the checks, ordered as required['arc'], for
+              monte_carlo_statistics.
+    """
+    generators = tuple(
+        np.random.default_rng(child)
+        for child in np.random.SeedSequence(monte_carlo["seed"]).spawn(2)
+    )
+    accumulator = new_slack_accumulator(
+        required["slack"],
+        HISTOGRAM_SIGMAS * np.hypot(monte_carlo["global_sigma"], monte_carlo["local_sigma"])
+        * np.abs(required["arrival"]),
+    )
+    checked = np.isfinite(required["required"])
+    groups = np.r_[0, np.flatnonzero(np.diff(required["check"])) + 1]
+    for start in range(0, monte_carlo["samples"], monte_carlo["block_size"]):
+        samples = min(monte_carlo["block_size"], monte_carlo["samples"] - start)
+        scales = sample_delay_scales(generators, samples, arc_delays["columns"], monte_carlo)
+        arrival = propagate_monte_carlo_block(arc_delays, scales)
+        # (samples, pairs, transitions) slacks, the worst transition and tag of each check
+        slack = required["required"][None] - np.moveaxis(arrival[:, :, required["row"]], 1, 2)
+        slack = np.where(checked, slack, np.inf).min(axis=2)
+        if len(groups):
+            slack = np.minimum.reduceat(slack, groups, axis=1)
+        accumulate_slacks(accumulator, slack)
+    return accumulator
+
+
+def new_slack_accumulator(center: np.ndarray, spread: np.ndarray) -> dict:
+    """
+    Create the running statistics of the slacks of a set of checks.
+
+    Parameters:
+        center (np.ndarray): The expected slack of each check, the middle of its
+                             histogram.
+        spread (np.ndarray): The half width of the histogram of each check. The slacks
+                             outside fall in its first or last bin.
+
+    Returns:
+        dict: The accumulators filled by accumulate_slacks.
+    """
+    center = np.asarray(center, dtype=float)
+    spread = np.broadcast_to(np.asarray(spread, dtype=float), center.shape)
+    width = np.where(spread > 0, 2 * spread / HISTOGRAM_BINS, 1.0)
+    return {
+        "samples": 0,
+        "center": center,
+        "low": center - width * HISTOGRAM_BINS / 2,
+        "width": width,
+        "sum": np.zeros(len(center)),
+        "sum_squares": np.zeros(len(center)),
+        "met": np.zeros(len(center), dtype=np.int64),
+        "design_met": 0,
+        "worst": np.full(len(center), np.inf),
+        "best": np.full(len(center), -np.inf),
+        "histogram": np.zeros((len(center), HISTOGRAM_BINS), dtype=np.int32),
+    }
+
+
+def accumulate_slacks(accumulator: dict, slacks: np.ndarray) -> None:
+    """
+    Add a block of samples to the running statistics of the checks.
+
+    Parameters:
+        accumulator (dict): The result of new_slack_accumulator.
+        slacks (np.ndarray): The (samples, checks) slacks of the block.
+    """
+    deviation = slacks - accumulator["center"]
+    met = slacks >= 0
+    accumulator["samples"] += len(slacks)
+    accumulator["sum"] += deviation.sum(axis=0)
+    accumulator["sum_squares"] += (deviation ** 2).sum(axis=0)
+    accumulator["met"] += met.sum(axis=0)
+    accumulator["design_met"] += int(met.all(axis=1).sum())
+    np.minimum(accumulator["worst"], slacks.min(axis=0, initial=np.inf),
+               out=accumulator["worst"])
+    np.maximum(accumulator["best"], slacks.max(axis=0, initial=-np.inf),
+               out=accumulator["best"])
+    bins = np.clip(np.floor((slacks - accumulator["low"]) / accumulator["width"]),
+                   0, HISTOGRAM_BINS - 1).astype(np.int64)
+    flat = bins + HISTOGRAM_BINS * np.arange(slacks.shape[1])
+    np.add.at(accumulator["histogram"].reshape(-1), flat.ravel(), 1)
+
+
+def histogram_sample(accumulator: dict, index: int) -> np.ndarray:
+    """
+    Estimate the sample of each check at an index of the sorted samples, spreading the
+    samples of a histogram bin evenly over its width. The first and last samples are
+    the exact worst and best slacks.
+
+    Parameters:
+        accumulator (dict): The result of new_slack_accumulator.
+        index (int): The index in the sorted samples.
+
+    Returns:
+        np.ndarray: The estimated slack of each check.
+    """
+    if index <= 0:
+        return accumulator["worst"]
+    if index >= accumulator["samples"] - 1:
+        return accumulator["best"]
+    counts = accumulator["histogram"]
+    cumulative = counts.cumsum(axis=1)
+    bins = (cumulative <= index).sum(axis=1)
+    count = counts[np.arange(len(bins)), bins]
+    before = cumulative[np.arange(len(bins)), bins] - count
+    value = accumulator["low"] + accumulator["width"] * (bins + (index - before + 0.5) / count)
+    return np.clip(value, accumulator["worst"], accumulator["best"])
+
+
+def monte_carlo_statistics(accumulator: dict, percentiles: tuple = (1, 5, 50, 95)) -> dict:
+    """
+    Summarize the slack distribution of every check arc over the samples.
+
+    The mean, std and yields are exact, and the percentiles are interpolated between
+    the samples estimated from the slack histograms (see histogram_sample).
+
+    Parameters:
+        accumulator (dict): The result of monte_carlo_slacks (see accumulate_slacks).
+        percentiles (tuple): The slack percentiles to compute.
+
+    Returns:
+        dict: The percentiles, the (percentiles, checks) slack of each percentile
+              (slack_percentiles), the mean, std and yield (fraction of the samples
+              with a non-negative slack) of each check, and the design_yield (fraction
+              of the samples meeting every check).
+    """
+    percentiles = tuple(percentiles)
+    samples = accumulator["samples"]
+    mean = accumulator["sum"] / samples
+    slack_percentiles = np.empty((len(percentiles), len(mean)))
+    for row, percentile in enumerate(percentiles):
+        # numpy's linear method between the samples around the rank of the percentile
+        rank = percentile / 100 * (samples - 1)
+        below, above = (histogram_sample(accumulator, index)
+                        for index in (np.floor(rank), np.ceil(rank)))
+        slack_percentiles[row] = below + (above - below) * (rank - np.floor(rank))
+    return {
+        "percentiles": percentiles,
+        "slack_percentiles": slack_percentiles,
+        "mean": accumulator["center"] + mean,
+        "std": np.sqrt(np.maximum(accumulator["sum_squares"] / samples - mean ** 2, 0.0)),
+        "yield": accumulator["met"] / samples,
+        "design_yield": accumulator["design_met"] / samples,
+    }
@@ -0,0 +1,151 @@
+import numpy as np
+from ..utils import get_input_pin_name, get_output_capacitance
+
+# 10%-90% step response time of a single pole, in time constants
+WIRE_SLEW_FACTOR = np.log(9.0)
+
+
+def rc_tree_levels(level: np.ndarray) -> list:
+    """
+    Group the nodes of every RC tree by their level, to process all the nets at once.
+
+    Parameters:
+        level (np.ndarray): The level of each node in its tree (0 for the drivers).
+
+    Returns:
+        list: The node indices of each level, from the drivers down.
+    """
+    order = np.argsort(level, kind="stable")
+    bounds = np.searchsorted(level[order], np.arange(level.max() + 2 if len(level) else 1))
+    return [order[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+
+def compute_rc_moments(parasitics: dict, pin_caps: np.ndarray = None) -> dict:
+    """
+    Compute the Elmore delay of every node and the driving point admittance of every
+    subtree of the RC trees, level by level for all the nets together.
+
+    Going up the trees, each subtree admittance y1 s + y2 s^2 + y3 s^3 is summed into
+    its parent through the resistance between them. y1 is the downstream capacitance,
+    and the Elmore delay of a node, going down the trees, is the delay of its parent
+    plus its resistance times its downstream capacitance.
+
+    Parameters:
+        parasitics (dict): The RC trees returned by parse_spef.
+        pin_caps (np.ndarray, optional): The capacitance of the load pins on each node.
+
+    Returns:
+        dict: The (nodes,) arrays delay (Elmore delay from the driver), y1, y2 and y3.
+    """
+    y1 = np.array(parasitics["cap"], dtype=float)
+    if pin_caps is not None:
+        y1 += pin_caps
+    y2 = np.zeros_like(y1)
+    y3 = np.zeros_like(y1)
+    parent, resistance = parasitics["parent"], parasitics["resistance"]
+    levels = rc_tree_levels(parasitics["level"])
+
+    for nodes in reversed(levels[1:]):
+        r, a1, a2, a3 = resistance[nodes], y1[nodes], y2[nodes], y3[nodes]
+        np.add.at(y1, parent[nodes], a1)
+        np.add.at(y2, parent[nodes], a2 - r * a1 ** 2)
+        np.add.at(y3, parent[nodes], a3 - 2 * r * a1 * a2 + r ** 2 * a1 ** 3)
+
+    delay = np.zeros_like(y1)
+    for nodes in levels[1:]:
+        delay[nodes] = delay[parent[nodes]] + resistance[nodes] * y1[nodes]
+    return {"delay": delay, "y1": y1, "y2": y2, "y3": y3}
+
+
+def effective_capacitance(y1, y2, y3, transition=np.inf):
+    """
+    Compute the effective capacitance of RC loads driven with a ramp.
+
+    The driving point admittance is reduced to a pi model (near capacitance C1,
+    resistance R and far capacitance C2), and the far capacitance is shielded by the
+    resistance in proportion to the charge it still misses at the end of the ramp:
+    Ceff = C1 + C2 (1 - tau / T (1 - exp(-T / tau))) with tau = R C2. A purely
+    capacitive load, or an infinite transition T, gives the total capacitance.
+
+    Parameters:
+        y1, y2, y3 (np.ndarray): The driving point admittance moments of the loads.
+        transition (np.ndarray): The output transition time of the drivers.
+
+    Returns:
+        np.ndarray: The effective capacitance of each load.
+    """
+    y1, y2, y3 = np.broadcast_arrays(*(np.asarray(y, dtype=float) for y in (y1, y2, y3)))
+    resistive = (y2 < 0) & (y3 > 0)
+    ceff = y1.copy()
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        far = np.where(resistive, y2 ** 2 / y3, 0.0)
+        tau = np.where(resistive, -y3 ** 2 / y2 ** 3, 0.0) * far
+        ratio = np.broadcast_to(np.asarray(transition, dtype=float), y1.shape) / tau
+        missing = np.where(ratio > 0, -np.expm1(-ratio) / ratio, 1.0)
+    ceff[resistive] = y1[resistive] - far[resistive] * missing[resistive]
+    return ceff
+
+
+def compute_net_delays(
+    timing_graph: dict,
+    parasitics: dict,
+    library,
+    driver_transition: np.ndarray = None,
+) -> dict:
+    """
+    Annotate the timing graph arcs with the wire delays of the SPEF RC trees.
+
+    Every arc is matched to the SPEF node of its load pin ('instance:pin'), and the
+    Liberty capacitance of the load pins is added to their nodes. The wire delay of an
+    arc is the Elmore delay of its load pin, and its slew degradation is the 10%-90%
+    step response of that delay, which the propagation combines with the driver slew
+    as the root of the sum of squares (see get_wire_delay). The load of the driver of
+    every annotated net is its effective capacitance, given the output transition of
+    the driver. The Liberty capacitance of each cell pin is looked up once.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        parasitics (dict): The RC trees returned by parse_spef.
+        library: The parsed liberty library.
+        driver_transition (np.ndarray, optional): The output transition of each node,
+                                                  the total capacitance is used without.
+
+    Returns:
+        dict: The (arcs,) wire_delay and wire_slew, and the (nodes,) load of every
+              node (NaN for the nodes without annotated net, loaded by their pins).
+    """
+    names, cells, pins = timing_graph["names"], timing_graph["cells"], parasitics["pins"]
+    arc_node = np.full(len(timing_graph["arc_from"]), -1, dtype=np.int64)
+    load_pins = {}
+    for arc, (sink, arc_pin) in enumerate(zip(timing_graph["arc_to"], timing_graph["arc_pin"])):
+        if timing_graph["outputs"][sink] or arc_pin is None:
+            arc_node[arc] = pins.get(names[sink], -1)
+            continue
+        load_pin = names[sink] + parasitics["delimiter"] + get_input_pin_name(arc_pin)
+        arc_node[arc] = pins.get(load_pin, -1)
+        if arc_node[arc] >= 0:
+            load_pins.setdefault((cells[sink], arc_pin), []).append(arc_node[arc])
+
+    # the pin capacitance of every cell pin, added to the nodes of its load pins
+    pin_caps = np.zeros(len(parasitics["cap"]))
+    for (cell_name, arc_pin), nodes in load_pins.items():
+        pin_caps[nodes] = get_output_capacitance([f",{cell_name},{arc_pin}"], library)
+
+    moments = compute_rc_moments(parasitics, pin_caps)
+    annotated = np.flatnonzero(arc_node >= 0)
+    wire_delay = np.zeros(len(arc_node))
+    wire_delay[annotated] = moments["delay"][arc_node[annotated]]
+
+    # the root of the net of each annotated driver
+    load = np.full(len(names), np.nan)
+    drivers = timing_graph["arc_from"][annotated]
+    roots = parasitics["net_driver"][parasitics["net"][arc_node[annotated]]]
+    transition = np.inf if driver_transition is None else driver_transition[drivers]
+    load[drivers] = effective_capacitance(
+        moments["y1"][roots], moments["y2"][roots], moments["y3"][roots], transition
+    )
+    return {
+        "wire_delay": wire_delay,
+        "wire_slew": WIRE_SLEW_FACTOR * wire_delay,
+        "load": load,
+    }
@@ -0,0 +1,476 @@
+import numpy as np
+from ..utils import get_timing_sense
+from ..network.exceptions import advance_tag, is_false_tag, start_tag
+from .model import calculate_arc_delays, calculate_constraint_time
+from .propagation import (
+    TRANSITIONS,
+    TRANSITION_INDEX,
+    get_check_edges,
+    get_clk2q_timing,
+    get_node_load,
+)
+
+
+def get_node_loads(timing_graph: dict, fanout: dict[str, list[str]], library) -> np.ndarray:
+    """
+    Retrieve the load capacitance of every node of the timing graph.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        fanout (dict): The fanout dictionary returned by get_fanout_dict.
+        library: The parsed liberty library.
+
+    Returns:
+        np.ndarray: The load of each node, 0 for the design ports.
+    """
+    ports = timing_graph["inputs"] | timing_graph["outputs"]
+    return np.array([
+        0.0 if ports[node] or key not in fanout else get_node_load(fanout[key], library)
+        for node, key in enumerate(timing_graph["keys"])
+    ])
+
+
+def compute_slew_bounds(
+    timing_graph: dict,
+    loads: np.ndarray,
+    cell_pin_mapping: dict,
+    input_transition_time: float = 1.5,
+    cone: dict = None,
+) -> np.ndarray:
+    """
+    Compute, with a forward pass over the timing graph, the largest rise and fall slew
+    any path can have at each node.
+
+    The arrival propagation keeps the slew of the latest arrival, which can be smaller
+    than the slew of an earlier one, so the largest slews are propagated separately.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        loads (np.ndarray): The load of each node, as returned by get_node_loads.
+        cell_pin_mapping (dict): A dictionary containing timing data for each cell.
+        input_transition_time (float): The clock transition time at the flip-flops.
+        cone (dict, optional): The result of select_path_cone.
+
+    Returns:
+        np.ndarray: (2, nodes) slews indexed by TRANSITION_INDEX, nan for the
+                    transitions that never arrive.
+    """
+    slews = np.full((2, len(timing_graph["names"])), np.nan)
+    for node in range(len(timing_graph["names"])):
+        if timing_graph["inputs"][node] or timing_graph["outputs"][node]:
+            continue
+        if timing_graph["sequential"][node]:
+            if cone is None or cone["startpoints"][node]:
+                launched = evaluate_launch(
+                    timing_graph, node, loads, cell_pin_mapping, input_transition_time
+                )
+                for (_, _, trans_type), (transition_time, _) in launched.items():
+                    slews[TRANSITION_INDEX[trans_type], node] = transition_time
+            continue
+        for arc in timing_graph["fanin"][node]:
+            source = timing_graph["arc_from"][arc]
+            reached = np.flatnonzero(np.isfinite(slews[:, source]))
+            if not len(reached) or (cone is not None and not cone["arcs"][arc]):
+                continue
+            delays = evaluate_arc(
+                timing_graph, arc, cell_pin_mapping, loads,
+                [(TRANSITIONS[trans], slews[trans, source]) for trans in reached],
+            )
+            for (_, _, trans_out), (transition_time, _) in delays.items():
+                trans = TRANSITION_INDEX[trans_out]
+                slews[trans, node] = np.fmax(slews[trans, node], transition_time)
+    return slews
+
+
+def get_bound_edge(exception_index: dict, clock_period: float) -> float:
+    """
+    Find the earliest setup capture edge any path can have, so that the required time
+    bounds hold whatever timing exception a path matches.
+
+    Parameters:
+        exception_index (dict): The result of build_exception_index, or None.
+        clock_period (float): The clock period.
+
+    Returns:
+        float: The earliest setup capture edge.
+    """
+    edges = [clock_period]
+    for exception in exception_index["exceptions"] if exception_index else ():
+        if exception["setup"] and exception["type"] == "max_delay":
+            edges.append(exception["value"])
+        elif exception["setup"] and exception["type"] == "multicycle_path":
+            edges.append(exception["value"] * clock_period)
+    return min(edges)
+
+
+def compute_required_bounds(
+    timing_graph: dict,
+    slews: np.ndarray,
+    loads: np.ndarray,
+    cell_pin_mapping: dict,
+    library,
+    related_pin_time: float = 0.04,
+    clock_network_delay: float = 0.0,
+    clock_uncertainty: float = 0.3,
+    clock_period: float = 10.0,
+    cone: dict = None,
+    exception_index: dict = None,
+) -> np.ndarray:
+    """
+    Compute, with a backward pass over the timing graph, the latest time a transition
+    can arrive at each node without any path through it violating its setup check.
+
+    The arc delays and the setup times are evaluated with the largest slew of each node
+    (see compute_slew_bounds), which no single path through the node exceeds. As the
+    delay and constraint
+    tables grow with the input slew, the required time of a node is a lower bound of the
+    required time of every path through it, and a partial path whose arrival is already
+    later than the required time minus a slack threshold can be discarded.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        slews (np.ndarray): The result of compute_slew_bounds.
+        loads (np.ndarray): The load of each node, as returned by get_node_loads.
+        cell_pin_mapping (dict): A dictionary containing timing data for each cell.
+        library: The parsed liberty library.
+        related_pin_time (float): The related pin transition time of the checks.
+        clock_network_delay (float): The clock network delay.
+        clock_uncertainty (float): The setup clock uncertainty.
+        clock_period (float): The clock period.
+        cone (dict, optional): The result of select_path_cone.
+        exception_index (dict, optional): The result of build_exception_index.
+
+    Returns:
+        np.ndarray: (2, nodes) required times indexed by TRANSITION_INDEX, infinite for
+                    the transitions from which no checked path starts.
+    """
+    capture_edge = get_bound_edge(exception_index, clock_period)
+    required = np.full((2, len(timing_graph["names"])), np.inf)
+    for node in reversed(range(len(timing_graph["names"]))):
+        reached = np.flatnonzero(np.isfinite(slews[:, node]))
+        if not len(reached):
+            continue
+        for arc in timing_graph["fanout"][node]:
+            if cone is not None and not cone["arcs"][arc]:
+                continue
+            sink = timing_graph["arc_to"][arc]
+            if timing_graph["sequential"][sink]:
+                if cone is not None and not cone["endpoints"][sink]:
+                    continue
+                for trans in reached:
+                    setup = np.asarray(calculate_constraint_time(
+                        cell_name=timing_graph["cells"][sink],
+                        checking_type="setup_checking",
+                        input_pin="D",
+                        library_name=library,
+                        constrained_pin_transition=slews[trans, node],
+                        related_pin_transition=related_pin_time,
+                    )).item()
+                    check = capture_edge - clock_network_delay - clock_uncertainty - setup
+                    required[trans, node] = min(required[trans, node], check)
+            elif not timing_graph["outputs"][sink]:
+                delays = evaluate_arc(
+                    timing_graph, arc, cell_pin_mapping, loads,
+                    [(TRANSITIONS[trans], slews[trans, node]) for trans in reached],
+                )
+                for (trans_type, _, trans_out), (_, delay) in delays.items():
+                    trans = TRANSITION_INDEX[trans_type]
+                    required[trans, node] = min(
+                        required[trans, node],
+                        required[TRANSITION_INDEX[trans_out], sink] - delay,
+                    )
+    return required
+
+
+def evaluate_arc(
+    timing_graph: dict,
+    arc: int,
+    cell_pin_mapping: dict,
+    loads: np.ndarray,
+    input_transitions: list,
+) -> dict:
+    """
+    Interpolate the delays of a combinational arc for some input transitions.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        arc (int): The arc index.
+        cell_pin_mapping (dict): A dictionary containing timing data for each cell.
+        loads (np.ndarray): The load of each node, as returned by get_node_loads.
+        input_transitions (list): (transition type, slew) pairs at the arc input.
+
+    Returns:
+        dict: The result of calculate_arc_delays.
+
+    Raises:
+        ValueError: If the arc input pin is not found for the sink cell.
+    """
+    sink = timing_graph["arc_to"][arc]
+    cell_name = timing_graph["cells"][sink]
+    input_pin = timing_graph["arc_pin"][arc]
+    if input_pin not in cell_pin_mapping.get(cell_name, {}):
+        raise ValueError(f"Input pin name '{input_pin}' not found for cell '{cell_name}'.")
+    return calculate_arc_delays(
+        timing_data=cell_pin_mapping[cell_name][input_pin],
+        input_transitions=input_transitions,
+        output_capacitance=loads[sink],
+        timing_sense=get_timing_sense(
+            cell_name=cell_name, input_pin_name=input_pin, cells_info=cell_pin_mapping
+        ),
+    )
+
+
+def evaluate_launch(
+    timing_graph: dict,
+    node: int,
+    loads: np.ndarray,
+    cell_pin_mapping: dict,
+    input_transition_time: float,
+) -> dict:
+    """
+    Interpolate the rise and fall clk-to-q delays of a sequential node.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        node (int): The sequential node.
+        loads (np.ndarray): The load of each node, as returned by get_node_loads.
+        cell_pin_mapping (dict): A dictionary containing timing data for each cell.
+        input_transition_time (float): The clock transition time at the flip-flop.
+
+    Returns:
+        dict: The result of calculate_arc_delays.
+    """
+    return calculate_arc_delays(
+        timing_data=get_clk2q_timing(cell_pin_mapping, timing_graph["cells"][node]),
+        input_transitions=[("rise", input_transition_time)],
+        output_capacitance=loads[node],
+        timing_sense="non_unate",
+    )
+
+
+def search_critical_paths(
+    timing_graph: dict,
+    required: np.ndarray,
+    loads: np.ndarray,
+    cell_pin_mapping: dict,
+    library,
+    slack_threshold: float,
+    input_transition_time: float = 1.5,
+    related_pin_time: float = 0.04,
+    clock_network_delay: float = 0.0,
+    clock_uncertainty: float = 0.3,
+    clock_period: float = 10.0,
+    cone: dict = None,
+    exception_index: dict = None,
+) -> dict:
+    """
+    Enumerate, with a branch and bound depth first search, the setup paths whose slack is
+    lower than a threshold.
+
+    Every partial path is timed exactly, with the slews along the path, and is only
+    extended while the required time bound of its last node (see compute_required_bounds)
+    minus its arrival stays lower than the threshold, so the paths with a large slack are
+    never built. A path is a sequence of nodes together with the transition at each node.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        required (np.ndarray): The result of compute_required_bounds.
+        loads (np.ndarray): The load of each node, as returned by get_node_loads.
+        cell_pin_mapping (dict): A dictionary containing timing data for each cell.
+        library: The parsed liberty library.
+        slack_threshold (float): Only the paths with a lower slack are returned.
+        input_transition_time (float): The clock transition time at the flip-flops.
+        related_pin_time (float): The related pin transition time of the checks.
+        clock_network_delay (float): The clock network delay.
+        clock_uncertainty (float): The setup clock uncertainty.
+        clock_period (float): The clock period.
+        cone (dict, optional): The result of select_path_cone.
+        exception_index (dict, optional): The result of build_exception_index.
+
+    Returns:
+        dict: A dictionary containing the following keys:
+            paths (list): one dictionary per path with its nodes (startpoint to capturing
+                flip-flop), the arrivals at each node but the last, transition (at the
+                check), setup, capture_edge and slack.
+            expanded (int): the number of partial paths extended.
+            pruned (int): the number of partial paths discarded by the bound.
+    """
+    search = {
+        "timing_graph": timing_graph,
+        "required": required,
+        "loads": loads,
+        "cell_pin_mapping": cell_pin_mapping,
+        "library": library,
+        "exception_index": exception_index,
+        "slack_threshold": slack_threshold,
+        "related_pin_time": related_pin_time,
+        "check_offset": clock_network_delay + clock_uncertainty,
+        "clock_period": clock_period,
+        "cone": cone,
+        "paths": [],
+        "expanded": 0,
+        "pruned": 0,
+    }
+    startpoints = timing_graph["sequential"] if cone is None \
+        else timing_graph["sequential"] & cone["startpoints"]
+    for start in np.flatnonzero(startpoints):
+        stack = launch_search(search, start, input_transition_time)
+        while stack:
+            node, trans, slew, tag, nodes, arrivals = stack.pop()
+            if required[trans, node] - arrivals[-1] >= slack_threshold:
+                search["pruned"] += 1
+                continue
+            search["expanded"] += 1
+            for arc in timing_graph["fanout"][node]:
+                if cone is None or cone["arcs"][arc]:
+                    stack.extend(extend_search(search, arc, trans, slew, tag, nodes, arrivals))
+
+    return {name: search[name] for name in ("paths", "expanded", "pruned")}
+
+
+def launch_search(search: dict, start: int, input_transition_time: float) -> list:
+    """
+    Create the partial paths made of the rise and fall launch of a startpoint.
+
+    Parameters:
+        search (dict): The state of search_critical_paths.
+        start (int): The sequential startpoint.
+        input_transition_time (float): The clock transition time at the flip-flop.
+
+    Returns:
+        list: The (node, transition, slew, tag, nodes, arrivals) partial paths.
+    """
+    exception_index = search["exception_index"]
+    tag = start_tag(exception_index, start) if exception_index else ()
+    if exception_index and is_false_tag(exception_index, tag, "setup"):
+        return []
+    launched = evaluate_launch(
+        search["timing_graph"], start, search["loads"], search["cell_pin_mapping"],
+        input_transition_time,
+    )
+    return [
+        (start, TRANSITION_INDEX[trans_type], transition_time, tag, (start,), (delay,))
+        for (_, _, trans_type), (transition_time, delay) in launched.items()
+    ]
+
+
+def extend_search(
+    search: dict,
+    arc: int,
+    trans: int,
+    slew: float,
+    tag: tuple,
+    nodes: tuple,
+    arrivals: tuple,
+) -> list:
+    """
+    Extend a partial path through an arc, or check it when the arc ends at a flip-flop.
+
+    Parameters:
+        search (dict): The state of search_critical_paths.
+        arc (int): The arc leaving the last node of the partial path.
+        trans (int): The transition at the last node.
+        slew (float): The slew at the last node.
+        tag (tuple): The exception tag of the partial path.
+        nodes (tuple): The nodes of the partial path.
+        arrivals (tuple): The arrival at each node of the partial path.
+
+    Returns:
+        list: The extended partial paths.
+    """
+    timing_graph = search["timing_graph"]
+    sink = timing_graph["arc_to"][arc]
+    if timing_graph["sequential"][sink]:
+        if search["cone"] is None or search["cone"]["endpoints"][sink]:
+            check_searched_path(search, sink, trans, slew, tag, nodes, arrivals)
+        return []
+    if timing_graph["outputs"][sink]:
+        return []
+
+    exception_index = search["exception_index"]
+    if exception_index:
+        tag = advance_tag(exception_index, tag, sink)
+        if is_false_tag(exception_index, tag, "setup"):
+            return []
+    delays = evaluate_arc(
+        timing_graph, arc, search["cell_pin_mapping"], search["loads"],
+        [(TRANSITIONS[trans], slew)],
+    )
+    return [
+        (sink, TRANSITION_INDEX[trans_out], transition_time, tag,
+         nodes + (sink,), arrivals + (arrivals[-1] + delay,))
+        for (_, _, trans_out), (transition_time, delay) in delays.items()
+    ]
+
+
+def check_searched_path(
+    search: dict,
+    endpoint: int,
+    trans: int,
+    slew: float,
+    tag: tuple,
+    nodes: tuple,
+    arrivals: tuple,
+) -> None:
+    """
+    Time the setup check of a complete path and keep it if its slack is below the threshold
+    (see extend_search for the parameters).
+    """
+    setup_edge, _ = get_check_edges(
+        search["exception_index"], tag, endpoint, search["clock_period"]
+    )
+    if setup_edge is None:
+        return
+    setup = np.asarray(calculate_constraint_time(
+        cell_name=search["timing_graph"]["cells"][endpoint],
+        checking_type="setup_checking",
+        input_pin="D",
+        library_name=search["library"],
+        constrained_pin_transition=slew,
+        related_pin_transition=search["related_pin_time"],
+    )).item()
+    slack = setup_edge - search["check_offset"] - setup - arrivals[-1]
+    if slack < search["slack_threshold"]:
+        search["paths"].append({
+            "nodes": nodes + (endpoint,),
+            "arrivals": arrivals,
+            "transition": trans,
+            "setup": setup,
+            "capture_edge": setup_edge,
+            "slack": slack,
+        })
+
+
+def format_searched_paths(timing_graph: dict, searched: dict, top_k: int = 100) -> dict:
+    """
+    Convert the searched paths into the format of extract_worst_paths, keeping the worst
+    transition of each sequence of nodes.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        searched (dict): The result of search_critical_paths.
+        top_k (int): The number of paths to keep, worst slack first.
+
+    Returns:
+        dict: A dictionary containing the following keys:
+            paths (dict): the path delays, ready for generate_timing_report.
+            capture_edges (dict): the capture edge of each path.
+    """
+    worst = {}
+    for path in sorted(searched["paths"], key=lambda path: path["slack"]):
+        worst.setdefault(path["nodes"], path)
+
+    keys = timing_graph["keys"]
+    paths_delay = {}
+    capture_edges = {}
+    for path_index, path in enumerate(list(worst.values())[:top_k]):
+        path_key = f"path{path_index + 1}"
+        paths_delay[path_key] = {}
+        previous = 0.0
+        for node, arrival in zip(path["nodes"][:-1], path["arrivals"]):
+            paths_delay[path_key][keys[node]] = round(arrival - previous, 6)
+            previous = arrival
+        paths_delay[path_key][f"{keys[path['nodes'][-1]]},end"] = round(path["setup"], 6)
+        capture_edges[path_key] = float(path["capture_edge"])
+
+    return {"paths": paths_delay, "capture_edges": capture_edges}
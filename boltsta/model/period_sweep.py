@@ -0,0 +1,180 @@
+import numpy as np
+from .cppr import cppr_credit
+from .propagation import (
+    LATE, EARLY, get_arrival_entries, get_check_edges, get_constraint_times, get_wire_delay,
+)
+from .domain_analysis import propagate_domain_arrivals
+
+
+def setup_slack_terms(
+    timing_graph: dict,
+    propagated: dict,
+    library,
+    related_pin_time: float = 0.04,
+    clock_network_delay: float = 0.0,
+    cone: dict = None,
+    clock_latency: dict = None,
+) -> dict:
+    """
+    Split the setup slack of every check arc into the terms linear in the clock period.
+
+    Only the required times depend on the clock period and the setup uncertainty: each
+    tag and transition reaching a check arc gives a slack of offset + multiplier x
+    period - uncertainty, where the multiplier is the multicycle setup multiplier (1
+    without exception, 0 for a max delay) and the offset holds the arrival, the setup
+    time and the clock latencies. The slack of the check arc is the minimum of its terms.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        propagated (dict): The result of propagate_arrival_times.
+        library: The parsed liberty library.
+        related_pin_time (float): The related pin transition time of the checks.
+        clock_network_delay (float): The clock network delay.
+        cone (dict, optional): The result of select_path_cone. Only the check arcs of
+                               the cone into its endpoints are evaluated.
+        clock_latency (dict, optional): The result of compute_clock_latencies.
+
+    Returns:
+        dict: Arrays with one entry per term, ordered by check arc: arc, multiplier and
+              offset.
+    """
+    exception_index = propagated.get("exception_index")
+    cppr_index = None if clock_latency is None else clock_latency.get("cppr")
+    terms = {"arc": [], "multiplier": [], "offset": []}
+    for arc, (source, sink) in enumerate(zip(timing_graph["arc_from"], timing_graph["arc_to"])):
+        if not timing_graph["sequential"][sink]:
+            continue
+        if cone is not None and not (cone["arcs"][arc] and cone["endpoints"][sink]):
+            continue
+        capture_latency = 0.0 if clock_latency is None else clock_latency["latency"][EARLY, sink]
+        wire_delay, wire_slew = get_wire_delay(propagated, arc)
+        for tag, entry in get_arrival_entries(propagated, source):
+            # the setup edge is linear in the period: its value at 0 and its slope
+            fixed, _ = get_check_edges(exception_index, tag, sink, 0.0)
+            if fixed is None:
+                continue
+            multiplier = get_check_edges(exception_index, tag, sink, 1.0)[0] - fixed
+            for trans in np.flatnonzero(np.isfinite(entry["arrival"][LATE])):
+                setup, _ = get_constraint_times(
+                    timing_graph, propagated, arc, library, trans,
+                    np.hypot(entry["slew"][:, trans], wire_slew), related_pin_time,
+                )
+                credit = cppr_credit(cppr_index, entry["launch"][LATE, trans], sink)
+                terms["arc"].append(arc)
+                terms["multiplier"].append(multiplier)
+                terms["offset"].append(
+                    fixed + capture_latency + credit - clock_network_delay - setup
+                    - entry["arrival"][LATE, trans] - wire_delay[LATE, trans]
+                )
+    return {
+        "arc": np.array(terms["arc"], dtype=np.int64),
+        "multiplier": np.array(terms["multiplier"], dtype=float),
+        "offset": np.array(terms["offset"], dtype=float),
+    }
+
+
+def sweep_setup_slack(terms: dict, periods, uncertainties) -> dict:
+    """
+    Evaluate the setup slack of every check arc for a grid of clock periods and setup
+    uncertainties in one broadcast, without propagating the arrival times again.
+
+    Parameters:
+        terms (dict): The result of setup_slack_terms.
+        periods (list): The clock periods of the sweep.
+        uncertainties (list): The setup clock uncertainties of the sweep.
+
+    Returns:
+        dict: A dictionary containing the periods and uncertainties of the sweep, and
+              the (periods, uncertainties) arrays wns (worst slack), tns (sum of the
+              negative slacks) and violations (number of check arcs with a negative
+              slack), with the number of checked endpoints.
+    """
+    periods = np.asarray(periods, dtype=float)
+    uncertainties = np.asarray(uncertainties, dtype=float)
+    if periods.ndim != 1 or uncertainties.ndim != 1:
+        raise ValueError("The periods and uncertainties must be one dimensional.")
+    if np.any(periods <= 0):
+        raise ValueError("Clock periods must be positive.")
+
+    shape = (len(periods), len(uncertainties))
+    if not len(terms["arc"]):
+        return {
+            "periods": periods, "uncertainties": uncertainties, "wns": np.full(shape, np.inf),
+            "tns": np.zeros(shape), "violations": np.zeros(shape, dtype=np.int64), "endpoints": 0,
+        }
+
+    # (terms, periods, uncertainties) slacks, reduced to the worst term of each check arc
+    slack = terms["offset"][:, None, None] + terms["multiplier"][:, None, None] * \
+        periods[None, :, None] - uncertainties[None, None, :]
+    starts = np.flatnonzero(np.r_[True, terms["arc"][1:] != terms["arc"][:-1]])
+    slack = np.minimum.reduceat(slack, starts, axis=0)
+    return {
+        "periods": periods,
+        "uncertainties": uncertainties,
+        "wns": slack.min(axis=0),
+        "tns": np.minimum(slack, 0.0).sum(axis=0),
+        "violations": (slack < 0).sum(axis=0),
+        "endpoints": len(starts),
+    }
+
+
+def minimum_period(terms: dict, uncertainties) -> np.ndarray:
+    """
+    Compute the exact minimum clock period meeting every setup check.
+
+    Every term must keep offset + multiplier x period - uncertainty >= 0, so the period
+    is the largest (uncertainty - offset) / multiplier. A term that does not scale with
+    the period (a max delay) and violates its check makes the checks unachievable.
+
+    Parameters:
+        terms (dict): The result of setup_slack_terms.
+        uncertainties (list): The setup clock uncertainties.
+
+    Returns:
+        np.ndarray: The minimum period for each uncertainty, 0 without a period
+                    dependent check and inf when no period meets the checks.
+    """
+    uncertainties = np.asarray(uncertainties, dtype=float)
+    scaled = terms["multiplier"] > 0
+    bounds = (uncertainties[:, None] - terms["offset"][None, scaled]) / \
+        terms["multiplier"][None, scaled]
+    period = np.maximum(bounds.max(axis=1, initial=0.0), 0.0)
+    fixed = terms["offset"][~scaled]
+    unachievable = (fixed[None, :] < uncertainties[:, None]).any(axis=1)
+    return np.where(unachievable, np.inf, period)
+
+
+def sweep_launch_domain(
+    task: dict,
+    shared: dict,
+    launch: str,
+    periods,
+    uncertainties,
+) -> dict:
+    """
+    Sweep the paths launched and captured by one clock domain of a multi-clock design.
+
+    The paths crossing to another clock are not swept: their capture edge depends on
+    both waveforms.
+
+    Parameters:
+        task (dict): The task of the launch clock, see build_domain_tasks.
+        shared (dict): The data shared by the clock domains, see analyze_launch_domain.
+        launch (str): The name of the launch clock.
+        periods (list): The clock periods of the sweep.
+        uncertainties (list): The setup clock uncertainties of the sweep.
+
+    Returns:
+        dict: The result of sweep_setup_slack, with the minimum_period of each
+              uncertainty.
+    """
+    timing_graph = shared["timing_graph"]
+    propagated = propagate_domain_arrivals(task, shared)
+    cone = dict(task["cone"], endpoints=task["cone"]["endpoints"] & task["capture_masks"][launch])
+    terms = setup_slack_terms(
+        timing_graph, propagated, shared["library"], shared["related_pin_time"], 0.0, cone,
+        shared.get("clock_latency"),
+    )
+    sweep = sweep_setup_slack(terms, periods, uncertainties)
+    sweep["minimum_period"] = minimum_period(terms, uncertainties)
+    return sweep
@@ -0,0 +1,353 @@
+import numpy as np
+from ..utils import interpolate_2d_points, get_timing_sense
+from ..readers.pocv_reader import pocv_coefficient
+from .model import get_output_transitions
+from .propagation import (
+    LATE, EARLY, ANALYSES, ANALYSIS_INDEX, TRANSITIONS, TRANSITION_INDEX, get_clk2q_timing,
+    get_arrival_entries, get_arrival_entry, get_launch_tag, get_node_derates,
+    get_propagated_load, get_sdf_delays, get_sink_tag, get_wire_delay,
+)
+
+# Direction in which each analysis moves the n-sigma arrival: later for setup, earlier for hold
+SIGMA_SIGNS = np.array([1.0, -1.0])[:, None]
+
+
+def calculate_pocv_arc_delays(
+    timing_data: dict,
+    output_transition: str,
+    input_transition_times: np.ndarray,
+    output_capacitance: float,
+    coefficients: tuple = (0.0, 0.0),
+) -> tuple:
+    """
+    Evaluate the mean delay, its sigma and the output transition of one output
+    transition of an arc at the late and early input slews.
+
+    The sigma of each analysis comes from the Liberty variation tables of the arc
+    (ocv_sigma_cell_rise_late, or ocv_sigma_cell_rise for both analyses), and otherwise
+    from the POCV coefficient of the cell times the mean delay.
+
+    Parameters:
+        timing_data (dict): A compiled arc (see compile_timing_arc).
+        output_transition (str): 'rise' or 'fall'.
+        input_transition_times (np.ndarray): (2, points) input slews, indexed by
+                                             ANALYSIS_INDEX on the first axis.
+        output_capacitance (float): The load of the arc.
+        coefficients (tuple): The late and early POCV coefficient of the cell.
+
+    Returns:
+        tuple: The (2, points) output transition times, mean delays and delay sigmas.
+    """
+    slews = np.asarray(input_transition_times, dtype=float)
+    out_slew, delay = (
+        interpolate_2d_points(table["index_1"], table["index_2"], table["values"],
+                              slews.ravel(), output_capacitance).reshape(slews.shape)
+        for table in (timing_data[f"{output_transition}_transition"],
+                      timing_data[f"cell_{output_transition}"])
+    )
+    sigma = np.empty_like(delay)
+    for analysis, name in enumerate(ANALYSES):
+        table = timing_data.get(f"ocv_sigma_cell_{output_transition}_{name}",
+                                timing_data.get(f"ocv_sigma_cell_{output_transition}"))
+        if table is None:
+            sigma[analysis] = coefficients[analysis] * np.abs(delay[analysis])
+        else:
+            sigma[analysis] = interpolate_2d_points(table["index_1"], table["index_2"],
+                                                    table["values"], slews[analysis],
+                                                    output_capacitance)
+    return out_slew, delay, sigma
+
+
+def propagate_pocv_arrivals(
+    timing_graph: dict,
+    fanout: dict,
+    cell_pin_mapping: dict,
+    library,
+    input_transition_time: float = 1.5,
+    n_sigma: float = 3.0,
+    coefficients: list = None,
+    cone: dict = None,
+    clock_latency: dict = None,
+    exception_index: dict = None,
+    derates: np.ndarray = None,
+    net_delays: dict = None,
+    sdf_delays: dict = None,
+) -> dict:
+    """
+    Propagate the mean and variance of the latest and earliest arrival times through
+    the timing graph (parametric on-chip variation).
+
+    Every arc delay is a Gaussian variable with the mean delay of the Liberty tables and
+    the sigma of calculate_pocv_arc_delays, and the arc delays are independent: along a
+    path the means and the variances add up. Each node keeps, per analysis and
+    transition, the arrival whose n-sigma value (mean + n_sigma * sigma for setup,
+    mean - n_sigma * sigma for hold) is the worst. Every arc is evaluated for both
+    analyses and all its input transitions at once, with NumPy arithmetic on the mean
+    and variance arrays.
+
+    The n-sigma arrivals are stored as the arrival of the result, laid out as the
+    result of propagate_arrival_times, so evaluate_endpoints gives the n-sigma slack of
+    every check and extract_worst_paths its n-sigma path. The exception tags, wire
+    delays and net loads are those of propagate_arrival_times. The derates scale the
+    mean and the sigma of the cell delays, and the SDF annotated delays replace the mean
+    delays, their sigma still coming from the Liberty tables.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        fanout (dict): The fanout dictionary returned by get_fanout_dict.
+        cell_pin_mapping (dict): The compiled timing arcs of compile_cell_pin_mapping.
+        library: The parsed liberty library.
+        input_transition_time (float): The clock transition time at the flip-flops.
+        n_sigma (float): The number of sigmas of the reported arrivals.
+        coefficients (list, optional): The result of parse_pocv_coefficients, for the
+                                       cells without variation tables.
+        cone (dict, optional): The result of select_path_cone.
+        clock_latency (dict, optional): The result of compute_clock_latencies. The
+                                        launch latency is added to the mean arrival.
+        exception_index (dict, optional): The result of build_exception_index.
+        derates (np.ndarray, optional): The result of build_node_derates.
+        net_delays (dict, optional): The result of compute_net_delays.
+        sdf_delays (dict, optional): The result of annotate_sdf_delays.
+
+    Returns:
+        dict: The (2, 2, nodes) arrival, slew, pred_arc, pred_transition and launch
+              arrays and tagged entries of propagate_arrival_times, the mean and
+              variance of each arrival, and n_sigma.
+    """
+    if input_transition_time < 0:
+        raise ValueError("Input transition time must be non-negative.")
+    if n_sigma < 0:
+        raise ValueError("The number of sigmas must be non-negative.")
+
+    num_nodes = len(timing_graph["names"])
+    arrival = np.empty((2, 2, num_nodes))
+    arrival[LATE] = -np.inf
+    arrival[EARLY] = np.inf
+    propagated = {
+        "arrival": arrival,
+        "mean": arrival.copy(),
+        "variance": np.zeros((2, 2, num_nodes)),
+        "slew": np.zeros((2, 2, num_nodes)),
+        "pred_arc": np.full((2, 2, num_nodes), -1, dtype=np.int64),
+        "pred_transition": np.full((2, 2, num_nodes), -1, dtype=np.int64),
+        "launch": np.full((2, 2, num_nodes), -1, dtype=np.int64),
+        "tagged": {},
+        "exception_index": exception_index,
+        "delay_cache": None,
+        "derates": derates,
+        "net_delays": net_delays,
+        "sdf_delays": sdf_delays,
+        "n_sigma": n_sigma,
+    }
+
+    sequential = timing_graph["sequential"]
+    skipped = timing_graph["inputs"] | timing_graph["outputs"]
+    if cone is not None:
+        skipped = skipped | ~cone["nodes"] | (sequential & ~cone["startpoints"])
+
+    # the late and early coefficient of every timed cell, looked up once
+    cell_coefficients = {
+        cell_name: tuple(pocv_coefficient(coefficients, cell_name, name) or 0.0
+                         for name in ANALYSES)
+        for cell_name in {timing_graph["cells"][node] for node in np.flatnonzero(~skipped)}
+    }
+    for node in range(num_nodes):
+        if skipped[node]:
+            continue
+        cell_name = timing_graph["cells"][node]
+        out_cap = get_propagated_load(propagated, timing_graph, fanout, library, node)
+
+        if sequential[node]:
+            latency, clock_slew = np.zeros(2), input_transition_time
+            if clock_latency is not None:
+                latency = clock_latency["latency"][:, node]
+                clock_slew = clock_latency["slew"][LATE, node]
+            launch_pocv_arrival(propagated, node, get_clk2q_timing(cell_pin_mapping, cell_name),
+                                clock_slew, out_cap, latency, cell_coefficients[cell_name])
+            continue
+
+        for arc in timing_graph["fanin"][node]:
+            if cone is None or cone["arcs"][arc]:
+                propagate_pocv_arc(propagated, timing_graph, arc, cell_pin_mapping, out_cap,
+                                   cell_coefficients[cell_name])
+
+    return propagated
+
+
+def annotate_pocv_delays(delay: np.ndarray, annotated, trans_out: int) -> np.ndarray:
+    """
+    Replace the mean delays of an output transition by their SDF annotated values.
+
+    Parameters:
+        delay (np.ndarray): The (2, points) mean delays of calculate_pocv_arc_delays.
+        annotated (np.ndarray): The result of get_sdf_delays, or None.
+        trans_out (int): The output transition index.
+
+    Returns:
+        np.ndarray: The delays, annotated where the SDF gives a value.
+    """
+    if annotated is None:
+        return delay
+    values = annotated[:, trans_out, None]
+    return np.where(np.isfinite(values), values, delay)
+
+
+def launch_pocv_arrival(
+    propagated: dict,
+    node: int,
+    timing_data: dict,
+    input_transition_time: float,
+    output_capacitance: float,
+    latency: np.ndarray,
+    coefficients: tuple,
+) -> None:
+    """
+    Launch both transitions of a sequential node through its clk-to-q arc, with the
+    mean and variance of the clk-to-q delay.
+
+    Parameters:
+        propagated (dict): The arrays being filled by propagate_pocv_arrivals.
+        node (int): The sequential node.
+        timing_data (dict): The compiled clk-to-q arc of the node.
+        input_transition_time (float): The clock transition time at the flip-flop.
+        output_capacitance (float): The load of the node.
+        latency (np.ndarray): The late and early clock latency of the node.
+        coefficients (tuple): The late and early POCV coefficient of the cell.
+    """
+    tag, blocked = get_launch_tag(propagated, node)
+    rows = np.array([analysis for analysis in (LATE, EARLY) if analysis not in blocked])
+    if not len(rows):
+        return
+    entry = get_arrival_entry(propagated, node, tag, create=True)
+    annotated = get_sdf_delays(propagated, "launch_delay", node)
+    scale = get_node_derates(propagated, node)
+    for trans_type in TRANSITIONS:
+        out_slew, delay, sigma = calculate_pocv_arc_delays(
+            timing_data, trans_type, np.full((2, 1), input_transition_time),
+            output_capacitance, coefficients,
+        )
+        trans_out = TRANSITION_INDEX[trans_type]
+        delay = annotate_pocv_delays(delay, annotated, trans_out)[:, 0] * scale
+        sigma = sigma[:, 0] * scale
+        mean = np.asarray(latency, dtype=float) + delay
+        arrival = mean + SIGMA_SIGNS[:, 0] * propagated["n_sigma"] * sigma
+        entry["mean"][rows, trans_out] = mean[rows]
+        entry["variance"][rows, trans_out] = sigma[rows] ** 2
+        entry["arrival"][rows, trans_out] = arrival[rows]
+        entry["slew"][rows, trans_out] = out_slew[rows, 0]
+        entry["launch"][rows, trans_out] = node
+
+
+def propagate_pocv_arc(
+    propagated: dict,
+    timing_graph: dict,
+    arc: int,
+    cell_pin_mapping: dict,
+    output_capacitance: float,
+    coefficients: tuple = (0.0, 0.0),
+) -> None:
+    """
+    Update the mean and variance of the arrivals at the sink of an arc, keeping for each
+    tag, analysis and output transition the input transition with the worst n-sigma
+    arrival.
+
+    Parameters:
+        propagated (dict): The arrays being filled by propagate_pocv_arrivals.
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        arc (int): The arc to propagate through.
+        cell_pin_mapping (dict): The compiled timing arcs of compile_cell_pin_mapping.
+        output_capacitance (float): The load of the arc sink.
+        coefficients (tuple): The late and early POCV coefficient of the sink cell.
+
+    Raises:
+        ValueError: If the arc input pin is not found for the sink cell.
+    """
+    source = timing_graph["arc_from"][arc]
+    node = timing_graph["arc_to"][arc]
+    cell_name = timing_graph["cells"][node]
+    input_pin = timing_graph["arc_pin"][arc]
+    if input_pin not in cell_pin_mapping.get(cell_name, {}):
+        raise ValueError(f"Input pin name '{input_pin}' not found for cell '{cell_name}'.")
+    time_sense = get_timing_sense(cell_pin_mapping, cell_name, input_pin)
+    wire_delay, wire_slew = get_wire_delay(propagated, arc)
+    annotated = get_sdf_delays(propagated, "cell_delay", arc)
+    scale = get_node_derates(propagated, node)[:, None]
+    analyses = np.arange(2)
+
+    for tag, entry in get_arrival_entries(propagated, source):
+        sink_tag, blocked = get_sink_tag(propagated, tag, node)
+        open_analyses = ~np.isin(analyses, blocked)
+        for trans_type in TRANSITIONS:
+            trans_ins = np.array([
+                trans_in for trans_in in range(2)
+                if trans_type in get_output_transitions(TRANSITIONS[trans_in], time_sense)
+            ])
+            reached = np.isfinite(entry["arrival"][:, trans_ins]) & open_analyses[:, None]
+            if not reached.any():
+                continue
+            trans_out = TRANSITION_INDEX[trans_type]
+            out_slew, delay, sigma = calculate_pocv_arc_delays(
+                cell_pin_mapping[cell_name][input_pin], trans_type,
+                np.hypot(entry["slew"][:, trans_ins], wire_slew), output_capacitance,
+                coefficients,
+            )
+            mean = entry["mean"][:, trans_ins] + wire_delay[:, trans_ins] \
+                + annotate_pocv_delays(delay, annotated, trans_out) * scale
+            variance = entry["variance"][:, trans_ins] + (sigma * scale) ** 2
+            candidate = mean + SIGMA_SIGNS * propagated["n_sigma"] * np.sqrt(variance)
+
+            # the worst candidate of each analysis, kept when worse than the current arrival
+            sink = get_arrival_entry(propagated, node, sink_tag, create=True)
+            score = np.where(reached, SIGMA_SIGNS * candidate, -np.inf)
+            best = score.argmax(axis=1)
+            current = SIGMA_SIGNS[:, 0] * sink["arrival"][:, trans_out]
+            better = score[analyses, best] > current
+            rows, picks = analyses[better], best[better]
+            sink["arrival"][rows, trans_out] = candidate[rows, picks]
+            sink["mean"][rows, trans_out] = mean[rows, picks]
+            sink["variance"][rows, trans_out] = variance[rows, picks]
+            sink["slew"][rows, trans_out] = out_slew[rows, picks]
+            sink["pred_arc"][rows, trans_out] = arc
+            sink["pred_transition"][rows, trans_out] = trans_ins[picks]
+            sink["launch"][rows, trans_out] = entry["launch"][rows, trans_ins[picks]]
+            if sink_tag:
+                for row in rows:
+                    sink["pred_tag"][row, trans_out] = tag
+
+
+def pocv_slack_statistics(
+    timing_graph: dict,
+    propagated: dict,
+    endpoints: dict,
+    analysis: str = "late",
+) -> dict:
+    """
+    Split the n-sigma slack of every check into its mean and sigma.
+
+    The n-sigma slack of evaluate_endpoints is the mean slack minus n_sigma times the
+    sigma of the arrival, for setup and hold alike.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        propagated (dict): The result of propagate_pocv_arrivals.
+        endpoints (dict): The result of evaluate_endpoints.
+        analysis (str): 'late' for the setup checks, 'early' for the hold checks.
+
+    Returns:
+        dict: The sigma and mean_slack arrays of the checks, NaN where not checked.
+    """
+    prefix = "" if analysis == "late" else "hold_"
+    transition = endpoints[f"{prefix}transition"]
+    sigma = np.full(len(transition), np.nan)
+    for position in np.flatnonzero(transition >= 0):
+        entry = get_arrival_entry(
+            propagated, timing_graph["arc_from"][endpoints["arc"][position]],
+            endpoints[f"{prefix}tag"][position],
+        )
+        sigma[position] = np.sqrt(
+            entry["variance"][ANALYSIS_INDEX[analysis], transition[position]]
+        )
+    return {
+        "sigma": sigma,
+        "mean_slack": endpoints[f"{prefix}slack"] + propagated["n_sigma"] * sigma,
+    }
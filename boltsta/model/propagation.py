@@ -0,0 +1,1021 @@
+import numpy as np
+from ..utils import (
+    compile_constraint_arcs,
+    get_input_pin_name,
+    get_output_capacitance,
+    get_timing_sense,
+)
+from ..network.exceptions import (
+    advance_tag,
+    completed_exceptions,
+    is_false_tag,
+    select_exception,
+    start_tag,
+)
+from .model import cached_arc_delays, calculate_constraint_time, get_output_transitions
+from .cppr import cppr_credit
+
+# Row of the arrival / slew arrays holding each transition
+TRANSITIONS = ("rise", "fall")
+TRANSITION_INDEX = {"rise": 0, "fall": 1}
+
+# First axis of the arrival / slew arrays: latest (setup) and earliest (hold) arrivals
+ANALYSES = ("late", "early")
+ANALYSIS_INDEX = {"late": 0, "early": 1}
+LATE = ANALYSIS_INDEX["late"]
+EARLY = ANALYSIS_INDEX["early"]
+
+# Arrays of the arrival data of a node, the last axis of the propagated arrays
+ENTRY_ARRAYS = ("arrival", "slew", "pred_arc", "pred_transition", "launch")
+
+
+def get_node_load(fanout_list: list[str], library) -> float:
+    """
+    Retrieve the load capacitance of a node, ignoring the design output ports.
+
+    Parameters:
+        fanout_list (list): The fanout of the node in the format 'node,cell_name,input_pin'.
+        library: The parsed liberty library.
+
+    Returns:
+        float: The total capacitance of the fanout pins.
+    """
+    cell_fanout = [
+        fanout for fanout in fanout_list
+        if fanout.split(",")[1] not in ("Input", "Output")
+    ]
+    if not cell_fanout:
+        return 0.0
+    return get_output_capacitance(fanout=cell_fanout, library=library)
+
+
+def get_wire_delay(propagated: dict, arc: int) -> tuple:
+    """
+    Retrieve the wire delay of an arc and the slew its net adds at the arc load pin.
+
+    Parameters:
+        propagated (dict): The result of propagate_arrival_times.
+        arc (int): The arc.
+
+    Returns:
+        tuple: The (2, 2) wire delays indexed by analysis and load pin transition, from
+               the net delays and the SDF interconnect delays, and the wire slew (see
+               compute_net_delays), combined with the driver slew by np.hypot. Both are
+               0 without net delays.
+    """
+    wire_delay, wire_slew = np.zeros((2, 2)), 0.0
+    net_delays = propagated.get("net_delays")
+    if net_delays is not None:
+        wire_delay, wire_slew = wire_delay + net_delays["wire_delay"][arc], \
+            net_delays["wire_slew"][arc]
+    sdf_delays = propagated.get("sdf_delays")
+    if sdf_delays is not None:
+        wire_delay = wire_delay + sdf_delays["wire_delay"][:, :, arc]
+    return wire_delay, wire_slew
+
+
+def get_sdf_delays(propagated: dict, name: str, index: int):
+    """
+    Retrieve the SDF annotated values of an arc or a node.
+
+    Parameters:
+        propagated (dict): The result of propagate_arrival_times.
+        name (str): The cell_delay, checks or launch_delay array of annotate_sdf_delays.
+        index (int): The arc, or the node for the launch_delay.
+
+    Returns:
+        np.ndarray: The (2, 2) annotated values, NaN for the ones to compute from the
+                    Liberty tables, or None when nothing is annotated.
+    """
+    sdf_delays = propagated.get("sdf_delays")
+    if sdf_delays is None:
+        return None
+    delays = sdf_delays[name][:, :, index]
+    return delays if np.isfinite(delays).any() else None
+
+
+def needs_table_lookup(propagated: dict, delays, node: int) -> bool:
+    """
+    Check whether the Liberty tables of an arc into a node must be interpolated.
+
+    Parameters:
+        propagated (dict): The result of propagate_arrival_times.
+        delays (np.ndarray): The result of get_sdf_delays for the arc.
+        node (int): The arc sink.
+
+    Returns:
+        bool: False when the SDF annotates every delay of the arc and the slew of the
+              node is not needed (see find_slew_nodes).
+    """
+    return delays is None or not np.isfinite(delays).all() \
+        or propagated["sdf_delays"]["needs_slew"][node]
+
+
+def get_constrained_pin(timing_graph: dict, arc: int, library) -> str:
+    """
+    Find the constrained pin of a check arc, among the pins of the sink cell with setup
+    and hold tables (see compile_constraint_arcs).
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        arc (int): The check arc.
+        library: The parsed liberty library.
+
+    Returns:
+        str: The constrained pin name, e.g. 'D' or 'SCD'.
+
+    Raises:
+        ValueError: If the arc input pin has no setup and hold tables.
+    """
+    cell_name = timing_graph["cells"][timing_graph["arc_to"][arc]]
+    pin = get_input_pin_name(timing_graph["arc_pin"][arc])
+    if pin not in compile_constraint_arcs(library).get(cell_name, {}):
+        raise ValueError(
+            f"No setup and hold timing for arc pin '{timing_graph['arc_pin'][arc]}' "
+            f"of cell '{cell_name}'."
+        )
+    return pin
+
+
+def get_constraint_times(
+    timing_graph: dict,
+    propagated: dict,
+    arc: int,
+    library,
+    transition: int,
+    constrained_pin_transition: np.ndarray,
+    related_pin_time: float,
+) -> np.ndarray:
+    """
+    Compute the setup and hold times of a check arc for a data transition, from the
+    SDF timing checks or, for the ones not annotated, the Liberty tables.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        propagated (dict): The result of propagate_arrival_times.
+        arc (int): The check arc.
+        library: The parsed liberty library.
+        transition (int): The data transition.
+        constrained_pin_transition (np.ndarray): The late and early data slews.
+        related_pin_time (float): The related pin transition time of the check.
+
+    Returns:
+        np.ndarray: The setup and hold times.
+    """
+    annotated = get_sdf_delays(propagated, "checks", arc)
+    if annotated is not None and np.isfinite(annotated[:, transition]).all():
+        return annotated[:, transition]
+    times = calculate_constraint_time(
+        cell_name=timing_graph["cells"][timing_graph["arc_to"][arc]],
+        checking_type="setup_hold_checking",
+        input_pin=get_constrained_pin(timing_graph, arc, library),
+        library_name=library,
+        constrained_pin_transition=constrained_pin_transition,
+        related_pin_transition=related_pin_time,
+    )
+    if annotated is None:
+        return times
+    return np.where(np.isfinite(annotated[:, transition]), annotated[:, transition], times)
+
+
+def get_clk2q_timing(cell_pin_mapping: dict, cell_name: str):
+    """
+    Retrieve the clk-to-q timing group of a sequential cell.
+
+    Parameters:
+        cell_pin_mapping (dict): A dictionary containing timing data for each cell.
+        cell_name (str): The name of the sequential cell.
+
+    Returns:
+        The timing group of the Q_CLK (or Q_CLK_N) arc.
+
+    Raises:
+        ValueError: If the cell or its clk-to-q arc is not found.
+    """
+    if cell_name not in cell_pin_mapping:
+        raise ValueError(f"Cell name '{cell_name}' not found in the cell timing data.")
+    for output_pin_name in ("Q_CLK", "Q_CLK_N"):
+        if output_pin_name in cell_pin_mapping[cell_name]:
+            return cell_pin_mapping[cell_name][output_pin_name]
+    raise ValueError(f"Output pin name 'Q_CLK_N' not found for cell '{cell_name}'.")
+
+
+def new_tagged_entry(batch: tuple = (), statistical: bool = False) -> dict:
+    """
+    Create the arrival data of a tagged node, laid out as one node of the untagged arrays.
+
+    Parameters:
+        batch (tuple): The leading shape of the arrays, e.g. (corners,) for the arrivals
+                       of every corner (see propagate_corner_arrivals).
+        statistical (bool): Whether to add the mean and variance of the arrivals (see
+                            propagate_pocv_arrivals).
+
+    Returns:
+        dict: (*batch, 2, 2) arrival, slew, pred_arc, pred_transition and launch arrays
+              indexed by analysis and transition, and the pred_tag of each of their
+              entries.
+    """
+    shape = tuple(batch) + (2, 2)
+    arrival = np.empty(shape)
+    arrival[..., LATE, :] = -np.inf
+    arrival[..., EARLY, :] = np.inf
+    pred_tag = np.empty(shape, dtype=object)
+    pred_tag.fill(())
+    entry = {
+        "arrival": arrival,
+        "slew": np.zeros(shape),
+        "pred_arc": np.full(shape, -1, dtype=np.int64),
+        "pred_transition": np.full(shape, -1, dtype=np.int64),
+        "launch": np.full(shape, -1, dtype=np.int64),
+        "pred_tag": pred_tag,
+    }
+    if statistical:
+        entry.update({"mean": arrival.copy(), "variance": np.zeros(shape)})
+    return entry
+
+
+def get_arrival_entry(propagated: dict, node: int, tag: tuple = (), create: bool = False):
+    """
+    Retrieve the arrival data of a node for the paths carrying a timing exception tag.
+
+    Parameters:
+        propagated (dict): The result of propagate_arrival_times.
+        node (int): The node index.
+        tag (tuple): The exception tag, () for the paths matching no exception.
+        create (bool): Whether to create the entry of a tag not reached yet.
+
+    Returns:
+        dict: The (2, 2) arrival, slew, pred_arc, pred_transition and launch of the node,
+              with their mean and variance for the statistical arrivals (views of the
+              propagated arrays for the untagged paths), or None if not reached.
+    """
+    statistical = "variance" in propagated
+    if not tag:
+        return {
+            name: propagated[name][..., node]
+            for name in ENTRY_ARRAYS + (("mean", "variance") if statistical else ())
+        }
+    node_tags = propagated["tagged"].setdefault(node, {}) if create \
+        else propagated["tagged"].get(node, {})
+    if tag not in node_tags and create:
+        node_tags[tag] = new_tagged_entry(propagated["arrival"].shape[:-3], statistical)
+    return node_tags.get(tag)
+
+
+def get_arrival_entries(propagated: dict, node: int) -> list:
+    """
+    List the arrival data of every tag reaching a node.
+
+    Parameters:
+        propagated (dict): The result of propagate_arrival_times.
+        node (int): The node index.
+
+    Returns:
+        list: (tag, entry) pairs, the untagged paths first.
+    """
+    return [((), get_arrival_entry(propagated, node))] + list(
+        propagated["tagged"].get(node, {}).items()
+    )
+
+
+def blocked_analyses(exception_index: dict, tag: tuple) -> tuple:
+    """
+    Find the analyses for which every path with the tag is a false path.
+
+    Parameters:
+        exception_index (dict): The result of build_exception_index, or None.
+        tag (tuple): The exception tag.
+
+    Returns:
+        tuple: The blocked analyses (LATE for setup, EARLY for hold).
+    """
+    if not exception_index or not tag:
+        return ()
+    return tuple(
+        analysis for analysis, check in ((LATE, "setup"), (EARLY, "hold"))
+        if is_false_tag(exception_index, tag, check)
+    )
+
+
+def get_launch_tag(propagated: dict, node: int) -> tuple:
+    """
+    Find the exception tag of the paths a sequential node launches.
+
+    Parameters:
+        propagated (dict): The arrays being filled by propagate_arrival_times.
+        node (int): The sequential node.
+
+    Returns:
+        tuple: The tag and its blocked analyses (see blocked_analyses).
+    """
+    exception_index = propagated.get("exception_index")
+    tag = start_tag(exception_index, node) if exception_index else ()
+    return tag, blocked_analyses(exception_index, tag)
+
+
+def get_sink_tag(propagated: dict, tag: tuple, node: int) -> tuple:
+    """
+    Find the exception tag of the paths with a tag once they reach a node.
+
+    Parameters:
+        propagated (dict): The arrays being filled by propagate_arrival_times.
+        tag (tuple): The exception tag at the arc source.
+        node (int): The arc sink.
+
+    Returns:
+        tuple: The tag at the node and its blocked analyses (see blocked_analyses).
+    """
+    exception_index = propagated.get("exception_index")
+    sink_tag = advance_tag(exception_index, tag, node) if exception_index else tag
+    return sink_tag, blocked_analyses(exception_index, sink_tag)
+
+
+def get_node_derates(propagated: dict, node: int) -> np.ndarray:
+    """
+    Retrieve the late and early derates of the delays of the arcs into a node.
+
+    Parameters:
+        propagated (dict): The arrays being filled by propagate_arrival_times.
+        node (int): The arc sink.
+
+    Returns:
+        np.ndarray: The (2,) derates, 1 without derates.
+    """
+    derates = propagated.get("derates")
+    return np.ones(2) if derates is None else derates[:, node]
+
+
+def propagate_arrival_times(
+    timing_graph: dict,
+    fanout: dict[str, list[str]],
+    cell_pin_mapping: dict,
+    library,
+    input_transition_time: float = 1.5,
+    cone: dict = None,
+    exception_index: dict = None,
+    clock_latency: dict = None,
+    delay_cache: dict = None,
+    derates: np.ndarray = None,
+    net_delays: dict = None,
+    sdf_delays: dict = None,
+) -> dict:
+    """
+    Propagate the latest and earliest rise and fall arrival times through the timing graph.
+
+    Every sequential node launches both a rising and a falling transition through its
+    clk-to-q arc, and every arc maps the transitions at its input pin to the output
+    transitions allowed by its timing sense: the same edge for positive unate arcs, the
+    opposite edge for negative unate arcs and both edges for non-unate arcs. Each node
+    keeps, per transition, the latest arrival (for setup) and the earliest arrival (for
+    hold) together with their slews and the fanin arcs that produced them. All the
+    edges of an arc, for both analyses, are interpolated in one calculate_arc_delays call.
+
+    Paths taking part in a timing exception carry the tag of their exception states and
+    are propagated separately from the other paths, in the tagged entries of the nodes
+    they reach. Arrivals whose tag already makes them false paths for an analysis are
+    dropped for that analysis.
+
+    With propagated clocks, each sequential node launches at its clock latency, with the
+    clock transition at its clock pin. With a delay cache, the arc edges already
+    evaluated for another instance of the cell with the same slew and load are looked up.
+    With derates, the late and early delays of the arcs into each node are scaled by the
+    derates of the node. With net delays, every arc adds the wire delay of its net and
+    degrades the slew reaching its load pin, and the annotated drivers see the effective
+    capacitance of their net. With SDF delays, the annotated arc delays, clk-to-q
+    delays and interconnect delays replace the Liberty interpolation (see
+    annotate_sdf_delays).
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        fanout (dict): The fanout dictionary returned by get_fanout_dict.
+        cell_pin_mapping (dict): A dictionary containing timing data for each cell.
+        library: The parsed liberty library.
+        input_transition_time (float): The clock transition time at the flip-flops.
+        cone (dict, optional): The result of select_path_cone. Only its startpoints
+                               launch and only its nodes and arcs are propagated.
+        exception_index (dict, optional): The result of build_exception_index.
+        clock_latency (dict, optional): The result of compute_clock_latencies.
+        delay_cache (dict, optional): The result of new_delay_cache.
+        derates (np.ndarray, optional): The result of build_node_derates.
+        net_delays (dict, optional): The result of compute_net_delays.
+        sdf_delays (dict, optional): The result of annotate_sdf_delays.
+
+    Returns:
+        dict: A dictionary containing the following (2, 2, nodes) arrays, indexed by
+              ANALYSIS_INDEX on the first axis and TRANSITION_INDEX on the second, for
+              the untagged paths: arrival (not finite where the transition never
+              arrives), slew, pred_arc (fanin arc of the arrival, -1 at startpoints),
+              pred_transition (transition of the arrival at the arc source) and launch
+              (startpoint of the arrival). The tagged
+              key maps node indices to the entries of their tags (see new_tagged_entry).
+    """
+    if input_transition_time < 0:
+        raise ValueError("Input transition time must be non-negative.")
+
+    num_nodes = len(timing_graph["names"])
+    arrival = np.empty((2, 2, num_nodes))
+    arrival[LATE] = -np.inf
+    arrival[EARLY] = np.inf
+    propagated = {
+        "arrival": arrival,
+        "slew": np.zeros((2, 2, num_nodes)),
+        "pred_arc": np.full((2, 2, num_nodes), -1, dtype=np.int64),
+        "pred_transition": np.full((2, 2, num_nodes), -1, dtype=np.int64),
+        "launch": np.full((2, 2, num_nodes), -1, dtype=np.int64),
+        "tagged": {},
+        "exception_index": exception_index,
+        "delay_cache": delay_cache,
+        "derates": derates,
+        "net_delays": net_delays,
+        "sdf_delays": sdf_delays,
+    }
+
+    sequential = timing_graph["sequential"]
+    skipped = timing_graph["inputs"] | timing_graph["outputs"]
+    if cone is not None:
+        skipped = skipped | ~cone["nodes"] | (sequential & ~cone["startpoints"])
+
+    for node in range(num_nodes):
+        if skipped[node]:
+            continue
+        cell_name = timing_graph["cells"][node]
+        out_cap = get_propagated_load(propagated, timing_graph, fanout, library, node)
+
+        if sequential[node]:
+            latency, clock_slew = (0.0, 0.0), input_transition_time
+            if clock_latency is not None:
+                latency = clock_latency["latency"][:, node]
+                clock_slew = clock_latency["slew"][LATE, node]
+            launch_arrival(
+                propagated, node, cell_pin_mapping, cell_name, clock_slew, out_cap, latency
+            )
+            continue
+
+        for arc in timing_graph["fanin"][node]:
+            if cone is not None and not cone["arcs"][arc]:
+                continue
+            propagate_arc(propagated, timing_graph, arc, cell_pin_mapping, out_cap)
+
+    return propagated
+
+
+def get_propagated_load(
+    propagated: dict,
+    timing_graph: dict,
+    fanout: dict,
+    library,
+    node: int,
+) -> float:
+    """
+    Retrieve the load a node drives during the propagation.
+
+    Parameters:
+        propagated (dict): The arrays being filled by propagate_arrival_times.
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        fanout (dict): The fanout dictionary returned by get_fanout_dict.
+        library: The parsed liberty library.
+        node (int): The node index.
+
+    Returns:
+        float: The effective capacitance of the annotated net of the node (see
+               compute_net_delays), or the capacitance of its fanout pins.
+    """
+    net_delays = propagated.get("net_delays")
+    if net_delays is not None and np.isfinite(net_delays["load"][node]):
+        return net_delays["load"][node]
+    return get_node_load(fanout[timing_graph["keys"][node]], library)
+
+
+def launch_arrival(
+    propagated: dict,
+    node: int,
+    cell_pin_mapping: dict,
+    cell_name: str,
+    input_transition_time: float,
+    output_capacitance: float,
+    latency: tuple = (0.0, 0.0),
+) -> None:
+    """
+    Launch both transitions of a sequential node through its clk-to-q arc.
+
+    Parameters:
+        propagated (dict): The arrays being filled by propagate_arrival_times.
+        node (int): The sequential node.
+        cell_pin_mapping (dict): A dictionary containing timing data for each cell.
+        cell_name (str): The cell of the node.
+        input_transition_time (float): The clock transition time at the flip-flop.
+        output_capacitance (float): The load of the node.
+        latency (tuple): The late and early clock latency of the node.
+    """
+    tag, blocked = get_launch_tag(propagated, node)
+    if len(blocked) == 2:
+        return
+
+    # the annotated clk-to-q delays need no lookup, unless the slew of the node is needed
+    annotated = get_sdf_delays(propagated, "launch_delay", node)
+    launched = {(None, None, trans_type): (np.nan, np.nan) for trans_type in TRANSITIONS}
+    if needs_table_lookup(propagated, annotated, node):
+        launched = cached_arc_delays(
+            delay_cache=propagated.get("delay_cache"),
+            cell_name=cell_name,
+            input_pin="CLK",
+            timing_data=get_clk2q_timing(cell_pin_mapping, cell_name),
+            input_transitions=[("rise", input_transition_time)],
+            output_capacitance=output_capacitance,
+            timing_sense="non_unate",
+        )
+    entry = get_arrival_entry(propagated, node, tag, create=True)
+    scale = get_node_derates(propagated, node)
+    for (_, _, trans_type), (transition_time, delay) in launched.items():
+        trans = TRANSITION_INDEX[trans_type]
+        for analysis in (LATE, EARLY):
+            if analysis not in blocked:
+                if annotated is not None and np.isfinite(annotated[analysis, trans]):
+                    delay = annotated[analysis, trans]
+                entry["arrival"][analysis, trans] = latency[analysis] + delay * scale[analysis]
+                entry["slew"][analysis, trans] = transition_time
+                entry["launch"][analysis, trans] = node
+
+
+def select_arc_delay(evaluated: dict, edge: tuple, annotated, analysis: int, trans_out: int):
+    """
+    Select the output transition time and the delay of an arc edge.
+
+    Parameters:
+        evaluated (dict): The result of cached_arc_delays, None when not looked up.
+        edge (tuple): The (input transition, slew, output transition) of the edge.
+        annotated (np.ndarray): The result of get_sdf_delays for the arc.
+        analysis (int): LATE or EARLY.
+        trans_out (int): The output transition index.
+
+    Returns:
+        tuple: The transition time (NaN when not looked up) and the delay, annotated or
+               interpolated.
+    """
+    transition_time, delay = (np.nan, np.nan) if evaluated is None else evaluated[edge]
+    if annotated is not None and np.isfinite(annotated[analysis, trans_out]):
+        delay = annotated[analysis, trans_out]
+    return transition_time, delay
+
+
+def lookup_arc_edges(
+    propagated: dict,
+    timing_graph: dict,
+    arc: int,
+    cell_pin_mapping: dict,
+    output_capacitance: float,
+    timing_sense: str,
+    input_transitions: list,
+) -> tuple:
+    """
+    Evaluate the edges of an arc for the input transitions reaching it, the SDF
+    annotated arcs needing no lookup unless the slew of their sink is needed.
+
+    Parameters:
+        propagated (dict): The arrays being filled by propagate_arrival_times.
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        arc (int): The arc.
+        cell_pin_mapping (dict): A dictionary containing timing data for each cell.
+        output_capacitance (float): The load of the arc sink.
+        timing_sense (str): The timing sense of the arc.
+        input_transitions (list): (transition_type, input_transition_time) pairs.
+
+    Returns:
+        tuple: The result of cached_arc_delays (None when not looked up) and of
+               get_sdf_delays for the arc, to pass to select_arc_delay.
+    """
+    node = timing_graph["arc_to"][arc]
+    annotated = get_sdf_delays(propagated, "cell_delay", arc)
+    if not needs_table_lookup(propagated, annotated, node):
+        return None, annotated
+    cell_name, input_pin = timing_graph["cells"][node], timing_graph["arc_pin"][arc]
+    evaluated = cached_arc_delays(
+        delay_cache=propagated.get("delay_cache"),
+        cell_name=cell_name,
+        input_pin=input_pin,
+        timing_data=cell_pin_mapping[cell_name][input_pin],
+        input_transitions=list(dict.fromkeys(input_transitions)),
+        output_capacitance=output_capacitance,
+        timing_sense=timing_sense,
+    )
+    return evaluated, annotated
+
+
+def propagate_arc(
+    propagated: dict,
+    timing_graph: dict,
+    arc: int,
+    cell_pin_mapping: dict,
+    output_capacitance: float,
+) -> None:
+    """
+    Update the arrivals at the sink of an arc with the transitions reaching its source.
+
+    Parameters:
+        propagated (dict): The arrays being filled by propagate_arrival_times.
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        arc (int): The arc to propagate through.
+        cell_pin_mapping (dict): A dictionary containing timing data for each cell.
+        output_capacitance (float): The load of the arc sink.
+
+    Raises:
+        ValueError: If the arc input pin is not found for the sink cell.
+    """
+    source = timing_graph["arc_from"][arc]
+    node = timing_graph["arc_to"][arc]
+    cell_name = timing_graph["cells"][node]
+    input_pin = timing_graph["arc_pin"][arc]
+    if input_pin not in cell_pin_mapping.get(cell_name, {}):
+        raise ValueError(f"Input pin name '{input_pin}' not found for cell '{cell_name}'.")
+    time_sense = get_timing_sense(
+        cell_name=cell_name,
+        input_pin_name=input_pin,
+        cells_info=cell_pin_mapping,
+    )
+    wire_delay, wire_slew = get_wire_delay(propagated, arc)
+
+    # the distinct input edges of every tag and analysis are interpolated together
+    reached = [
+        (tag, entry, analysis, trans_in)
+        for tag, entry in get_arrival_entries(propagated, source)
+        for analysis in (LATE, EARLY)
+        for trans_in in np.flatnonzero(np.isfinite(entry["arrival"][analysis]))
+    ]
+    if not reached:
+        return
+    evaluated, annotated = lookup_arc_edges(
+        propagated, timing_graph, arc, cell_pin_mapping, output_capacitance, time_sense,
+        [
+            (TRANSITIONS[trans_in], np.hypot(entry["slew"][analysis, trans_in], wire_slew))
+            for _, entry, analysis, trans_in in reached
+        ],
+    )
+
+    scale = get_node_derates(propagated, node)
+    sink_tags = {}
+    for tag, entry, analysis, trans_in in reached:
+        if tag not in sink_tags:
+            sink_tags[tag] = get_sink_tag(propagated, tag, node)
+        sink_tag, blocked = sink_tags[tag]
+        if analysis in blocked:
+            continue
+        sink = get_arrival_entry(propagated, node, sink_tag, create=True)
+
+        edge = (TRANSITIONS[trans_in], np.hypot(entry["slew"][analysis, trans_in], wire_slew))
+        for trans_type in get_output_transitions(TRANSITIONS[trans_in], time_sense):
+            trans_out = TRANSITION_INDEX[trans_type]
+            transition_time, delay = select_arc_delay(
+                evaluated, edge + (trans_type,), annotated, analysis, trans_out
+            )
+            candidate = entry["arrival"][analysis, trans_in] + wire_delay[analysis, trans_in] \
+                + delay * scale[analysis]
+            current = sink["arrival"][analysis, trans_out]
+            if (candidate > current) if analysis == LATE else (candidate < current):
+                sink["arrival"][analysis, trans_out] = candidate
+                sink["slew"][analysis, trans_out] = transition_time
+                sink["pred_arc"][analysis, trans_out] = arc
+                sink["pred_transition"][analysis, trans_out] = trans_in
+                sink["launch"][analysis, trans_out] = entry["launch"][analysis, trans_in]
+                if sink_tag:
+                    sink["pred_tag"][analysis, trans_out] = tag
+
+
+def get_check_edges(
+    exception_index: dict,
+    tag: tuple,
+    endpoint: int,
+    clock_period: float,
+    clock_hold_edge: float = 0.0,
+) -> tuple:
+    """
+    Compute the capture edges of the setup and hold checks of the paths with a tag.
+
+    Without exception the setup check captures at the clock period and the hold check
+    at clock_hold_edge (0 when launch and capture clocks are the same). A multicycle
+    path moves the setup edge to multiplier x period and adds (setup multiplier - 1 -
+    hold multiplier) x period to the hold edge, and a max (min) delay replaces the
+    setup (hold) edge by its value.
+
+    Parameters:
+        exception_index (dict): The result of build_exception_index, or None.
+        tag (tuple): The exception tag of the paths.
+        endpoint (int): The endpoint index.
+        clock_period (float): The clock period, or the setup edge between two clocks.
+        clock_hold_edge (float): The hold edge between the launch and capture clocks.
+
+    Returns:
+        tuple: The setup and hold capture edges, None for a false path.
+    """
+    if not exception_index:
+        return clock_period, clock_hold_edge
+    matched = completed_exceptions(exception_index, tag, endpoint)
+    setup_exception = select_exception(exception_index, matched, "setup")
+    hold_exception = select_exception(exception_index, matched, "hold")
+
+    setup_multiplier = 1.0
+    if setup_exception is not None and setup_exception["type"] == "multicycle_path":
+        setup_multiplier = setup_exception["value"]
+    setup_edge = setup_multiplier * clock_period
+    if setup_exception is not None and setup_exception["type"] == "max_delay":
+        setup_edge = setup_exception["value"]
+    elif setup_exception is not None and setup_exception["type"] == "false_path":
+        setup_edge = None
+
+    hold_edge = clock_hold_edge + (setup_multiplier - 1) * clock_period
+    if hold_exception is not None:
+        if hold_exception["type"] == "multicycle_path":
+            hold_edge -= hold_exception["value"] * clock_period
+        elif hold_exception["type"] == "min_delay":
+            hold_edge = hold_exception["value"]
+        else:
+            hold_edge = None
+    return setup_edge, hold_edge
+
+
+def evaluate_endpoints(
+    timing_graph: dict,
+    propagated: dict,
+    library,
+    related_pin_time: float = 0.04,
+    clock_network_delay: float = 0.0,
+    clock_uncertainty: float = 0.3,
+    clock_period: float = 10.0,
+    clock_hold_uncertainty: float = 0.0,
+    cone: dict = None,
+    clock_hold_edge: float = 0.0,
+    clock_latency: dict = None,
+) -> dict:
+    """
+    Compute the setup and hold slack of every check arc from the propagated arrival times.
+
+    The setup required time follows generate_timing_report: the capture edge minus the
+    clock network delay, the clock uncertainty and the setup time of the capturing
+    flip-flop, evaluated with the slew of the latest transition. The hold required time
+    is the hold capture edge plus the clock network delay, the hold uncertainty and the
+    hold time, evaluated with the slew of the earliest transition. Both constraints come
+    from one calculate_constraint_time call per transition. The capture edges are the
+    clock period and clock_hold_edge, unless the timing exceptions of the path change them (see
+    get_check_edges), and false paths are not checked.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        propagated (dict): The result of propagate_arrival_times.
+        library: The parsed liberty library.
+        related_pin_time (float): The related pin transition time of the checks.
+        clock_network_delay (float): The clock network delay.
+        clock_uncertainty (float): The setup clock uncertainty.
+        clock_period (float): The clock period.
+        clock_hold_uncertainty (float): The hold clock uncertainty.
+        cone (dict, optional): The result of select_path_cone. Only the check arcs of
+                               the cone into its endpoints are evaluated.
+        clock_hold_edge (float): The hold capture edge, see clock_relationship for
+                                 paths between two clock domains.
+        clock_latency (dict, optional): The result of compute_clock_latencies. The
+                                        early (late) clock latency of the capturing
+                                        flip-flop delays its setup (hold) edge, and the
+                                        clock reconvergence pessimism of the launching
+                                        flip-flop of each arrival is removed.
+
+    Returns:
+        dict: Arrays with one entry per reached check arc: arc, and for the worst setup
+              transition transition, arrival, setup, slack, capture_edge and tag, and
+              for the worst hold transition hold_transition, hold_arrival, hold,
+              hold_slack, hold_capture_edge and hold_tag. A check without any checked
+              path has an infinite slack and a transition of -1.
+    """
+    setup_fields = ("transition", "arrival", "setup", "slack", "capture_edge", "tag")
+    hold_fields = ("hold_transition", "hold_arrival", "hold", "hold_slack",
+                   "hold_capture_edge", "hold_tag")
+    results = {name: [] for name in ("arc",) + setup_fields + hold_fields}
+    unchecked = (-1, np.nan, np.nan, np.inf, np.nan, ())
+    for arc, (source, sink) in enumerate(zip(timing_graph["arc_from"], timing_graph["arc_to"])):
+        if not timing_graph["sequential"][sink]:
+            continue
+        if cone is not None and not (cone["arcs"][arc] and cone["endpoints"][sink]):
+            continue
+        worst_setup, worst_hold = evaluate_check_arc(
+            timing_graph, propagated, arc, library, related_pin_time,
+            clock_network_delay=clock_network_delay,
+            clock_uncertainty=clock_uncertainty,
+            clock_period=clock_period,
+            clock_hold_uncertainty=clock_hold_uncertainty,
+            clock_hold_edge=clock_hold_edge,
+            capture_latency=(0.0, 0.0) if clock_latency is None
+            else clock_latency["latency"][:, sink],
+            cppr_index=None if clock_latency is None else clock_latency.get("cppr"),
+        )
+        if worst_setup is None and worst_hold is None:
+            continue
+        results["arc"].append(arc)
+        for name, value in zip(setup_fields + hold_fields,
+                               (worst_setup or unchecked) + (worst_hold or unchecked)):
+            results[name].append(value)
+
+    int_fields = ("arc", "transition", "hold_transition")
+    return {
+        name: values if name in ("tag", "hold_tag")
+        else np.array(values, dtype=np.int64 if name in int_fields else float)
+        for name, values in results.items()
+    }
+
+
+def evaluate_check_arc(
+    timing_graph: dict,
+    propagated: dict,
+    arc: int,
+    library,
+    related_pin_time: float,
+    clock_network_delay: float,
+    clock_uncertainty: float,
+    clock_period: float,
+    clock_hold_uncertainty: float,
+    clock_hold_edge: float = 0.0,
+    capture_latency: tuple = (0.0, 0.0),
+    cppr_index: dict = None,
+) -> tuple:
+    """
+    Find the worst setup and hold check of a check arc over the tags and transitions
+    reaching its source (see evaluate_endpoints for the parameters). capture_latency
+    holds the late and early clock latency of the capturing flip-flop, and cppr_index
+    (see build_cppr_index) the clock tree segments shared with the launching flip-flops.
+
+    Returns:
+        tuple: The worst setup and the worst hold check, each a (transition, arrival,
+               constraint, slack, capture edge, tag) tuple, or None when not checked.
+    """
+    source = timing_graph["arc_from"][arc]
+    sink = timing_graph["arc_to"][arc]
+    wire_delay, wire_slew = get_wire_delay(propagated, arc)
+    worst_setup = worst_hold = None
+    for tag, entry in get_arrival_entries(propagated, source):
+        setup_edge, hold_edge = get_check_edges(
+            propagated.get("exception_index"), tag, sink, clock_period, clock_hold_edge
+        )
+        arrival = entry["arrival"] + wire_delay
+        for trans in np.flatnonzero(np.isfinite(arrival).any(axis=0)):
+            setup, hold = get_constraint_times(
+                timing_graph, propagated, arc, library, trans,
+                np.hypot(entry["slew"][:, trans], wire_slew), related_pin_time,
+            )
+            if setup_edge is not None and np.isfinite(arrival[LATE, trans]):
+                required = setup_edge + capture_latency[EARLY] - clock_network_delay \
+                    - clock_uncertainty - setup
+                required += cppr_credit(cppr_index, entry["launch"][LATE, trans], sink)
+                slack = required - arrival[LATE, trans]
+                if worst_setup is None or slack < worst_setup[3]:
+                    worst_setup = (trans, arrival[LATE, trans], setup, slack, setup_edge, tag)
+            if hold_edge is not None and np.isfinite(arrival[EARLY, trans]):
+                required = hold_edge + capture_latency[LATE] + clock_network_delay \
+                    + clock_hold_uncertainty + hold
+                required -= cppr_credit(cppr_index, entry["launch"][EARLY, trans], sink)
+                slack = arrival[EARLY, trans] - required
+                if worst_hold is None or slack < worst_hold[3]:
+                    worst_hold = (trans, arrival[EARLY, trans], hold, slack, hold_edge, tag)
+    return worst_setup, worst_hold
+
+
+def trace_worst_path(
+    timing_graph: dict,
+    propagated: dict,
+    arc: int,
+    transition: int,
+    analysis: int = LATE,
+    tag: tuple = (),
+) -> tuple:
+    """
+    Walk the arrival predecessors back from a check arc to its startpoint.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        propagated (dict): The result of propagate_arrival_times.
+        arc (int): The check arc ending the path.
+        transition (int): The transition arriving at the check arc source.
+        analysis (int): LATE for the setup path, EARLY for the hold path.
+        tag (tuple): The exception tag of the path at the check arc source.
+
+    Returns:
+        tuple: The node indices, the transition at each node, the arc input pins and
+               the arrival time at each node (except the capturing flip-flop) of the
+               path, from the startpoint to the capturing flip-flop.
+    """
+    nodes = [timing_graph["arc_to"][arc]]
+    transitions = [transition]
+    pins = [timing_graph["arc_pin"][arc]]
+    arrivals = []
+    node = timing_graph["arc_from"][arc]
+    while True:
+        nodes.append(node)
+        transitions.append(transition)
+        entry = get_arrival_entry(propagated, node, tag)
+        arrivals.append(entry["arrival"][analysis, transition])
+        prev_arc = entry["pred_arc"][analysis, transition]
+        if prev_arc < 0:
+            break
+        pins.append(timing_graph["arc_pin"][prev_arc])
+        if tag:
+            tag = entry["pred_tag"][analysis, transition]
+        transition = entry["pred_transition"][analysis, transition]
+        node = timing_graph["arc_from"][prev_arc]
+
+    return nodes[::-1], transitions[::-1], pins[::-1], arrivals[::-1]
+
+
+def select_worst_endpoints(endpoints: dict, top_k: int = 100, analysis: str = "late"):
+    """
+    Order the checked endpoints by slack, worst first.
+
+    Parameters:
+        endpoints (dict): The result of evaluate_endpoints.
+        top_k (int): The number of endpoints to keep.
+        analysis (str): 'late' for the setup slack, 'early' for the hold slack.
+
+    Returns:
+        np.ndarray: The positions of the top_k worst endpoints in the endpoint arrays.
+    """
+    slack = endpoints["slack" if analysis == "late" else "hold_slack"]
+    order = np.argsort(slack, kind="stable")
+    return order[np.isfinite(slack[order])][:top_k]
+
+
+def extract_worst_paths(
+    timing_graph: dict,
+    propagated: dict,
+    endpoints: dict,
+    top_k: int = 100,
+    analysis: str = "late",
+    clock_latency: dict = None,
+) -> dict:
+    """
+    Extract the K worst endpoint paths in the format returned by build_paths_delay_dict.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        propagated (dict): The result of propagate_arrival_times.
+        endpoints (dict): The result of evaluate_endpoints.
+        top_k (int): The number of paths to extract, worst slack first.
+        analysis (str): 'late' for the setup paths, 'early' for the hold paths.
+        clock_latency (dict, optional): The result of compute_clock_latencies, whose
+                                        launch latency is not part of the clk-to-q delay.
+
+    Returns:
+        dict: A dictionary where keys are path identifiers (e.g., "path1") and values are
+              dictionaries mapping cell names to their delays, ready for generate_timing_report.
+              The last entry of each path is the setup (or hold) time of the endpoint.
+              With net delays, each cell entry includes the wire delay of its input
+              net, and the net into the endpoint has its own entry before the last one.
+    """
+    prefix = "" if analysis == "late" else "hold_"
+    check = "setup" if analysis == "late" else "hold"
+    analysis_index = ANALYSIS_INDEX[analysis]
+    keys = timing_graph["keys"]
+
+    paths_delay = {}
+    for path_index, endpoint in enumerate(select_worst_endpoints(endpoints, top_k, analysis)):
+        tag = endpoints[f"{prefix}tag"][endpoint]
+        nodes, transitions, _, arrivals = trace_worst_path(
+            timing_graph, propagated,
+            endpoints["arc"][endpoint], endpoints[f"{prefix}transition"][endpoint],
+            analysis_index, tag,
+        )
+        path_key = f"path{path_index + 1}"
+        paths_delay[path_key] = {}
+        # the launch clock latency is reported apart from the clock to output delay
+        previous = 0.0
+        if clock_latency is not None:
+            previous = clock_latency["latency"][analysis_index, nodes[0]]
+        for node, arrival in zip(nodes[:-1], arrivals):
+            paths_delay[path_key][keys[node]] = round(arrival - previous, 6)
+            previous = arrival
+        # the wire delay of the last net, the other ones being part of the cell rows
+        arc = endpoints["arc"][endpoint]
+        wire_delay = get_wire_delay(propagated, arc)[0][analysis_index, transitions[-1]]
+        if wire_delay:
+            pin = get_input_pin_name(timing_graph["arc_pin"][arc])
+            paths_delay[path_key][f"{timing_graph['names'][nodes[-1]]},{pin} (net)"] = \
+                round(wire_delay, 6)
+        paths_delay[path_key][f"{keys[nodes[-1]]},end"] = round(endpoints[check][endpoint], 6)
+
+    return paths_delay
+
+
+def extract_capture_edges(
+    endpoints: dict,
+    top_k: int = 100,
+    analysis: str = "late",
+) -> dict:
+    """
+    Extract the capture edges of the paths returned by extract_worst_paths.
+
+    Parameters:
+        endpoints (dict): The result of evaluate_endpoints.
+        top_k (int): The number of paths extracted, worst slack first.
+        analysis (str): 'late' for the setup paths, 'early' for the hold paths.
+
+    Returns:
+        dict: The capture edge of each path identifier, for generate_timing_report.
+    """
+    edges = endpoints["capture_edge" if analysis == "late" else "hold_capture_edge"]
+    return {
+        f"path{path_index + 1}": float(edges[endpoint])
+        for path_index, endpoint in enumerate(select_worst_endpoints(endpoints, top_k, analysis))
+    }
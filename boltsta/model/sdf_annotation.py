@@ -0,0 +1,142 @@
+import numpy as np
+from ..utils import get_input_pin_name
+
+# Clock pins of the clk-to-q arcs (see get_clk2q_timing)
+CLOCK_PINS = ("CLK", "CLK_N")
+
+
+def split_arc_pin(arc_pin: str) -> tuple:
+    """
+    Split an arc pin name built by concatenate_pins into its output and input pins.
+
+    Parameters:
+        arc_pin (str): The 'output_input' pin name of the arc, e.g. 'Q_RESET_B'.
+
+    Returns:
+        tuple: The output and input pin names, e.g. ('Q', 'RESET_B').
+    """
+    input_pin = get_input_pin_name(arc_pin)
+    return arc_pin[:-len(input_pin) - 1], input_pin
+
+
+def get_output_pin_names(timing_graph: dict) -> list:
+    """
+    Find the output pin of every cell node from the arcs into it.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+
+    Returns:
+        list: The output pin name of each node, None for the ports and the cells without
+              fanin arcs.
+    """
+    output_pins = [None] * len(timing_graph["names"])
+    for sink, arc_pin in zip(timing_graph["arc_to"], timing_graph["arc_pin"]):
+        if arc_pin is not None:
+            output_pins[sink] = split_arc_pin(arc_pin)[0]
+    return output_pins
+
+
+def find_slew_nodes(timing_graph: dict, annotation: dict) -> np.ndarray:
+    """
+    Find the nodes whose slew is still needed with the SDF delays: the sources of the
+    arcs missing an annotated delay or an annotated setup or hold time, and going back
+    through the combinational cells, the sources of the arcs into those nodes, whose
+    Liberty lookups need the input slews.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        annotation (dict): The cell_delay and checks arrays of annotate_sdf_delays.
+
+    Returns:
+        np.ndarray: A (nodes,) boolean array, True for the nodes needing their slew.
+    """
+    sinks = timing_graph["arc_to"]
+    checked = timing_graph["sequential"][sinks]
+    missing = np.where(
+        checked,
+        np.isnan(annotation["checks"]).any(axis=(0, 1)),
+        np.isnan(annotation["cell_delay"]).any(axis=(0, 1)) & ~timing_graph["outputs"][sinks],
+    )
+    needs_slew = np.zeros(len(timing_graph["names"]), dtype=bool)
+    needs_slew[timing_graph["arc_from"][missing]] = True
+    # the nodes are in topological order
+    for node in reversed(range(len(needs_slew))):
+        if needs_slew[node] and not timing_graph["sequential"][node]:
+            needs_slew[timing_graph["arc_from"][timing_graph["fanin"][node]]] = True
+    return needs_slew
+
+
+def annotate_sdf_delays(timing_graph: dict, sdf: dict) -> dict:
+    """
+    Fill the per-arc delay arrays of the timing graph from an SDF file.
+
+    The IOPATH delay of a cell arc is matched by the instance of the arc sink and the
+    input and output pins of the arc, the clk-to-q delay of a flip-flop by its clock pin
+    and Q, the INTERCONNECT delay of an arc by its source pin and load pin, and the
+    setup and hold times of a check arc by the flip-flop and the data pin. The
+    propagation uses the annotated values instead of the Liberty tables, and the arcs
+    (or transitions) missing from the SDF fall back to the Liberty calculation. As an
+    SDF file holds no slews, the Liberty tables are only looked up on the arcs into the
+    nodes whose slew is still needed by such a fallback.
+
+    Parameters:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        sdf (dict): The delays and timing checks returned by parse_sdf.
+
+    Returns:
+        dict: The (2, 2, arcs) cell_delay and wire_delay arrays indexed by analysis and
+              output (load pin) transition, the (2, 2, arcs) checks array holding the
+              setup and hold times of each data transition, the (2, 2, nodes)
+              launch_delay array of the flip-flops, NaN where not annotated (the wire
+              delays are 0), the (nodes,) needs_slew array of find_slew_nodes and the
+              number of annotated arcs.
+    """
+    names, divider = timing_graph["names"], sdf["divider"]
+    num_arcs, num_nodes = len(timing_graph["arc_from"]), len(names)
+    annotation = {
+        "cell_delay": np.full((2, 2, num_arcs), np.nan),
+        "wire_delay": np.zeros((2, 2, num_arcs)),
+        "checks": np.full((2, 2, num_arcs), np.nan),
+        "launch_delay": np.full((2, 2, num_nodes), np.nan),
+    }
+
+    # the interconnects by source instance (or port) and load pin
+    interconnect = {
+        (source.rpartition(divider)[0] or source, load): delays
+        for (source, load), delays in sdf["interconnect"].items()
+    }
+    output_pins = get_output_pin_names(timing_graph)
+    for arc, (source, sink, arc_pin) in enumerate(zip(
+        timing_graph["arc_from"], timing_graph["arc_to"], timing_graph["arc_pin"]
+    )):
+        if arc_pin is None:
+            load = names[sink]
+        else:
+            output_pin, input_pin = split_arc_pin(arc_pin)
+            load = names[sink] + divider + input_pin
+            if timing_graph["sequential"][sink]:
+                for check, name in enumerate(("setup", "hold")):
+                    annotation["checks"][check, :, arc] = sdf[name].get(
+                        (names[sink], input_pin), np.nan
+                    )
+            else:
+                annotation["cell_delay"][:, :, arc] = sdf["iopath"].get(
+                    (names[sink], input_pin, output_pin), np.nan
+                )
+        wire_delay = interconnect.get((names[source], load))
+        if wire_delay is not None:
+            annotation["wire_delay"][:, :, arc] = np.nan_to_num(wire_delay)
+
+    for node in np.flatnonzero(timing_graph["sequential"]):
+        for clock_pin in CLOCK_PINS:
+            delays = sdf["iopath"].get((names[node], clock_pin, output_pins[node] or "Q"))
+            if delays is not None:
+                annotation["launch_delay"][:, :, node] = delays
+
+    annotation["needs_slew"] = find_slew_nodes(timing_graph, annotation)
+    annotation["annotated"] = int(
+        np.isfinite(annotation["cell_delay"]).any(axis=(0, 1)).sum()
+        + np.isfinite(annotation["checks"]).any(axis=(0, 1)).sum()
+    )
+    return annotation
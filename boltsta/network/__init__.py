@@ -2,3 +2,13 @@ from .graph_creator import draw_graph
 from .graph_creator import print_node_predecessors_successors
 from .graph_creator import graph_creation_func
 from .path_detector import graph_path_handler
+from .levelizer import build_timing_graph, load_sequential_names
+from .path_counter import count_paths, estimate_enumeration_cost, select_timing_algorithm
+from .reachability import build_reachability_index, select_path_cone
+from .cone_extractor import extract_path_cone, get_cone_fanout_dict
+from .exceptions import build_exception_index, match_path_exceptions
+from .scan_pruning import prune_scan_arcs
+from .ideal_networks import find_ideal_networks, hide_ideal_networks
+from .constant_propagation import propagate_constants
+from .lca import build_lca_index, query_lca
+from .mode_overlay import build_mode_overlay, intersect_cones
@@ -0,0 +1,119 @@
+import logging
+from collections import deque
+from .levelizer import is_sequential_cell, load_sequential_names
+from .scan_pruning import _arc_pin
+
+
+# 1
+def get_clock_sources(G, clocks):
+    """
+    Maps the graph nodes defining a clock to the name of their clock. A pin source is
+    reduced to its instance, as the graph nodes are instances and ports.
+
+    Args:
+        G (networkx.DiGraph): The graph representing the design.
+        clocks (list): The clocks returned by parse_clocks.
+
+    Returns:
+        dict: The clock name of each source node, the first clock defined on a node
+        winning.
+    """
+    clock_sources = {}
+    for clock in clocks:
+        for source in clock["sources"]:
+            node = source.split("/")[0]
+            if node not in G:
+                logging.warning(f"Clock '{clock['name']}' source '{source}' not found")
+                continue
+            clock_sources.setdefault(node, clock["name"])
+    return clock_sources
+
+
+# 2
+def trace_clock_source(G, driver, clock_sources, sequential_names):
+    """
+    Traces a clock net back from its driver, through the buffers and the combinational
+    cells of the clock tree, to the nearest clock source.
+
+    Args:
+        G (networkx.DiGraph): The graph representing the design.
+        driver (str): The node driving a clock pin.
+        clock_sources (dict): The result of get_clock_sources.
+        sequential_names (list): Substrings identifying sequential cells.
+
+    Returns:
+        str or None: The name of the clock, None when no clock source reaches the driver.
+    """
+    queue = deque([driver])
+    visited = {driver}
+    while queue:
+        node = queue.popleft()
+        if node in clock_sources:
+            return clock_sources[node]
+        cell = G.nodes[node]["cell"]
+        if cell in ("Input", "Output") or is_sequential_cell(cell, sequential_names):
+            continue
+        for predecessor in G.predecessors(node):
+            if predecessor not in visited:
+                visited.add(predecessor)
+                queue.append(predecessor)
+    return None
+
+
+# 3 MAIN FUNCTION HERE!!
+def assign_clock_domains(G, clock_pins, clocks, sequential_names=None):
+    """
+    Tags every sequential cell with the clock domain of its clock pin, found by tracing
+    the clock pin back to a create_clock source.
+
+    Args:
+        G (networkx.DiGraph): The graph representing the design, with its clock network.
+        clock_pins (dict): The clock pins of each cell, as returned by extract_clock_pins.
+        clocks (list): The clocks returned by parse_clocks.
+        sequential_names (list, optional): Substrings identifying sequential cells.
+
+    Returns:
+        dict: The clock name of each sequential cell, None for the unclocked ones.
+    """
+    if sequential_names is None:
+        sequential_names = load_sequential_names()
+    clock_sources = get_clock_sources(G, clocks)
+
+    traced = {}
+    domains = {}
+    for node, cell in G.nodes(data="cell"):
+        if not is_sequential_cell(cell, sequential_names):
+            continue
+        domains[node] = None
+        for driver, _, input_pin in G.in_edges(node, data="input_pin"):
+            if _arc_pin(input_pin, clock_pins.get(cell, ())) is None:
+                continue
+            if driver not in traced:
+                traced[driver] = trace_clock_source(G, driver, clock_sources, sequential_names)
+            domains[node] = traced[driver]
+            break
+
+    unclocked = [node for node, clock in domains.items() if clock is None]
+    if unclocked:
+        logging.warning(f"{len(unclocked)} sequential cells are not reached by any clock")
+    return domains
+
+
+# 4
+def group_clock_domains(domains, clocks):
+    """
+    Groups the sequential cells by clock domain, in the order the clocks are defined.
+
+    Args:
+        domains (dict): The result of assign_clock_domains.
+        clocks (list): The clocks returned by parse_clocks.
+
+    Returns:
+        dict: The list of sequential cells of each clock name, for the clocks that have
+        any.
+    """
+    groups = {clock["name"]: [] for clock in clocks}
+    for node, clock in domains.items():
+        if clock is not None:
+            groups[clock].append(node)
+    return {clock: nodes for clock, nodes in groups.items() if nodes}
@@ -0,0 +1,161 @@
+from collections import deque
+import networkx as nx
+from .levelizer import is_sequential_cell, load_sequential_names
+
+
+# 1
+def _is_boundary(G, node, sequential_names):
+    # timing paths start and stop at the ports and the sequential cells
+    cell = G.nodes[node]["cell"]
+    return cell in ("Input", "Output") or is_sequential_cell(cell, sequential_names)
+
+
+# 2
+def _cone_nodes(G, seeds, sequential_names, neighbors):
+    """
+    Collects the nodes reached from the seeds, without crossing ports or sequential cells.
+
+    Args:
+        G (networkx.DiGraph): The graph representing the design.
+        seeds (list): The nodes the search starts from.
+        sequential_names (list): Substrings identifying sequential cells.
+        neighbors (callable): G.predecessors for a fan-in cone, G.successors for a fan-out cone.
+
+    Returns:
+        set: The seeds and every node of their cone.
+
+    Raises:
+        ValueError: If a seed is not found in the graph.
+    """
+    for seed in seeds:
+        if seed not in G:
+            raise ValueError(f"Node '{seed}' not found in the design graph.")
+
+    visited = set(seeds)
+    queue = deque(seeds)
+    while queue:
+        node = queue.popleft()
+        for neighbor in neighbors(node):
+            if neighbor in visited:
+                continue
+            visited.add(neighbor)
+            # boundary nodes end a path, so the search does not go through them
+            if not _is_boundary(G, neighbor, sequential_names):
+                queue.append(neighbor)
+    return visited
+
+
+# 3
+def fanin_cone_nodes(G, endpoints, sequential_names=None):
+    """
+    Collects the transitive fan-in of the endpoints, up to the startpoints that launch into it.
+
+    Args:
+        G (networkx.DiGraph): The graph representing the design.
+        endpoints (list): The names of the endpoint nodes.
+        sequential_names (list, optional): Substrings identifying sequential cells.
+
+    Returns:
+        set: The endpoints and the nodes of their fan-in cone.
+    """
+    if sequential_names is None:
+        sequential_names = load_sequential_names()
+    return _cone_nodes(G, endpoints, sequential_names, G.predecessors)
+
+
+# 4
+def fanout_cone_nodes(G, startpoints, sequential_names=None):
+    """
+    Collects the transitive fan-out of the startpoints, up to the endpoints capturing it.
+
+    Args:
+        G (networkx.DiGraph): The graph representing the design.
+        startpoints (list): The names of the startpoint nodes.
+        sequential_names (list, optional): Substrings identifying sequential cells.
+
+    Returns:
+        set: The startpoints and the nodes of their fan-out cone.
+    """
+    if sequential_names is None:
+        sequential_names = load_sequential_names()
+    return _cone_nodes(G, startpoints, sequential_names, G.successors)
+
+
+# 5 MAIN FUNCTION HERE!!
+def extract_path_cone(G, startpoints=None, endpoints=None, sequential_names=None):
+    """
+    Extracts the part of the design holding the paths between startpoints and endpoints
+    as a subgraph view, without copying the graph.
+
+    The nodes are the fan-out cone of the startpoints, the fan-in cone of the endpoints,
+    or their intersection when both are given. Arcs launched by a sequential cell that
+    is not a requested startpoint, and arcs captured by one that is not a requested
+    endpoint, are hidden, so every path of the view goes from a requested startpoint
+    to a requested endpoint. The searches, and iterating the view, only visit the cone.
+
+    Args:
+        G (networkx.DiGraph): The graph representing the design.
+        startpoints (list, optional): The names of the startpoint nodes.
+        endpoints (list, optional): The names of the endpoint nodes.
+        sequential_names (list, optional): Substrings identifying sequential cells.
+
+    Returns:
+        networkx.DiGraph: A read-only view of G restricted to the cone.
+
+    Raises:
+        ValueError: If neither startpoints nor endpoints are given, or a node is not found.
+    """
+    if not startpoints and not endpoints:
+        raise ValueError("At least one startpoint or endpoint is needed to extract a cone.")
+    if sequential_names is None:
+        sequential_names = load_sequential_names()
+
+    if startpoints and endpoints:
+        nodes = fanout_cone_nodes(G, startpoints, sequential_names) & fanin_cone_nodes(
+            G, endpoints, sequential_names
+        )
+    elif startpoints:
+        nodes = fanout_cone_nodes(G, startpoints, sequential_names)
+    else:
+        nodes = fanin_cone_nodes(G, endpoints, sequential_names)
+
+    launching = set(startpoints) if startpoints else None
+    capturing = set(endpoints) if endpoints else None
+    boundary = {node for node in nodes if _is_boundary(G, node, sequential_names)}
+
+    def show_edge(u, v):
+        if launching is not None and u in boundary and u not in launching:
+            return False
+        return capturing is None or v not in boundary or v in capturing
+
+    return nx.subgraph_view(G, filter_node=nx.filters.show_nodes(nodes), filter_edge=show_edge)
+
+
+# 6
+def get_cone_fanout_dict(G, cone, ideal_fanout=None):
+    """
+    Returns the fanout dictionary of the cone nodes, with every fanout of the full design.
+
+    The loads of the cone nodes also depend on the pins outside of the cone, so the
+    fanout is read from G, in the format of get_fanout_dict. The ideal network drivers
+    have no load, their fanout is left empty.
+
+    Parameters:
+    G (networkx.DiGraph): The graph representing the design.
+    cone (networkx.DiGraph): The view returned by extract_path_cone.
+    ideal_fanout (dict, optional): The ideal network drivers returned by find_ideal_networks.
+
+    Returns:
+    dict: A dictionary where the keys are the cone nodes in the format 'node,cell_type',
+          and the values are lists of their fanouts in the format 'node2,cell_type,input_attr'.
+    """
+    fanout_dict = {}
+    for node, cell in cone.nodes(data="cell"):
+        if ideal_fanout and node in ideal_fanout:
+            fanout_dict[f"{node},{cell}"] = []
+            continue
+        fanout_dict[f"{node},{cell}"] = [
+            f"{fanout},{G.nodes[fanout]['cell']},{attrs.get('input_pin', None)}"
+            for fanout, attrs in G[node].items()
+        ]
+    return fanout_dict
@@ -0,0 +1,276 @@
+import re
+from .levelizer import is_sequential_cell, load_sequential_names
+from .scan_pruning import _arc_pin
+
+_FUNCTION_TOKENS = re.compile(r"\s*([A-Za-z_][\w\[\]]*|[01]|[!'&*|+^()])")
+
+
+# 1
+def _tokenize_function(expression):
+    tokens, position = [], 0
+    expression = expression.strip()
+    while position < len(expression):
+        match = _FUNCTION_TOKENS.match(expression, position)
+        if match is None:
+            raise ValueError(f"Invalid character in function '{expression}' at {position}")
+        tokens.append(match.group(1))
+        position = match.end()
+    return tokens
+
+
+# 2
+def parse_function(expression):
+    """
+    Parses a Liberty function string into an expression tree.
+
+    The operators are, from the highest to the lowest precedence, the negations '!A'
+    and "A'", the xor 'A^B', the and 'A&B', 'A*B' or 'A B', and the or 'A|B' or 'A+B'.
+
+    Args:
+        expression (str): The function attribute of an output pin, e.g. "(!A) | (!B)".
+
+    Returns:
+        tuple: The expression tree, made of ("const", value), ("pin", name),
+        ("not", operand) and ("and" | "or" | "xor", operands) nodes.
+    """
+    tokens = _tokenize_function(expression)
+    tree, position = _parse_or(tokens, 0)
+    if position != len(tokens):
+        raise ValueError(f"Unexpected '{tokens[position]}' in function '{expression}'")
+    return tree
+
+
+def _parse_or(tokens, position):
+    operands = []
+    while True:
+        operand, position = _parse_and(tokens, position)
+        operands.append(operand)
+        if position < len(tokens) and tokens[position] in ("|", "+"):
+            position += 1
+            continue
+        return (operands[0] if len(operands) == 1 else ("or", operands)), position
+
+
+def _parse_and(tokens, position):
+    operands = []
+    while True:
+        operand, position = _parse_xor(tokens, position)
+        operands.append(operand)
+        if position < len(tokens) and tokens[position] in ("&", "*"):
+            position += 1
+            continue
+        # a space between two operands is an and
+        if position < len(tokens) and tokens[position] not in ("|", "+", ")"):
+            continue
+        return (operands[0] if len(operands) == 1 else ("and", operands)), position
+
+
+def _parse_xor(tokens, position):
+    operands = []
+    while True:
+        operand, position = _parse_unary(tokens, position)
+        operands.append(operand)
+        if position < len(tokens) and tokens[position] == "^":
+            position += 1
+            continue
+        return (operands[0] if len(operands) == 1 else ("xor", operands)), position
+
+
+def _parse_unary(tokens, position):
+    if position >= len(tokens):
+        raise ValueError("Unexpected end of function")
+    token = tokens[position]
+    if token == "!":
+        operand, position = _parse_unary(tokens, position + 1)
+        return ("not", operand), position
+    if token == "(":
+        operand, position = _parse_or(tokens, position + 1)
+        if position >= len(tokens) or tokens[position] != ")":
+            raise ValueError("Missing ')' in function")
+        position += 1
+    elif token in ("0", "1"):
+        operand, position = ("const", int(token)), position + 1
+    elif token[0].isalpha() or token[0] == "_":
+        operand, position = ("pin", token), position + 1
+    else:
+        raise ValueError(f"Unexpected '{token}' in function")
+    # postfix negations
+    while position < len(tokens) and tokens[position] == "'":
+        operand, position = ("not", operand), position + 1
+    return operand, position
+
+
+# 3
+def function_pins(tree):
+    """
+    Returns the set of input pins an expression tree depends on.
+    """
+    if tree[0] == "pin":
+        return {tree[1]}
+    if tree[0] == "const":
+        return set()
+    if tree[0] == "not":
+        return function_pins(tree[1])
+    return set().union(*(function_pins(operand) for operand in tree[1]))
+
+
+# 4
+def evaluate_function(tree, values):
+    """
+    Evaluates an expression tree in three-valued logic: a pin missing from values is
+    unknown, and the result is known when the known pins control the output.
+
+    Args:
+        tree (tuple): The expression tree returned by parse_function.
+        values (dict): The constant value (0 or 1) of some input pins.
+
+    Returns:
+        int or None: The constant value of the output, None when it is not constant.
+    """
+    kind = tree[0]
+    if kind == "const":
+        return tree[1]
+    if kind == "pin":
+        return values.get(tree[1])
+    if kind == "not":
+        value = evaluate_function(tree[1], values)
+        return None if value is None else 1 - value
+
+    operands = [evaluate_function(operand, values) for operand in tree[1]]
+    if kind == "xor":
+        return None if None in operands else sum(operands) % 2
+    # a controlling value decides the output of an and (0) or an or (1)
+    controlling = 0 if kind == "and" else 1
+    if controlling in operands:
+        return controlling
+    return None if None in operands else 1 - controlling
+
+
+# 5
+def compile_cell_functions(cell_functions):
+    """
+    Parses the function strings returned by extract_cell_functions.
+
+    Args:
+        cell_functions (dict): The function string of each output pin of each cell.
+
+    Returns:
+        dict: The expression tree of each output pin of each cell.
+    """
+    return {
+        cell: {pin: parse_function(function) for pin, function in functions.items()}
+        for cell, functions in cell_functions.items()
+    }
+
+
+# 6
+def _node_function(G, node, compiled_functions):
+    functions = compiled_functions.get(G.nodes[node]["cell"])
+    if not functions:
+        return None
+    output_pin = G.nodes[node].get("output_pin")
+    if output_pin in functions:
+        return functions[output_pin]
+    return next(iter(functions.values())) if len(functions) == 1 else None
+
+
+# 7
+def _input_values(G, node, tree, node_values, constant_pins):
+    # the constant value of each input pin of node
+    pins = function_pins(tree)
+    values = {pin: value for pin, value in constant_pins.get(node, {}).items() if pin in pins}
+    for u, _, input_pin in G.in_edges(node, data="input_pin"):
+        pin = _arc_pin(input_pin, pins)
+        if pin is not None and pin not in values and u in node_values:
+            values[pin] = node_values[u]
+    return values
+
+
+# 8
+def _spread_constants(G, compiled_functions, node_values, constant_pins, sequential_names):
+    """
+    Spreads the constants forward through the combinational cells, evaluating a cell
+    again each time one of its inputs becomes constant.
+
+    Args:
+        G (networkx.DiGraph): The graph representing the design.
+        compiled_functions (dict): The result of compile_cell_functions.
+        node_values (dict): The constant of the nodes, updated in place.
+        constant_pins (dict): The constant of the instance pins of set_case_analysis.
+        sequential_names (list): Substrings identifying sequential cells.
+    """
+    queue = [node for node in G if G.in_degree(node) == 0 or node in constant_pins]
+    queue.extend(node_values)
+    while queue:
+        node = queue.pop()
+        if node not in node_values:
+            if is_sequential_cell(G.nodes[node]["cell"], sequential_names):
+                continue
+            tree = _node_function(G, node, compiled_functions)
+            if tree is None:
+                continue
+            values = _input_values(G, node, tree, node_values, constant_pins)
+            value = evaluate_function(tree, values)
+            if value is None:
+                continue
+            node_values[node] = value
+        queue.extend(successor for successor in G.successors(node) if successor not in node_values)
+
+
+# 9
+def _constant_arcs(G, node_values, constant_pins):
+    # the arcs into a constant instance pin and the arcs driven by a constant node
+    constant_arcs = {}
+    for u, v, input_pin in G.edges(data="input_pin"):
+        pin = _arc_pin(input_pin, constant_pins.get(v, ()))
+        if pin is not None:
+            constant_arcs[(u, v)] = constant_pins[v][pin]
+        elif u in node_values:
+            constant_arcs[(u, v)] = node_values[u]
+    return constant_arcs
+
+
+# 10 MAIN FUNCTION HERE!!
+def propagate_constants(G, cell_functions, case_analysis=None, sequential_names=None):
+    """
+    Propagates the constants of the tie cells and of set_case_analysis through the
+    combinational cells, using their Liberty functions, before timing.
+
+    A tie cell drives a constant, and a combinational cell drives one when the constants
+    at its inputs control its output (e.g. an and2 with a 0 input). The constants do not
+    propagate through the sequential cells. The arcs driven by a constant, the arcs into
+    a constant instance pin and the arcs into a cell driving a constant carry no
+    transition: they are disabled.
+
+    Args:
+        G (networkx.DiGraph): The graph representing the design.
+        cell_functions (dict): The function of each output pin of each cell, as returned
+            by extract_cell_functions.
+        case_analysis (dict, optional): The constant value of each port and instance/pin
+            name, as returned by parse_case_analysis.
+        sequential_names (list, optional): Substrings identifying sequential cells.
+
+    Returns:
+        dict: A dictionary containing:
+            - nodes (dict): The nodes driving a constant and its value.
+            - arcs (dict): The (driver, instance) arcs held at a constant and their value.
+            - disabled (set): The (driver, instance) arcs that are not timed.
+    """
+    if sequential_names is None:
+        sequential_names = load_sequential_names()
+
+    node_values, constant_pins = {}, {}
+    for name, value in (case_analysis or {}).items():
+        if "/" in name:
+            instance, pin = name.rsplit("/", 1)
+            constant_pins.setdefault(instance, {})[pin] = value
+        elif name in G and G.nodes[name]["cell"] == "Input":
+            node_values[name] = value
+    _spread_constants(G, compile_cell_functions(cell_functions), node_values, constant_pins,
+                      sequential_names)
+
+    constant_arcs = _constant_arcs(G, node_values, constant_pins)
+    disabled = set(constant_arcs)
+    for node in node_values:
+        disabled.update(G.in_edges(node))
+    return {"nodes": node_values, "arcs": constant_arcs, "disabled": disabled}
@@ -0,0 +1,232 @@
+import fnmatch
+import logging
+
+# Priority of the exception types, the highest one applies when several match a path
+EXCEPTION_PRIORITY = {
+    'false_path': 3,
+    'max_delay': 2,
+    'min_delay': 2,
+    'multicycle_path': 1,
+}
+
+
+# 1
+def _resolve_nodes(timing_graph, names):
+    """
+    Converts SDC object names, possibly with wildcards, into node indices.
+
+    Args:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        names (list): The instance and port names.
+
+    Returns:
+        set: The indices of the matching nodes.
+    """
+    index = timing_graph["index"]
+    nodes = set()
+    for name in names:
+        if name in index:
+            nodes.add(index[name])
+        elif any(char in name for char in "*?["):
+            nodes.update(index[node] for node in fnmatch.filter(timing_graph["names"], name))
+        else:
+            logging.warning(f"Timing exception object '{name}' not found in the design")
+    return nodes
+
+
+# 2 MAIN FUNCTION HERE!!
+def build_exception_index(timing_graph, exceptions):
+    """
+    Resolves the SDC timing exceptions on the timing graph and indexes them by the
+    node indices of their startpoints, through points and endpoints.
+
+    A path matches an exception when it starts at one of its -from nodes, then goes
+    through one node of each -through list in order, and ends at one of its -to nodes.
+    The progress of a path along an exception is a state (exception id, number of
+    -through lists passed), and the set of states of a path is its tag. Exceptions
+    without -from are only tagged from their first -through node, and exceptions
+    with neither -from nor -through are applied at their endpoints only, so paths
+    unaffected by exceptions stay untagged.
+
+    Args:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        exceptions (list): The timing_exceptions returned by sdc_parser.
+
+    Returns:
+        dict: A dictionary containing the following keys:
+            exceptions (list): the resolved exceptions, with node index sets in
+                place of the names and their priority.
+            by_start (dict): startpoint index to the ids of the exceptions it starts.
+            by_through (dict): node index to (exception id, -through position) pairs.
+            by_end (dict): endpoint index to the ids of the endpoint only exceptions.
+    """
+    resolved = []
+    by_start = {}
+    by_through = {}
+    by_end = {}
+    for exception in exceptions:
+        start, end = (
+            None if exception[key] is None else _resolve_nodes(timing_graph, exception[key])
+            for key in ('from', 'to')
+        )
+        throughs = [_resolve_nodes(timing_graph, names) for names in exception['through']]
+        if start == set() or end == set() or any(not nodes for nodes in throughs):
+            logging.warning(f"Ignoring {exception['type']} exception matching no path")
+            continue
+
+        exception_id = len(resolved)
+        resolved.append({
+            **exception,
+            'from': start,
+            'through': throughs,
+            'to': end,
+            'priority': (EXCEPTION_PRIORITY[exception['type']], exception_id),
+        })
+        for node in start or ():
+            by_start.setdefault(node, []).append(exception_id)
+        for position, nodes in enumerate(throughs):
+            for node in nodes:
+                by_through.setdefault(node, []).append((exception_id, position))
+        if start is None and not throughs:
+            for node in end:
+                by_end.setdefault(node, []).append(exception_id)
+
+    return {
+        "exceptions": resolved,
+        "by_start": by_start,
+        "by_through": by_through,
+        "by_end": by_end,
+    }
+
+
+# 3
+def start_tag(exception_index, node):
+    """
+    Returns the tag of the paths launched by a startpoint.
+
+    Args:
+        exception_index (dict): The index returned by build_exception_index.
+        node (int): The startpoint index.
+
+    Returns:
+        tuple: The sorted (exception id, -through position) states of the paths.
+    """
+    exception_ids = exception_index["by_start"].get(node, ())
+    return tuple(sorted((exception_id, 0) for exception_id in exception_ids))
+
+
+# 4
+def advance_tag(exception_index, tag, node):
+    """
+    Moves a tag through a node: every state waiting for the node passes to the next
+    -through list, and exceptions without -from start at their first -through node.
+
+    Args:
+        exception_index (dict): The index returned by build_exception_index.
+        tag (tuple): The tag of the path before the node.
+        node (int): The node the path goes through.
+
+    Returns:
+        tuple: The tag of the path after the node.
+    """
+    through = exception_index["by_through"].get(node)
+    if not through:
+        return tag
+    states = set(tag)
+    exceptions = exception_index["exceptions"]
+    for exception_id, position in through:
+        if (exception_id, position) in states:
+            states.discard((exception_id, position))
+            states.add((exception_id, position + 1))
+        elif position == 0 and exceptions[exception_id]['from'] is None:
+            states.add((exception_id, 1))
+    return tuple(sorted(states))
+
+
+# 5
+def completed_exceptions(exception_index, tag, endpoint=None):
+    """
+    Lists the exceptions matched by a path with the given tag, ending at the endpoint.
+
+    Args:
+        exception_index (dict): The index returned by build_exception_index.
+        tag (tuple): The tag of the path.
+        endpoint (int, optional): The endpoint index. When None, only the exceptions
+            without -to are returned, as they match wherever the path ends.
+
+    Returns:
+        list: The ids of the matched exceptions.
+    """
+    exceptions = exception_index["exceptions"]
+    matched = []
+    for exception_id, position in tag:
+        exception = exceptions[exception_id]
+        if position != len(exception['through']):
+            continue
+        if exception['to'] is None or (endpoint is not None and endpoint in exception['to']):
+            matched.append(exception_id)
+    if endpoint is not None:
+        matched.extend(exception_index["by_end"].get(endpoint, ()))
+    return matched
+
+
+# 6
+def select_exception(exception_index, exception_ids, check):
+    """
+    Picks the exception applying to a setup or hold check among the matched ones.
+
+    Args:
+        exception_index (dict): The index returned by build_exception_index.
+        exception_ids (list): The matched exceptions.
+        check (str): 'setup' or 'hold'.
+
+    Returns:
+        dict: The highest priority exception applying to the check, or None.
+    """
+    candidates = [
+        exception_index["exceptions"][exception_id] for exception_id in exception_ids
+        if exception_index["exceptions"][exception_id][check]
+    ]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda exception: exception['priority'])
+
+
+# 7
+def is_false_tag(exception_index, tag, check):
+    """
+    Checks whether every path with the tag is false for a check, wherever it ends, so
+    its arrival does not need to be propagated any further.
+
+    Args:
+        exception_index (dict): The index returned by build_exception_index.
+        tag (tuple): The tag of the path.
+        check (str): 'setup' or 'hold'.
+
+    Returns:
+        bool: True if the paths are false paths for the check.
+    """
+    exception = select_exception(exception_index, completed_exceptions(exception_index, tag), check)
+    return exception is not None and exception['type'] == 'false_path'
+
+
+# 8
+def match_path_exceptions(exception_index, nodes):
+    """
+    Runs the exception state machine along a path.
+
+    Args:
+        exception_index (dict): The index returned by build_exception_index.
+        nodes (list): The node indices of the path, from startpoint to endpoint.
+
+    Returns:
+        dict: The exception applying to the setup and to the hold check of the path
+              (None when no exception applies), under the 'setup' and 'hold' keys.
+    """
+    tag = start_tag(exception_index, nodes[0])
+    for node in nodes[1:-1]:
+        tag = advance_tag(exception_index, tag, node)
+    matched = completed_exceptions(exception_index, tag, nodes[-1])
+    return {
+        check: select_exception(exception_index, matched, check) for check in ('setup', 'hold')
+    }
@@ -169,4 +169,9 @@ def graph_creation_func(file_path):
                                                     input_list, output_list,
                                                     port_to_node_to_instance,
                                                     mod_input_pins)
+
+    # the output pin of each instance, which selects the function of multi-output cells
+    for instance in ast.modules[0].module_instances:
+        if instance.instance_name in G:
+            G.nodes[instance.instance_name]["output_pin"] = instance.output_pin
     return G
@@ -0,0 +1,122 @@
+import logging
+import networkx as nx
+from .levelizer import is_sequential_cell, load_sequential_names
+from .scan_pruning import _arc_pin
+
+
+# 1
+def _is_combinational(G, node, sequential_names):
+    cell = G.nodes[node]["cell"]
+    return cell not in ("Input", "Output") and not is_sequential_cell(cell, sequential_names)
+
+
+# 2
+def get_ideal_arcs(G, ideal_pins):
+    """
+    Finds the arcs into the clock and asynchronous pins of the design cells.
+
+    Args:
+        G (networkx.DiGraph): The graph representing the design.
+        ideal_pins (dict): The ideal pins of each cell, as returned by extract_ideal_pins.
+
+    Returns:
+        set: The (driver, instance) arcs into an ideal pin.
+    """
+    return {
+        (u, v) for u, v, input_pin in G.edges(data="input_pin")
+        if _arc_pin(input_pin, ideal_pins.get(G.nodes[v]["cell"], ())) is not None
+    }
+
+
+# 3
+def _spread_ideal_networks(G, ideal, ideal_arcs, sequential_names):
+    """
+    Spreads the ideal network drivers along the buffer trees, backward to the cells
+    only driving ideal networks and forward to the cells only driven by them.
+
+    Args:
+        G (networkx.DiGraph): The graph representing the design.
+        ideal (set): The ideal network drivers, updated in place.
+        ideal_arcs (set): The arcs into clock and asynchronous pins.
+        sequential_names (list): Substrings identifying sequential cells.
+    """
+    queue = list(ideal)
+    while queue:
+        node = queue.pop()
+        for predecessor in G.predecessors(node):
+            is_driver = G.nodes[predecessor]["cell"] == "Input" or \
+                _is_combinational(G, predecessor, sequential_names)
+            if predecessor in ideal or not is_driver:
+                continue
+            if all(s in ideal or (predecessor, s) in ideal_arcs for s in G.successors(predecessor)):
+                ideal.add(predecessor)
+                queue.append(predecessor)
+        for successor in G.successors(node):
+            if successor in ideal or not _is_combinational(G, successor, sequential_names):
+                continue
+            if all(p in ideal for p in G.predecessors(successor)):
+                ideal.add(successor)
+                queue.append(successor)
+
+
+# 4 MAIN FUNCTION HERE!!
+def find_ideal_networks(G, ideal_pins, ideal_sources=None, sequential_names=None):
+    """
+    Finds the nodes driving ideal networks, which carry no data path.
+
+    A node drives an ideal network when set_ideal_network names it, when its fanout only
+    goes to clock and asynchronous pins, or when it is a combinational cell whose fanout
+    only goes to ideal network drivers (the buffers of a clock or reset tree, found
+    backward from the pins). The combinational cells whose inputs all come from ideal
+    network drivers are ideal network drivers too (the ideal network propagates forward
+    from set_ideal_network sources).
+
+    Args:
+        G (networkx.DiGraph): The graph representing the design.
+        ideal_pins (dict): The ideal pins of each cell, as returned by extract_ideal_pins.
+        ideal_sources (list, optional): The ports and instances of set_ideal_network.
+        sequential_names (list, optional): Substrings identifying sequential cells.
+
+    Returns:
+        dict: The ideal network drivers and the number of pins of their network.
+    """
+    if sequential_names is None:
+        sequential_names = load_sequential_names()
+    ideal_arcs = get_ideal_arcs(G, ideal_pins)
+
+    ideal = set()
+    for source in ideal_sources or ():
+        if source in G:
+            ideal.add(source)
+        else:
+            logging.warning(f"Ideal network source '{source}' not found in the design")
+    for node in G:
+        out_arcs = [(node, successor) for successor in G.successors(node)]
+        if out_arcs and all(arc in ideal_arcs for arc in out_arcs) and \
+                not is_sequential_cell(G.nodes[node]["cell"], sequential_names):
+            ideal.add(node)
+
+    _spread_ideal_networks(G, ideal, ideal_arcs, sequential_names)
+    return {node: G.out_degree(node) for node in ideal}
+
+
+# 5
+def hide_ideal_networks(G, ideal_fanout, ideal_pins=None):
+    """
+    Removes, as a subgraph view, the arcs of the ideal networks and the arcs into clock
+    and asynchronous pins, so that they are neither searched for data paths nor counted
+    in the loads. Only the fanout counts of the ideal networks are kept.
+
+    Args:
+        G (networkx.DiGraph): The graph representing the design.
+        ideal_fanout (dict): The result of find_ideal_networks.
+        ideal_pins (dict, optional): The ideal pins of each cell, as returned by
+            extract_ideal_pins.
+
+    Returns:
+        networkx.DiGraph: A read-only view of G without the ideal network arcs.
+    """
+    hidden = get_ideal_arcs(G, ideal_pins or {})
+    for node in ideal_fanout:
+        hidden.update((node, successor) for successor in G.successors(node))
+    return nx.subgraph_view(G, filter_edge=nx.filters.hide_edges(hidden))
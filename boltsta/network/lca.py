@@ -0,0 +1,86 @@
+import numpy as np
+
+
+# 1
+def _euler_tour(parents):
+    # iterative depth first tour of the forest, a node is listed again after each child
+    num_nodes = len(parents)
+    children = [[] for _ in range(num_nodes)]
+    for node, parent in enumerate(parents):
+        if parent >= 0:
+            children[parent].append(node)
+
+    tour, depths = [], []
+    first = np.full(num_nodes, -1, dtype=np.int64)
+    component = np.full(num_nodes, -1, dtype=np.int64)
+    depth = np.zeros(num_nodes, dtype=np.int64)
+    for root in np.flatnonzero(np.asarray(parents) < 0):
+        stack = [(int(root), 0)]
+        while stack:
+            node, child = stack.pop()
+            if child == 0:
+                first[node] = len(tour)
+                component[node] = root
+                if parents[node] >= 0:
+                    depth[node] = depth[parents[node]] + 1
+            tour.append(node)
+            depths.append(depth[node])
+            if child < len(children[node]):
+                stack.append((node, child + 1))
+                stack.append((children[node][child], 0))
+    if (first < 0).any():
+        raise ValueError("The parent array contains a cycle.")
+    return np.array(tour, dtype=np.int64), np.array(depths, dtype=np.int64), first, component
+
+
+# 2 MAIN FUNCTION HERE!!
+def build_lca_index(parents):
+    """
+    Builds a lowest common ancestor index over a forest: an Euler tour of the forest and
+    a sparse table of the shallowest tour entry of every power of two range, so that
+    the common ancestor of two nodes is found with two table lookups.
+
+    Args:
+        parents (list or np.ndarray): The parent of each node, -1 for the roots.
+
+    Returns:
+        dict: A dictionary containing the following keys:
+            tour (np.ndarray): The nodes in Euler tour order.
+            first (np.ndarray): The first tour position of each node.
+            component (np.ndarray): The root of the tree of each node.
+            table (list): table[k][i] is the tour position of the shallowest node
+                          of the tour range [i, i + 2**k).
+            depths (np.ndarray): The depth of each tour entry.
+    """
+    tour, depths, first, component = _euler_tour(parents)
+    table = [np.arange(len(tour), dtype=np.int64)]
+    span = 1
+    while 2 * span <= len(tour):
+        previous = table[-1]
+        left, right = previous[:len(tour) - 2 * span + 1], previous[span:len(tour) - span + 1]
+        table.append(np.where(depths[left] <= depths[right], left, right))
+        span *= 2
+    return {"tour": tour, "first": first, "component": component, "table": table,
+            "depths": depths}
+
+
+# 3
+def query_lca(lca_index, u, v):
+    """
+    Finds the lowest common ancestor of two nodes in constant time.
+
+    Args:
+        lca_index (dict): The index returned by build_lca_index.
+        u, v (int): The two nodes.
+
+    Returns:
+        int: The lowest common ancestor, -1 when the nodes are in different trees.
+    """
+    if lca_index["component"][u] != lca_index["component"][v]:
+        return -1
+    left, right = sorted((int(lca_index["first"][u]), int(lca_index["first"][v])))
+    level = (right - left + 1).bit_length() - 1
+    row = lca_index["table"][level]
+    depths = lca_index["depths"]
+    a, b = row[left], row[right - (1 << level) + 1]
+    return int(lca_index["tour"][a if depths[a] <= depths[b] else b])
@@ -0,0 +1,176 @@
+import os
+import networkx as nx
+import numpy as np
+
+# Default list of substrings identifying sequential cells
+FF_NAMES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ff_names.txt")
+
+
+# 1
+def load_sequential_names(targets_file_name=FF_NAMES_FILE):
+    """
+    Reads the list of substrings used to identify sequential cells.
+
+    Args:
+        targets_file_name (str): The file containing one substring per line.
+
+    Returns:
+        list: The unique, non-empty substrings.
+    """
+    with open(targets_file_name, "r") as f:
+        names = {line.strip() for line in f}
+    names.discard("")
+    return sorted(names)
+
+
+# 2
+def is_sequential_cell(cell_name, sequential_names):
+    """
+    Checks whether a cell is a sequential cell (flip-flop or latch).
+
+    Args:
+        cell_name (str): The cell type of the node.
+        sequential_names (list): Substrings identifying sequential cells.
+
+    Returns:
+        bool: True if the cell is sequential.
+    """
+    return any(name in cell_name for name in sequential_names)
+
+
+# 3 MAIN FUNCTION HERE!!
+def build_timing_graph(G, sequential_names=None):
+    """
+    Levelizes the design graph and converts it into an index based timing graph.
+
+    Arcs entering a sequential node are capture (check) arcs and are not followed
+    by the levelization, so sequential nodes act as both startpoints and endpoints
+    and the remaining graph is a DAG. Nodes are numbered in topological order, so
+    iterating the indices in increasing order visits every node after all of its
+    fanin.
+
+    Args:
+        G (networkx.DiGraph): The graph representing the design.
+        sequential_names (list, optional): Substrings identifying sequential cells.
+            Defaults to the content of ff_names.txt.
+
+    Returns:
+        dict: The timing graph with the following keys:
+            names (list): node names in topological order.
+            cells (list): cell type of each node.
+            keys (list): 'node,cell' strings, as used by the adjacency and fanout dicts.
+            index (dict): node name to node index.
+            level (np.ndarray): logic level of each node.
+            depth (np.ndarray): logic depth of each node, see compute_logic_depth.
+            sequential, inputs, outputs (np.ndarray): boolean node type masks.
+            arc_from, arc_to (np.ndarray): node indices of each arc.
+            arc_pin (list): 'input_pin' attribute of each arc (None if missing).
+            fanin, fanout (list): arc indices entering and leaving each node.
+
+    Raises:
+        ValueError: If the design contains a combinational loop.
+    """
+    if sequential_names is None:
+        sequential_names = load_sequential_names()
+
+    node_cells = nx.get_node_attributes(G, "cell")
+    sequential_nodes = {
+        node for node, cell in node_cells.items()
+        if cell not in ("Input", "Output") and is_sequential_cell(cell, sequential_names)
+    }
+
+    # arcs captured by a sequential node do not propagate through it
+    combinational_view = nx.subgraph_view(
+        G, filter_edge=lambda u, v: v not in sequential_nodes
+    )
+    try:
+        generations = list(nx.topological_generations(combinational_view))
+    except nx.NetworkXUnfeasible:
+        cycle = nx.find_cycle(combinational_view)
+        raise ValueError(f"Combinational loop detected in the design: {cycle}")
+
+    names = []
+    level = []
+    for gen_index, generation in enumerate(generations):
+        for node in sorted(generation):
+            names.append(node)
+            level.append(gen_index)
+
+    index = {node: i for i, node in enumerate(names)}
+    cells = [node_cells[node] for node in names]
+    keys = [f"{node},{cell}" for node, cell in zip(names, cells)]
+
+    arc_from, arc_to, arc_pin = [], [], []
+    fanin = [[] for _ in names]
+    fanout = [[] for _ in names]
+    for u, v, attrs in G.edges(data=True):
+        arc_id = len(arc_pin)
+        arc_from.append(index[u])
+        arc_to.append(index[v])
+        arc_pin.append(attrs.get("input_pin", None))
+        fanout[index[u]].append(arc_id)
+        fanin[index[v]].append(arc_id)
+
+    timing_graph = {
+        "names": names,
+        "cells": cells,
+        "keys": keys,
+        "index": index,
+        "level": np.array(level, dtype=np.int64),
+        "sequential": np.array([node in sequential_nodes for node in names], dtype=bool),
+        "inputs": np.array([cell == "Input" for cell in cells], dtype=bool),
+        "outputs": np.array([cell == "Output" for cell in cells], dtype=bool),
+        "arc_from": np.array(arc_from, dtype=np.int64),
+        "arc_to": np.array(arc_to, dtype=np.int64),
+        "arc_pin": arc_pin,
+        "fanin": fanin,
+        "fanout": fanout,
+    }
+    timing_graph["depth"] = compute_logic_depth(timing_graph)
+    return timing_graph
+
+
+# 4
+def compute_logic_depth(timing_graph):
+    """
+    Computes the logic depth of every node, the number of cell stages of the shortest
+    path through it, as used by the depth based (AOCV) derates.
+
+    A path counts its launching flip-flop (the clk-to-q stage) and its combinational
+    cells, but neither the ports nor the capturing flip-flop. The depth of a node is the
+    number of stages from a startpoint up to and including the node plus the number of
+    stages after it, so the graph based depth is the most pessimistic one of all the
+    paths through the node and is computed once, in one forward and one backward pass.
+
+    Args:
+        timing_graph (dict): The timing graph, without its depth.
+
+    Returns:
+        np.ndarray: The logic depth of each node, 0 for the ports.
+    """
+    arc_from = timing_graph["arc_from"]
+    arc_to = timing_graph["arc_to"]
+    sequential = timing_graph["sequential"]
+    ports = timing_graph["inputs"] | timing_graph["outputs"]
+    num_nodes = len(timing_graph["names"])
+
+    # stages up to and including each node
+    before = np.zeros(num_nodes, dtype=np.int64)
+    for node in range(num_nodes):
+        sources = arc_from[timing_graph["fanin"][node]]
+        if ports[node]:
+            continue
+        if sequential[node] or len(sources) == 0:
+            before[node] = 1
+        else:
+            before[node] = 1 + before[sources].min()
+
+    # stages after each node, up to a capturing flip-flop or an output port
+    after = np.zeros(num_nodes, dtype=np.int64)
+    for node in range(num_nodes - 1, -1, -1):
+        sinks = arc_to[timing_graph["fanout"][node]]
+        sinks = sinks[~ports[sinks]]
+        if len(sinks) > 0:
+            after[node] = np.where(sequential[sinks], 0, 1 + after[sinks]).min()
+
+    return np.where(ports, 0, before + after)
@@ -0,0 +1,55 @@
+import numpy as np
+
+
+# 1 MAIN FUNCTION HERE!!
+def build_mode_overlay(timing_graph, G_mode):
+    """
+    Builds the overlay of an analysis mode on a timing graph shared by several modes.
+
+    The shared timing graph holds every arc that some mode times. A mode only removes
+    arcs from it (its case analysis constants, scan arcs and ideal networks), so the
+    mode is a mask over the shared arcs, laid out as a path cone: the propagation and
+    the endpoint checks of the mode skip its disabled arcs without building and
+    levelizing a timing graph of its own.
+
+    Args:
+        timing_graph (dict): The shared timing graph returned by build_timing_graph.
+        G_mode (networkx.DiGraph): The graph view of the mode, without its disabled arcs
+                                   (see prune_scan_arcs and hide_ideal_networks).
+
+    Returns:
+        dict: Boolean masks of the mode: nodes, arcs, startpoints and endpoints, as
+              returned by select_path_cone.
+    """
+    names = timing_graph["names"]
+    num_nodes = len(names)
+    arcs = np.fromiter(
+        (G_mode.has_edge(names[source], names[sink])
+         for source, sink in zip(timing_graph["arc_from"], timing_graph["arc_to"])),
+        dtype=bool, count=len(timing_graph["arc_from"]),
+    )
+    return {
+        "nodes": np.ones(num_nodes, dtype=bool),
+        "arcs": arcs,
+        "startpoints": np.ones(num_nodes, dtype=bool),
+        "endpoints": np.ones(num_nodes, dtype=bool),
+    }
+
+
+# 2
+def intersect_cones(cone, other):
+    """
+    Intersects two path cones, for example a path query and a mode overlay.
+
+    Args:
+        cone (dict): A path cone (see select_path_cone), or None for the whole graph.
+        other (dict): Another path cone, or None.
+
+    Returns:
+        dict: The masks selected by both cones, None when both are None.
+    """
+    if cone is None or other is None:
+        return other if cone is None else cone
+    return {
+        name: cone[name] & other[name] for name in ("nodes", "arcs", "startpoints", "endpoints")
+    }
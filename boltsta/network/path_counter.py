@@ -0,0 +1,155 @@
+import logging
+import math
+import numpy as np
+
+# Rough per-path and per-stage costs of exhaustive enumeration (find_paths_BFS,
+# get_input_attr and build_paths_delay_dict together), used for the estimates.
+BYTES_PER_PATH = 400
+BYTES_PER_STAGE = 120
+SECONDS_PER_STAGE = 5e-4
+
+# Default limits above which exhaustive enumeration is not attempted
+MAX_EXHAUSTIVE_PATHS = 100000
+MAX_EXHAUSTIVE_MEMORY = 2 * 1024 ** 3
+MAX_EXHAUSTIVE_RUNTIME = 600.0
+
+
+# 1
+def count_paths(timing_graph):
+    """
+    Counts the reg-reg paths ending at every endpoint with one dynamic programming
+    pass over the levelized timing graph.
+
+    Every sequential node launches exactly one path. The number of paths reaching a
+    combinational node is the sum over its fanin, and the number of paths captured by
+    a sequential node is the sum over its check arcs. Counts are python integers, so
+    they never overflow, and the total number of path stages is accumulated alongside
+    to estimate the average path depth.
+
+    Args:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+
+    Returns:
+        dict: A dictionary containing the following keys:
+            endpoint_counts (dict): 'node,cell' key of each endpoint to its path count.
+            total_paths (int): The number of reg-reg paths in the design.
+            total_stages (int): The number of nodes summed over all the paths.
+            log10_paths (float): log10 of total_paths (0.0 if there are none).
+    """
+    sequential = timing_graph["sequential"]
+    inputs = timing_graph["inputs"]
+    outputs = timing_graph["outputs"]
+    arc_from = timing_graph["arc_from"]
+    num_nodes = len(timing_graph["names"])
+
+    counts = [0] * num_nodes
+    stages = [0] * num_nodes
+    endpoint_counts = {}
+    total_paths = 0
+    total_stages = 0
+
+    # indices are in topological order, so the fanin is always done first
+    for node in range(num_nodes):
+        if sequential[node]:
+            # the node launches a new path of a single stage
+            counts[node], stages[node] = 1, 1
+        elif not (inputs[node] or outputs[node]):
+            for arc in timing_graph["fanin"][node]:
+                source = arc_from[arc]
+                counts[node] += counts[source]
+                stages[node] += stages[source] + counts[source]
+
+    # the check arcs are summed once every launch count is known
+    for node in np.flatnonzero(sequential):
+        node_count = 0
+        node_stages = 0
+        for arc in timing_graph["fanin"][node]:
+            source = arc_from[arc]
+            node_count += counts[source]
+            node_stages += stages[source] + counts[source]
+        if node_count:
+            endpoint_counts[timing_graph["keys"][node]] = node_count
+            total_paths += node_count
+            total_stages += node_stages
+
+    return {
+        "endpoint_counts": endpoint_counts,
+        "total_paths": total_paths,
+        "total_stages": total_stages,
+        "log10_paths": math.log10(total_paths) if total_paths else 0.0,
+    }
+
+
+# 2
+def estimate_enumeration_cost(path_counts,
+                              bytes_per_path=BYTES_PER_PATH,
+                              bytes_per_stage=BYTES_PER_STAGE,
+                              seconds_per_stage=SECONDS_PER_STAGE):
+    """
+    Estimates the memory and runtime needed to enumerate and time every path.
+
+    Args:
+        path_counts (dict): The result of count_paths.
+        bytes_per_path (int): Fixed memory cost of one enumerated path.
+        bytes_per_stage (int): Memory cost of one stage of an enumerated path.
+        seconds_per_stage (float): Time needed to time one stage of a path.
+
+    Returns:
+        dict: average_depth, memory_bytes and runtime_seconds of the enumeration.
+    """
+    total_paths = path_counts["total_paths"]
+    total_stages = path_counts["total_stages"]
+    average_depth = total_stages / total_paths if total_paths else 0.0
+    return {
+        "average_depth": average_depth,
+        "memory_bytes": total_paths * bytes_per_path + total_stages * bytes_per_stage,
+        "runtime_seconds": total_stages * seconds_per_stage,
+    }
+
+
+# 3
+def select_timing_algorithm(path_counts, cost,
+                            max_paths=MAX_EXHAUSTIVE_PATHS,
+                            max_memory=MAX_EXHAUSTIVE_MEMORY,
+                            max_runtime=MAX_EXHAUSTIVE_RUNTIME,
+                            unsupported=None):
+    """
+    Chooses between exhaustive path timing and graph based propagation.
+
+    Args:
+        path_counts (dict): The result of count_paths.
+        cost (dict): The result of estimate_enumeration_cost.
+        max_paths (int): Maximum number of paths to enumerate exhaustively.
+        max_memory (int): Maximum estimated memory (bytes) of the enumeration.
+        max_runtime (float): Maximum estimated runtime (seconds) of the enumeration.
+        unsupported (list, optional): Names of the analyses of the run the exhaustive path
+            timing does not support, selecting the propagation.
+
+    Returns:
+        str: 'exhaustive' or 'propagation'.
+    """
+    total_paths = path_counts["total_paths"]
+    logging.info(
+        f"Path count: {total_paths} reg-reg paths (log10 = {path_counts['log10_paths']:.2f}) "
+        f"to {len(path_counts['endpoint_counts'])} endpoints, "
+        f"average depth {cost['average_depth']:.2f}"
+    )
+    logging.info(
+        f"Exhaustive enumeration estimate: {cost['memory_bytes'] / 1024 ** 2:.2f} MB, "
+        f"{cost['runtime_seconds']:.2f} sec"
+    )
+
+    reasons = [f"exhaustive timing does not support {name} analysis" for name in unsupported or []]
+    if total_paths > max_paths:
+        reasons.append(f"{total_paths} paths > {max_paths}")
+    if cost["memory_bytes"] > max_memory:
+        reasons.append(f"memory {cost['memory_bytes']} bytes > {max_memory}")
+    if cost["runtime_seconds"] > max_runtime:
+        reasons.append(f"runtime {cost['runtime_seconds']:.2f} sec > {max_runtime}")
+
+    if reasons:
+        logging.info(f"Selected graph based propagation ({', '.join(reasons)})")
+        return "propagation"
+
+    logging.info("Selected exhaustive path timing")
+    return "exhaustive"
@@ -0,0 +1,176 @@
+import numpy as np
+
+
+# 1
+def merge_ranges(ranges):
+    """
+    Merges node index ranges into sorted, disjoint runs.
+
+    Args:
+        ranges (np.ndarray): A (k, 2) array of half-open [start, end) ranges, in any order
+        and possibly overlapping or adjacent.
+
+    Returns:
+        np.ndarray: The (runs, 2) sorted ranges covering the same nodes, adjacent and
+        overlapping ranges merged into a single run.
+    """
+    if len(ranges) < 2:
+        return ranges
+    ranges = ranges[np.argsort(ranges[:, 0], kind="stable")]
+    reach = np.maximum.accumulate(ranges[:, 1])
+    # a run starts at each range beginning after the end of all the previous ones
+    starts = np.flatnonzero(np.concatenate(([True], ranges[1:, 0] > reach[:-1])))
+    return np.column_stack((ranges[starts, 0], np.maximum.reduceat(ranges[:, 1], starts)))
+
+
+# 2
+def ranges_to_mask(ranges, num_nodes):
+    """
+    Converts node index ranges into a boolean node mask.
+
+    Args:
+        ranges (np.ndarray): A (k, 2) array of [start, end) ranges, possibly overlapping.
+        num_nodes (int): The number of nodes of the timing graph.
+
+    Returns:
+        np.ndarray: True for the nodes covered by a range.
+    """
+    bounds = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.add.at(bounds, ranges[:, 0], 1)
+    np.add.at(bounds, ranges[:, 1], -1)
+    return np.cumsum(bounds[:num_nodes]) > 0
+
+
+# 3
+def _build_cones(timing_graph, order, arcs, neighbours):
+    # the cone of each node is the union of its neighbours and of their cones, the
+    # cones of the sequential neighbours are not followed
+    sequential = timing_graph["sequential"]
+    cones = [None] * len(timing_graph["names"])
+    for node in order:
+        nodes = neighbours[arcs[node]]
+        parts = [np.column_stack((nodes, nodes + 1))]
+        parts += [cones[neighbour] for neighbour in nodes if not sequential[neighbour]]
+        cones[node] = merge_ranges(np.concatenate(parts).astype(np.int64, copy=False))
+    return cones
+
+
+# 4
+def build_reachability_index(timing_graph):
+    """
+    Builds the fan-in and fan-out cone of every node of the levelized timing graph as
+    run-length compressed node sets.
+
+    Each cone is a sorted array of disjoint [start, end) ranges of node indices. The
+    nodes are numbered in topological order, so the cone of a node mostly holds a few
+    long runs of the following (or preceding) levels and the index grows with the number
+    of runs rather than with the square of the number of nodes. Cones stop at sequential
+    nodes: a flip-flop reached by a cone is part of it, but its own fanout (or fanin) is
+    not followed, as no timing path crosses it. The fan-out cones are built in reverse
+    topological order and the fan-in cones in topological order, each one merging the
+    already built cones of its neighbours.
+
+    Args:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+
+    Returns:
+        dict: A dictionary containing the following keys:
+            fanout_cones (list): strict descendants ranges of each node.
+            fanin_cones (list): strict ancestors ranges of each node.
+    """
+    sequential = timing_graph["sequential"]
+    num_nodes = len(timing_graph["names"])
+
+    fanout_cones = _build_cones(timing_graph, range(num_nodes - 1, -1, -1),
+                                timing_graph["fanout"], timing_graph["arc_to"])
+    # the fanin of a sequential node is only known once the combinational nodes are done
+    order = np.concatenate((np.flatnonzero(~sequential), np.flatnonzero(sequential)))
+    fanin_cones = _build_cones(timing_graph, order, timing_graph["fanin"],
+                               timing_graph["arc_from"])
+
+    return {"fanout_cones": fanout_cones, "fanin_cones": fanin_cones}
+
+
+# 5
+def _node_mask(timing_graph, nodes):
+    mask = np.zeros(len(timing_graph["names"]), dtype=bool)
+    for node in nodes:
+        if node not in timing_graph["index"]:
+            raise ValueError(f"Node '{node}' not found in the timing graph.")
+        mask[timing_graph["index"][node]] = True
+    return mask
+
+
+# 6
+def _cones_mask(timing_graph, cones, nodes):
+    # the union of the cones of the nodes
+    ranges = [cones[timing_graph["index"][node]] for node in nodes]
+    return ranges_to_mask(np.concatenate(ranges), len(timing_graph["names"]))
+
+
+# 7
+def select_path_cone(timing_graph, reachability, from_nodes=None, through_nodes=None,
+                     to_nodes=None):
+    """
+    Restricts the timing graph to the paths matching a -from/-through/-to query.
+
+    The nodes of the matching paths are the intersection of the fan-out cone of the
+    startpoints, the fan-in and fan-out cones of every through node and the fan-in
+    cone of the endpoints. Arcs entering the fan-out cone of a through node from
+    outside of it are excluded, so arrivals propagated inside the cone always went
+    through that node.
+
+    Args:
+        timing_graph (dict): The timing graph returned by build_timing_graph.
+        reachability (dict): The index returned by build_reachability_index.
+        from_nodes (list, optional): Names of the startpoint flip-flops.
+        through_nodes (list, optional): Names of nodes every path must go through.
+        to_nodes (list, optional): Names of the endpoint flip-flops.
+
+    Returns:
+        dict: Boolean masks of the cone: nodes, arcs, startpoints (flip-flops that launch)
+              and endpoints (flip-flops whose check arcs are evaluated).
+
+    Raises:
+        ValueError: If a node is not found in the timing graph.
+    """
+    fanout_cones = reachability["fanout_cones"]
+    fanin_cones = reachability["fanin_cones"]
+    sequential = timing_graph["sequential"]
+    arc_from = timing_graph["arc_from"]
+    arc_to = timing_graph["arc_to"]
+
+    nodes = np.ones(len(timing_graph["names"]), dtype=bool)
+    startpoints = nodes.copy()
+    endpoints = nodes.copy()
+    if from_nodes:
+        startpoints = _node_mask(timing_graph, from_nodes)
+        downstream = _cones_mask(timing_graph, fanout_cones, from_nodes)
+        nodes &= startpoints | downstream
+        endpoints &= downstream
+    if to_nodes:
+        endpoints &= _node_mask(timing_graph, to_nodes)
+        upstream = _cones_mask(timing_graph, fanin_cones, to_nodes)
+        nodes &= endpoints | upstream
+        startpoints &= upstream
+
+    through_masks = []
+    for node in through_nodes or []:
+        node_mask = _node_mask(timing_graph, [node])
+        fanin = _cones_mask(timing_graph, fanin_cones, [node])
+        fanout = _cones_mask(timing_graph, fanout_cones, [node])
+        nodes &= node_mask | fanin | fanout
+        startpoints &= node_mask | fanin
+        endpoints &= node_mask | fanout
+        through_masks.append((fanout, node_mask | fanout))
+
+    arc_mask = nodes[arc_from] & nodes[arc_to]
+    for downstream, allowed_sources in through_masks:
+        arc_mask &= ~(downstream[arc_to] & ~allowed_sources[arc_from])
+
+    return {
+        "nodes": nodes,
+        "arcs": arc_mask,
+        "startpoints": nodes & sequential & startpoints,
+        "endpoints": nodes & sequential & endpoints,
+    }
@@ -0,0 +1,116 @@
+import networkx as nx
+
+
+# 1
+def _arc_pin(input_pin, pins):
+    # the input_pin attribute of an arc is '<output pin>_<input pin>'
+    if input_pin is None:
+        return None
+    return next((pin for pin in pins if input_pin.endswith(f"_{pin}")), None)
+
+
+# 2
+def get_constant_arcs(G, case_analysis):
+    """
+    Finds the arcs held at a constant value by set_case_analysis: the arcs driven by a
+    constant port and the arcs into a constant instance pin.
+
+    Args:
+        G (networkx.DiGraph): The graph representing the design.
+        case_analysis (dict): The constant value of each port and instance/pin name, as
+            returned by parse_case_analysis.
+
+    Returns:
+        dict: (driver, instance) arc to its constant value.
+    """
+    constant_pins = {}
+    for name, value in case_analysis.items():
+        if "/" in name:
+            instance, pin = name.rsplit("/", 1)
+            constant_pins.setdefault(instance, {})[pin] = value
+
+    constant_arcs = {}
+    for u, v, input_pin in G.edges(data="input_pin"):
+        if G.nodes[u]["cell"] == "Input" and u in case_analysis:
+            constant_arcs[(u, v)] = case_analysis[u]
+            continue
+        pin = _arc_pin(input_pin, constant_pins.get(v, ()))
+        if pin is not None:
+            constant_arcs[(u, v)] = constant_pins[v][pin]
+    return constant_arcs
+
+
+# 3
+def get_scan_arcs(G, scan_pins, constant_arcs, functional=False):
+    """
+    Finds the arcs of the scan cells that are not timed in the current mode.
+
+    In functional mode the scan input and scan enable arcs are removed. A scan enable
+    held at a constant value selects the mode of its cell: the scan input arcs are
+    removed when it disables the scan, and the functional data arcs when it enables it.
+
+    Args:
+        G (networkx.DiGraph): The graph representing the design.
+        scan_pins (dict): The scan pins of each scan cell, as returned by extract_scan_pins.
+        constant_arcs (dict): The constant arcs returned by get_constant_arcs.
+        functional (bool): Whether the analysis is in functional mode.
+
+    Returns:
+        set: The (driver, instance) arcs to remove.
+    """
+    scan_arcs = set()
+    for node, cell in G.nodes(data="cell"):
+        if cell not in scan_pins:
+            continue
+        pins = scan_pins[cell]
+        cell_pins = pins["scan_in"] | pins["data"] | set(pins["scan_enable"])
+        in_arcs = [
+            ((u, node), _arc_pin(input_pin, cell_pins))
+            for u, _, input_pin in G.in_edges(node, data="input_pin")
+        ]
+
+        # the scan mode selected by a constant scan enable, None when it toggles
+        scan_mode = None
+        for arc, pin in in_arcs:
+            if pin in pins["scan_enable"] and arc in constant_arcs:
+                scan_mode = constant_arcs[arc] != pins["scan_enable"][pin]
+
+        for arc, pin in in_arcs:
+            if functional and (pin in pins["scan_in"] or pin in pins["scan_enable"]):
+                scan_arcs.add(arc)
+            elif scan_mode is False and pin in pins["scan_in"]:
+                scan_arcs.add(arc)
+            elif scan_mode is True and pin in pins["data"]:
+                scan_arcs.add(arc)
+    return scan_arcs
+
+
+# 4 MAIN FUNCTION HERE!!
+def prune_scan_arcs(G, scan_pins, case_analysis=None, functional=False, constants=None):
+    """
+    Removes, as a subgraph view, the arcs that are not timed in the analysis mode: the
+    arcs held at a constant value by set_case_analysis, and the scan shift arcs of the
+    scan cells (see get_scan_arcs), so that scan chains do not create reg-reg paths in
+    functional mode.
+
+    Args:
+        G (networkx.DiGraph): The graph representing the design.
+        scan_pins (dict): The scan pins of each scan cell, as returned by extract_scan_pins.
+        case_analysis (dict, optional): The constant value of each port and instance/pin
+            name, as returned by parse_case_analysis.
+        functional (bool): Whether the analysis is in functional mode.
+        constants (dict, optional): The result of propagate_constants. When given, its
+            constant arcs select the scan modes and its disabled arcs are removed instead
+            of the set_case_analysis arcs.
+
+    Returns:
+        networkx.DiGraph: A read-only view of G without the removed arcs.
+    """
+    if constants is None:
+        constant_arcs = get_constant_arcs(G, case_analysis or {})
+        removed = set(constant_arcs)
+    else:
+        constant_arcs = constants["arcs"]
+        removed = set(constants["disabled"])
+    removed |= get_scan_arcs(G, scan_pins, constant_arcs, functional)
+    return nx.subgraph_view(G, filter_edge=nx.filters.hide_edges(removed))
@@ -1,3 +1,7 @@
 from .verilog_reader import *
 from .liberty_parser import parse_liberty_file
-from .sdc_reader import sdc_parser
+from .scd_reader import sdc_parser
+from .pocv_reader import read_pocv_coefficients, parse_pocv_coefficients, pocv_coefficient
+from .aocv_reader import read_aocv_tables, parse_aocv_tables, aocv_table
+from .spef_reader import read_spef, parse_spef
+from .sdf_reader import read_sdf, parse_sdf
@@ -0,0 +1,89 @@
+import numpy as np
+from .side_file_reader import parse_side_file_blocks, match_side_file_entry
+from .pocv_reader import DERATE_TYPES
+
+
+def parse_aocv_tables(content):
+    """
+    Parses an AOCV derate side file, made of blocks of 'key: value' lines:
+
+        object_type: lib_cell
+        rf_type: rise fall
+        delay_type: cell
+        derate_type: late
+        object_spec: sky130_fd_sc_hd__*
+        depth: 1 2 4 8
+        distance: 0 500
+        table: 1.12 1.08 1.06 1.05 \\
+               1.14 1.10 1.08 1.07
+
+    Each table derates the cell delays of the library cells matching the object_spec
+    pattern (a library prefix such as 'lib/cell' is dropped) for the analyses of its
+    derate_type (both when not given). The table holds one row of derates per distance,
+    with one derate per logic depth. The net delay tables are ignored, net delays not
+    being modeled, and so is the rf_type.
+
+    Args:
+        content (str): the content of the AOCV file
+
+    Returns:
+        (list): the tables in file order, dictionaries with the keys pattern,
+        derate_types, depth, distance and table (a (distances, depths) array)
+
+    Raises:
+        ValueError: if a table has no object_spec, or if its size or its indices are invalid
+    """
+    tables = []
+    for block in parse_side_file_blocks(content, 'table'):
+        if block.get('delay_type', 'cell') != 'cell':
+            continue
+        try:
+            depth = np.array(block.get('depth', '1').split(), dtype=float)
+            distance = np.array(block.get('distance', '0').split(), dtype=float)
+            table = np.array(block['table'].split(), dtype=float)
+        except ValueError:
+            raise ValueError(f"Invalid AOCV table for '{block['object_spec']}'.")
+        if table.size != depth.size * distance.size:
+            raise ValueError(
+                f"The AOCV table for '{block['object_spec']}' has {table.size} derates "
+                f"instead of {depth.size} depths times {distance.size} distances."
+            )
+        if np.any(np.diff(depth) <= 0) or np.any(np.diff(distance) <= 0):
+            raise ValueError(f"The AOCV indices for '{block['object_spec']}' must be increasing.")
+        tables.append({
+            'pattern': block['object_spec'].split('/')[-1],
+            'derate_types': tuple(block.get('derate_type', ' '.join(DERATE_TYPES)).split()),
+            'depth': depth,
+            'distance': distance,
+            'table': table.reshape(distance.size, depth.size),
+        })
+    return tables
+
+
+def read_aocv_tables(file_path):
+    """
+    Reads an AOCV derate side file, see parse_aocv_tables.
+
+    Args:
+        file_path (str): path to the AOCV file
+
+    Returns:
+        (list): the tables in file order
+    """
+    with open(file_path, 'r') as file:
+        return parse_aocv_tables(file.read())
+
+
+def aocv_table(tables, cell_name, analysis='late'):
+    """
+    Finds the AOCV table of a library cell, the last matching table winning.
+
+    Args:
+        tables (list): the result of parse_aocv_tables
+        cell_name (str): the library cell name
+        analysis (str): 'late' or 'early'
+
+    Returns:
+        (dict): the table, or None when no table matches the cell
+    """
+    return match_side_file_entry(tables, cell_name, analysis)
@@ -0,0 +1,74 @@
+from .side_file_reader import parse_side_file_blocks, match_side_file_entry
+
+# Analyses of a coefficient with no derate_type
+DERATE_TYPES = ('late', 'early')
+
+
+def parse_pocv_coefficients(content):
+    """
+    Parses a POCV coefficient side file, made of blocks of 'key: value' lines:
+
+        object_type: lib_cell
+        derate_type: late early
+        object_spec: sky130_fd_sc_hd__inv_*
+        coefficient: 0.05
+
+    Each coefficient applies to the library cells matching the object_spec pattern (a
+    library prefix such as 'lib/cell' is dropped) and to the analyses of its derate_type
+    (both when not given). The delay sigma of their arcs is the coefficient times the
+    mean delay. The other keys (version, rf_type, delay_type...) are ignored.
+
+    Args:
+        content (str): the content of the coefficient file
+
+    Returns:
+        (list): the coefficients in file order, dictionaries with the keys pattern,
+        coefficient and derate_types
+
+    Raises:
+        ValueError: if a coefficient has no object_spec or is not a non-negative number
+    """
+    coefficients = []
+    for block in parse_side_file_blocks(content, 'coefficient'):
+        try:
+            coefficient = float(block['coefficient'])
+        except ValueError:
+            coefficient = -1.0
+        if coefficient < 0:
+            raise ValueError(f"Invalid POCV coefficient '{block['coefficient']}'.")
+        coefficients.append({
+            'pattern': block['object_spec'].split('/')[-1],
+            'coefficient': coefficient,
+            'derate_types': tuple(block.get('derate_type', ' '.join(DERATE_TYPES)).split()),
+        })
+    return coefficients
+
+
+def read_pocv_coefficients(file_path):
+    """
+    Reads a POCV coefficient side file, see parse_pocv_coefficients.
+
+    Args:
+        file_path (str): path to the coefficient file
+
+    Returns:
+        (list): the coefficients in file order
+    """
+    with open(file_path, 'r') as file:
+        return parse_pocv_coefficients(file.read())
+
+
+def pocv_coefficient(coefficients, cell_name, analysis='late'):
+    """
+    Finds the POCV coefficient of a library cell, the last matching entry winning.
+
+    Args:
+        coefficients (list): the result of parse_pocv_coefficients
+        cell_name (str): the library cell name
+        analysis (str): 'late' or 'early'
+
+    Returns:
+        (float): the coefficient, or None when no entry matches the cell
+    """
+    entry = match_side_file_entry(coefficients, cell_name, analysis)
+    return None if entry is None else entry['coefficient']
@@ -1,5 +1,330 @@
 import re
 
+# SDC commands defining timing exceptions
+EXCEPTION_COMMANDS = {
+    'set_false_path': 'false_path',
+    'set_multicycle_path': 'multicycle_path',
+    'set_max_delay': 'max_delay',
+    'set_min_delay': 'min_delay',
+}
+
+
+def split_tcl_words(command):
+    """
+    Splits a Tcl command into words, keeping [..] and {..} groups as single words.
+
+    Args:
+        command (str): the command line, without line continuations
+
+    Returns:
+        (list): the words of the command
+    """
+    words = []
+    word = ''
+    depth = 0
+    for char in command:
+        if char in '[{':
+            depth += 1
+        elif char in ']}':
+            depth -= 1
+        if char.isspace() and depth == 0:
+            if word:
+                words.append(word)
+            word = ''
+        else:
+            word += char
+    if word:
+        words.append(word)
+    return words
+
+
+def parse_sdc_objects(word, keep_pins=False):
+    """
+    Extracts the object names of an SDC object argument, e.g. [get_pins {u1/A u2/A}],
+    {u1 u2} or u1. Pin names are reduced to their instance name, as the timing graph
+    nodes are instances and ports, unless keep_pins is set.
+
+    Args:
+        word (str): the SDC argument
+        keep_pins (bool): whether to keep the instance/pin names of the pins
+
+    Returns:
+        (list): the instance and port names, or None for clock objects
+    """
+    if word.startswith('['):
+        command = split_tcl_words(word[1:-1])
+        if command and command[0] == 'get_clocks':
+            return None
+        arguments = [arg for arg in command[1:] if not arg.startswith('-')]
+    else:
+        arguments = [word]
+
+    names = []
+    for argument in arguments:
+        for name in argument.strip('{}').split():
+            names.append(name if keep_pins else name.split('/')[0])
+    return list(dict.fromkeys(names))
+
+
+def parse_timing_exception(command):
+    """
+    Parses a set_false_path, set_multicycle_path, set_max_delay or set_min_delay command.
+
+    The -rise/-fall variants of -from, -through and -to are treated as their plain form,
+    and -from clock objects do not restrict the startpoints.
+
+    Args:
+        command (str): the SDC command
+
+    Returns:
+        (dict): the exception with the following keys: type, value (multiplier or
+        delay, None for false paths), from and to (lists of names, None when
+        unrestricted), through (list of name lists, in path order), setup and hold
+        (whether the exception applies to the setup and to the hold checks)
+    """
+    words = split_tcl_words(command)
+    exception = {
+        'type': EXCEPTION_COMMANDS[words[0]],
+        'value': None,
+        'from': None,
+        'through': [],
+        'to': None,
+        'setup': False,
+        'hold': False,
+    }
+    position = 1
+    while position < len(words):
+        word = words[position]
+        option = re.sub(r'^-(rise_|fall_)', '-', word)
+        if option in ('-from', '-to', '-through') and position + 1 < len(words):
+            names = parse_sdc_objects(words[position + 1])
+            if option == '-through':
+                exception['through'].append(names or [])
+            elif names is not None:
+                key = option[1:]
+                exception[key] = (exception[key] or []) + names
+            position += 2
+            continue
+        if option in ('-setup', '-hold'):
+            exception[option[1:]] = True
+        elif not word.startswith('-'):
+            exception['value'] = float(word)
+        position += 1
+
+    # the checks each exception applies to when not given
+    if exception['type'] == 'max_delay':
+        exception['setup'], exception['hold'] = True, False
+    elif exception['type'] == 'min_delay':
+        exception['setup'], exception['hold'] = False, True
+    elif not (exception['setup'] or exception['hold']):
+        exception['setup'] = True
+        exception['hold'] = exception['type'] == 'false_path'
+    return exception
+
+
+def parse_case_analysis(tcl_content):
+    """
+    Parses the set_case_analysis commands of an SDC file. Only the constant values are
+    kept, the rising and falling cases do not hold a net at a constant value.
+
+    Args:
+        tcl_content (str): the content of the .sdc file
+
+    Returns:
+        (dict): the constant value (0 or 1) of each port name and instance/pin name
+    """
+    constants = {'0': 0, 'zero': 0, '1': 1, 'one': 1}
+    case_analysis = {}
+    for line in tcl_content.replace('\\\n', ' ').splitlines():
+        words = split_tcl_words(line.strip())
+        if len(words) < 3 or words[0] != 'set_case_analysis' or words[1] not in constants:
+            continue
+        for name in parse_sdc_objects(words[2], keep_pins=True) or []:
+            case_analysis[name] = constants[words[1]]
+    return case_analysis
+
+
+def parse_ideal_networks(tcl_content):
+    """
+    Parses the set_ideal_network commands of an SDC file.
+
+    Args:
+        tcl_content (str): the content of the .sdc file
+
+    Returns:
+        (list): the port and instance names driving the ideal networks, pins being
+        reduced to their instance
+    """
+    ideal_networks = []
+    for line in tcl_content.replace('\\\n', ' ').splitlines():
+        words = split_tcl_words(line.strip())
+        if words and words[0] == 'set_ideal_network':
+            for word in words[1:]:
+                if not word.startswith('-'):
+                    ideal_networks.extend(parse_sdc_objects(word) or [])
+    return list(dict.fromkeys(ideal_networks))
+
+
+def parse_clock(command):
+    """
+    Parses a create_clock command. A clock without -name is named after its first
+    source, and a clock without -waveform rises at 0 and falls at half its period.
+
+    Args:
+        command (str): the SDC command
+
+    Returns:
+        (dict): the clock with the following keys: name, period, waveform (rise and
+        fall times) and sources (port and instance/pin names)
+    """
+    words = split_tcl_words(command)
+    clock = {'name': None, 'period': None, 'waveform': None, 'sources': []}
+    position = 1
+    while position < len(words):
+        word = words[position]
+        if word in ('-name', '-period', '-waveform') and position + 1 < len(words):
+            value = words[position + 1].strip('{}')
+            if word == '-name':
+                clock['name'] = value
+            elif word == '-period':
+                clock['period'] = float(value)
+            else:
+                clock['waveform'] = tuple(float(edge) for edge in value.split()[:2])
+            position += 2
+            continue
+        if not word.startswith('-'):
+            clock['sources'].extend(parse_sdc_objects(word, keep_pins=True) or [])
+        position += 1
+
+    if clock['period'] is None:
+        raise ValueError(f"create_clock without -period: {command}")
+    if clock['name'] is None:
+        if not clock['sources']:
+            raise ValueError(f"create_clock without -name nor source: {command}")
+        clock['name'] = clock['sources'][0]
+    if clock['waveform'] is None:
+        clock['waveform'] = (0.0, clock['period'] / 2)
+    return clock
+
+
+def parse_clocks(tcl_content):
+    """
+    Parses every create_clock command of an SDC file.
+
+    Args:
+        tcl_content (str): the content of the .sdc file
+
+    Returns:
+        (list): the clocks returned by parse_clock, in file order
+    """
+    clocks = []
+    for line in tcl_content.replace('\\\n', ' ').splitlines():
+        words = line.split()
+        if words and words[0] == 'create_clock':
+            clocks.append(parse_clock(line.strip()))
+    return clocks
+
+
+def parse_propagated_clocks(tcl_content, clocks):
+    """
+    Parses the set_propagated_clock commands of an SDC file. The clocks are given by
+    [all_clocks], by [get_clocks] names or by their source ports and pins.
+
+    Args:
+        tcl_content (str): the content of the .sdc file
+        clocks (list): the clocks returned by parse_clocks
+
+    Returns:
+        (list): the names of the clocks whose latency is propagated, in clock order
+    """
+    propagated = set()
+    for line in tcl_content.replace('\\\n', ' ').splitlines():
+        words = split_tcl_words(line.strip())
+        if not words or words[0] != 'set_propagated_clock':
+            continue
+        for word in words[1:]:
+            command = split_tcl_words(word[1:-1]) if word.startswith('[') else [word]
+            if command[0] == 'all_clocks':
+                propagated.update(clock['name'] for clock in clocks)
+                continue
+            arguments = command[1:] if word.startswith('[') else command
+            names = {name for argument in arguments for name in argument.strip('{}').split()}
+            propagated.update(
+                clock['name'] for clock in clocks
+                if clock['name'] in names or names & set(clock['sources'])
+            )
+    return [clock['name'] for clock in clocks if clock['name'] in propagated]
+
+
+def parse_timing_exceptions(tcl_content):
+    """
+    Parses every timing exception command of an SDC file.
+
+    Args:
+        tcl_content (str): the content of the .sdc file
+
+    Returns:
+        (list): the exceptions returned by parse_timing_exception, in file order
+    """
+    timing_exceptions = []
+    for line in tcl_content.replace('\\\n', ' ').splitlines():
+        words = line.split()
+        if words and words[0] in EXCEPTION_COMMANDS:
+            timing_exceptions.append(parse_timing_exception(line.strip()))
+    return timing_exceptions
+
+
+def parse_timing_derates(tcl_content):
+    """
+    Parses the set_timing_derate commands of an SDC file, given either as a value or
+    from the SYNTH_TIMING_DERATE environment variable.
+
+    Args:
+        tcl_content (str): the content of the .sdc file
+
+    Returns:
+        (list): the [derate, 'early' or 'late'] pairs, in file order
+    """
+    timing_derates = []
+    pattern_derate_env = r'set\s+::env\(SYNTH_TIMING_DERATE\)\s+([\d.]+)'
+    pattern_derate_early = (r'set_timing_derate\s+-early\s+'
+                            r'\[expr\s+\{1-\$::env\(SYNTH_TIMING_DERATE\)\}\]')
+    pattern_derate_late = (r'set_timing_derate\s+-late\s+'
+                           r'\[expr\s+\{1\+\$::env\(SYNTH_TIMING_DERATE\)\}\]')
+    pattern_derate_value = r'set_timing_derate\s+-(early|late)\s+([\d.]+)'
+
+    synth_timing_derate = None
+    for line in tcl_content.splitlines():
+        match_env = re.search(pattern_derate_env, line.strip())
+        if match_env:
+            synth_timing_derate = float(match_env.group(1))
+            continue
+
+        if re.search(pattern_derate_early, line.strip()) and synth_timing_derate is not None:
+            early_derate = 1 - synth_timing_derate
+            timing_derates.append([early_derate, 'early'])
+            continue
+
+        if re.search(pattern_derate_late, line.strip()) and synth_timing_derate is not None:
+            late_derate = 1 + synth_timing_derate
+            timing_derates.append([late_derate, 'late'])
+            continue
+
+        match_value = re.search(pattern_derate_value, line.strip())
+        if match_value:
+            timing_derates.append([float(match_value.group(2)), match_value.group(1)])
+    return timing_derates
+
+
+# The parse_* helper of each command family of sdc_parser, by the key of its result
+SDC_COMMAND_PARSERS = {
+    'timing_derates': parse_timing_derates,
+    'timing_exceptions': parse_timing_exceptions,
+    'case_analysis': parse_case_analysis,
+    'ideal_networks': parse_ideal_networks,
+    'clocks': parse_clocks,
+}
+
 
 def sdc_parser(file_path):
     """
@@ -12,7 +337,8 @@ def sdc_parser(file_path):
     Returns:
         (dict): a dictionary containing the following constraints:
         clock_transition, clock_hold_uncertainty, clock_setup_uncertainty,
-        in_out_delays, load_value, timing_derates
+        in_out_delays, load_value, timing_derates, timing_exceptions, case_analysis,
+        ideal_networks, clocks, propagated_clocks
     """
     # Initialize variables to store results
     clock_transition = None
@@ -20,7 +346,6 @@ def sdc_parser(file_path):
     clock_setup_uncertainty = None
     in_out_delays = []
     load_value = None
-    timing_derates = []
 
     # Read the content of the SDC file
     with open(file_path, 'r') as file:
@@ -62,26 +387,9 @@ def sdc_parser(file_path):
             load_value = match.group(1)
             break
 
-    # Timing Derates
-    pattern_derate_env = r'set\s+::env\(SYNTH_TIMING_DERATE\)\s+([\d.]+)'
-    pattern_derate_early = r'set_timing_derate\s+-early\s+\[expr\s+\{1-\$::env\(SYNTH_TIMING_DERATE\)\}\]'
-    pattern_derate_late = r'set_timing_derate\s+-late\s+\[expr\s+\{1\+\$::env\(SYNTH_TIMING_DERATE\)\}\]'
-
-    synth_timing_derate = None
-    for line in tcl_content.splitlines():
-        match_env = re.search(pattern_derate_env, line.strip())
-        if match_env:
-            synth_timing_derate = float(match_env.group(1))
-            continue
-
-        if re.search(pattern_derate_early, line.strip()) and synth_timing_derate is not None:
-            early_derate = 1 - synth_timing_derate
-            timing_derates.append([early_derate, 'early'])
-            continue
-
-        if re.search(pattern_derate_late, line.strip()) and synth_timing_derate is not None:
-            late_derate = 1 + synth_timing_derate
-            timing_derates.append([late_derate, 'late'])
+    # Timing Derates, Timing Exceptions, Case Analysis, Ideal Networks and Clocks
+    commands = {name: parse(tcl_content) for name, parse in SDC_COMMAND_PARSERS.items()}
+    commands['propagated_clocks'] = parse_propagated_clocks(tcl_content, commands['clocks'])
 
     # Return the results as a dictionary
     return {
@@ -90,5 +398,5 @@ def sdc_parser(file_path):
         'clock_setup_uncertainty': clock_setup_uncertainty,
         'in_out_delays': in_out_delays,
         'load_value': load_value,
-        'timing_derates': timing_derates
+        **commands
     }
@@ -0,0 +1,211 @@
+import gzip
+import re
+import numpy as np
+
+# Tokens of an SDF file: quoted strings, parentheses and words (with their escaped characters)
+SDF_TOKEN = re.compile(r'"[^"]*"|[()]|(?:\\.|[^\s()"\\])+')
+# Scale of the SDF time units to the library time unit, ns
+TIME_UNITS = {'S': 1e9, 'MS': 1e6, 'US': 1e3, 'NS': 1.0, 'PS': 1e-3, 'FS': 1e-6}
+# Timing checks read from the TIMINGCHECK sections
+TIMING_CHECKS = ('SETUP', 'HOLD', 'SETUPHOLD')
+
+
+def tokenize_sdf(lines):
+    """
+    Splits the lines of an SDF file into tokens, one line at a time, so that a large
+    file is never held in memory. The // and /* */ comments are dropped.
+
+    Args:
+        lines (iterable): the lines of the SDF file
+
+    Yields:
+        (str): the '(' and ')' tokens, the words and the quoted strings
+    """
+    in_comment = False
+    for line in lines:
+        if in_comment or '/*' in line:
+            line, in_comment = _strip_block_comments(line, in_comment)
+        for token in SDF_TOKEN.findall(line.split('//')[0]):
+            yield token
+
+
+def _strip_block_comments(line, in_comment):
+    # the parts of the line outside of the /* */ comments, and whether a comment is still open
+    text = ''
+    while line:
+        if in_comment:
+            end = line.find('*/')
+            if end < 0:
+                return text, True
+            line, in_comment = line[end + 2:], False
+        else:
+            start = line.find('/*')
+            if start < 0:
+                return text + line, False
+            text, line, in_comment = text + line[:start] + ' ', line[start + 2:], True
+    return text, in_comment
+
+
+def parse_sdf(lines):
+    """
+    Parses the cell and interconnect delays and the setup and hold checks of an SDF file.
+
+    The tokens are grouped into nested lists, one (CELL ...) block at a time: every block
+    is read into the result as soon as it is closed and then dropped, so only the
+    header and the current cell are held in memory. The ABSOLUTE IOPATH (conditional
+    or not) and INTERCONNECT delays and the SETUP, HOLD and SETUPHOLD checks are read,
+    the INCREMENT delays and the other constructs are ignored.
+
+    Each delay value is a min:typ:max triple, the early analysis using its min and the
+    late one its max (the typ value when they are missing). The setup times are the
+    late values and the hold times the early ones. The times are converted to ns.
+
+    Args:
+        lines (iterable): the lines of the SDF file
+
+    Returns:
+        (dict): iopath mapping (instance, input pin, output pin) to a (2, 2) array of
+        delays indexed by analysis (late, early) and output transition (rise, fall),
+        interconnect mapping (source pin, load pin) to a (2, 2) array indexed by
+        analysis and load transition, setup and hold mapping (instance, data pin) to the
+        (2,) rise and fall data checks, and the divider of the hierarchical names; the
+        missing values are NaN
+
+    Raises:
+        ValueError: if the parentheses are unbalanced or a time unit is not supported
+    """
+    sdf = {'iopath': {}, 'interconnect': {}, 'setup': {}, 'hold': {}, 'divider': '/', 'scale': 1.0}
+    stack = [[]]
+    for token in tokenize_sdf(lines):
+        if token == '(':
+            stack.append([])
+        elif token == ')':
+            if len(stack) < 2:
+                raise ValueError("Unbalanced parentheses in the SDF file.")
+            group = stack.pop()
+            if not _read_sdf_group(sdf, group):
+                stack[-1].append(group)
+        else:
+            stack[-1].append(token.strip('"').replace('\\', ''))
+    if len(stack) != 1:
+        raise ValueError("Unbalanced parentheses in the SDF file.")
+    del sdf['scale']
+    return sdf
+
+
+def _read_sdf_group(sdf, group):
+    # the header groups and the cells are read when closed, True when the group is consumed
+    keyword = group[0].upper() if group and isinstance(group[0], str) else None
+    if keyword == 'TIMESCALE':
+        sdf['scale'] = _time_scale(''.join(group[1:]))
+    elif keyword == 'DIVIDER' and len(group) > 1:
+        sdf['divider'] = group[1]
+    elif keyword == 'CELL':
+        _read_sdf_cell(sdf, group)
+    else:
+        return False
+    return True
+
+
+def _time_scale(timescale):
+    match = re.fullmatch(r'([\d.]*)\s*([a-zA-Z]+)', timescale)
+    if match is None or match.group(2).upper() not in TIME_UNITS:
+        raise ValueError(f"Unsupported SDF time scale '{timescale}'.")
+    return float(match.group(1) or 1.0) * TIME_UNITS[match.group(2).upper()]
+
+
+def _read_sdf_cell(sdf, cell):
+    # the delays and checks of a (CELL (CELLTYPE ..) (INSTANCE ..) ..) block
+    instance = ''
+    for group in cell[1:]:
+        keyword = _keyword(group)
+        if keyword == 'INSTANCE':
+            instance = group[1] if len(group) > 1 else ''
+        elif keyword == 'DELAY':
+            for section in group[1:]:
+                if _keyword(section) == 'ABSOLUTE':
+                    _read_sdf_delays(sdf, instance, section[1:])
+        elif keyword == 'TIMINGCHECK':
+            _read_sdf_checks(sdf, instance, group[1:])
+
+
+def _read_sdf_delays(sdf, instance, delays):
+    prefix = instance + sdf['divider'] if instance else ''
+    for delay in delays:
+        keyword = _keyword(delay)
+        if keyword == 'COND':
+            delay, keyword = delay[-1], _keyword(delay[-1])
+        if keyword == 'IOPATH' and instance:
+            key = (instance, _port_name(delay[1]), _port_name(delay[2]))
+            _merge_delays(sdf['iopath'], key, _delay_values(sdf, delay[3:]))
+        elif keyword == 'INTERCONNECT':
+            key = (prefix + _port_name(delay[1]), prefix + _port_name(delay[2]))
+            _merge_delays(sdf['interconnect'], key, _delay_values(sdf, delay[3:]))
+
+
+def _read_sdf_checks(sdf, instance, checks):
+    for check in checks:
+        keyword = _keyword(check)
+        if keyword not in TIMING_CHECKS or not instance:
+            continue
+        port = check[1][-1] if _keyword(check[1]) == 'COND' else check[1]
+        data, edge = _port_name(port), _keyword(port)
+        values = [_triple(sdf, value) for value in check[3:5]]
+        transitions = {'POSEDGE': [0], 'NEGEDGE': [1]}.get(edge, [0, 1])
+        for name, value in zip(('setup', 'hold') if keyword == 'SETUPHOLD'
+                               else (keyword.lower(),), values):
+            times = sdf[name].setdefault((instance, data), np.full(2, np.nan))
+            # the setup time of the late analysis, the hold time of the early one
+            times[transitions] = value[0 if name == 'setup' else 1]
+
+
+def _keyword(group):
+    return group[0].upper() if isinstance(group, list) and group and isinstance(group[0], str) \
+        else None
+
+
+def _port_name(port):
+    # the pin of a port, without its (posedge CLK) edge
+    return port[-1] if isinstance(port, list) else port
+
+
+def _triple(sdf, value):
+    # the (late, early) values of a (min:typ:max) triple, NaN when empty
+    parts = [float(part) * sdf['scale'] for part in ''.join(value).split(':') if part]
+    if not parts:
+        return np.nan, np.nan
+    return max(parts), min(parts)
+
+
+def _delay_values(sdf, values):
+    # the (2, 2) delays of the rise and fall values, a single value applying to both
+    triples = [_triple(sdf, value) for value in values[:2] if isinstance(value, list)]
+    if not triples:
+        return np.full((2, 2), np.nan)
+    rise, fall = triples[0], triples[-1]
+    return np.array([rise, fall]).T
+
+
+def _merge_delays(delays, key, values):
+    # the conditional delays of an arc are merged into its worst late and early delays
+    if key not in delays:
+        delays[key] = values
+        return
+    merged = delays[key]
+    merged[0] = np.fmax(merged[0], values[0])
+    merged[1] = np.fmin(merged[1], values[1])
+
+
+def read_sdf(file_path):
+    """
+    Reads an SDF file, or a gzip compressed one, see parse_sdf.
+
+    Args:
+        file_path (str): path to the .sdf or .sdf.gz file
+
+    Returns:
+        (dict): the delays and timing checks of the file
+    """
+    file = gzip.open(file_path, 'rt') if file_path.endswith('.gz') else open(file_path, 'r')
+    with file:
+        return parse_sdf(file)
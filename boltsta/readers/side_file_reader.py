@@ -0,0 +1,53 @@
+import fnmatch
+
+
+def parse_side_file_blocks(content, closing_key):
+    """
+    Splits a variation side file (POCV coefficients, AOCV tables) into its blocks of
+    'key: value' lines. A block ends with its closing_key line; the keys it does not
+    set carry over from the previous block, except object_spec. Comments start with '#'
+    and lines ending with '\\' continue on the next line.
+
+    Args:
+        content (str): the content of the side file
+        closing_key (str): the key ending every block, e.g. 'coefficient'
+
+    Returns:
+        (list): the 'key: value' dictionary of every block, in file order
+
+    Raises:
+        ValueError: if a block has no object_spec
+    """
+    blocks = []
+    block = {}
+    for line in content.replace('\\\n', ' ').splitlines():
+        line = line.split('#')[0].strip()
+        if ':' not in line:
+            continue
+        key, value = (part.strip() for part in line.split(':', 1))
+        block[key] = value
+        if key != closing_key:
+            continue
+        if 'object_spec' not in block:
+            raise ValueError(f"The {closing_key} '{value}' has no object_spec.")
+        blocks.append(dict(block))
+        del block[closing_key], block['object_spec']
+    return blocks
+
+
+def match_side_file_entry(entries, cell_name, analysis='late'):
+    """
+    Finds the last entry of a side file matching a library cell and an analysis.
+
+    Args:
+        entries (list): entries with the keys pattern and derate_types
+        cell_name (str): the library cell name
+        analysis (str): 'late' or 'early'
+
+    Returns:
+        (dict): the entry, or None when no entry matches the cell
+    """
+    for entry in reversed(entries or []):
+        if analysis in entry['derate_types'] and fnmatch.fnmatchcase(cell_name, entry['pattern']):
+            return entry
+    return None
@@ -0,0 +1,225 @@
+import gzip
+from array import array
+from collections import deque
+import numpy as np
+
+# Scale of the SPEF units to the library units: capacitances in pF, resistances in kohm
+CAPACITANCE_UNITS = {'FF': 1e-3, 'PF': 1.0, 'NF': 1e3, 'UF': 1e6}
+RESISTANCE_UNITS = {'OHM': 1e-3, 'KOHM': 1.0, 'MOHM': 1e3}
+
+
+def open_spef(file_path):
+    """
+    Opens a SPEF file for reading, decompressing a '.gz' file on the fly.
+
+    Args:
+        file_path (str): path to the .spef or .spef.gz file
+
+    Returns:
+        (file): the text stream of the file
+    """
+    if file_path.endswith('.gz'):
+        return gzip.open(file_path, 'rt')
+    return open(file_path, 'r')
+
+
+def new_parasitics():
+    """
+    Creates the empty flat arrays of the RC trees of a SPEF file, see parse_spef.
+
+    Returns:
+        (dict): the parasitics being filled by add_rc_tree
+    """
+    return {
+        'nets': [],
+        'net_driver': array('q'),
+        'cap': array('d'),
+        'parent': array('q'),
+        'resistance': array('d'),
+        'level': array('q'),
+        'net': array('q'),
+        'pins': {},
+        'delimiter': ':',
+    }
+
+
+def add_rc_tree(parasitics, net_name, nodes, caps, resistors, driver, pins):
+    """
+    Orients the RC network of a net from its driver and appends it to the flat arrays.
+
+    The nodes are appended in breadth first order from the driver, each with its
+    parent node, the resistance to its parent and its level in the tree. Resistors
+    closing a loop are dropped and the nodes not connected to the driver are attached
+    to it without resistance, so that every net is a tree.
+
+    Args:
+        parasitics (dict): the arrays of new_parasitics
+        net_name (str): the name of the net
+        nodes (int): the number of nodes of the net
+        caps (list): the ground capacitance of each node
+        resistors (list): the (node, node, resistance) of each resistor
+        driver (int): the driver node, 0 when the net has none
+        pins (dict): the node of each instance or port pin of the net
+    """
+    adjacency = [[] for _ in range(nodes)]
+    for first, second, resistance in resistors:
+        adjacency[first].append((second, resistance))
+        adjacency[second].append((first, resistance))
+
+    offset = len(parasitics['cap'])
+    parent = [-1] * nodes
+    resistance = [0.0] * nodes
+    level = [0] * nodes
+    order = [driver]
+    visited = [False] * nodes
+    visited[driver] = True
+    queue = deque(order)
+    while queue:
+        node = queue.popleft()
+        for other, value in adjacency[node]:
+            if not visited[other]:
+                visited[other] = True
+                parent[other], resistance[other], level[other] = node, value, level[node] + 1
+                order.append(other)
+                queue.append(other)
+    for node in range(nodes):
+        if not visited[node]:
+            parent[node], level[node] = driver, 1
+            order.append(node)
+
+    position = [0] * nodes
+    for index, node in enumerate(order):
+        position[node] = offset + index
+    for node in order:
+        parasitics['cap'].append(caps[node])
+        parasitics['parent'].append(-1 if parent[node] < 0 else position[parent[node]])
+        parasitics['resistance'].append(resistance[node])
+        parasitics['level'].append(level[node])
+        parasitics['net'].append(len(parasitics['nets']))
+    parasitics['net_driver'].append(offset)
+    parasitics['nets'].append(net_name)
+    parasitics['pins'].update({pin: position[node] for pin, node in pins.items()})
+
+
+def parse_spef(lines):
+    """
+    Parses the detailed nets (*D_NET) of a SPEF file, one line at a time, so that a
+    large file is never held in memory.
+
+    Each net keeps its RC tree in flat arrays shared by all the nets (see add_rc_tree):
+    the ground capacitance of every node, with the coupling capacitances grounded, and
+    the resistance to its parent. The capacitances are converted to pF and the
+    resistances to kohm, so their product is in ns. Only the *CONN, *CAP and *RES
+    sections are read.
+
+    Args:
+        lines (iterable): the lines of the SPEF file
+
+    Returns:
+        (dict): the nets names, and the flat (nodes,) arrays cap, parent (-1 for the
+        driver of each net), resistance, level and net (index of the node's net), the
+        (nets,) net_driver node, the pins dictionary mapping 'instance:pin' and port
+        names to their node and the delimiter of the instance and pin names
+
+    Raises:
+        ValueError: if a unit is not supported
+    """
+    parasitics = new_parasitics()
+    state = {'cap_unit': 1e-3, 'res_unit': 1e-3, 'delimiter': ':', 'name_map': {},
+             'section': None, 'net': None}
+    for line in lines:
+        fields = line.split('//')[0].split()
+        if not fields or _parse_spef_header(state, fields):
+            continue
+        if fields[0] == '*D_NET':
+            state['net'] = {'name': _resolve_name(state, fields[1]), 'nodes': {}, 'caps': [],
+                            'resistors': [], 'driver': 0, 'pins': {}}
+            state['section'] = None
+        elif fields[0] == '*END' and state['net'] is not None:
+            net = state['net']
+            if net['caps']:
+                add_rc_tree(parasitics, net['name'], len(net['caps']), net['caps'],
+                            net['resistors'], net['driver'], net['pins'])
+            state['net'] = state['section'] = None
+        elif state['net'] is not None:
+            _parse_net_line(state, fields)
+
+    parasitics['delimiter'] = state['delimiter']
+    return {
+        name: np.frombuffer(values, dtype=np.int64 if values.typecode == 'q' else float)
+        if isinstance(values, array) else values
+        for name, values in parasitics.items()
+    }
+
+
+def _parse_spef_header(state, fields):
+    # the units, delimiter, name map and section keywords, True when the line is one of them
+    keyword = fields[0]
+    if keyword == '*C_UNIT':
+        state['cap_unit'] = float(fields[1]) * _unit_scale(CAPACITANCE_UNITS, fields[2])
+    elif keyword == '*R_UNIT':
+        state['res_unit'] = float(fields[1]) * _unit_scale(RESISTANCE_UNITS, fields[2])
+    elif keyword == '*DELIMITER':
+        state['delimiter'] = fields[1]
+    elif keyword in ('*NAME_MAP', '*PORTS', '*CONN', '*CAP', '*RES', '*INDUC'):
+        state['section'] = keyword
+    elif state['section'] == '*NAME_MAP' and keyword[1:].isdigit():
+        state['name_map'][keyword] = fields[1]
+    else:
+        return False
+    return True
+
+
+def _parse_net_line(state, fields):
+    # a pin, capacitance or resistance of the current net
+    net, section = state['net'], state['section']
+    if section == '*CONN' and fields[0] in ('*P', '*I'):
+        name = _resolve_name(state, fields[1])
+        node = _node_index(net, name)
+        net['pins'][name] = node
+        # an input port or an output pin drives the net
+        if (fields[0], fields[2]) in (('*P', 'I'), ('*I', 'O')):
+            net['driver'] = node
+    elif section == '*CAP':
+        # a coupling capacitance is grounded at the node of this net
+        node = _node_index(net, _resolve_name(state, fields[1]))
+        net['caps'][node] += float(fields[-1]) * state['cap_unit']
+    elif section == '*RES':
+        net['resistors'].append((_node_index(net, _resolve_name(state, fields[1])),
+                                 _node_index(net, _resolve_name(state, fields[2])),
+                                 float(fields[3]) * state['res_unit']))
+
+
+def _resolve_name(state, name):
+    # the '*index' references of the name map, without the escape characters
+    if name.startswith('*'):
+        head, separator, tail = name.partition(state['delimiter'])
+        name = state['name_map'].get(head, head) + separator + tail
+    return name.replace('\\', '')
+
+
+def _node_index(net, name):
+    if name not in net['nodes']:
+        net['nodes'][name] = len(net['caps'])
+        net['caps'].append(0.0)
+    return net['nodes'][name]
+
+
+def read_spef(file_path):
+    """
+    Reads a SPEF file, or a gzip compressed one, see parse_spef.
+
+    Args:
+        file_path (str): path to the .spef or .spef.gz file
+
+    Returns:
+        (dict): the RC trees of the detailed nets
+    """
+    with open_spef(file_path) as file:
+        return parse_spef(file)
+
+
+def _unit_scale(units, name):
+    if name.upper() not in units:
+        raise ValueError(f"Unsupported SPEF unit '{name}'.")
+    return units[name.upper()]
@@ -200,7 +200,8 @@ def modify_input_pins(ast, input_pins, output_pins):
         output_pins (list): List of output pins.
 
     Returns:
-        object: Modified AST with updated input pin names.
+        object: Modified AST with updated input pin names, and the output pin of each
+        instance in its output_pin attribute.
 
     Raises:
         ValueError: If input_pins or output_pins is not a list, or if the AST structure is invalid.
@@ -228,6 +229,8 @@ def modify_input_pins(ast, input_pins, output_pins):
             # Special case handling for "RESET_B" as it should not be used as the output pin
             if output_pin == "RESET_B":
                 output_pin = "Q"
+            # Kept on the instance, it selects the function of the multi-output cells
+            instance.output_pin = output_pin
 
             # Iterate over each connection key (pin)
             for key in connections:
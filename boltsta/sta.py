@@ -1,25 +1,777 @@
-from .readers import sdc_parser,parse_liberty_file
-from .network import graph_path_handler
+import logging
+import os
+import numpy as np
+from .readers import (
+    sdc_parser, parse_liberty_file, read_pocv_coefficients, read_aocv_tables, read_spef, read_sdf,
+)
+from .network.graph_creator import graph_creation_func
+from .network.path_detector import all_paths_info
+from .network.levelizer import build_timing_graph, load_sequential_names
+from .network.path_counter import count_paths, estimate_enumeration_cost, select_timing_algorithm
+from .network.reachability import build_reachability_index, select_path_cone
+from .network.cone_extractor import extract_path_cone, get_cone_fanout_dict
+from .network.exceptions import build_exception_index
+from .network.scan_pruning import prune_scan_arcs
+from .network.constant_propagation import propagate_constants
+from .network.clock_domains import assign_clock_domains, group_clock_domains
+from .network.ideal_networks import find_ideal_networks, hide_ideal_networks
+from .network.mode_overlay import build_mode_overlay, intersect_cones
 from .model import Model
+from .model.propagation import (
+    LATE, EARLY, propagate_arrival_times, evaluate_endpoints, extract_worst_paths,
+    extract_capture_edges,
+)
+from .model.domain_analysis import build_domain_tasks, analyze_clock_domains
+from .model.modes import mode_name, analyze_modes
+from .model.pocv import propagate_pocv_arrivals, pocv_slack_statistics
+from .model.monte_carlo import (
+    monte_carlo_arc_delays, monte_carlo_required_times, monte_carlo_slacks, monte_carlo_statistics,
+)
+from .model.clock_latency import compute_clock_latencies, extract_path_latencies
+from .model.derates import build_node_derates
+from .model.net_delays import compute_net_delays
+from .model.sdf_annotation import annotate_sdf_delays
+from .model.period_sweep import (
+    setup_slack_terms, sweep_setup_slack, minimum_period, sweep_launch_domain,
+)
+from .model.corners import (
+    corner_name, stack_corner_tables, propagate_corner_arrivals, select_corner,
+    merge_corner_endpoints, extract_corner_worst_paths,
+)
+from .model.path_search import (
+    get_node_loads, compute_slew_bounds, compute_required_bounds, search_critical_paths,
+    format_searched_paths
+)
+from .utils import (
+    extract_cell_pin_mapping, compile_cell_pin_mapping, extract_cell_functions, extract_clock_pins,
+    extract_ideal_pins, extract_scan_pins, generate_timing_report, generate_sweep_report,
+    generate_monte_carlo_report,
+)
 
-def run_sta(library_path,design_path,sdc_path,dir):
 
-    # first step is to read liberty file
-    pdk_path = parse_liberty_file(library_path)
+# clock of the designs whose SDC does not create one
+DEFAULT_CLOCK = {'name': 'core_clock', 'period': 10, 'waveform': (0, 5), 'sources': []}
 
-    # seconcd step is to read the constraints
-    sdc_constraints = sdc_parser(sdc_path)
+# the features of a run, reported by their names
+FEATURE_NAMES = {
+    'corners': "multi-corner", 'modes': "multi-mode", 'clocks': "multi-clock",
+    'sweep': "period sweep", 'exceptions': "timing exception", 'pocv': "POCV",
+    'monte_carlo': "Monte Carlo", 'aocv': "AOCV", 'spef': "SPEF", 'sdf': "SDF", 'hold': "hold",
+    'through': "-through", 'path_search': "slack threshold", 'clock_latency': "propagated clock",
+}
+# the other features each feature supports, a run combining two features that do not support
+# each other is rejected; the features missing here are supported by all the others. The
+# corners, modes and clock domains each split the run into reports of their own, POCV, Monte
+# Carlo and AOCV are distinct variation models and the SDF interconnect delays already
+# include the SPEF wires
+FEATURE_SUPPORT = {
+    'corners': {'aocv', 'spef', 'sdf'},
+    'modes': {'aocv', 'spef', 'sdf'},
+    'clocks': {'sweep', 'pocv', 'aocv', 'spef', 'sdf'},
+    'sweep': {'clocks', 'pocv', 'aocv', 'spef', 'sdf'},
+    'pocv': {'clocks', 'sweep', 'spef', 'sdf'},
+    'monte_carlo': {'aocv', 'spef', 'sdf'},
+    'aocv': {'corners', 'modes', 'clocks', 'sweep', 'monte_carlo', 'spef', 'sdf'},
+    'spef': {'corners', 'modes', 'clocks', 'sweep', 'pocv', 'monte_carlo', 'aocv'},
+    'sdf': {'corners', 'modes', 'clocks', 'sweep', 'pocv', 'monte_carlo', 'aocv'},
+}
+# the features the exhaustive path timing supports, the others are only timed by the propagation
+EXHAUSTIVE_FEATURES = {'aocv'}
+# the features the bounds of the branch and bound path search support
+PATH_SEARCH_FEATURES = {'hold', 'through', 'exceptions', 'path_search'}
 
-    # constraints variables needed
-    clock_transition = sdc_constraints['clock_transition']
-    clock_hold_uncertainty = sdc_constraints['clock_hold_uncertainty']
-    clock_setup_uncertainty = sdc_constraints['clock_setup_uncertainty']
-    timing_derates = sdc_constraints['timing_derates']
 
-    # third step is to generate the grapth 
-    rr, rr_atr_list, ir, ir_atr_list, ro, ro_atr_list, fanout_dict = graph_path_handler(design_path)
+def _sdc_float(value, default):
+    # sdc_parser returns the matched strings, or None if the command is missing
+    return default if value is None else float(value)
 
-    # fourh step is to generate the timing reports
-    Model(pdk_path,rr,rr_atr_list,clock_transition,0.14,dir,0,clock_setup_uncertainty,10)
-    
-    pass
\ No newline at end of file
+
+def _report_searched_paths(run):
+    # branch and bound search of the setup paths with a slack lesser than the threshold
+    timing_graph, cell_mapping, pdk_path = run['timing_graph'], run['cell_mapping'], run['library']
+    clock, cone, exception_index = run['clock'], run['cone'], run['exception_index']
+    clock_transition, clock_setup_uncertainty = (run['clock_transition'],
+                                                 run['clock_setup_uncertainty'])
+    slack_lesser_than = run['slack_lesser_than']
+    loads = get_node_loads(timing_graph, run['fanout'], pdk_path)
+    slews = compute_slew_bounds(timing_graph, loads, cell_mapping, clock_transition, cone)
+    required = compute_required_bounds(timing_graph, slews, loads, cell_mapping, pdk_path, 0.14, 0,
+                                       clock_setup_uncertainty, clock['period'], cone,
+                                       exception_index)
+    searched = search_critical_paths(timing_graph, required, loads, cell_mapping, pdk_path,
+                                     slack_lesser_than, clock_transition, 0.14, 0,
+                                     clock_setup_uncertainty, clock['period'], cone,
+                                     exception_index)
+    logging.info(f"Path search: {len(searched['paths'])} paths with slack lesser than "
+                 f"{slack_lesser_than}, {searched['expanded']} partial paths extended and "
+                 f"{searched['pruned']} pruned")
+    formatted = format_searched_paths(timing_graph, searched, run['top_k'])
+    generate_timing_report(formatted["paths"], run['report_path'], 0, 0, clock_setup_uncertainty,
+                           clock['period'], capture_edges=formatted["capture_edges"],
+                           launch_clock=clock['name'], capture_clock=clock['name'])
+
+
+def _report_clock_domains(groups, clocks, report_path, hold_report_path, clock_setup_uncertainty,
+                          clock_hold_uncertainty):
+    # one path group per launch / capture clock pair, the cross domain pairs after the clock ones
+    periods = {clock['name']: clock['period'] for clock in clocks}
+    order = sorted(groups, key=lambda pair: pair[0] != pair[1])
+    for analysis, path, uncertainty, path_type in (
+            ("late", report_path, clock_setup_uncertainty, "max"),
+            ("early", hold_report_path, clock_hold_uncertainty, "min")):
+        if not any(analysis in groups[pair] for pair in order):
+            continue
+        open(path, "w").close()
+        for launch, capture in order:
+            group = groups[(launch, capture)][analysis]
+            logging.info(f"Path group {launch} -> {capture}: {group['endpoints']} {path_type} "
+                         f"endpoints, worst slack {group['worst_slack']:.4f}")
+            generate_timing_report(group["paths"], path, 0, 0, uncertainty, periods[capture],
+                                   path_type=path_type, capture_edges=group["capture_edges"],
+                                   launch_clock=launch, capture_clock=capture,
+                                   path_group=capture if launch == capture
+                                   else f"{launch}->{capture}",
+                                   append=True, clock_latencies=group["clock_latencies"])
+
+
+def _analyze_clock_domains(run):
+    # the paths of each launch / capture clock pair are analyzed and reported apart, a period
+    # sweep moves the required times of each launch domain
+    timing_graph, clocks = run['timing_graph'], run['clocks']
+    domains = assign_clock_domains(run['G_design'], extract_clock_pins(run['library']), clocks,
+                                   run['sequential_names'])
+    logging.info("Clock domains: " + ", ".join(
+        f"{name} ({len(nodes)} flip-flops)"
+        for name, nodes in group_clock_domains(domains, clocks).items()))
+    tasks = build_domain_tasks(timing_graph, build_reachability_index(timing_graph), domains,
+                               clocks, run['from_nodes'], run['through_nodes'], run['to_nodes'])
+    shared = {
+        'timing_graph': timing_graph, 'fanout': run['fanout'],
+        'cell_pin_mapping': run['cell_mapping'], 'library': run['library'],
+        'exception_index': run['exception_index'], 'clock_transition': run['clock_transition'],
+        'related_pin_time': 0.14, 'clock_setup_uncertainty': run['clock_setup_uncertainty'],
+        'clock_hold_uncertainty': run['clock_hold_uncertainty'], 'top_k': run['top_k'],
+        'analyses': ("late", "early") if 'hold' in run['features'] else ("late",),
+        'slack_lesser_than': run['slack_lesser_than'], 'clock_latency': run['clock_latency'],
+        'delay_cache': run['delay_cache'], 'derates': run['derates'],
+        'net_delays': run['net_delays'], 'sdf_delays': run['sdf_delays'],
+        'pocv': _pocv_settings(run),
+    }
+    if 'sweep' in run['features']:
+        periods = {clock['name']: run['sweep_periods'] or [clock['period']] for clock in clocks}
+        return _report_period_sweep({
+            launch: sweep_launch_domain(task, shared, launch, periods[launch],
+                                        run['sweep_uncertainties'])
+            for launch, task in tasks.items()
+        }, run['dir'])
+    _report_clock_domains(analyze_clock_domains(tasks, shared, run['jobs']), clocks,
+                          run['report_path'], run['hold_report_path'],
+                          run['clock_setup_uncertainty'], run['clock_hold_uncertainty'])
+    return run['report_path']
+
+
+def _log_pocv_slack(timing_graph, propagated, endpoints, analysis):
+    # the reported slacks are n-sigma slacks, the worst one is split into its mean and sigma
+    for name, prefix in (("late", ""), ("early", "hold_"))[:2 if analysis == "setup_hold" else 1]:
+        slack = endpoints[f"{prefix}slack"]
+        if not np.isfinite(slack).any():
+            continue
+        worst = int(np.argmin(slack))
+        statistics = pocv_slack_statistics(timing_graph, propagated, endpoints, name)
+        logging.info(f"POCV {'setup' if name == 'late' else 'hold'}: worst "
+                     f"{propagated['n_sigma']:g}-sigma slack {slack[worst]:.4f} "
+                     f"(mean {statistics['mean_slack'][worst]:.4f}, "
+                     f"sigma {statistics['sigma'][worst]:.4f})")
+
+
+def _report_monte_carlo(timing_graph, nominal, endpoints, fanout_dict, cell_mapping, pdk_path,
+                        clock_period, clock_setup_uncertainty, cone, clock_latency, monte_carlo,
+                        top_k, dir):
+    # the samples scale the nominal arc delays, the required times stay nominal
+    arc_delays = monte_carlo_arc_delays(timing_graph, nominal, fanout_dict, cell_mapping,
+                                        pdk_path, cone, clock_latency)
+    required = monte_carlo_required_times(timing_graph, nominal, pdk_path, 0.14, clock_period,
+                                          clock_setup_uncertainty, cone, clock_latency)
+    statistics = monte_carlo_statistics(monte_carlo_slacks(arc_delays, required, monte_carlo))
+    nominal_slack = dict(zip(endpoints['arc'], endpoints['slack']))
+    names = [timing_graph['names'][timing_graph['arc_to'][arc]] for arc in required['arc']]
+    monte_carlo_report_path = os.path.join(dir, "monte_carlo_report.txt")
+    generate_monte_carlo_report(statistics, names,
+                                [nominal_slack[arc] for arc in required['arc']], monte_carlo,
+                                monte_carlo_report_path, top_k)
+    logging.info(f"Monte Carlo: {monte_carlo['samples']} samples over {len(required['arc'])} "
+                 f"endpoints, design yield {statistics['design_yield']:.2%}, "
+                 f"report {monte_carlo_report_path}")
+
+
+def _timing_derates(timing_derates):
+    # late and early derates of set_timing_derate, 1 when not set
+    derates = {'late': 1.0, 'early': 1.0}
+    for value, analysis in timing_derates:
+        derates[analysis] = float(value)
+    return derates['late'], derates['early']
+
+
+def _node_derates(timing_graph, timing_derates, aocv_tables):
+    # the cell delay derates of every node, None when the delays are not derated
+    derates = _timing_derates(timing_derates)
+    if derates == (1.0, 1.0) and not aocv_tables:
+        return None
+    node_derates = build_node_derates(timing_graph, derates, aocv_tables)
+    logging.info(f"Timing derates: late {node_derates[LATE].min():.4f} to "
+                 f"{node_derates[LATE].max():.4f}, early {node_derates[EARLY].min():.4f} to "
+                 f"{node_derates[EARLY].max():.4f}"
+                 + (f", AOCV depth up to {timing_graph['depth'].max()}" if aocv_tables else ""))
+    return node_derates
+
+
+def _net_delays(timing_graph, fanout_dict, cell_mapping, pdk_path, clock_transition,
+                exception_index, clock_latency, derates, parasitics, cone=None):
+    # the drivers see the total capacitance of their nets first, then their effective
+    # capacitance at the output transitions this first propagation gives
+    net_delays = compute_net_delays(timing_graph, parasitics, pdk_path)
+    propagated = propagate_arrival_times(timing_graph, fanout_dict, cell_mapping, pdk_path,
+                                         clock_transition, cone, exception_index, clock_latency,
+                                         None, derates, net_delays)
+    net_delays = compute_net_delays(timing_graph, parasitics, pdk_path,
+                                    propagated['slew'][LATE].max(axis=0))
+    annotated = net_delays['wire_delay'] > 0
+    logging.info(f"Parasitics: {len(parasitics['nets'])} nets, {annotated.sum()} of "
+                 f"{len(annotated)} arcs annotated, wire delay up to "
+                 f"{net_delays['wire_delay'].max(initial=0.0):.4f}")
+    return net_delays
+
+
+def _sdf_delays(timing_graph, sdf_path):
+    # the SDF delays annotated on the timing graph, None without SDF file
+    if sdf_path is None:
+        return None
+    sdf_delays = annotate_sdf_delays(timing_graph, read_sdf(sdf_path))
+    logging.info(f"SDF: {sdf_delays['annotated']} of {len(timing_graph['arc_from'])} arcs "
+                 f"annotated, {sdf_delays['needs_slew'].sum()} pins computing their slews "
+                 f"from the Liberty tables")
+    return sdf_delays
+
+
+def _compute_clock_latencies(G_design, timing_graph, clocks, propagated_clocks, pdk_path,
+                             cell_mapping, clock_transition, sequential_names, timing_derates):
+    # propagated clock latencies of the flip-flops, None while every clock stays ideal
+    propagated = [clock for clock in clocks if clock['name'] in propagated_clocks]
+    if not propagated:
+        return None
+    clock_latency = compute_clock_latencies(G_design, timing_graph, propagated,
+                                            extract_clock_pins(pdk_path), cell_mapping, pdk_path,
+                                            clock_transition, sequential_names,
+                                            _timing_derates(timing_derates))
+    if not clock_latency['latency'].any():
+        logging.info("Propagated clocks: no clock tree cells, the clocks stay ideal")
+        return None
+    logging.info(f"Propagated clocks: latency from {clock_latency['latency'].min():.4f} "
+                 f"to {clock_latency['latency'].max():.4f}")
+    return clock_latency
+
+
+def _report_period_sweep(sweeps, dir):
+    # the sweep of each clock, with its minimum period
+    for clock_name, sweep in sweeps.items():
+        logging.info(f"Period sweep {clock_name}: {len(sweep['periods'])} periods x "
+                     f"{len(sweep['uncertainties'])} uncertainties over {sweep['endpoints']} "
+                     f"endpoints, minimum period {sweep['minimum_period'].max():.4f}")
+    sweep_report_path = os.path.join(dir, "period_sweep_report.txt")
+    generate_sweep_report(sweeps, sweep_report_path)
+    return sweep_report_path
+
+
+def _report_corners(timing_graph, fanout_dict, corners, libraries, mappings, latencies,
+                    clock_transition, cone, exception_index, clock, clock_setup_uncertainty,
+                    clock_hold_uncertainty, top_k, analysis, slack_lesser_than, dir, derates,
+                    net_delays, sdf_delays):
+    # the arrivals of every corner are propagated together
+    stacked = propagate_corner_arrivals(timing_graph, fanout_dict, stack_corner_tables(mappings),
+                                        libraries, clock_transition, cone, derates,
+                                        exception_index, latencies, net_delays, sdf_delays)
+    propagated = [select_corner(stacked, corner) for corner in range(len(corners))]
+    endpoints = [evaluate_endpoints(timing_graph, corner_propagated, library, 0.14, 0,
+                                    clock_setup_uncertainty, clock['period'],
+                                    clock_hold_uncertainty, cone, clock_latency=latency)
+                 for corner_propagated, library, latency in zip(propagated, libraries, latencies)]
+    merged = merge_corner_endpoints(endpoints)
+
+    checks = [("late", "setup", clock_setup_uncertainty, "max")]
+    if analysis == "setup_hold":
+        checks.append(("early", "hold", clock_hold_uncertainty, "min"))
+    for analysis_name, check, uncertainty, path_type in checks:
+        prefix = "" if analysis_name == "late" else "hold_"
+        count = top_k
+        if slack_lesser_than is not None and analysis_name == "late":
+            count = min(top_k, int((merged['slack'] < slack_lesser_than).sum()))
+        # one report per corner
+        for corner, name in enumerate(corners):
+            slack = merged[f'corner_{prefix}slack'][corner]
+            slack = slack[np.isfinite(slack)]
+            logging.info(f"Corner {name}: {len(slack)} {path_type} endpoints, worst slack "
+                         f"{slack.min() if len(slack) else np.inf:.4f}, total negative slack "
+                         f"{np.minimum(slack, 0).sum():.4f}")
+            paths = extract_worst_paths(timing_graph, propagated[corner], endpoints[corner],
+                                        count, analysis_name, latencies[corner])
+            generate_timing_report(
+                paths, os.path.join(dir, f"{check}_timing_report_{name}.txt"), 0, 0,
+                uncertainty, clock['period'], path_type=path_type,
+                capture_edges=extract_capture_edges(endpoints[corner], count, analysis_name),
+                launch_clock=clock['name'], capture_clock=clock['name'],
+                clock_latencies=None if latencies[corner] is None else
+                extract_path_latencies(timing_graph, paths, latencies[corner], analysis_name))
+        # the worst case over the corners, every endpoint in its worst corner
+        paths, capture_edges, path_corners = extract_corner_worst_paths(
+            timing_graph, propagated, endpoints, merged, count, analysis_name, latencies)
+        clock_latencies = None
+        if any(latency is not None for latency in latencies):
+            clock_latencies = {
+                path_key: extract_path_latencies(timing_graph, {path_key: paths[path_key]},
+                                                 latencies[corner], analysis_name)[path_key]
+                for path_key, corner in path_corners.items()
+            }
+        generate_timing_report(
+            paths, os.path.join(dir, f"{check}_timing_report.txt"), 0, 0, uncertainty,
+            clock['period'], path_type=path_type, capture_edges=capture_edges,
+            launch_clock=clock['name'], capture_clock=clock['name'],
+            clock_latencies=clock_latencies,
+            path_corners={path_key: corners[corner] for path_key, corner in path_corners.items()})
+    return os.path.join(dir, "setup_timing_report.txt")
+
+
+def _clock_constraints(sdc_constraints):
+    # clock transition, setup and hold uncertainties of the SDC, with their defaults
+    return (_sdc_float(sdc_constraints['clock_transition'], 0.15),
+            _sdc_float(sdc_constraints['clock_setup_uncertainty'], 0.0),
+            _sdc_float(sdc_constraints['clock_hold_uncertainty'], 0.0))
+
+
+def _constrained_graph(G_design, pdk_path, sdc_constraints, functional, sequential_names):
+    # clock and reset networks are ideal, they are neither searched nor loaded
+    ideal_pins = extract_ideal_pins(pdk_path)
+    ideal_fanout = find_ideal_networks(G_design, ideal_pins, sdc_constraints['ideal_networks'],
+                                       sequential_names)
+    G = hide_ideal_networks(G_design, ideal_fanout, ideal_pins)
+    logging.info(f"Ideal networks: {len(ideal_fanout)} drivers of "
+                 f"{sum(ideal_fanout.values())} pins")
+    # scan shift arcs and the arcs disabled by the tie cells and case analysis constants are not
+    # timed
+    constants = propagate_constants(G, extract_cell_functions(pdk_path),
+                                    sdc_constraints['case_analysis'], sequential_names)
+    if functional or constants['disabled']:
+        G_ideal = G
+        G = prune_scan_arcs(G_ideal, extract_scan_pins(pdk_path), functional=functional,
+                            constants=constants)
+        logging.info(f"Constants: {len(constants['nodes'])} constant nodes, removed "
+                     f"{G_ideal.number_of_edges() - G.number_of_edges()} scan and constant arcs")
+    return G, ideal_fanout
+
+
+def _exception_index(timing_graph, timing_exceptions):
+    # the timing exceptions indexed by the nodes of the timing graph, None without exceptions
+    if not timing_exceptions:
+        return None
+    exception_index = build_exception_index(timing_graph, timing_exceptions)
+    logging.info(f"Indexed {len(exception_index['exceptions'])} of {len(timing_exceptions)} "
+                 f"timing exceptions")
+    return exception_index
+
+
+def _mode_task(name, sdc_constraints, G_design, G_shared, timing_graph, query, pdk_path,
+               cell_mapping, functional, sequential_names, aocv_tables, parasitics):
+    # the case analysis constants, scan arcs and ideal networks of the mode only mask shared arcs
+    clock = (sdc_constraints['clocks'] or [DEFAULT_CLOCK])[0]
+    G_mode, ideal_fanout = _constrained_graph(G_design, pdk_path, sdc_constraints, functional,
+                                              sequential_names)
+    clock_transition, clock_setup_uncertainty, clock_hold_uncertainty = \
+        _clock_constraints(sdc_constraints)
+    task = {
+        'cone': intersect_cones(query, build_mode_overlay(timing_graph, G_mode)),
+        'fanout': get_cone_fanout_dict(G_design, G_shared, ideal_fanout),
+        'clock': clock,
+        'clock_transition': clock_transition,
+        'clock_setup_uncertainty': clock_setup_uncertainty,
+        'clock_hold_uncertainty': clock_hold_uncertainty,
+        'exception_index': _exception_index(timing_graph, sdc_constraints['timing_exceptions']),
+        'clock_latency': _compute_clock_latencies(G_design, timing_graph, [clock],
+                                                  sdc_constraints['propagated_clocks'], pdk_path,
+                                                  cell_mapping, clock_transition, sequential_names,
+                                                  sdc_constraints['timing_derates']),
+        'derates': _node_derates(timing_graph, sdc_constraints['timing_derates'], aocv_tables),
+    }
+    # the net loads depend on the transitions of the mode
+    task['net_delays'] = None
+    if parasitics is not None:
+        task['net_delays'] = _net_delays(timing_graph, task['fanout'], cell_mapping, pdk_path,
+                                         clock_transition, task['exception_index'],
+                                         task['clock_latency'], task['derates'], parasitics,
+                                         task['cone'])
+    logging.info(f"Mode {name}: {task['cone']['arcs'].sum()} of {len(timing_graph['arc_from'])} "
+                 f"arcs timed, clock {clock['name']}")
+    return task
+
+
+def _report_modes(results, tasks, analyses, dir):
+    # one path group per mode
+    report_path = os.path.join(dir, "setup_timing_report.txt")
+    hold_report_path = os.path.join(dir, "hold_timing_report.txt")
+    for analysis_name, path, uncertainty, path_type in (
+            ("late", report_path, 'clock_setup_uncertainty', "max"),
+            ("early", hold_report_path, 'clock_hold_uncertainty', "min")):
+        if analysis_name not in analyses:
+            continue
+        open(path, "w").close()
+        for name, groups in results.items():
+            group, clock = groups[analysis_name], tasks[name]['clock']
+            logging.info(f"Mode {name}: {group['endpoints']} {path_type} endpoints, "
+                         f"worst slack {group['worst_slack']:.4f}")
+            generate_timing_report(group["paths"], path, 0, 0, tasks[name][uncertainty],
+                                   clock['period'], path_type=path_type,
+                                   capture_edges=group["capture_edges"],
+                                   launch_clock=clock['name'], capture_clock=clock['name'],
+                                   path_group=f"{clock['name']} ({name})", append=True,
+                                   clock_latencies=group["clock_latencies"])
+    return report_path
+
+
+def _run_modes(pdk_path, design_path, modes, options, aocv_tables):
+    # the netlist graph, its levelization and the cell arc tables are built once, each mode is an
+    # overlay
+    from_nodes, through_nodes, to_nodes = (options['from_nodes'], options['through_nodes'],
+                                           options['to_nodes'])
+    G_design = graph_creation_func(design_path)
+    sequential_names = load_sequential_names()
+    ideal_pins = extract_ideal_pins(pdk_path)
+    G_shared = hide_ideal_networks(
+        G_design, find_ideal_networks(G_design, ideal_pins, None, sequential_names), ideal_pins)
+    if from_nodes or to_nodes:
+        G_shared = extract_path_cone(G_shared, from_nodes, to_nodes, sequential_names)
+    timing_graph = build_timing_graph(G_shared, sequential_names)
+    cell_mapping = compile_cell_pin_mapping(extract_cell_pin_mapping(pdk_path))
+    query = None
+    if through_nodes:
+        query = select_path_cone(timing_graph, build_reachability_index(timing_graph), from_nodes,
+                                 through_nodes, to_nodes)
+
+    parasitics = None
+    if options['spef_path'] is not None:
+        parasitics = read_spef(options['spef_path'])
+    tasks = {
+        name: _mode_task(name, sdc_constraints, G_design, G_shared, timing_graph, query, pdk_path,
+                         cell_mapping, options['functional'], sequential_names, aocv_tables,
+                         parasitics)
+        for name, sdc_constraints in modes.items()
+    }
+    shared = {
+        'timing_graph': timing_graph, 'cell_pin_mapping': cell_mapping, 'library': pdk_path,
+        'related_pin_time': 0.14, 'top_k': options['top_k'],
+        'analyses': ("late", "early") if options['analysis'] == "setup_hold" else ("late",),
+        'slack_lesser_than': options['slack_lesser_than'], 'delay_cache': options['delay_cache'],
+        'sdf_delays': _sdf_delays(timing_graph, options['sdf_path']),
+    }
+    return _report_modes(analyze_modes(tasks, shared, options['jobs']), tasks, shared['analyses'],
+                         options['dir'])
+
+
+def _run_features(options, library_paths, modes):
+    # the features of a run, from its options and the constraints of its modes
+    enabled = {
+        'corners': len(library_paths) > 1,
+        'modes': len(modes) > 1,
+        'clocks': any(len(sdc_constraints['clocks']) > 1 for sdc_constraints in modes.values()),
+        'sweep': options['sweep_periods'] is not None
+        or options['sweep_uncertainties'] is not None,
+        'exceptions': any(sdc_constraints['timing_exceptions']
+                          for sdc_constraints in modes.values()),
+        'pocv': options['pocv_sigma'] is not None or options['pocv_coefficients'] is not None,
+        'monte_carlo': options['monte_carlo'] is not None,
+        'aocv': options['aocv_tables'] is not None,
+        'spef': options['spef_path'] is not None,
+        'sdf': options['sdf_path'] is not None,
+        'hold': options['analysis'] == "setup_hold",
+        'through': bool(options['through_nodes']),
+        'path_search': options['slack_lesser_than'] is not None,
+    }
+    return {feature for feature, active in enabled.items() if active}
+
+
+def _check_features(features, algorithm):
+    # every two features of the run support each other, and the exhaustive path timing all of them
+    combined = [feature for feature in FEATURE_SUPPORT if feature in features]
+    for position, feature in enumerate(combined):
+        for other in combined[position + 1:]:
+            if other not in FEATURE_SUPPORT[feature] or feature not in FEATURE_SUPPORT[other]:
+                raise ValueError(f"The {FEATURE_NAMES[feature]} and {FEATURE_NAMES[other]} "
+                                 f"analyses are not supported together.")
+    unsupported = _exhaustive_unsupported(features)
+    if algorithm == "exhaustive" and unsupported:
+        raise ValueError(f"Exhaustive path timing does not support {', '.join(unsupported)} "
+                         f"analysis.")
+
+
+def _exhaustive_unsupported(features):
+    # the names of the features only timed by the propagation
+    return [name for feature, name in FEATURE_NAMES.items()
+            if feature in features and feature not in EXHAUSTIVE_FEATURES]
+
+
+def _timing_algorithm(algorithm, features, timing_graph):
+    # count the paths to decide whether they can be enumerated, the features the exhaustive
+    # path timing does not support select the propagation
+    if algorithm != "auto":
+        return algorithm
+    path_counts = count_paths(timing_graph)
+    return select_timing_algorithm(path_counts, estimate_enumeration_cost(path_counts),
+                                   unsupported=_exhaustive_unsupported(features))
+
+
+def _setup_run(options, design_path, library_paths, corner_libraries, sdc_constraints,
+               features, aocv_tables):
+    # the clocks, the levelized timing graph of the requested paths and its clock latencies
+    pdk_path = corner_libraries[0]
+    clocks = sdc_constraints['clocks'] or [DEFAULT_CLOCK]
+    clock_transition, clock_setup_uncertainty, clock_hold_uncertainty = \
+        _clock_constraints(sdc_constraints)
+    run = {
+        **options, 'features': features, 'library_paths': library_paths,
+        'corner_libraries': corner_libraries, 'library': pdk_path, 'sdc': sdc_constraints,
+        'clocks': clocks, 'clock': clocks[0], 'clock_transition': clock_transition,
+        'clock_setup_uncertainty': clock_setup_uncertainty,
+        'clock_hold_uncertainty': clock_hold_uncertainty,
+        # a period / uncertainty sweep propagates the arrival times once and only moves the
+        # required times
+        'sweep_uncertainties': options['sweep_uncertainties'] or [clock_setup_uncertainty],
+        'report_path': os.path.join(options['dir'], "setup_timing_report.txt"),
+        'hold_report_path': os.path.join(options['dir'], "hold_timing_report.txt"),
+    }
+
+    # generate the graph, keep the cone of the requested paths and levelize it
+    G_design = graph_creation_func(design_path)
+    sequential_names = load_sequential_names()
+    G, ideal_fanout = _constrained_graph(G_design, pdk_path, sdc_constraints,
+                                         options['functional'], sequential_names)
+    G_cone = G
+    if options['from_nodes'] or options['to_nodes']:
+        G_cone = extract_path_cone(G, options['from_nodes'], options['to_nodes'], sequential_names)
+        logging.info(f"Path cone: {G_cone.number_of_nodes()} of {G.number_of_nodes()} nodes")
+    timing_graph = build_timing_graph(G_cone, sequential_names)
+    cell_mapping = compile_cell_pin_mapping(extract_cell_pin_mapping(pdk_path))
+    run.update({
+        'G_design': G_design, 'G_cone': G_cone, 'sequential_names': sequential_names,
+        'timing_graph': timing_graph, 'cell_mapping': cell_mapping,
+        'fanout': get_cone_fanout_dict(G_design, G_cone, ideal_fanout),
+    })
+
+    # each propagated clock tree is timed once, the latency of every flip-flop is then looked up
+    run['clock_latency'] = _compute_clock_latencies(
+        G_design, timing_graph, clocks, sdc_constraints['propagated_clocks'], pdk_path,
+        cell_mapping, clock_transition, sequential_names, sdc_constraints['timing_derates'])
+    # the delay derates are applied by the propagation, POCV derates the mean and sigma of
+    # the delays
+    run['derates'] = _node_derates(timing_graph, sdc_constraints['timing_derates'], aocv_tables)
+    return run
+
+
+def _run_exhaustive(run):
+    # every reg-reg path of the cone is enumerated and timed
+    rr, rr_atr_list, ir, ir_atr_list, ro, ro_atr_list, adjacency_dict = \
+        all_paths_info(run['G_cone'])
+    derates = run['derates']
+    Model(run['library'], rr, rr_atr_list, run['fanout'], run['clock_transition'], 0.14,
+          run['report_path'], 0, 0, run['clock_setup_uncertainty'], run['clock']['period'],
+          run['clock']['name'], run['delay_cache'],
+          None if derates is None else dict(zip(run['timing_graph']['keys'], derates[LATE])))
+    return run['report_path']
+
+
+def _setup_propagation(run):
+    # the timing exceptions, wire and annotated delays and the -through cone of the propagation
+    timing_graph = run['timing_graph']
+    run['exception_index'] = _exception_index(timing_graph, run['sdc']['timing_exceptions'])
+
+    # the wire delays of the nets, whose driver loads depend on the driver transitions
+    run['net_delays'] = None
+    if run['spef_path'] is not None:
+        run['net_delays'] = _net_delays(timing_graph, run['fanout'], run['cell_mapping'],
+                                        run['library'], run['clock_transition'],
+                                        run['exception_index'], run['clock_latency'],
+                                        run['derates'], read_spef(run['spef_path']))
+    # the delays computed by another tool, replacing the Liberty interpolation of the arcs they
+    # annotate
+    run['sdf_delays'] = _sdf_delays(timing_graph, run['sdf_path'])
+
+    # restrict the propagation to the paths going through the -through nodes, the clock domain
+    # tasks restrict their own propagation
+    run['cone'] = None
+    if run['through_nodes'] and 'clocks' not in run['features']:
+        run['cone'] = select_path_cone(timing_graph, build_reachability_index(timing_graph),
+                                       run['from_nodes'], run['through_nodes'], run['to_nodes'])
+        logging.info(f"Path query cone: {run['cone']['nodes'].sum()} of "
+                     f"{len(run['cone']['nodes'])} nodes")
+
+
+def _run_corners(run):
+    # the corners share the graph, its levelization, the path cone and the timing exceptions
+    libraries, sdc_constraints = run['corner_libraries'], run['sdc']
+    mappings = [run['cell_mapping']] + [
+        compile_cell_pin_mapping(extract_cell_pin_mapping(library)) for library in libraries[1:]
+    ]
+    latencies = [run['clock_latency']] + [
+        _compute_clock_latencies(run['G_design'], run['timing_graph'], run['clocks'],
+                                 sdc_constraints['propagated_clocks'], library, mapping,
+                                 run['clock_transition'], run['sequential_names'],
+                                 sdc_constraints['timing_derates'])
+        for library, mapping in zip(libraries[1:], mappings[1:])
+    ]
+    corners = [corner_name(path) for path in run['library_paths']]
+    logging.info(f"Corners: {', '.join(corners)}")
+    return _report_corners(run['timing_graph'], run['fanout'], corners, libraries, mappings,
+                           latencies, run['clock_transition'], run['cone'],
+                           run['exception_index'], run['clock'], run['clock_setup_uncertainty'],
+                           run['clock_hold_uncertainty'], run['top_k'], run['analysis'],
+                           run['slack_lesser_than'], run['dir'], run['derates'],
+                           run['net_delays'], run['sdf_delays'])
+
+
+def _pocv_settings(run):
+    # the number of sigmas of the POCV arrivals and the coefficients of the cells without
+    # variation tables, None without POCV
+    if 'pocv' not in run['features']:
+        return None
+    coefficients = None
+    if run['pocv_coefficients'] is not None:
+        coefficients = read_pocv_coefficients(run['pocv_coefficients'])
+    return {'n_sigma': 3.0 if run['pocv_sigma'] is None else run['pocv_sigma'],
+            'coefficients': coefficients}
+
+
+def _propagate(run, pocv):
+    # the arrival times of the run, POCV propagates their means and variances
+    if pocv is not None:
+        return propagate_pocv_arrivals(run['timing_graph'], run['fanout'], run['cell_mapping'],
+                                       run['library'], run['clock_transition'], pocv['n_sigma'],
+                                       pocv['coefficients'], run['cone'], run['clock_latency'],
+                                       run['exception_index'], run['derates'],
+                                       run['net_delays'], run['sdf_delays'])
+    return propagate_arrival_times(run['timing_graph'], run['fanout'], run['cell_mapping'],
+                                   run['library'], run['clock_transition'], run['cone'],
+                                   run['exception_index'], run['clock_latency'],
+                                   run['delay_cache'], run['derates'], run['net_delays'],
+                                   run['sdf_delays'])
+
+
+def _run_sweep(run):
+    # the setup slack of every period and uncertainty over one propagation
+    propagated = _propagate(run, _pocv_settings(run))
+    terms = setup_slack_terms(run['timing_graph'], propagated, run['library'], 0.14, 0,
+                              run['cone'], run['clock_latency'])
+    clock_sweep = sweep_setup_slack(terms, run['sweep_periods'] or [run['clock']['period']],
+                                    run['sweep_uncertainties'])
+    clock_sweep['minimum_period'] = minimum_period(terms, run['sweep_uncertainties'])
+    return _report_period_sweep({run['clock']['name']: clock_sweep}, run['dir'])
+
+
+def _report_paths(run, propagated, endpoints, analysis_name, top_k):
+    # the worst paths of the setup (late) or hold (early) endpoints
+    late = analysis_name == "late"
+    timing_graph, clock, clock_latency = run['timing_graph'], run['clock'], run['clock_latency']
+    path_delays = extract_worst_paths(timing_graph, propagated, endpoints, top_k, analysis_name,
+                                      clock_latency)
+    if late:
+        logging.info(f"Reporting the {len(path_delays)} worst of {len(endpoints['arc'])} "
+                     f"endpoints")
+    generate_timing_report(
+        path_delays, run['report_path'] if late else run['hold_report_path'], 0, 0,
+        run['clock_setup_uncertainty'] if late else run['clock_hold_uncertainty'],
+        clock['period'], path_type="max" if late else "min",
+        capture_edges=extract_capture_edges(endpoints, top_k, analysis_name),
+        launch_clock=clock['name'], capture_clock=clock['name'],
+        clock_latencies=None if clock_latency is None else
+        extract_path_latencies(timing_graph, path_delays, clock_latency, analysis_name))
+
+
+def _report_run(run, propagated, endpoints, searched):
+    # the setup paths (unless already searched), the Monte Carlo slacks and the hold paths
+    features = run['features']
+    if 'pocv' in features:
+        _log_pocv_slack(run['timing_graph'], propagated, endpoints, run['analysis'])
+    if not searched:
+        setup_k = run['top_k']
+        if run['slack_lesser_than'] is not None:
+            setup_k = min(setup_k, int((endpoints['slack'] < run['slack_lesser_than']).sum()))
+        _report_paths(run, propagated, endpoints, "late", setup_k)
+    if 'monte_carlo' in features:
+        _report_monte_carlo(run['timing_graph'], propagated, endpoints, run['fanout'],
+                            run['cell_mapping'], run['library'], run['clock']['period'],
+                            run['clock_setup_uncertainty'], run['cone'], run['clock_latency'],
+                            run['monte_carlo'], run['top_k'], run['dir'])
+    if 'hold' in features:
+        _report_paths(run, propagated, endpoints, "early", run['top_k'])
+    return run['report_path']
+
+
+def run_sta(library_path, design_path, sdc_path, dir,
+            algorithm="auto", top_k=100, analysis="setup",
+            from_nodes=None, through_nodes=None, to_nodes=None, slack_lesser_than=None,
+            functional=False, jobs=1,
+            sweep_periods=None, sweep_uncertainties=None,
+            delay_cache=None,
+            pocv_sigma=None, pocv_coefficients=None, monte_carlo=None, aocv_tables=None,
+            spef_path=None, sdf_path=None):
+    options = {
+        'dir': dir, 'top_k': top_k, 'analysis': analysis, 'from_nodes': from_nodes,
+        'through_nodes': through_nodes, 'to_nodes': to_nodes,
+        'slack_lesser_than': slack_lesser_than, 'functional': functional, 'jobs': jobs,
+        'sweep_periods': sweep_periods, 'sweep_uncertainties': sweep_uncertainties,
+        'delay_cache': delay_cache, 'pocv_sigma': pocv_sigma,
+        'pocv_coefficients': pocv_coefficients, 'monte_carlo': monte_carlo,
+        'aocv_tables': aocv_tables, 'spef_path': spef_path, 'sdf_path': sdf_path,
+    }
+
+    # first step is to read the constraints, one SDC file per mode, and check the features of
+    # the run
+    library_paths = [library_path] if isinstance(library_path, str) else list(library_path)
+    sdc_paths = [sdc_path] if isinstance(sdc_path, str) else list(sdc_path)
+    modes = {mode_name(path): sdc_parser(path) for path in sdc_paths}
+    features = _run_features(options, library_paths, modes)
+    _check_features(features, algorithm)
+
+    # second step is to read the liberty files, one per corner, and the AOCV tables derating
+    # the cell delays by their depth
+    corner_libraries = [parse_liberty_file(path) for path in library_paths]
+    aocv = read_aocv_tables(aocv_tables) if aocv_tables is not None else None
+    if 'modes' in features:
+        return _run_modes(corner_libraries[0], design_path, modes, options, aocv)
+
+    # third step is to build the timing graph and pick the timing algorithm
+    run = _setup_run(options, design_path, library_paths, corner_libraries,
+                     next(iter(modes.values())), features, aocv)
+    if run['clock_latency'] is not None:
+        features.add('clock_latency')
+        _check_features(features, algorithm)
+    if _timing_algorithm(algorithm, features, run['timing_graph']) == "exhaustive":
+        return _run_exhaustive(run)
+
+    # fourth step is to propagate the arrival times and generate the timing reports
+    _setup_propagation(run)
+    if 'clocks' in features:
+        return _analyze_clock_domains(run)
+    if 'corners' in features:
+        return _run_corners(run)
+    if 'sweep' in features:
+        return _run_sweep(run)
+    # the bounds of the path search assume ideal clocks and fixed Liberty arc delays without
+    # derates and wires
+    searched = 'path_search' in features and features <= PATH_SEARCH_FEATURES \
+        and run['derates'] is None
+    if searched:
+        _report_searched_paths(run)
+        if 'hold' not in features:
+            return run['report_path']
+    propagated = _propagate(run, _pocv_settings(run))
+    endpoints = evaluate_endpoints(run['timing_graph'], propagated, run['library'], 0.14, 0,
+                                   run['clock_setup_uncertainty'], run['clock']['period'],
+                                   run['clock_hold_uncertainty'], run['cone'],
+                                   clock_latency=run['clock_latency'])
+    return _report_run(run, propagated, endpoints, searched)
@@ -1,3 +1,5 @@
+import re
+import weakref
 import numpy as np
 from liberty.types import *
 from tabulate import tabulate
@@ -59,6 +61,264 @@ def extract_cell_pin_mapping(library: str) -> dict:
     return cell_pin_mapping
 
 
+# Table groups of the timing arcs and of the setup / hold checks
+LOOKUP_TABLES = (
+    "cell_rise", "cell_fall", "rise_transition", "fall_transition",
+    "rise_constraint", "fall_constraint",
+)
+
+# Liberty variation format (LVF) tables of the delay sigma of an arc, used by POCV
+POCV_SIGMA_TABLES = ("ocv_sigma_cell_rise", "ocv_sigma_cell_fall")
+
+# Compiled setup / hold tables of every parsed library, built on first use
+_compiled_constraints = weakref.WeakKeyDictionary()
+
+
+def compile_lookup_table(table_group) -> dict:
+    """
+    Converts a Liberty lookup table group into contiguous float64 arrays, once.
+
+    Args:
+        table_group: A cell_rise, cell_fall, rise_transition, fall_transition,
+            rise_constraint or fall_constraint group.
+
+    Returns:
+        dict: index_1 and index_2 as (1, n) arrays, the layout returned by get_array, and
+        the (n1, n2) values.
+    """
+    return {
+        name: np.ascontiguousarray(table_group.get_array(name), dtype=np.float64)
+        for name in ("index_1", "index_2", "values")
+    }
+
+
+def compile_timing_arc(timing_group) -> dict:
+    """
+    Compiles a timing group into the arc representation used by the delay model.
+
+    Args:
+        timing_group: The timing group of an arc, as stored by extract_cell_pin_mapping.
+
+    Returns:
+        dict: The timing_sense, timing_type and related_pin attributes of the group and
+        the compile_lookup_table of each table group it holds. The sigma tables of a
+        single sigma_type (early or late) are stored as e.g. "ocv_sigma_cell_rise_late".
+    """
+    arc = {name: timing_group[name] for name in ("timing_sense", "timing_type", "related_pin")}
+    for table_group in timing_group.groups:
+        if table_group.group_name in LOOKUP_TABLES:
+            arc[table_group.group_name] = compile_lookup_table(table_group)
+        elif table_group.group_name in POCV_SIGMA_TABLES:
+            sigma_type = str(table_group["sigma_type"] or "early_and_late").strip('"')
+            name = table_group.group_name
+            if sigma_type != "early_and_late":
+                name = f"{name}_{sigma_type}"
+            arc[name] = compile_lookup_table(table_group)
+    return arc
+
+
+def compile_cell_pin_mapping(cell_pin_mapping: dict) -> dict:
+    """
+    Compiles every timing arc of a cell pin mapping, so that the delay calculations read
+    ready arrays instead of extracting them from the Liberty groups on every call.
+
+    Args:
+        cell_pin_mapping (dict): The result of extract_cell_pin_mapping.
+
+    Returns:
+        dict: The same mapping of cells and pins, holding compile_timing_arc arcs.
+    """
+    return {
+        cell_name: {pin: compile_timing_arc(timing) for pin, timing in pins.items()}
+        for cell_name, pins in cell_pin_mapping.items()
+    }
+
+
+def compile_constraint_arcs(library) -> dict:
+    """
+    Compiles the setup and hold tables of every constrained pin of the library, with the
+    table selection of calculate_constraint_time. The result is built once per parsed
+    library and reused.
+
+    Args:
+        library (LibertyLibrary): Parsed Liberty library.
+
+    Returns:
+        dict: For each cell and constrained pin, the compiled table of 'setup_checking'
+        and 'hold_checking'.
+    """
+    if library in _compiled_constraints:
+        return _compiled_constraints[library]
+    constraint_arcs = {}
+    for cell_group in library.get_groups("cell"):
+        for pin_group in cell_group.get_groups("pin"):
+            timings = pin_group.get_groups("timing")
+            checks = {}
+            for check, position, rising in (
+                ("setup_checking", 0, "setup_rising"), ("hold_checking", 1, "hold_rising")
+            ):
+                if position >= len(timings):
+                    continue
+                rise = timings[position]["timing_type"] == rising
+                table_name = "rise_constraint" if rise else "fall_constraint"
+                table_groups = [g for g in timings[position].groups if g.group_name == table_name]
+                if table_groups:
+                    checks[check] = compile_lookup_table(table_groups[0])
+            if checks:
+                constraint_arcs.setdefault(cell_group.args[0], {})[pin_group.args[0]] = checks
+    _compiled_constraints[library] = constraint_arcs
+    return constraint_arcs
+
+
+def get_lookup_table(timing_data, table_name: str) -> dict:
+    """
+    Returns a lookup table of a timing arc, compiled (see compile_timing_arc) or not.
+
+    Args:
+        timing_data: A compiled arc, or a Liberty timing group.
+        table_name (str): The table group name, e.g. "cell_rise".
+
+    Returns:
+        dict: The compile_lookup_table of the table.
+    """
+    if isinstance(timing_data, dict):
+        return timing_data[table_name]
+    return compile_lookup_table(timing_data.get_group(table_name))
+
+
+# Function to extract the scan pins of the scan cells from the Liberty library
+def extract_scan_pins(library) -> dict:
+    """
+    Extracts the scan pins of the cells describing their test mode in a test_cell group.
+
+    The scan pins are the test_cell pins whose signal_type is a scan input or a scan
+    enable, and the functional data pins are the other inputs of the test_cell flip-flop
+    next_state function.
+
+    Args:
+        library (LibertyLibrary): Parsed Liberty library.
+
+    Returns:
+        dict: Dictionary where keys are cell names and values are dictionaries with the
+              scan_in pins (set), the scan_enable pins (dict mapping each pin to True
+              when it is active low) and the data pins (set).
+    """
+    scan_pins = {}
+    for cell_group in library.get_groups("cell"):
+        for test_cell in cell_group.get_groups("test_cell"):
+            scan_in, scan_enable, input_pins = set(), {}, set()
+            for pin_group in test_cell.get_groups("pin"):
+                pin_name = str(pin_group.args[0]).strip('"')
+                signal_type = str(pin_group.get("signal_type", "")).strip('"')
+                if signal_type.startswith("test_scan_in"):
+                    scan_in.add(pin_name)
+                elif signal_type.startswith("test_scan_enable"):
+                    scan_enable[pin_name] = signal_type.endswith("_inverted")
+                elif str(pin_group.get("direction", "")).strip('"') == "input":
+                    input_pins.add(pin_name)
+            if not scan_in:
+                continue
+
+            # the functional data pins are the ones the test_cell flip-flop samples
+            next_states = [
+                str(ff_group.get("next_state", "")).strip('"')
+                for ff_group in test_cell.get_groups("ff")
+            ]
+            data_pins = {
+                name for next_state in next_states
+                for name in re.findall(r"[A-Za-z_]\w*", next_state) if name in input_pins
+            }
+            cell_name = str(cell_group.args[0]).strip('"')
+            scan_pins[cell_name] = {
+                "scan_in": scan_in,
+                "scan_enable": scan_enable,
+                "data": data_pins,
+            }
+
+    return scan_pins
+
+
+# Function to extract the clock and asynchronous pins of the cells from the Liberty library
+def extract_ideal_pins(library) -> dict:
+    """
+    Extracts the pins of the cells whose nets are ideal networks: the clock pins and the
+    asynchronous clear and preset pins of the flip-flops and latches.
+
+    Args:
+        library (LibertyLibrary): Parsed Liberty library.
+
+    Returns:
+        dict: Dictionary where keys are cell names and values are sets of pin names.
+    """
+    ideal_pins = {}
+    for cell_group in library.get_groups("cell"):
+        pins = {
+            str(pin_group.args[0]).strip('"') for pin_group in cell_group.get_groups("pin")
+            if str(pin_group.get("clock", "")).strip('"') == "true"
+        }
+        for state_group in cell_group.get_groups("ff") + cell_group.get_groups("latch"):
+            for attribute in ("clocked_on", "enable", "clear", "preset"):
+                expression = str(state_group.get(attribute, "")).strip('"')
+                pins.update(re.findall(r"[A-Za-z_]\w*", expression))
+        if pins:
+            ideal_pins[str(cell_group.args[0]).strip('"')] = pins
+
+    return ideal_pins
+
+
+# Function to extract the clock pins of the sequential cells from the Liberty library
+def extract_clock_pins(library) -> dict:
+    """
+    Extracts the clock pins of the flip-flops and latches: the pins of their clocked_on
+    and enable expressions.
+
+    Args:
+        library (LibertyLibrary): Parsed Liberty library.
+
+    Returns:
+        dict: Dictionary where keys are cell names and values are sets of pin names.
+    """
+    clock_pins = {}
+    for cell_group in library.get_groups("cell"):
+        pins = set()
+        for state_group in cell_group.get_groups("ff") + cell_group.get_groups("latch"):
+            for attribute in ("clocked_on", "enable"):
+                expression = str(state_group.get(attribute, "")).strip('"')
+                pins.update(re.findall(r"[A-Za-z_]\w*", expression))
+        if pins:
+            clock_pins[str(cell_group.args[0]).strip('"')] = pins
+
+    return clock_pins
+
+
+# Function to extract the logic functions of the combinational cells from the Liberty library
+def extract_cell_functions(library) -> dict:
+    """
+    Extracts the logic function of the output pins of the combinational cells. The cells
+    with a ff or latch group are skipped, their function is the state of the cell.
+
+    Args:
+        library (LibertyLibrary): Parsed Liberty library.
+
+    Returns:
+        dict: Dictionary where keys are cell names and values are dictionaries mapping
+              each output pin to its function string (e.g. {"Y": "(!A) | (!B)"}).
+    """
+    cell_functions = {}
+    for cell_group in library.get_groups("cell"):
+        if cell_group.get_groups("ff") or cell_group.get_groups("latch"):
+            continue
+        functions = {
+            str(pin_group.args[0]).strip('"'): str(pin_group.get("function")).strip('"')
+            for pin_group in cell_group.get_groups("pin")
+            if pin_group.get("function") is not None
+        }
+        if functions:
+            cell_functions[str(cell_group.args[0]).strip('"')] = functions
+
+    return cell_functions
+
+
 # Function to interpolate 2D data using a provided formula
 def interpolate_2d_formula(
     index_1_values: list,
@@ -130,6 +390,146 @@ def find_nearest_index(arr: list, value: float) -> tuple:
     return arr[idx[0]], arr[idx[1]]
 
 
+def _interpolation_pairs(index, points, bracket):
+    # lower position of the pair of adjacent index values each point is interpolated on
+    size = index.shape[-1]
+    if size < 2:
+        return np.zeros(points.shape, dtype=np.int64)
+    if index.shape[0] == 1:
+        upper = np.searchsorted(index[0], points, side="right")
+    else:
+        upper = (index[:, None, :] <= points[:, :, None]).sum(axis=-1)
+    lower = np.clip(upper - 1, 0, size - 2)
+    if bracket:
+        return lower
+    # the two nearest index values are adjacent: the bracket, moved by one when the index
+    # value beyond its nearer end is closer than its farther end (the lower index value
+    # winning ties, as with a stable sort of the distances)
+    rows = np.arange(index.shape[0])[:, None] if index.shape[0] > 1 else 0
+    below, above = index[rows, lower], index[rows, lower + 1]
+    left = (lower > 0) & (points - index[rows, np.maximum(lower - 1, 0)] <= above - points)
+    right = (lower < size - 2) & \
+        (index[rows, np.minimum(lower + 2, size - 1)] - points < points - below)
+    return lower - left + right
+
+
+def interpolate_2d_points(
+    index_1_values,
+    index_2_values,
+    table_values,
+    x0,
+    y0,
+    bracket: bool = False,
+) -> np.ndarray:
+    """
+    Interpolates a 2D table, or a stack of tables of the same shape, at many points in
+    one vectorized call.
+
+    The pair of index values of every point is found with np.searchsorted instead of
+    sorting the distances to every index value, and the four corner values of all the
+    points are gathered at once. By default the pair is the two nearest index values,
+    so the result matches interpolate_2d_formula; with bracket=True it is the interval
+    holding the point (the last one outside the table).
+
+    Parameters:
+        index_1_values (array-like): Values of index_1, (n1,) or (1, n1) as returned by
+                                     get_array, or (tables, n1) for a stack.
+        index_2_values (array-like): Values of index_2, (n2,), (1, n2) or (tables, n2).
+        table_values (array-like): (n1, n2) table values, or (tables, n1, n2).
+        x0 (array-like): Target values of index_1, broadcast with y0 to (points,) or, for
+                         a stack, to (tables, points).
+        y0 (array-like): Target values of index_2.
+        bracket (bool): Whether to interpolate between the index values around each
+                        point instead of the two nearest ones.
+
+    Returns:
+        np.ndarray: The interpolated values, (points,) for one table and
+                    (tables, points) for a stack.
+    """
+    values = np.asarray(table_values, dtype=float)
+    stacked = values.ndim == 3
+    if not stacked:
+        values = values[None]
+    num_tables, rows_1, rows_2 = values.shape
+    index_1 = np.asarray(index_1_values, dtype=float).reshape(-1, rows_1)
+    index_2 = np.asarray(index_2_values, dtype=float).reshape(-1, rows_2)
+    x, y = np.broadcast_arrays(np.asarray(x0, dtype=float), np.asarray(y0, dtype=float))
+    x = np.broadcast_to(np.atleast_1d(x), (num_tables, np.atleast_1d(x).shape[-1]))
+    y = np.broadcast_to(np.atleast_1d(y), x.shape)
+
+    # shared index values are searched once for all the tables
+    if index_1.shape[0] > 1 and not (index_1 == index_1[0]).all():
+        i1 = _interpolation_pairs(index_1, x, bracket)
+    else:
+        index_1 = index_1[:1]
+        i1 = _interpolation_pairs(index_1, x, bracket)
+    if index_2.shape[0] > 1 and not (index_2 == index_2[0]).all():
+        i2 = _interpolation_pairs(index_2, y, bracket)
+    else:
+        index_2 = index_2[:1]
+        i2 = _interpolation_pairs(index_2, y, bracket)
+    j1 = np.minimum(i1 + 1, rows_1 - 1)
+    j2 = np.minimum(i2 + 1, rows_2 - 1)
+
+    tables = np.arange(num_tables)[:, None]
+    rows = tables if index_1.shape[0] > 1 else 0
+    x1, x2 = index_1[rows, i1], index_1[rows, j1]
+    rows = tables if index_2.shape[0] > 1 else 0
+    y1, y2 = index_2[rows, i2], index_2[rows, j2]
+
+    # Calculate interpolation parameters, a single index value having weight 1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x01 = np.where(x2 != x1, (x - x1) / (x2 - x1), 0.0)
+        y01 = np.where(y2 != y1, (y - y1) / (y2 - y1), 0.0)
+    x20, y20 = 1.0 - x01, 1.0 - y01
+
+    result = (
+        x20 * y20 * values[tables, i1, i2] + x20 * y01 * values[tables, i1, j2]
+        + x01 * y20 * values[tables, j1, i2] + x01 * y01 * values[tables, j1, j2]
+    )
+    return result if stacked else result[0]
+
+
+def interpolate_2d_batch(tables: list, x0, y0) -> np.ndarray:
+    """
+    Interpolates several 2D tables at once, each at its own point, with the same
+    nearest index selection and formula as interpolate_2d_formula.
+
+    Tables of the same shape are stacked and interpolated with a single
+    interpolate_2d_points call, so the rise and fall tables of a timing arc cost one
+    call.
+
+    Parameters:
+        tables (list): (index_1_values, index_2_values, table_values) of each table, as
+                       returned by get_array.
+        x0 (array-like): Target value of index_1 for each table.
+        y0 (array-like): Target value of index_2 for each table.
+
+    Returns:
+        np.ndarray: The interpolated value of each table.
+    """
+    x0 = np.broadcast_to(np.asarray(x0, dtype=float), len(tables))
+    y0 = np.broadcast_to(np.asarray(y0, dtype=float), len(tables))
+    result = np.empty(len(tables))
+
+    # group the tables by shape so that every group can be stacked
+    groups = {}
+    for position, (index_1_values, _, table_values) in enumerate(tables):
+        shape = (len(index_1_values[0]), np.shape(table_values))
+        groups.setdefault(shape, []).append(position)
+
+    for positions in groups.values():
+        result[positions] = interpolate_2d_points(
+            [tables[p][0][0] for p in positions],
+            [tables[p][1][0] for p in positions],
+            [tables[p][2] for p in positions],
+            x0[positions][:, None],
+            y0[positions][:, None],
+        )[:, 0]
+
+    return result
+
+
 def calculate_rising_edge_delay(
     timing_data: dict, input_transition_time: float, output_capacitance: float
 ) -> tuple:
@@ -137,30 +537,31 @@ def calculate_rising_edge_delay(
     Calculates the rising edge delay for a given timing data.
 
     Parameters:
-        timing_data (dict): The timing data for the rising edge.
+        timing_data (dict): The timing data for the rising edge, compiled by
+            compile_timing_arc or a Liberty timing group.
         input_transition_time (float): The input transition time.
         output_capacitance (float): The output capacitance.
 
     Returns:
         tuple: The rise delay and cell rise delay.
     """
-    cell_rise_data = timing_data.get_group("cell_rise")
-    rise_transition_data = timing_data.get_group("rise_transition")
+    cell_rise_data = get_lookup_table(timing_data, "cell_rise")
+    rise_transition_data = get_lookup_table(timing_data, "rise_transition")
 
     # Calculate rise transition delay
     rise_transition_delay = interpolate_2d_formula(
-        rise_transition_data.get_array("index_1"),
-        rise_transition_data.get_array("index_2"),
-        rise_transition_data.get_array("values"),
+        rise_transition_data["index_1"],
+        rise_transition_data["index_2"],
+        rise_transition_data["values"],
         input_transition_time,
         output_capacitance,
     )
 
     # Calculate cell rise delay
     cell_rise_delay = interpolate_2d_formula(
-        cell_rise_data.get_array("index_1"),
-        cell_rise_data.get_array("index_2"),
-        cell_rise_data.get_array("values"),
+        cell_rise_data["index_1"],
+        cell_rise_data["index_2"],
+        cell_rise_data["values"],
         input_transition_time,
         output_capacitance,
     )
@@ -175,30 +576,31 @@ def calculate_falling_edge_delay(
     Calculates the falling edge delay for a given timing data.
 
     Parameters:
-        timing_data (dict): The timing data for the falling edge.
+        timing_data (dict): The timing data for the falling edge, compiled by
+            compile_timing_arc or a Liberty timing group.
         input_transition_time (float): The input transition time.
         output_capacitance (float): The output capacitance.
 
     Returns:
         tuple: The fall delay and cell fall delay.
     """
-    cell_fall_data = timing_data.get_group("cell_fall")
-    fall_transition_data = timing_data.get_group("fall_transition")
+    cell_fall_data = get_lookup_table(timing_data, "cell_fall")
+    fall_transition_data = get_lookup_table(timing_data, "fall_transition")
 
     # Calculate fall transition delay
     fall_transition_delay = interpolate_2d_formula(
-        fall_transition_data.get_array("index_1"),
-        fall_transition_data.get_array("index_2"),
-        fall_transition_data.get_array("values"),
+        fall_transition_data["index_1"],
+        fall_transition_data["index_2"],
+        fall_transition_data["values"],
         input_transition_time,
         output_capacitance,
     )
 
     # Calculate cell fall delay
     cell_fall_delay = interpolate_2d_formula(
-        cell_fall_data.get_array("index_1"),
-        cell_fall_data.get_array("index_2"),
-        cell_fall_data.get_array("values"),
+        cell_fall_data["index_1"],
+        cell_fall_data["index_2"],
+        cell_fall_data["values"],
         input_transition_time,
         output_capacitance,
     )
@@ -229,6 +631,22 @@ def get_timing_sense(cells_info, cell_name, input_pin_name):
     return None
 
  
+def get_input_pin_name(pin_name: str) -> str:
+    """
+    Retrieve the input pin of an arc pin name built by concatenate_pins.
+
+    Parameters:
+        pin_name (str): The 'output_input' pin name of the arc, e.g. 'Q_RESET_B'.
+
+    Returns:
+        str: The input pin name, e.g. 'RESET_B'.
+    """
+    parts = pin_name.split("_")
+    if len(parts) == 3:
+        return f"{parts[1]}_{parts[2]}"
+    return parts[-1]
+
+
 def get_output_capacitance(
     fanout: list[str],
     library: str,
@@ -247,13 +665,8 @@ def get_output_capacitance(
     capacitance = 0
     # Iterate through each cell in the fanout list
     for cell in fanout:
-        output_pin_name = cell.split(",")[2]
+        input_pin_name = get_input_pin_name(cell.split(",")[2])
         cell_name = cell.split(",")[1]
-        parts = output_pin_name.split("_")
-        if len(parts) == 3:
-            input_pin_name = f"{parts[1]}_{parts[2]}"
-        else:
-            input_pin_name = parts[-1]
 
         # Retrieve the cell from the library
         cell = select_cell(library, cell_name)
@@ -313,22 +726,160 @@ def interpolate_constraint_time(
     Interpolates the constraint time based on transition times.
 
     Parameters:
-        constraint_data: The data group containing constraint values.
+        constraint_data: The constraint table, compiled by compile_lookup_table or a
+            Liberty rise_constraint / fall_constraint group.
         related_pin_transition (float): Transition time of the related pin.
         constrained_pin_transition (float): Transition time of the constrained pin.
 
     Returns:
         float: Interpolated constraint time.
     """
+    if not isinstance(constraint_data, dict):
+        constraint_data = compile_lookup_table(constraint_data)
     return interpolate_2d_formula(
-        constraint_data.get_array("index_1"),
-        constraint_data.get_array("index_2"),
-        constraint_data.get_array("values"),
+        constraint_data["index_1"],
+        constraint_data["index_2"],
+        constraint_data["values"],
         related_pin_transition,
         constrained_pin_transition,
     )
 
 
+def setup_required_rows(
+    setup_time: float,
+    path_delay: float,
+    clock_network_delay: float,
+    clock_uncertainty: float,
+    clock_period: float,
+    capture_latency: float = None,
+    clock_pessimism: float = 0.0,
+) -> list:
+    """
+    Builds the required time and slack rows of a setup (max) timing report.
+
+    Args:
+        setup_time (float): Setup time of the capturing flip-flop.
+        path_delay (float): Data arrival time of the path.
+        clock_network_delay (float): Delay of clock path.
+        clock_uncertainty (float): Setup clock uncertainty.
+        clock_period (float): Clock period.
+        capture_latency (float, optional): Propagated clock latency of the capturing
+                                           flip-flop, replacing the clock network delay.
+        clock_pessimism (float): Clock reconvergence pessimism removed from the check.
+
+    Returns:
+        list: The report rows, from the capturing clock edge to the slack.
+    """
+    rows = [["clock period (rise edge)", f"{clock_period:.4f}", f"{clock_period:.4f}"]]
+    if capture_latency is None:
+        data_required_time = clock_period - clock_network_delay
+        rows.append(
+            [
+                "clock network delay (ideal)",
+                f"{clock_network_delay:.4f}",
+                f"{data_required_time:.4f}",
+            ]
+        )
+    else:
+        data_required_time = clock_period + capture_latency
+        rows.append(
+            [
+                "clock network delay (propagated)",
+                f"{capture_latency:.4f}",
+                f"{data_required_time:.4f}",
+            ]
+        )
+    if clock_pessimism:
+        data_required_time += clock_pessimism
+        rows.append(
+            ["clock reconvergence pessimism", f"{clock_pessimism:.4f}",
+             f"{data_required_time:.4f}"]
+        )
+    data_required_time -= clock_uncertainty
+    rows.append(
+        ["clock uncertainty", f"{-clock_uncertainty:.4f}", f"{data_required_time:.4f}"]
+    )
+
+    # Adjust data required time for setup time
+    data_required_time -= setup_time
+    rows.append(["setup_time", f"{-setup_time:.4f}", f"{data_required_time:.4f}"])
+
+    # Add final data required and arrival times to the table
+    rows.append(["----------------------------", "-------", "--------"])
+    rows.append(["data required time", "", f"{data_required_time:.4f}"])
+    rows.append(["data arrival time", "", f"{-path_delay:.4f}"])
+    rows.append(["----------------------------", "-------", "--------"])
+
+    # Calculate and add slack to the table
+    slack = data_required_time - path_delay
+    slack_status = "MET" if slack >= 0 else "VIOLATE"
+    rows.append([f"slack ({slack_status})", "", f"{slack:.4f}"])
+    return rows
+
+
+def hold_required_rows(
+    hold_time: float,
+    path_delay: float,
+    clock_rise_edge: float,
+    clock_network_delay: float,
+    clock_uncertainty: float,
+    capture_latency: float = None,
+    clock_pessimism: float = 0.0,
+) -> list:
+    """
+    Builds the required time and slack rows of a hold (min) timing report.
+
+    Args:
+        hold_time (float): Hold time of the capturing flip-flop.
+        path_delay (float): Data arrival time of the path.
+        clock_rise_edge (float): Delay of clock rise edge.
+        clock_network_delay (float): Delay of clock path.
+        clock_uncertainty (float): Hold clock uncertainty.
+        capture_latency (float, optional): Propagated clock latency of the capturing
+                                           flip-flop, replacing the clock network delay.
+        clock_pessimism (float): Clock reconvergence pessimism removed from the check.
+
+    Returns:
+        list: The report rows, from the capturing clock edge to the slack.
+    """
+    rows = [["clock CLKM (rise edge)", f"{clock_rise_edge:.4f}", f"{clock_rise_edge:.4f}"]]
+    network_delay = clock_network_delay if capture_latency is None else capture_latency
+    data_required_time = clock_rise_edge + network_delay
+    rows.append(
+        [
+            f"clock network delay ({'ideal' if capture_latency is None else 'propagated'})",
+            f"{network_delay:.4f}",
+            f"{data_required_time:.4f}",
+        ]
+    )
+    if clock_pessimism:
+        data_required_time -= clock_pessimism
+        rows.append(
+            ["clock reconvergence pessimism", f"{-clock_pessimism:.4f}",
+             f"{data_required_time:.4f}"]
+        )
+    data_required_time += clock_uncertainty
+    rows.append(
+        ["clock uncertainty", f"{clock_uncertainty:.4f}", f"{data_required_time:.4f}"]
+    )
+
+    # Adjust data required time for hold time
+    data_required_time += hold_time
+    rows.append(["hold_time", f"{hold_time:.4f}", f"{data_required_time:.4f}"])
+
+    # Add final data required and arrival times to the table
+    rows.append(["----------------------------", "-------", "--------"])
+    rows.append(["data required time", "", f"{-data_required_time:.4f}"])
+    rows.append(["data arrival time", "", f"{path_delay:.4f}"])
+    rows.append(["----------------------------", "-------", "--------"])
+
+    # Calculate and add slack to the table
+    slack = path_delay - data_required_time
+    slack_status = "MET" if slack >= 0 else "VIOLATE"
+    rows.append([f"slack ({slack_status})", "", f"{slack:.4f}"])
+    return rows
+
+
 def generate_timing_report(
     delays: dict,
     output_file: str,
@@ -336,6 +887,14 @@ def generate_timing_report(
     clock_network_delay: float = 0.0,
     clock_uncertainty: float = 0.3,
     clock_period: float = 10.0,
+    path_type: str = "max",
+    capture_edges: dict = None,
+    launch_clock: str = "core_clock",
+    capture_clock: str = "core_clock",
+    path_group: str = None,
+    append: bool = False,
+    clock_latencies: dict = None,
+    path_corners: dict = None,
 ):
     """
     Generates a timing report for the given delays using the tabulate library and
@@ -349,12 +908,29 @@ def generate_timing_report(
         clock_network_delay (float): Delay of clock path.
         clock_uncertainty (float): Clock uncertainty.
         clock_period (float): Clock period.
+        path_type (str): "max" for setup paths, whose last delay is the setup time, or
+                         "min" for hold paths, whose last delay is the hold time and
+                         which are captured by the same clock edge that launched them.
+        capture_edges (dict, optional): Capture edge of the paths changed by a timing
+                                        exception, replacing the clock period (setup)
+                                        or the clock rise edge (hold) of the check.
+        launch_clock (str): Clock of the startpoints.
+        capture_clock (str): Clock of the endpoints.
+        path_group (str, optional): Path group of the paths, the capture clock by default.
+        append (bool): Whether to append the paths to the report file instead of
+                       overwriting it, to write several path groups.
+        clock_latencies (dict, optional): Propagated launch and capture clock latencies
+                                          and clock reconvergence pessimism of each path,
+                                          replacing the clock network delay.
+        path_corners (dict, optional): The corner of each path of a multi-corner report.
 
     Returns:
         None
     """
+    if path_type not in ("max", "min"):
+        raise ValueError("Invalid path type. Please use 'max' or 'min'.")
 
-    with open(output_file, "w") as file:
+    with open(output_file, "a" if append else "w") as file:
         # Iterate over each path and its cell delays
         for path_key, cells_delay in delays.items():
             if not cells_delay:
@@ -370,21 +946,28 @@ def generate_timing_report(
 
             # Print start and end points
             print(
-                f"Startpoint: {startpoint} (rising edge-triggered flip-flop clocked by core_clock)",
+                f"Startpoint: {startpoint} "
+                f"(rising edge-triggered flip-flop clocked by {launch_clock})",
                 file=file,
             )
             print(
-                f"Endpoint: {endpoint} (rising edge-triggered flip-flop clocked by core_clock)",
+                f"Endpoint: {endpoint} "
+                f"(rising edge-triggered flip-flop clocked by {capture_clock})",
                 file=file,
             )
-            print("Path Group: core_clock", file=file)
-            print("Path Type: max\n", file=file)
+            print(f"Path Group: {path_group or capture_clock}", file=file)
+            if path_corners is not None:
+                print(f"Corner: {path_corners[path_key]}", file=file)
+            print(f"Path Type: {path_type}\n", file=file)
 
             headers = ["Point", "Incr", "Path"]
             table = []
 
             # Initial conditions
-            path_delay = 0.00
+            launch_latency, capture_latency, clock_pessimism = (clock_latencies or {}).get(
+                path_key, (None, None, 0.0)
+            )
+            path_delay = 0.00 if launch_latency is None else launch_latency
 
             # Add initial clock conditions to the table
             table.append(
@@ -394,13 +977,22 @@ def generate_timing_report(
                     f"{clock_rise_edge:.4f}",
                 ]
             )
-            table.append(
-                [
-                    "clock network delay (ideal)",
-                    f"{clock_network_delay:.4f}",
-                    f"{clock_network_delay:.4f}",
-                ]
-            )
+            if launch_latency is None:
+                table.append(
+                    [
+                        "clock network delay (ideal)",
+                        f"{clock_network_delay:.4f}",
+                        f"{clock_network_delay:.4f}",
+                    ]
+                )
+            else:
+                table.append(
+                    [
+                        "clock network delay (propagated)",
+                        f"{launch_latency:.4f}",
+                        f"{clock_rise_edge + launch_latency:.4f}",
+                    ]
+                )
 
             # Iterate over cells in the path (excluding the last cell)
             items_to_iterate = list(cells_delay.items())[:-1]
@@ -423,49 +1015,92 @@ def generate_timing_report(
             # Add data arrival time to the table
             table.append(["data arrival time", "", f"{path_delay:.4f}"])
 
-            # Calculate and add data required time to the table
-            table.append(
-                [
-                    "clock period (rise edge)",
-                    f"{clock_period:.4f}",
-                    f"{clock_period:.4f}",
-                ]
-            )
-            data_required_time = clock_period - clock_network_delay
-            table.append(
-                [
-                    "clock network delay (ideal)",
-                    f"{clock_network_delay:.4f}",
-                    f"{data_required_time:.4f}",
-                ]
-            )
-            data_required_time -= clock_uncertainty
-            table.append(
-                [
-                    "clock uncertainty",
-                    f"{-clock_uncertainty:.4f}",
-                    f"{data_required_time:.4f}",
-                ]
-            )
+            if path_type == "min":
+                table.extend(
+                    hold_required_rows(
+                        cells_delay[cell_keys[-1]], path_delay,
+                        (capture_edges or {}).get(path_key, clock_rise_edge),
+                        clock_network_delay, clock_uncertainty, capture_latency, clock_pessimism,
+                    )
+                )
+            else:
+                table.extend(
+                    setup_required_rows(
+                        cells_delay[cell_keys[-1]], path_delay,
+                        clock_network_delay, clock_uncertainty,
+                        (capture_edges or {}).get(path_key, clock_period), capture_latency,
+                        clock_pessimism,
+                    )
+                )
 
-            # Adjust data required time for setup time
-            setup_time = cells_delay[cell_keys[-1]]
-            data_required_time -= setup_time
-            table.append(
-                ["setup_time", f"{-setup_time:.4f}", f"{data_required_time:.4f}"]
-            )
+            # Print the table using tabulate
+            file.write(tabulate(table, headers, tablefmt="simple"))
+            file.write("\n\n")
 
-            # Add final data required and arrival times to the table
-            table.append(["----------------------------", "-------", "--------"])
-            table.append(["data required time", "", f"{data_required_time:.4f}"])
-            table.append(["data arrival time", "", f"{-path_delay:.4f}"])
-            table.append(["----------------------------", "-------", "--------"])
 
-            # Calculate and add slack to the table
-            slack = data_required_time - path_delay
-            slack_status = "MET" if slack >= 0 else "VIOLATE"
-            table.append([f"slack ({slack_status})", "", f"{slack:.4f}"])
+def generate_sweep_report(sweeps: dict, output_file: str):
+    """
+    Generates the report of a clock period and setup uncertainty sweep.
 
-            # Print the table using tabulate
+    Args:
+        sweeps (dict): The sweep of each clock name, as returned by sweep_setup_slack
+                       with the minimum_period of each uncertainty.
+        output_file (str): Path to the output file where the report will be saved.
+    """
+    with open(output_file, "w") as file:
+        for clock_name, sweep in sweeps.items():
+            print(f"Clock: {clock_name}", file=file)
+            print(f"Checked endpoints: {sweep['endpoints']}", file=file)
+            for uncertainty, period in zip(sweep["uncertainties"], sweep["minimum_period"]):
+                print(
+                    f"Minimum period (uncertainty {uncertainty:.4f}): {period:.4f}", file=file
+                )
+            print("", file=file)
+
+            headers = ["Period", "Uncertainty", "WNS", "TNS", "Violations"]
+            table = [
+                [
+                    f"{period:.4f}", f"{uncertainty:.4f}", f"{sweep['wns'][i, j]:.4f}",
+                    f"{sweep['tns'][i, j]:.4f}", int(sweep["violations"][i, j]),
+                ]
+                for i, period in enumerate(sweep["periods"])
+                for j, uncertainty in enumerate(sweep["uncertainties"])
+            ]
             file.write(tabulate(table, headers, tablefmt="simple"))
             file.write("\n\n")
+
+
+def generate_monte_carlo_report(statistics: dict, endpoints: list, nominal_slack, monte_carlo: dict,
+                                output_file: str, top_k: int = 100):
+    """
+    Generates the report of a Monte Carlo timing run: the setup slack distribution and
+    the yield of every endpoint, the worst first slack percentile first.
+
+    Args:
+        statistics (dict): The result of monte_carlo_statistics.
+        endpoints (list): The endpoint name of each check.
+        nominal_slack (array-like): The nominal setup slack of each check.
+        monte_carlo (dict): The settings of the run, see new_monte_carlo.
+        output_file (str): Path to the output file where the report will be saved.
+        top_k (int): The number of endpoints to report.
+    """
+    order = np.argsort(statistics["slack_percentiles"][0], kind="stable")[:top_k]
+    with open(output_file, "w") as file:
+        print(f"Samples: {monte_carlo['samples']} (seed {monte_carlo['seed']}, global sigma "
+              f"{monte_carlo['global_sigma']:g}, local sigma {monte_carlo['local_sigma']:g})",
+              file=file)
+        print(f"Checked endpoints: {len(endpoints)}", file=file)
+        print(f"Design yield: {statistics['design_yield']:.2%}", file=file)
+        print("", file=file)
+
+        headers = ["Endpoint", "Nominal", "Mean", "Std"] + \
+            [f"P{percentile:g}" for percentile in statistics["percentiles"]] + ["Yield"]
+        table = [
+            [endpoints[check], f"{nominal_slack[check]:.4f}", f"{statistics['mean'][check]:.4f}",
+             f"{statistics['std'][check]:.4f}"]
+            + [f"{value:.4f}" for value in statistics["slack_percentiles"][:, check]]
+            + [f"{statistics['yield'][check]:.2%}"]
+            for check in order
+        ]
+        file.write(tabulate(table, headers, tablefmt="simple"))
+        file.write("\n")
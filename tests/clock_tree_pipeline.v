@@ -0,0 +1,55 @@
+module clock_tree_pipeline(CLK, RST_N, IN0, OUT0);
+    input CLK;
+    input RST_N;
+    input IN0;
+    output OUT0;
+    wire CLK;
+    wire RST_N;
+    wire clk_1;
+    wire clk_2;
+    wire q1;
+    wire q2;
+    wire n1;
+    wire n2;
+
+    sky130_fd_sc_hd__clkbuf_1 _c1_ (
+        .A(CLK),
+        .X(clk_1)
+    );
+
+    sky130_fd_sc_hd__clkbuf_1 _c2_ (
+        .A(clk_1),
+        .X(clk_2)
+    );
+
+    sky130_fd_sc_hd__dfrtp_1 _r1_ (
+        .CLK(clk_1),
+        .D(IN0),
+        .RESET_B(RST_N),
+        .Q(q1)
+    );
+
+    sky130_fd_sc_hd__inv_1 _u1_ (
+        .A(q1),
+        .Y(n1)
+    );
+
+    sky130_fd_sc_hd__dfrtp_1 _r2_ (
+        .CLK(clk_1),
+        .D(n1),
+        .RESET_B(RST_N),
+        .Q(q2)
+    );
+
+    sky130_fd_sc_hd__inv_1 _u2_ (
+        .A(q2),
+        .Y(n2)
+    );
+
+    sky130_fd_sc_hd__dfrtp_1 _r3_ (
+        .CLK(clk_2),
+        .D(n2),
+        .RESET_B(RST_N),
+        .Q(OUT0)
+    );
+endmodule
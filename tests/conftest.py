@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from boltsta.readers import parse_liberty_file
+from boltsta.utils import extract_cell_pin_mapping, compile_cell_pin_mapping
+from boltsta.network.graph_creator import graph_creation_func
+from boltsta.network.path_detector import all_paths_info
+from boltsta.network.fanout import get_fanout_dict
+from boltsta.network.levelizer import build_timing_graph, load_sequential_names
+
+LIBRARY_PATH = "tests/sky130_fd_sc_hd__mini.lib"
+
+
+def pytest_addoption(parser):
+    parser.addoption("--benchmark", action="store_true",
+                     help="run the wall-clock benchmarks marked with benchmark")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: wall-clock benchmark, run with --benchmark")
+
+
+def pytest_collection_modifyitems(config, items):
+    # the timings depend on the machine, the benchmarks only run when asked for
+    if config.getoption("--benchmark"):
+        return
+    skip = pytest.mark.skip(reason="benchmark, run with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def library():
+    return parse_liberty_file(LIBRARY_PATH)
+
+
+@pytest.fixture(scope="session")
+def cell_pin_mapping(library):
+    return compile_cell_pin_mapping(extract_cell_pin_mapping(library))
+
+
+@pytest.fixture(scope="session")
+def load_design():
+    def load(verilog_path):
+        # the netlist graph, its reg-reg paths, fanout and levelized timing graph
+        G = graph_creation_func(verilog_path)
+        reg_reg, rr_attr_list, _, _, _, _, adjacency_dict = all_paths_info(G)
+        return {
+            "G": G,
+            "timing_graph": build_timing_graph(G, load_sequential_names()),
+            "fanout": get_fanout_dict(G, adjacency_dict),
+            "paths": reg_reg,
+            "paths_attributes": rr_attr_list,
+        }
+    return load
+
+
+@pytest.fixture(scope="module")
+def pipeline(load_design):
+    return load_design("tests/pipeline.v")
+
+
+@pytest.fixture(scope="session")
+def random_table():
+    def table(rng, rows, columns):
+        # sorted random indices and values of a rows x columns NLDM table
+        index_1 = np.array([np.sort(rng.uniform(0.01, 1.5, rows))])
+        index_2 = np.array([np.sort(rng.uniform(0.0005, 0.2, columns))])
+        return index_1, index_2, rng.uniform(0.01, 2.0, (rows, columns))
+    return table
@@ -0,0 +1,71 @@
+module const_pipeline(CLK, RST_N, IN0, IN1, OUT0, OUT1);
+    input CLK;
+    input RST_N;
+    input IN0;
+    input IN1;
+    output OUT0;
+    output OUT1;
+    wire CLK;
+    wire RST_N;
+    wire q1;
+    wire q2;
+    wire lo;
+    wire hi;
+    wire n1;
+    wire n2;
+    wire n3;
+
+    sky130_fd_sc_hd__dfrtp_1 _r1_ (
+        .CLK(CLK),
+        .D(IN0),
+        .RESET_B(RST_N),
+        .Q(q1)
+    );
+
+    sky130_fd_sc_hd__dfrtp_1 _r2_ (
+        .CLK(CLK),
+        .D(IN1),
+        .RESET_B(RST_N),
+        .Q(q2)
+    );
+
+    sky130_fd_sc_hd__conb_1 _t1_ (
+        .LO(lo)
+    );
+
+    sky130_fd_sc_hd__conb_1 _t2_ (
+        .HI(hi)
+    );
+
+    sky130_fd_sc_hd__and2_1 _u1_ (
+        .A(q1),
+        .B(lo),
+        .X(n1)
+    );
+
+    sky130_fd_sc_hd__nand2_1 _u2_ (
+        .A(q2),
+        .B(hi),
+        .Y(n2)
+    );
+
+    sky130_fd_sc_hd__xor2_1 _u3_ (
+        .A(n1),
+        .B(n2),
+        .X(n3)
+    );
+
+    sky130_fd_sc_hd__dfrtp_1 _r3_ (
+        .CLK(CLK),
+        .D(n3),
+        .RESET_B(RST_N),
+        .Q(OUT0)
+    );
+
+    sky130_fd_sc_hd__dfrtp_1 _r4_ (
+        .CLK(CLK),
+        .D(n1),
+        .RESET_B(RST_N),
+        .Q(OUT1)
+    );
+endmodule
@@ -0,0 +1,50 @@
+module ideal_pipeline (CLK, RST_N, IN0, IN1, OUT0);
+    input CLK;
+    input RST_N;
+    input IN0;
+    input IN1;
+    output OUT0;
+
+    wire clk_buf;
+    wire rst_buf;
+    wire q1;
+    wire q2;
+    wire n1;
+
+    sky130_fd_sc_hd__clkbuf_1 _c1_ (
+        .A(CLK),
+        .X(clk_buf)
+    );
+
+    sky130_fd_sc_hd__buf_1 _b1_ (
+        .A(RST_N),
+        .X(rst_buf)
+    );
+
+    sky130_fd_sc_hd__dfrtp_1 _r1_ (
+        .CLK(clk_buf),
+        .D(IN0),
+        .RESET_B(rst_buf),
+        .Q(q1)
+    );
+
+    sky130_fd_sc_hd__dfrtp_1 _r2_ (
+        .CLK(clk_buf),
+        .D(IN1),
+        .RESET_B(rst_buf),
+        .Q(q2)
+    );
+
+    sky130_fd_sc_hd__nand2_1 _u1_ (
+        .A(q1),
+        .B(q2),
+        .Y(n1)
+    );
+
+    sky130_fd_sc_hd__dfrtp_1 _r3_ (
+        .CLK(clk_buf),
+        .D(n1),
+        .RESET_B(rst_buf),
+        .Q(OUT0)
+    );
+endmodule
@@ -0,0 +1,58 @@
+module scan_pipeline (CLK, RST_N, IN0, IN1, SI, SE, OUT0);
+    input CLK;
+    input RST_N;
+    input IN0;
+    input IN1;
+    input SI;
+    input SE;
+    output OUT0;
+
+    wire q1;
+    wire q2;
+    wire q3;
+    wire n1;
+    wire n2;
+
+    sky130_fd_sc_hd__sdfrtp_1 _r1_ (
+        .CLK(CLK),
+        .D(IN0),
+        .SCD(SI),
+        .SCE(SE),
+        .RESET_B(RST_N),
+        .Q(q1)
+    );
+
+    sky130_fd_sc_hd__sdfrtp_1 _r2_ (
+        .CLK(CLK),
+        .D(IN1),
+        .SCD(q1),
+        .SCE(SE),
+        .RESET_B(RST_N),
+        .Q(q2)
+    );
+
+    sky130_fd_sc_hd__nand2_1 _u1_ (
+        .A(q1),
+        .B(q2),
+        .Y(n1)
+    );
+
+    sky130_fd_sc_hd__inv_1 _u2_ (
+        .A(n1),
+        .Y(n2)
+    );
+
+    sky130_fd_sc_hd__sdfrtp_1 _r3_ (
+        .CLK(CLK),
+        .D(n2),
+        .SCD(q2),
+        .SCE(SE),
+        .RESET_B(RST_N),
+        .Q(q3)
+    );
+
+    sky130_fd_sc_hd__buf_1 _u3_ (
+        .A(q3),
+        .X(OUT0)
+    );
+endmodule
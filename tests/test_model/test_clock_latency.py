@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+from boltsta.readers.scd_reader import parse_clocks, parse_propagated_clocks
+from boltsta.utils import extract_clock_pins
+from boltsta.model import (
+    compute_clock_latencies, extract_path_latencies, propagate_arrival_times, evaluate_endpoints,
+    extract_worst_paths, LATE, EARLY,
+)
+
+
+@pytest.fixture(scope="module")
+def design(load_design, library, cell_pin_mapping):
+    loaded = load_design("tests/clock_tree_pipeline.v")
+    with open("tests/clock_tree_pipeline.sdc") as sdc:
+        content = sdc.read()
+    clocks = parse_clocks(content)
+    clock_latency = compute_clock_latencies(
+        loaded["G"], loaded["timing_graph"], clocks, extract_clock_pins(library), cell_pin_mapping,
+        library, 0.15
+    )
+    return {
+        "G": loaded["G"], "clocks": clocks,
+        "propagated_clocks": parse_propagated_clocks(content, clocks),
+        "timing_graph": loaded["timing_graph"], "fanout": loaded["fanout"],
+        "clock_latency": clock_latency, "cell_mapping": cell_pin_mapping, "library": library,
+    }
+
+
+def latency(design, node, analysis=LATE):
+    return design["clock_latency"]["latency"][analysis, design["timing_graph"]["index"][node]]
+
+
+def test_parse_propagated_clocks(design):
+    assert design["propagated_clocks"] == ["core_clock"]
+
+
+def test_latency_follows_clock_tree_depth(design):
+    # _r1_ and _r2_ are clocked through one buffer, _r3_ through two
+    assert latency(design, "_r1_") > 0
+    assert latency(design, "_r1_") == pytest.approx(latency(design, "_r2_"))
+    assert latency(design, "_r3_") > latency(design, "_r1_")
+    assert latency(design, "_u1_") == 0
+    assert set(design["clock_latency"]["trees"]["core_clock"]["driver"]) == {"_r1_", "_r2_", "_r3_"}
+
+
+def test_skew_shifts_slack(design):
+    timing_graph, cell_mapping, library = (design["timing_graph"], design["cell_mapping"],
+                                           design["library"])
+    slacks = {}
+    for clock_latency in (None, design["clock_latency"]):
+        propagated = propagate_arrival_times(
+            timing_graph, design["fanout"], cell_mapping, library, 0.15,
+            clock_latency=clock_latency,
+        )
+        endpoints = evaluate_endpoints(
+            timing_graph, propagated, library, 0.14, 0, 0.25, 10.0, 0.1,
+            clock_latency=clock_latency,
+        )
+        slacks[clock_latency is None] = {
+            timing_graph["names"][timing_graph["arc_to"][arc]]: slack
+            for arc, slack in zip(endpoints["arc"], endpoints["slack"])
+        }
+
+    # the setup slack of each path moves by the capture latency minus the launch latency, up to
+    # the clock to output delay change of the propagated clock transition
+    for launch, capture in (("_r1_", "_r2_"), ("_r2_", "_r3_")):
+        skew = latency(design, capture, EARLY) - latency(design, launch, LATE)
+        assert slacks[False][capture] - slacks[True][capture] == pytest.approx(skew, abs=0.01)
+
+
+def test_extract_path_latencies(design):
+    timing_graph, cell_mapping, library = (design["timing_graph"], design["cell_mapping"],
+                                           design["library"])
+    clock_latency = design["clock_latency"]
+    propagated = propagate_arrival_times(
+        timing_graph, design["fanout"], cell_mapping, library, 0.15, clock_latency=clock_latency
+    )
+    endpoints = evaluate_endpoints(
+        timing_graph, propagated, library, 0.14, 0, 0.25, 10.0, 0.1, clock_latency=clock_latency
+    )
+    paths = extract_worst_paths(
+        timing_graph, propagated, endpoints, 10, clock_latency=clock_latency
+    )
+    latencies = extract_path_latencies(timing_graph, paths, clock_latency)
+
+    assert len(latencies) == 2
+    for path_key, cells_delay in paths.items():
+        names = [key.split(",")[0] for key in cells_delay]
+        assert latencies[path_key] == pytest.approx(
+            (latency(design, names[0], LATE), latency(design, names[-1], EARLY), 0.0)
+        )
+        # the clock to output delay does not include the launch latency
+        assert list(cells_delay.values())[0] < 0.5
+    assert np.all(clock_latency["slew"] > 0)
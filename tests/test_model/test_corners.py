@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+from boltsta.readers import parse_liberty_file, read_spef, read_sdf
+from boltsta.readers.scd_reader import parse_timing_exceptions
+from boltsta.network.exceptions import build_exception_index
+from boltsta import extract_cell_pin_mapping, compile_cell_pin_mapping
+from boltsta.model import (
+    propagate_arrival_times,
+    evaluate_endpoints,
+    stack_corner_tables,
+    propagate_corner_arrivals,
+    select_corner,
+    merge_corner_endpoints,
+    extract_corner_worst_paths,
+    extract_worst_paths,
+    corner_name,
+    build_node_derates,
+    compute_net_delays,
+    annotate_sdf_delays,
+)
+
+SLOW_LIBRARY_PATH = "tests/sky130_fd_sc_hd__mini_ss.lib"
+
+
+@pytest.fixture(scope="module")
+def libraries(library):
+    return [library, parse_liberty_file(SLOW_LIBRARY_PATH)]
+
+
+@pytest.fixture(scope="module")
+def mappings(libraries, cell_pin_mapping):
+    return [cell_pin_mapping, compile_cell_pin_mapping(extract_cell_pin_mapping(libraries[1]))]
+
+
+@pytest.fixture(scope="module")
+def corners(pipeline, libraries, mappings):
+    stacked = propagate_corner_arrivals(
+        pipeline["timing_graph"], pipeline["fanout"], stack_corner_tables(mappings), libraries,
+        0.15
+    )
+    propagated = [select_corner(stacked, corner) for corner in range(len(libraries))]
+    endpoints = [
+        evaluate_endpoints(pipeline["timing_graph"], corner_propagated, library, 0.14, 0, 0.25,
+                           10.0)
+        for corner_propagated, library in zip(propagated, libraries)
+    ]
+    return propagated, endpoints
+
+
+def test_corner_name():
+    assert corner_name("libs/sky130_fd_sc_hd__ss_100C_1v60.lib") == "sky130_fd_sc_hd__ss_100C_1v60"
+
+
+def test_stacked_tables_have_a_corner_axis(mappings):
+    stacked = stack_corner_tables(mappings)
+    table = stacked["sky130_fd_sc_hd__inv_1"]["Y_A"]["cell_rise"]
+    assert table["values"].shape == (2, 3, 3)
+    assert table["index_1"].shape == (2, 3)
+    assert np.allclose(table["values"][1], 1.35 * table["values"][0], atol=1e-6)
+
+
+def test_stack_rejects_missing_arcs(mappings):
+    reduced = {cell: dict(pins) for cell, pins in mappings[1].items()}
+    del reduced["sky130_fd_sc_hd__inv_1"]["Y_A"]
+    with pytest.raises(ValueError):
+        stack_corner_tables([mappings[0], reduced])
+
+
+def test_corner_pass_matches_each_corner(pipeline, corners, libraries, mappings):
+    """One pass over the stacked tables gives the arrivals of every corner's own pass."""
+    propagated, _ = corners
+    for corner, (mapping, library) in enumerate(zip(mappings, libraries)):
+        expected = propagate_arrival_times(
+            pipeline["timing_graph"], pipeline["fanout"], mapping, library, 0.15
+        )
+        for name in ("arrival", "slew", "pred_arc", "pred_transition", "launch"):
+            assert np.array_equal(propagated[corner][name], expected[name])
+
+
+@pytest.mark.parametrize("annotation", ["spef", "sdf"])
+def test_corner_pass_times_the_tags_and_annotations(pipeline, libraries, mappings, annotation):
+    """The exception tags, derates and wire or SDF delays are those of each corner's pass."""
+    timing_graph, fanout = pipeline["timing_graph"], pipeline["fanout"]
+    settings = {
+        "exception_index": build_exception_index(timing_graph, parse_timing_exceptions(
+            "set_multicycle_path 2 -setup -from [get_cells _r1_]\n"
+            "set_false_path -hold -through [get_cells _u3_]")),
+        "derates": build_node_derates(timing_graph, (1.05, 0.95)),
+        "net_delays": None if annotation != "spef" else
+        compute_net_delays(timing_graph, read_spef("tests/pipeline.spef"), libraries[0]),
+        "sdf_delays": None if annotation != "sdf" else
+        annotate_sdf_delays(timing_graph, read_sdf("tests/pipeline.sdf")),
+    }
+    stacked = propagate_corner_arrivals(timing_graph, fanout, stack_corner_tables(mappings),
+                                        libraries, 0.15, **settings)
+    for corner, (mapping, library) in enumerate(zip(mappings, libraries)):
+        propagated = select_corner(stacked, corner)
+        expected = propagate_arrival_times(timing_graph, fanout, mapping, library, 0.15,
+                                           **settings)
+        assert expected["tagged"]
+        assert propagated["tagged"].keys() == expected["tagged"].keys()
+        for node, tags in expected["tagged"].items():
+            for tag, entry in tags.items():
+                assert np.allclose(propagated["tagged"][node][tag]["arrival"], entry["arrival"])
+        assert np.allclose(propagated["arrival"], expected["arrival"])
+        endpoints, expected_endpoints = (
+            evaluate_endpoints(timing_graph, result, library, 0.14, 0, 0.25, 10.0, 0.1)
+            for result in (propagated, expected)
+        )
+        for name in ("slack", "hold_slack"):
+            assert np.allclose(endpoints[name], expected_endpoints[name])
+
+
+def test_merged_endpoints_take_the_worst_corner(corners):
+    _, endpoints = corners
+    merged = merge_corner_endpoints(endpoints)
+
+    assert np.array_equal(merged["slack"], np.minimum(endpoints[0]["slack"], endpoints[1]["slack"]))
+    # the slow corner has the worst setup slack of every endpoint
+    assert (merged["corner"] == 1).all()
+    assert merged["corner_slack"].shape == (2, len(merged["arc"]))
+
+
+def test_merged_paths_come_from_their_worst_corner(pipeline, corners):
+    propagated, endpoints = corners
+    merged = merge_corner_endpoints(endpoints)
+    paths, capture_edges, path_corners = extract_corner_worst_paths(
+        pipeline["timing_graph"], propagated, endpoints, merged, 2
+    )
+
+    assert list(paths) == ["path1", "path2"] == list(capture_edges)
+    assert path_corners == {"path1": 1, "path2": 1}
+    assert paths == extract_worst_paths(pipeline["timing_graph"], propagated[1], endpoints[1], 2)
@@ -0,0 +1,74 @@
+import pytest
+from boltsta.readers.scd_reader import parse_clocks
+from boltsta.utils import extract_clock_pins
+from boltsta.model import (
+    compute_clock_latencies, extract_path_latencies, propagate_arrival_times, evaluate_endpoints,
+    extract_worst_paths, cppr_credit, clock_tree_parents,
+)
+
+
+@pytest.fixture(scope="module")
+def design(load_design, library, cell_pin_mapping):
+    clock_tree_pipeline = load_design("tests/clock_tree_pipeline.v")
+    timing_graph = clock_tree_pipeline["timing_graph"]
+    with open("tests/clock_tree_pipeline.sdc") as sdc:
+        clocks = parse_clocks(sdc.read())
+    clock_latency = compute_clock_latencies(
+        clock_tree_pipeline["G"], timing_graph, clocks, extract_clock_pins(library),
+        cell_pin_mapping, library, 0.15, derates=(1.05, 0.95),
+    )
+    return {
+        "timing_graph": timing_graph, "fanout": clock_tree_pipeline["fanout"],
+        "clock_latency": clock_latency, "tree": clock_latency["trees"]["core_clock"],
+    }
+
+
+def tree_node(design, name):
+    return design["tree"]["timing_graph"]["index"][name]
+
+
+def test_clock_tree_parents(design):
+    parents = clock_tree_parents(design["tree"]["timing_graph"])
+    assert parents[tree_node(design, "CLK")] == -1
+    assert parents[tree_node(design, "_c1_")] == tree_node(design, "CLK")
+    assert parents[tree_node(design, "_c2_")] == tree_node(design, "_c1_")
+
+
+def test_credit_is_pessimism_of_common_buffer(design):
+    index = design["timing_graph"]["index"]
+    cppr = design["clock_latency"]["cppr"]
+    late, early = design["tree"]["arrival"][:, tree_node(design, "_c1_")]
+
+    # _r1_ and _r2_ share _c1_, _r3_ is clocked through _c2_ below it
+    assert cppr_credit(cppr, index["_r1_"], index["_r2_"]) == pytest.approx(late - early)
+    assert cppr_credit(cppr, index["_r2_"], index["_r3_"]) == pytest.approx(late - early)
+    assert late - early > 0
+    assert cppr_credit(cppr, index["_r1_"], index["_u1_"]) == 0.0
+    assert cppr_credit(None, index["_r1_"], index["_r2_"]) == 0.0
+
+
+@pytest.mark.parametrize("analysis, slack", [("late", "slack"), ("early", "hold_slack")])
+def test_cppr_relaxes_slack_and_reports(design, analysis, slack, library, cell_pin_mapping):
+    timing_graph = design["timing_graph"]
+    clock_latency = design["clock_latency"]
+    propagated = propagate_arrival_times(
+        timing_graph, design["fanout"], cell_pin_mapping, library, 0.15, clock_latency=clock_latency
+    )
+    endpoints = {}
+    for name, latency in (("cppr", clock_latency), ("none", dict(clock_latency, cppr=None))):
+        endpoints[name] = evaluate_endpoints(
+            timing_graph, propagated, library, 0.14, 0, 0.25, 10.0, 0.1, clock_latency=latency
+        )
+
+    paths = extract_worst_paths(
+        timing_graph, propagated, endpoints["cppr"], 10, analysis, clock_latency
+    )
+    latencies = extract_path_latencies(timing_graph, paths, clock_latency, analysis)
+    credits = {
+        list(cells)[-1].split(",")[0]: latencies[path_key][2] for path_key, cells in paths.items()
+    }
+    for position, arc in enumerate(endpoints["cppr"]["arc"]):
+        sink = timing_graph["names"][timing_graph["arc_to"][arc]]
+        gained = endpoints["cppr"][slack][position] - endpoints["none"][slack][position]
+        assert gained == pytest.approx(credits[sink])
+        assert gained > 0
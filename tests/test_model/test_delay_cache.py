@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+from boltsta.model import (
+    build_paths_delay_dict,
+    propagate_arrival_times,
+    calculate_arc_delays,
+    cached_arc_delays,
+    new_delay_cache,
+    delay_cache_stats,
+    lookup_delay,
+    store_delay,
+)
+
+ARC = ("sky130_fd_sc_hd__inv_1", "Y_A")
+
+
+@pytest.fixture(scope="module")
+def timing_data(cell_pin_mapping):
+    return cell_pin_mapping[ARC[0]][ARC[1]]
+
+
+@pytest.fixture(scope="module")
+def propagation_args(pipeline, library, cell_pin_mapping):
+    return pipeline["timing_graph"], pipeline["fanout"], cell_pin_mapping, library, 1.5
+
+
+@pytest.fixture(scope="module")
+def path_args(pipeline, library, cell_pin_mapping):
+    return (pipeline["paths"], pipeline["paths_attributes"], pipeline["fanout"], cell_pin_mapping,
+            library, 0.14, 1.5)
+
+
+def test_cached_arc_delays_match_interpolation(timing_data):
+    """A cached evaluation returns the delays of calculate_arc_delays, hit or miss."""
+    delay_cache = new_delay_cache()
+    transitions = [("rise", 0.1), ("fall", 0.2)]
+    expected = calculate_arc_delays(timing_data, transitions, 0.01, "negative_unate")
+
+    assert cached_arc_delays(delay_cache, *ARC, timing_data, transitions, 0.01,
+                             "negative_unate") == expected
+    assert cached_arc_delays(delay_cache, *ARC, timing_data, transitions, 0.01,
+                             "negative_unate") == expected
+    assert delay_cache_stats(delay_cache)["hits"] == 2
+    assert delay_cache_stats(delay_cache)["misses"] == 2
+
+
+def test_lru_eviction():
+    """The least recently used entry is evicted when the cache is full."""
+    delay_cache = new_delay_cache(max_entries=2)
+    store_delay(delay_cache, "a", 1)
+    store_delay(delay_cache, "b", 2)
+    assert lookup_delay(delay_cache, "a") == 1
+    store_delay(delay_cache, "c", 3)
+
+    assert lookup_delay(delay_cache, "b") is None
+    assert lookup_delay(delay_cache, "a") == 1
+    stats = delay_cache_stats(delay_cache)
+    assert (stats["entries"], stats["evictions"]) == (2, 1)
+
+
+def test_slew_tolerance_shares_nearby_slews(timing_data):
+    """Slews within the tolerance share one evaluation, at the quantized slew."""
+    delay_cache = new_delay_cache(slew_tolerance=0.01)
+    first = cached_arc_delays(delay_cache, *ARC, timing_data, [("rise", 0.1001)], 0.01,
+                              "negative_unate")
+    second = cached_arc_delays(delay_cache, *ARC, timing_data, [("rise", 0.0999)], 0.01,
+                               "negative_unate")
+
+    assert first[("rise", 0.1001, "fall")] == second[("rise", 0.0999, "fall")]
+    assert first[("rise", 0.1001, "fall")] == pytest.approx(
+        calculate_arc_delays(timing_data, [("rise", 0.1)], 0.01, "negative_unate")[
+            ("rise", 0.1, "fall")])
+    assert delay_cache_stats(delay_cache)["hits"] == 1
+
+
+def test_invalid_cache_settings():
+    with pytest.raises(ValueError):
+        new_delay_cache(max_entries=0)
+    with pytest.raises(ValueError):
+        new_delay_cache(slew_tolerance=-0.1)
+
+
+def test_exact_cache_keeps_propagated_arrivals(propagation_args):
+    """Without a tolerance the cached propagation is exact, even with evictions."""
+    expected = propagate_arrival_times(*propagation_args)
+    delay_cache = new_delay_cache(max_entries=4)
+    cached = propagate_arrival_times(*propagation_args, delay_cache=delay_cache)
+
+    assert np.array_equal(cached["arrival"], expected["arrival"])
+    assert np.array_equal(cached["slew"], expected["slew"])
+    assert delay_cache_stats(delay_cache)["evictions"] > 0
+
+
+def test_cache_shared_by_path_stages(path_args):
+    """The enumerated path stages give the same delays through the cache."""
+    delay_cache = new_delay_cache()
+
+    assert build_paths_delay_dict(*path_args, delay_cache=delay_cache) == \
+        build_paths_delay_dict(*path_args)
+    assert delay_cache_stats(delay_cache)["misses"] > 0
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+from boltsta.readers.aocv_reader import parse_aocv_tables
+from boltsta.model import (
+    propagate_arrival_times,
+    build_node_derates,
+    aocv_derate,
+    build_paths_delay_dict,
+    LATE,
+    EARLY,
+)
+
+TABLES = parse_aocv_tables("""derate_type: late
+object_spec: sky130_fd_sc_hd__*
+depth: 1 2 4
+distance: 0 1000
+table: 1.20 1.10 1.05 1.30 1.20 1.10
+derate_type: early
+object_spec: sky130_fd_sc_hd__inv_*
+depth: 1
+distance: 0
+table: 0.9
+""")
+
+
+@pytest.fixture(scope="module")
+def design(pipeline):
+    return tuple(pipeline[name] for name in ("timing_graph", "fanout", "paths", "paths_attributes"))
+
+
+def test_logic_depth(design):
+    """The depth of a node is the number of stages of the shortest path through it."""
+    timing_graph = design[0]
+    depth = dict(zip(timing_graph["names"], timing_graph["depth"]))
+    # _r2_ -> _u1_ -> _u4_ -> _u5_ -> _r3_
+    assert depth["_r2_"] == depth["_u1_"] == depth["_u4_"] == depth["_u5_"] == 4
+    # _r1_ -> _u3_ -> _r4_
+    assert depth["_r1_"] == depth["_u3_"] == 2
+    # _r4_ -> OUT0
+    assert depth["_r4_"] == 1
+    assert depth["IN0"] == depth["OUT1"] == 0
+
+
+def test_aocv_derate_interpolation():
+    table = TABLES[0]
+    assert np.allclose(aocv_derate(table, np.array([1, 3, 8])), [1.20, 1.075, 1.05])
+    assert np.allclose(aocv_derate(table, np.array([2]), 500.0), [1.15])
+
+
+def test_build_node_derates(design):
+    timing_graph = design[0]
+    ports = timing_graph["inputs"] | timing_graph["outputs"]
+    derates = build_node_derates(timing_graph, (1.05, 0.95), TABLES)
+    assert np.all(derates[:, ports] == 1.0)
+    index = timing_graph["index"]
+    assert derates[LATE, index["_r1_"]] == pytest.approx(1.10)
+    assert derates[LATE, index["_u4_"]] == pytest.approx(1.05)
+    # the cells without an early table keep the flat derate
+    assert derates[EARLY, index["_u2_"]] == pytest.approx(0.9)
+    assert derates[EARLY, index["_u1_"]] == pytest.approx(0.95)
+
+    with pytest.raises(ValueError):
+        build_node_derates(timing_graph, (1.05, 0.0))
+
+
+def test_flat_derates_scale_arrivals(design, library, cell_pin_mapping):
+    """Arrivals are sums of cell delays, so a flat derate scales them."""
+    timing_graph, fanout = design[:2]
+    expected = propagate_arrival_times(timing_graph, fanout, cell_pin_mapping, library, 0.15)
+    unit = propagate_arrival_times(timing_graph, fanout, cell_pin_mapping, library, 0.15,
+                                   derates=build_node_derates(timing_graph))
+    derated = propagate_arrival_times(timing_graph, fanout, cell_pin_mapping, library, 0.15,
+                                      derates=build_node_derates(timing_graph, (1.05, 0.95)))
+
+    assert np.array_equal(unit["arrival"], expected["arrival"])
+    for analysis, factor in ((LATE, 1.05), (EARLY, 0.95)):
+        reached = np.isfinite(expected["arrival"][analysis])
+        assert np.allclose(derated["arrival"][analysis][reached],
+                           factor * expected["arrival"][analysis][reached])
+    assert np.array_equal(derated["slew"], expected["slew"])
+
+
+def test_exhaustive_paths_use_node_derates(design, library, cell_pin_mapping):
+    timing_graph, fanout, paths, attributes = design
+    derates = build_node_derates(timing_graph, (1.0, 1.0), TABLES)
+    node_derates = dict(zip(timing_graph["keys"], derates[LATE]))
+    nominal = build_paths_delay_dict(
+        paths, attributes, fanout, cell_pin_mapping, library, 0.14, 0.15
+    )
+    derated = build_paths_delay_dict(
+        paths, attributes, fanout, cell_pin_mapping, library, 0.14, 0.15, derates=node_derates
+    )
+    for path_key, stages in nominal.items():
+        for cell, delay in stages.items():
+            # the setup time of the endpoint is not derated
+            factor = 1.0 if cell.endswith(",end") else node_derates[cell]
+            assert derated[path_key][cell] == pytest.approx(delay * factor, abs=2e-6)
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+from boltsta.readers.scd_reader import parse_clocks
+from boltsta.utils import extract_clock_pins
+from boltsta.model import (
+    clock_relationship, build_domain_tasks, analyze_clock_domains, propagate_arrival_times,
+    evaluate_endpoints,
+)
+from boltsta.network.reachability import build_reachability_index
+from boltsta.network.clock_domains import assign_clock_domains
+
+
+def clock(name, period, rise=0.0):
+    return {"name": name, "period": period, "waveform": (rise, rise + period / 2), "sources": []}
+
+
+@pytest.mark.parametrize("launch, capture, expected", [
+    (clock("a", 10), clock("a", 10), (10.0, 0.0)),
+    (clock("a", 10), clock("b", 4), (2.0, 0.0)),
+    (clock("b", 4), clock("a", 10), (2.0, 0.0)),
+    (clock("a", 10), clock("b", 5), (5.0, 0.0)),
+    (clock("a", 10), clock("b", 10, 3), (3.0, -7.0)),
+])
+def test_clock_relationship(launch, capture, expected):
+    assert clock_relationship(launch, capture) == pytest.approx(expected)
+
+
+@pytest.fixture(scope="module")
+def design(load_design, library, cell_pin_mapping):
+    two_clock_pipeline = load_design("tests/two_clock_pipeline.v")
+    timing_graph = two_clock_pipeline["timing_graph"]
+    with open("tests/two_clock_pipeline.sdc") as sdc:
+        clocks = parse_clocks(sdc.read())
+    domains = assign_clock_domains(two_clock_pipeline["G"], extract_clock_pins(library), clocks)
+    shared = {
+        "timing_graph": timing_graph, "fanout": two_clock_pipeline["fanout"],
+        "cell_pin_mapping": cell_pin_mapping, "library": library,
+        "exception_index": None, "clock_transition": 0.15, "related_pin_time": 0.14,
+        "clock_setup_uncertainty": 0.25, "clock_hold_uncertainty": 0.1, "top_k": 10,
+        "analyses": ("late", "early"), "slack_lesser_than": None,
+    }
+    tasks = build_domain_tasks(timing_graph, build_reachability_index(timing_graph), domains,
+                               clocks)
+    return {"shared": shared, "tasks": tasks}
+
+
+def endpoint_names(group, analysis="late"):
+    return sorted(list(path)[-1].split(",")[0] for path in group[analysis]["paths"].values())
+
+
+def test_path_groups(design):
+    groups = analyze_clock_domains(design["tasks"], design["shared"])
+
+    assert set(groups) == {("clk_a", "clk_a"), ("clk_a", "clk_b"),
+                           ("clk_b", "clk_a"), ("clk_b", "clk_b")}
+    assert endpoint_names(groups[("clk_a", "clk_a")]) == ["_r4_"]
+    assert endpoint_names(groups[("clk_a", "clk_b")]) == ["_r3_"]
+    assert endpoint_names(groups[("clk_b", "clk_a")]) == ["_r2_"]
+    assert groups[("clk_a", "clk_b")]["late"]["capture_edges"] == {"path1": 2.0}
+    assert groups[("clk_b", "clk_b")]["late"]["capture_edges"] == {"path1": 4.0}
+
+
+def test_domain_slack_matches_single_pass(design):
+    # the clk_a -> clk_a group is the single clock analysis restricted to its endpoints
+    shared = design["shared"]
+    groups = analyze_clock_domains(design["tasks"], shared)
+    propagated = propagate_arrival_times(shared["timing_graph"], shared["fanout"],
+                                         shared["cell_pin_mapping"], shared["library"], 0.15)
+    endpoints = evaluate_endpoints(shared["timing_graph"], propagated, shared["library"], 0.14, 0,
+                                   0.25, 10.0, 0.1)
+    index = shared["timing_graph"]["index"]
+    arc_to = shared["timing_graph"]["arc_to"][endpoints["arc"]]
+    assert groups[("clk_a", "clk_a")]["late"]["worst_slack"] == pytest.approx(
+        float(np.min(endpoints["slack"][arc_to == index["_r4_"]]))
+    )
+
+
+def test_parallel_workers_match_serial(design):
+    serial = analyze_clock_domains(design["tasks"], design["shared"], jobs=1)
+    parallel = analyze_clock_domains(design["tasks"], design["shared"], jobs=2)
+    assert serial.keys() == parallel.keys()
+    for pair in serial:
+        assert serial[pair]["late"]["paths"] == parallel[pair]["late"]["paths"]
+        assert serial[pair]["early"]["worst_slack"] == pytest.approx(
+            parallel[pair]["early"]["worst_slack"])
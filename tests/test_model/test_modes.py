@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+from boltsta.readers import read_sdf
+from boltsta.utils import extract_scan_pins
+from boltsta.model import (
+    propagate_arrival_times,
+    evaluate_endpoints,
+    extract_worst_paths,
+    analyze_modes,
+    mode_name,
+    annotate_sdf_delays,
+)
+from boltsta.network.scan_pruning import prune_scan_arcs
+from boltsta.network.mode_overlay import build_mode_overlay
+
+CLOCK = {"name": "core_clock", "period": 10, "waveform": (0, 5), "sources": []}
+
+
+@pytest.fixture(scope="module")
+def design(load_design, library, cell_pin_mapping):
+    scan_pipeline = load_design("tests/scan_pipeline.v")
+    G, timing_graph = scan_pipeline["G"], scan_pipeline["timing_graph"]
+    scan_pins = extract_scan_pins(library)
+    tasks = {}
+    modes = (("functional", {"SE": 0}), ("scan_shift", {"SE": 1}), ("all", None))
+    for name, case_analysis in modes:
+        tasks[name] = {
+            "cone": build_mode_overlay(timing_graph, prune_scan_arcs(G, scan_pins, case_analysis)),
+            "fanout": scan_pipeline["fanout"],
+            "clock": CLOCK, "clock_transition": 0.15,
+            "clock_setup_uncertainty": 0.25, "clock_hold_uncertainty": 0.1,
+            "exception_index": None, "clock_latency": None,
+        }
+    shared = {
+        "timing_graph": timing_graph, "cell_pin_mapping": cell_pin_mapping, "library": library,
+        "related_pin_time": 0.14, "top_k": 10, "analyses": ("late", "early"),
+        "slack_lesser_than": None,
+    }
+    return G, tasks, shared
+
+
+def test_mode_name():
+    assert mode_name("constraints/scan_shift.sdc") == "scan_shift"
+
+
+def test_unconstrained_mode_matches_a_single_run(design, library, cell_pin_mapping):
+    _, tasks, shared = design
+    results = analyze_modes({"all": tasks["all"]}, shared)
+    timing_graph = shared["timing_graph"]
+    propagated = propagate_arrival_times(
+        timing_graph, tasks["all"]["fanout"], cell_pin_mapping, library, 0.15
+    )
+    endpoints = evaluate_endpoints(timing_graph, propagated, library, 0.14, 0, 0.25, 10, 0.1)
+
+    expected = extract_worst_paths(timing_graph, propagated, endpoints, 10)
+    assert results["all"]["late"]["paths"] == expected
+    assert results["all"]["late"]["worst_slack"] == pytest.approx(np.nanmin(endpoints["slack"]))
+
+
+def test_modes_share_the_sdf_delays(design, library, cell_pin_mapping):
+    _, tasks, shared = design
+    timing_graph = shared["timing_graph"]
+    sdf_delays = annotate_sdf_delays(timing_graph, read_sdf("tests/pipeline.sdf"))
+    results = analyze_modes({"all": tasks["all"]}, dict(shared, sdf_delays=sdf_delays))
+    propagated = propagate_arrival_times(
+        timing_graph, tasks["all"]["fanout"], cell_pin_mapping, library, 0.15,
+        sdf_delays=sdf_delays,
+    )
+    endpoints = evaluate_endpoints(timing_graph, propagated, library, 0.14, 0, 0.25, 10, 0.1)
+
+    assert sdf_delays["annotated"]
+    assert results["all"]["late"]["paths"] == extract_worst_paths(
+        timing_graph, propagated, endpoints, 10)
+    assert results["all"]["late"]["paths"] != analyze_modes({"all": tasks["all"]}, shared)[
+        "all"]["late"]["paths"]
+
+
+def test_modes_time_their_own_arcs(design):
+    _, tasks, shared = design
+    results = analyze_modes({name: tasks[name] for name in ("functional", "scan_shift")}, shared)
+
+    # the functional mode captures the logic cone in _r3_, the shift mode the scan chain
+    assert results["functional"]["late"]["endpoints"] == 1
+    assert results["scan_shift"]["late"]["endpoints"] == 2
+    assert results["functional"]["late"]["paths"] != results["scan_shift"]["late"]["paths"]
+
+
+def test_worker_processes_match_serial_modes(design):
+    _, tasks, shared = design
+    assert analyze_modes(tasks, shared, jobs=2) == analyze_modes(tasks, shared)
+
+
+def test_invalid_jobs(design):
+    _, tasks, shared = design
+    with pytest.raises(ValueError):
+        analyze_modes(tasks, shared, jobs=0)
@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+from boltsta.model import (
+    propagate_arrival_times,
+    evaluate_endpoints,
+    new_monte_carlo,
+    monte_carlo_arc_delays,
+    monte_carlo_required_times,
+    monte_carlo_slacks,
+    monte_carlo_statistics,
+    new_slack_accumulator,
+    accumulate_slacks,
+)
+from boltsta.network.exceptions import build_exception_index
+from boltsta.readers.scd_reader import parse_timing_exceptions
+
+
+@pytest.fixture(scope="module")
+def design(pipeline, library, cell_pin_mapping):
+    timing_graph, fanout = pipeline["timing_graph"], pipeline["fanout"]
+    nominal = propagate_arrival_times(timing_graph, fanout, cell_pin_mapping, library, 0.15)
+    return {
+        "timing_graph": timing_graph,
+        "fanout": fanout,
+        "library": library,
+        "cell_pin_mapping": cell_pin_mapping,
+        "endpoints": evaluate_endpoints(timing_graph, nominal, library, 0.14, 0, 0.25, 10.0),
+        "arc_delays": monte_carlo_arc_delays(timing_graph, nominal, fanout, cell_pin_mapping,
+                                             library),
+        "required": monte_carlo_required_times(timing_graph, nominal, library, 0.14, 10.0, 0.25),
+    }
+
+
+def run(design, monte_carlo):
+    return monte_carlo_statistics(
+        monte_carlo_slacks(design["arc_delays"], design["required"], monte_carlo)
+    )
+
+
+def test_samples_without_variation_are_nominal(design):
+    statistics = run(design, new_monte_carlo(4, global_sigma=0.0, local_sigma=0.0))
+    assert np.array_equal(design["required"]["arc"], design["endpoints"]["arc"])
+    assert np.allclose(design["required"]["slack"], design["endpoints"]["slack"])
+    assert np.allclose(statistics["mean"], design["endpoints"]["slack"])
+    assert np.allclose(statistics["slack_percentiles"], design["endpoints"]["slack"])
+    assert np.allclose(statistics["std"], 0.0)
+
+
+def test_samples_do_not_depend_on_the_block_size(design):
+    """Seeded samples are reproducible, whatever the number of samples per block."""
+    statistics = run(design, new_monte_carlo(500, seed=3, block_size=500))
+    blocks = run(design, new_monte_carlo(500, seed=3, block_size=64))
+    for name in ("slack_percentiles", "mean", "std", "yield"):
+        assert np.allclose(blocks[name], statistics[name])
+    assert not np.allclose(run(design, new_monte_carlo(500, seed=4))["mean"],
+                           statistics["mean"])
+
+
+def test_global_variation_scales_every_delay(design):
+    statistics = run(design, new_monte_carlo(400, global_sigma=0.1, local_sigma=0.0))
+    # every sample moves the arrival of each endpoint by the same relative factor
+    relative = statistics["std"] / design["required"]["arrival"]
+    assert np.allclose(relative, relative[0], rtol=0.05)
+    assert relative[0] == pytest.approx(0.1, rel=0.2)
+
+
+def test_monte_carlo_statistics():
+    slacks = np.array([[-1.0, 2.0], [1.0, 3.0], [2.0, -0.5], [3.0, 4.0]])
+    accumulator = new_slack_accumulator(np.array([1.0, 2.0]), np.array([4.0, 4.0]))
+    accumulate_slacks(accumulator, slacks[:3])
+    accumulate_slacks(accumulator, slacks[3:])
+    statistics = monte_carlo_statistics(accumulator, percentiles=(0, 50, 100))
+
+    assert statistics["slack_percentiles"] == pytest.approx(
+        np.array([[-1.0, -0.5], [1.5, 2.5], [3.0, 4.0]]), abs=0.01
+    )
+    assert statistics["slack_percentiles"][[0, 2]].tolist() == [[-1.0, -0.5], [3.0, 4.0]]
+    assert statistics["yield"].tolist() == [0.75, 0.75]
+    assert statistics["design_yield"] == 0.5
+    assert statistics["mean"] == pytest.approx([1.25, 2.125])
+    assert statistics["std"] == pytest.approx(slacks.std(axis=0))
+
+
+def test_false_path_is_not_sampled(design):
+    timing_graph, fanout = design["timing_graph"], design["fanout"]
+    library, cell_pin_mapping = design["library"], design["cell_pin_mapping"]
+    endpoint = timing_graph["names"][timing_graph["arc_to"][design["required"]["arc"][0]]]
+    exception_index = build_exception_index(
+        timing_graph, parse_timing_exceptions(f"set_false_path -to [get_cells {endpoint}]")
+    )
+    nominal = propagate_arrival_times(timing_graph, fanout, cell_pin_mapping, library, 0.15,
+                                      exception_index=exception_index)
+    endpoints = evaluate_endpoints(timing_graph, nominal, library, 0.14, 0, 0.25, 10.0)
+    required = monte_carlo_required_times(timing_graph, nominal, library, 0.14, 10.0, 0.25)
+    statistics = monte_carlo_statistics(monte_carlo_slacks(
+        monte_carlo_arc_delays(timing_graph, nominal, fanout, cell_pin_mapping, library),
+        required, new_monte_carlo(4, global_sigma=0.0, local_sigma=0.0),
+    ))
+
+    checked = np.isfinite(endpoints["slack"])
+    assert np.array_equal(required["arc"], design["required"]["arc"][1:])
+    assert np.array_equal(required["arc"], endpoints["arc"][checked])
+    assert np.allclose(statistics["mean"], endpoints["slack"][checked])
+
+
+@pytest.mark.parametrize("arguments", [
+    {"samples": 0}, {"samples": 10, "block_size": 0}, {"samples": 10, "local_sigma": -0.1},
+])
+def test_invalid_monte_carlo_settings(arguments):
+    with pytest.raises(ValueError):
+        new_monte_carlo(**arguments)
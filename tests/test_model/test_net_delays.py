@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+from boltsta.readers import parse_spef
+from boltsta.model import (
+    propagate_arrival_times,
+    evaluate_endpoints,
+    extract_worst_paths,
+    compute_rc_moments,
+    compute_net_delays,
+    effective_capacitance,
+)
+
+# driver -2- a -1- b, a -4- c in kohm, with 1, 3, 4 and 2 pF on driver, a, b and c
+TREE = """*C_UNIT 1 PF
+*R_UNIT 1 KOHM
+*D_NET tree 10
+*CONN
+*I drv:Y O
+*CAP
+1 drv:Y 1
+2 a 3
+3 b 4
+4 c 2
+*RES
+1 drv:Y a 2
+2 a b 1
+3 a c 4
+*END
+"""
+
+
+def n5_spef(resistance, capacitance):
+    # the net from _u5_ to the D pin of _r3_
+    return parse_spef(f"""*C_UNIT 1 PF
+*R_UNIT 1 KOHM
+*D_NET n5 {capacitance}
+*CONN
+*I _u5_:X O
+*I _r3_:D I
+*CAP
+1 _r3_:D {capacitance}
+*RES
+1 _u5_:X _r3_:D {resistance}
+*END
+""".splitlines())
+
+
+@pytest.fixture(scope="module")
+def propagate(pipeline, library, cell_pin_mapping):
+    # the pipeline arrivals with the given wire delays
+    def run(net_delays=None):
+        return propagate_arrival_times(pipeline["timing_graph"], pipeline["fanout"],
+                                       cell_pin_mapping, library, 0.15, net_delays=net_delays)
+    return run
+
+
+def test_elmore_delay():
+    parasitics = parse_spef(TREE.splitlines())
+    moments = compute_rc_moments(parasitics)
+    delay = dict(zip(["drv:Y", "a", "b", "c"], moments["delay"][[0, 1, 2, 3]]))
+    assert parasitics["pins"]["drv:Y"] == 0
+    assert moments["y1"][0] == pytest.approx(10.0)
+    assert delay["a"] == pytest.approx(18.0)
+    assert delay["b"] == pytest.approx(22.0)
+    assert delay["c"] == pytest.approx(26.0)
+
+
+def test_effective_capacitance_of_single_rc():
+    """A resistance R into a capacitance C reduces to the pi model C1 = 0, R, C2 = C."""
+    resistance, capacitance = 2.0, 0.5
+    y1, y2, y3 = capacitance, -resistance * capacitance ** 2, resistance ** 2 * capacitance ** 3
+    assert effective_capacitance(y1, y2, y3) == pytest.approx(capacitance)
+    assert effective_capacitance(y1, y2, y3, 0.0) == pytest.approx(0.0)
+    tau = resistance * capacitance
+    transition = 3.0
+    expected = capacitance * (1 - tau / transition * (1 - np.exp(-transition / tau)))
+    assert effective_capacitance(y1, y2, y3, transition) == pytest.approx(expected)
+    # a purely capacitive load
+    assert effective_capacitance(1.5, 0.0, 0.0, 0.1) == pytest.approx(1.5)
+
+
+def test_ideal_wires_keep_arrivals(pipeline, library, propagate):
+    expected = propagate()
+    net_delays = compute_net_delays(pipeline["timing_graph"], n5_spef(0.0, 0.0), library)
+    propagated = propagate(net_delays)
+    assert not net_delays["wire_delay"].any()
+    assert np.array_equal(propagated["arrival"], expected["arrival"])
+    assert np.array_equal(propagated["slew"], expected["slew"])
+
+
+def test_wire_delay_reaches_endpoint(pipeline, library, propagate):
+    timing_graph = pipeline["timing_graph"]
+    net_delays = compute_net_delays(timing_graph, n5_spef(2.0, 0.001), library)
+    propagated = propagate(net_delays)
+    arc = np.flatnonzero(timing_graph["arc_to"] == timing_graph["index"]["_r3_"])
+    arc = arc[timing_graph["arc_from"][arc] == timing_graph["index"]["_u5_"]][0]
+    # the Elmore delay of the D pin, loaded by its Liberty capacitance
+    pin_cap = net_delays["load"][timing_graph["index"]["_u5_"]] - 0.001
+    assert net_delays["wire_delay"][arc] == pytest.approx(2.0 * (0.001 + pin_cap))
+    assert np.count_nonzero(net_delays["wire_delay"]) == 1
+
+    endpoints = evaluate_endpoints(timing_graph, propagated, library, 0.14, 0, 0.25, 10.0)
+    paths = extract_worst_paths(timing_graph, propagated, endpoints, top_k=2)
+    for path_index, stages in enumerate(paths.values()):
+        endpoint = np.argsort(endpoints["slack"], kind="stable")[path_index]
+        arrival = sum(delay for cell, delay in stages.items() if not cell.endswith(",end"))
+        assert 10.0 - 0.25 - stages[list(stages)[-1]] - arrival == pytest.approx(
+            endpoints["slack"][endpoint], abs=1e-5)
+    assert paths["path1"]["_r3_,D (net)"] == pytest.approx(net_delays["wire_delay"][arc], abs=1e-6)
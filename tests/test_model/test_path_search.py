@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+from boltsta.model import (
+    propagate_arrival_times,
+    evaluate_endpoints,
+    get_node_loads,
+    compute_slew_bounds,
+    compute_required_bounds,
+    search_critical_paths,
+    format_searched_paths,
+)
+from boltsta.network.exceptions import build_exception_index
+from boltsta.readers.scd_reader import parse_timing_exceptions
+
+
+@pytest.fixture(scope="module")
+def design(pipeline, library, cell_pin_mapping):
+    timing_graph, fanout = pipeline["timing_graph"], pipeline["fanout"]
+    loads = get_node_loads(timing_graph, fanout, library)
+    slews = compute_slew_bounds(timing_graph, loads, cell_pin_mapping, 1.5)
+    return {
+        "timing_graph": timing_graph,
+        "fanout": fanout,
+        "cell_pin_mapping": cell_pin_mapping,
+        "library": library,
+        "loads": loads,
+        "required": compute_required_bounds(
+            timing_graph, slews, loads, cell_pin_mapping, library, 0.04, 0.0, 0.3, 10.0
+        ),
+    }
+
+
+def search(design, slack_threshold, required=None, exception_index=None):
+    return search_critical_paths(
+        design["timing_graph"], design["required"] if required is None else required,
+        design["loads"], design["cell_pin_mapping"], design["library"], slack_threshold,
+        1.5, 0.04, 0.0, 0.3, 10.0, exception_index=exception_index,
+    )
+
+
+@pytest.fixture(scope="module")
+def all_paths(design):
+    # without a threshold every path is listed
+    return search(design, np.inf)["paths"]
+
+
+def slacks(paths):
+    return sorted(path["slack"] for path in paths)
+
+
+def test_worst_searched_path_matches_propagation(design, all_paths):
+    timing_graph, library = design["timing_graph"], design["library"]
+    propagated = propagate_arrival_times(
+        timing_graph, design["fanout"], design["cell_pin_mapping"], library, 1.5
+    )
+    endpoints = evaluate_endpoints(timing_graph, propagated, library, 0.04, 0.0, 0.3, 10.0)
+    assert slacks(all_paths)[0] == pytest.approx(endpoints["slack"].min())
+
+
+@pytest.mark.parametrize("quantile", [0.0, 0.1, 0.5])
+def test_pruning_keeps_every_path_below_the_threshold(design, all_paths, quantile):
+    slack_threshold = np.quantile(slacks(all_paths), quantile) + 1e-9
+    searched = search(design, slack_threshold)
+    expected = [slack for slack in slacks(all_paths) if slack < slack_threshold]
+    assert slacks(searched["paths"]) == pytest.approx(expected)
+    assert searched["pruned"] > 0
+    assert searched["expanded"] < search(design, np.inf)["expanded"]
+
+
+def test_required_bounds_are_lower_bounds(design, all_paths):
+    # the slack of a partial path computed with the bound never exceeds the real one
+    for path in all_paths:
+        for node, arrival in zip(path["nodes"][:-1], path["arrivals"]):
+            assert design["required"][:, node].min() - arrival <= path["slack"] + 1e-9
+
+
+def test_searched_false_path(design):
+    exception_index = build_exception_index(
+        design["timing_graph"], parse_timing_exceptions("set_false_path -from [get_cells _r1_]")
+    )
+    searched = search(design, np.inf, exception_index=exception_index)
+    start = design["timing_graph"]["index"]["_r1_"]
+    assert searched["paths"]
+    assert all(path["nodes"][0] != start for path in searched["paths"])
+
+
+def test_format_searched_paths(design, all_paths):
+    formatted = format_searched_paths(design["timing_graph"], {"paths": all_paths}, top_k=3)
+    assert list(formatted["paths"]) == ["path1", "path2", "path3"]
+    assert formatted["capture_edges"] == {"path1": 10.0, "path2": 10.0, "path3": 10.0}
+    path = min(all_paths, key=lambda path: path["slack"])
+    delays = list(formatted["paths"]["path1"].values())
+    assert sum(delays[:-1]) == pytest.approx(path["arrivals"][-1], abs=1e-5)
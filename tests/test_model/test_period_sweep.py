@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from boltsta.model import (
+    propagate_arrival_times, evaluate_endpoints, setup_slack_terms, sweep_setup_slack,
+    minimum_period,
+)
+from boltsta.network.exceptions import build_exception_index
+from boltsta.readers.scd_reader import parse_timing_exceptions
+
+periods = [0.5, 0.8, 1.0, 10.0]
+uncertainties = [0.0, 0.3]
+
+
+@pytest.fixture(scope="module", params=[None, "set_multicycle_path 2 -setup -to [get_cells _r3_]"])
+def design(request, pipeline, library, cell_pin_mapping):
+    timing_graph = pipeline["timing_graph"]
+    exception_index = None
+    if request.param:
+        exceptions = parse_timing_exceptions(request.param)
+        exception_index = build_exception_index(timing_graph, exceptions)
+    propagated = propagate_arrival_times(
+        timing_graph, pipeline["fanout"], cell_pin_mapping, library, 1.5,
+        exception_index=exception_index,
+    )
+    return {
+        "timing_graph": timing_graph, "propagated": propagated,
+        "terms": setup_slack_terms(timing_graph, propagated, library, 0.04, 0.0),
+    }
+
+
+def test_sweep_matches_endpoint_evaluation(design, library):
+    sweep = sweep_setup_slack(design["terms"], periods, uncertainties)
+    for i, period in enumerate(periods):
+        for j, uncertainty in enumerate(uncertainties):
+            slack = evaluate_endpoints(
+                design["timing_graph"], design["propagated"], library, 0.04, 0.0, uncertainty,
+                period,
+            )["slack"]
+            assert sweep["wns"][i, j] == pytest.approx(slack.min())
+            assert sweep["tns"][i, j] == pytest.approx(np.minimum(slack, 0).sum())
+            assert sweep["violations"][i, j] == (slack < 0).sum()
+            assert sweep["endpoints"] == len(slack)
+
+
+def test_minimum_period_is_exact(design):
+    period = minimum_period(design["terms"], uncertainties)
+    sweep = sweep_setup_slack(design["terms"], period, uncertainties)
+    # the worst slack is 0 at the minimum period of its uncertainty
+    assert np.diag(sweep["wns"]) == pytest.approx([0.0, 0.0], abs=1e-9)
+    assert period[1] == pytest.approx(period[0] + 0.3)
+
+
+def test_max_delay_without_margin_is_unachievable():
+    terms = {"arc": np.array([0, 1]), "multiplier": np.array([1.0, 0.0]),
+             "offset": np.array([-1.0, 0.1])}
+    assert minimum_period(terms, [0.0, 0.2]).tolist() == [1.0, np.inf]
+    with pytest.raises(ValueError):
+        sweep_setup_slack(terms, [0.0], [0.0])
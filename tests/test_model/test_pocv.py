@@ -0,0 +1,126 @@
+import numpy as np
+import pytest
+from boltsta.readers import parse_liberty_file, read_spef, read_sdf
+from boltsta.readers.pocv_reader import parse_pocv_coefficients
+from boltsta.readers.scd_reader import parse_timing_exceptions
+from boltsta.network.exceptions import build_exception_index
+from boltsta import extract_cell_pin_mapping, compile_cell_pin_mapping
+from boltsta.model import (
+    propagate_arrival_times,
+    propagate_pocv_arrivals,
+    calculate_pocv_arc_delays,
+    pocv_slack_statistics,
+    evaluate_endpoints,
+    build_node_derates,
+    compute_net_delays,
+    annotate_sdf_delays,
+)
+
+LIBRARY_PATH = "tests/sky130_fd_sc_hd__mini.lib"
+COEFFICIENTS = parse_pocv_coefficients("object_spec: sky130_fd_sc_hd__*\ncoefficient: 0.05\n")
+
+# late only delay sigma of the inverter rise arc
+SIGMA_TABLE = """ocv_sigma_cell_rise("delay_template3x3") {
+                    sigma_type : "late";
+                    index_1("0.01, 0.1, 1.0");
+                    index_2("0.001, 0.01, 0.1");
+                    values("0.001, 0.002, 0.003", "0.001, 0.002, 0.003", "0.001, 0.002, 0.003");
+                }
+                """
+
+
+@pytest.fixture(scope="module")
+def arguments(pipeline, library, cell_pin_mapping):
+    # the positional arguments shared by both propagations
+    return pipeline["timing_graph"], pipeline["fanout"], cell_pin_mapping, library, 0.15
+
+
+def test_zero_sigma_matches_propagation(arguments):
+    """Without variation the n-sigma arrivals are the deterministic ones."""
+    expected = propagate_arrival_times(*arguments)
+    propagated = propagate_pocv_arrivals(*arguments)
+
+    for name in ("arrival", "slew", "pred_arc", "pred_transition", "launch"):
+        assert np.array_equal(propagated[name], expected[name])
+    assert np.array_equal(propagated["mean"], expected["arrival"])
+    assert not propagated["variance"].any()
+
+
+def test_variances_add_along_the_paths(arguments):
+    expected = propagate_arrival_times(*arguments)
+    propagated = propagate_pocv_arrivals(*arguments, n_sigma=2.0, coefficients=COEFFICIENTS)
+    reached = np.isfinite(expected["arrival"])
+    sigma = np.sqrt(propagated["variance"][reached])
+
+    # with one coefficient the means are the deterministic arrivals
+    assert np.allclose(propagated["mean"][reached], expected["arrival"][reached])
+    assert (sigma > 0).all()
+    late = np.isfinite(propagated["arrival"][0])
+    assert np.allclose(propagated["arrival"][0][late],
+                       propagated["mean"][0][late] + 2.0 * np.sqrt(propagated["variance"][0][late]))
+    # a path sigma is smaller than the sum of its arc sigmas
+    assert (sigma < 0.05 * np.abs(propagated["mean"][reached]) + 1e-12).all()
+
+
+def test_n_sigma_slack_statistics(arguments):
+    timing_graph, _, _, library, _ = arguments
+    propagated = propagate_pocv_arrivals(*arguments, n_sigma=3.0, coefficients=COEFFICIENTS)
+    nominal = propagate_arrival_times(*arguments)
+    endpoints = evaluate_endpoints(timing_graph, propagated, library, 0.14, 0, 0.25, 10.0, 0.1)
+    expected = evaluate_endpoints(timing_graph, nominal, library, 0.14, 0, 0.25, 10.0, 0.1)
+
+    for analysis, prefix in (("late", ""), ("early", "hold_")):
+        statistics = pocv_slack_statistics(timing_graph, propagated, endpoints, analysis)
+        assert (endpoints[f"{prefix}slack"] < expected[f"{prefix}slack"]).all()
+        assert np.allclose(statistics["mean_slack"], expected[f"{prefix}slack"])
+        assert np.allclose(endpoints[f"{prefix}slack"],
+                           statistics["mean_slack"] - 3.0 * statistics["sigma"])
+
+
+def test_zero_sigma_matches_annotated_propagation(arguments):
+    """The tags, derates, wires and SDF delays are those of propagate_arrival_times."""
+    timing_graph, _, _, library, _ = arguments
+    settings = {
+        "exception_index": build_exception_index(timing_graph, parse_timing_exceptions(
+            "set_multicycle_path 2 -setup -from [get_cells _r1_]\n"
+            "set_false_path -hold -through [get_cells _u3_]")),
+        "derates": build_node_derates(timing_graph, (1.05, 0.95)),
+        "net_delays": compute_net_delays(timing_graph, read_spef("tests/pipeline.spef"), library),
+        "sdf_delays": annotate_sdf_delays(timing_graph, read_sdf("tests/pipeline.sdf")),
+    }
+    expected = propagate_arrival_times(*arguments, **settings)
+    propagated = propagate_pocv_arrivals(*arguments, **settings)
+
+    assert expected["tagged"]
+    assert propagated["tagged"].keys() == expected["tagged"].keys()
+    for node, tags in expected["tagged"].items():
+        for tag, entry in tags.items():
+            assert np.allclose(propagated["tagged"][node][tag]["arrival"], entry["arrival"])
+    assert np.allclose(propagated["arrival"], expected["arrival"])
+    endpoints = evaluate_endpoints(timing_graph, propagated, library, 0.14, 0, 0.25, 10.0)
+    statistics = pocv_slack_statistics(timing_graph, propagated, endpoints)
+    assert np.allclose(endpoints["slack"], evaluate_endpoints(
+        timing_graph, expected, library, 0.14, 0, 0.25, 10.0)["slack"])
+    assert not statistics["sigma"][np.isfinite(statistics["sigma"])].any()
+
+
+def test_liberty_sigma_tables(tmp_path):
+    """The variation tables of an arc replace the coefficient of its analysis."""
+    content = open(LIBRARY_PATH).read()
+    cell = content.index('cell("sky130_fd_sc_hd__inv_1")')
+    position = content.index("cell_fall(", cell)
+    path = tmp_path / "lvf.lib"
+    path.write_text(content[:position] + SIGMA_TABLE + content[position:])
+    arc = compile_cell_pin_mapping(extract_cell_pin_mapping(parse_liberty_file(str(path))))[
+        "sky130_fd_sc_hd__inv_1"]["Y_A"]
+
+    assert "ocv_sigma_cell_rise_late" in arc
+    _, delay, sigma = calculate_pocv_arc_delays(arc, "rise", np.array([[0.1], [0.1]]), 0.01,
+                                                (0.05, 0.05))
+    assert sigma[0, 0] == pytest.approx(0.002)
+    assert sigma[1, 0] == pytest.approx(0.05 * delay[1, 0])
+
+
+def test_invalid_n_sigma(arguments):
+    with pytest.raises(ValueError):
+        propagate_pocv_arrivals(*arguments, n_sigma=-1)
@@ -0,0 +1,261 @@
+import numpy as np
+import pytest
+from boltsta import (
+    extract_cell_pin_mapping,
+    calculate_rising_edge_delay,
+    calculate_falling_edge_delay,
+    get_timing_sense,
+)
+from boltsta.model import (
+    build_paths_delay_dict,
+    propagate_arrival_times,
+    evaluate_endpoints,
+    extract_worst_paths,
+    calculate_constraint_time,
+    calculate_arc_delays,
+    get_output_transitions,
+    get_node_load,
+    get_constrained_pin,
+    LATE,
+    EARLY,
+)
+from boltsta.network.reachability import build_reachability_index, select_path_cone
+from boltsta.network.exceptions import build_exception_index
+from boltsta.readers.scd_reader import parse_timing_exceptions
+
+
+@pytest.fixture(scope="module")
+def design(pipeline, library):
+    # the uncompiled arcs, as read by the scalar interpolation of the enumerated paths
+    return {**pipeline, "cell_pin_mapping": extract_cell_pin_mapping(library), "library": library}
+
+
+@pytest.fixture(scope="module")
+def propagated(design, library):
+    return propagate_arrival_times(
+        design["timing_graph"], design["fanout"], design["cell_pin_mapping"], library, 1.5
+    )
+
+
+def worst_edge_arrival(path, path_attribute, design, analysis=max):
+    # brute force over every edge sequence of the path with the scalar interpolation
+    mapping = design["cell_pin_mapping"]
+    launch = mapping[path[0].split(",")[1]]["Q_CLK"]
+    load = get_node_load(design["fanout"][path[0]], design["library"])
+    arrivals = []
+    for trans, edge_delay in (
+        ("rise", calculate_rising_edge_delay), ("fall", calculate_falling_edge_delay)
+    ):
+        slew, delay = edge_delay(launch, 1.5, load)
+        arrivals.append((trans, slew.item(), delay.item()))
+    for stage, pin in zip(path[1:-1], path_attribute):
+        cell_name = stage.split(",")[1]
+        load = get_node_load(design["fanout"][stage], design["library"])
+        sense = get_timing_sense(mapping, cell_name, pin)
+        next_arrivals = []
+        for trans, slew, time in arrivals:
+            for out in get_output_transitions(trans, sense):
+                edge_delay = calculate_rising_edge_delay if out == "rise" \
+                    else calculate_falling_edge_delay
+                out_slew, delay = edge_delay(mapping[cell_name][pin], slew, load)
+                next_arrivals.append((out, out_slew.item(), time + delay.item()))
+        arrivals = next_arrivals
+    return analysis(time for _, _, time in arrivals)
+
+
+def test_propagation_matches_worst_enumerated_path(design, propagated):
+    # paths captured by _r3_ end with _u5_
+    paths = [
+        (path, attribute)
+        for path, attribute in zip(design["paths"], design["paths_attributes"])
+        if path[-1].startswith("_r3_")
+    ]
+    source = design["timing_graph"]["index"]["_u5_"]
+    worst_late = max(worst_edge_arrival(path, attribute, design) for path, attribute in paths)
+    worst_early = min(
+        worst_edge_arrival(path, attribute, design, min) for path, attribute in paths
+    )
+    assert propagated["arrival"][LATE, :, source].max() == pytest.approx(worst_late, abs=1e-9)
+    assert propagated["arrival"][EARLY, :, source].min() == pytest.approx(worst_early, abs=1e-9)
+
+
+def test_propagation_not_earlier_than_rise_launch(design, propagated, library):
+    paths_delay = build_paths_delay_dict(
+        paths=design["paths"],
+        paths_attributes=design["paths_attributes"],
+        fanout=design["fanout"],
+        cell_pin_mapping=design["cell_pin_mapping"],
+        library=library,
+        related_pin_time=0.04,
+        input_transition_time=1.5,
+    )
+    # paths captured by _r3_ are the ones with an end entry
+    worst_rise_arrival = max(
+        sum(list(delays.values())[:-1])
+        for delays in paths_delay.values()
+        if "_r3_,sky130_fd_sc_hd__dfrtp_1,end" in delays
+    )
+    source = design["timing_graph"]["index"]["_u5_"]
+    assert propagated["arrival"][LATE, :, source].max() >= worst_rise_arrival - 1e-9
+
+
+def test_both_transitions_follow_timing_sense(design, propagated):
+    index = design["timing_graph"]["index"]
+    # every reached node carries both transitions
+    for name in ("_u1_", "_u2_", "_u3_", "_u4_", "_u5_"):
+        assert np.all(np.isfinite(propagated["arrival"][:, :, index[name]]))
+    # the inverter output rises from a falling input and falls from a rising one
+    inverter = index["_u2_"]
+    assert list(propagated["pred_transition"][LATE, :, inverter]) == [1, 0]
+
+
+def test_arc_delays_match_scalar_interpolation(design):
+    timing_data = design["cell_pin_mapping"]["sky130_fd_sc_hd__xor2_1"]["X_A"]
+    delays = calculate_arc_delays(timing_data, [("rise", 0.12), ("fall", 0.4)], 0.02, "non_unate")
+    assert len(delays) == 4
+    for (_, slew, out), (transition_time, delay) in delays.items():
+        edge_delay = calculate_rising_edge_delay if out == "rise" else calculate_falling_edge_delay
+        expected_slew, expected_delay = edge_delay(timing_data, slew, 0.02)
+        assert transition_time == pytest.approx(expected_slew.item())
+        assert delay == pytest.approx(expected_delay.item())
+
+
+def test_extract_worst_paths(design, propagated, library):
+    endpoints = evaluate_endpoints(
+        design["timing_graph"], propagated, library, 0.04, 0.0, 0.3, 10.0
+    )
+    assert len(endpoints["arc"]) == 2
+    paths_delay = extract_worst_paths(design["timing_graph"], propagated, endpoints, top_k=1)
+    assert list(paths_delay) == ["path1"]
+    delays = paths_delay["path1"]
+    keys = list(delays)
+    assert keys[0] == "_r1_,sky130_fd_sc_hd__dfrtp_1"
+    assert keys[-1] == "_r3_,sky130_fd_sc_hd__dfrtp_1,end"
+    arrival = sum(list(delays.values())[:-1])
+    slack = 10.0 - 0.3 - delays[keys[-1]] - arrival
+    assert slack == pytest.approx(endpoints["slack"].min(), abs=1e-5)
+
+
+def test_early_arrivals_not_later_than_late(design, propagated):
+    arrival = propagated["arrival"]
+    reached = np.isfinite(arrival[LATE])
+    assert reached.any()
+    assert np.array_equal(reached, np.isfinite(arrival[EARLY]))
+    assert np.all(arrival[EARLY][reached] <= arrival[LATE][reached])
+    # _u3_ is reached through two fanin arcs of different depths
+    source = design["timing_graph"]["index"]["_u3_"]
+    assert arrival[EARLY, :, source].min() < arrival[LATE, :, source].max()
+
+
+def test_hold_paths(design, propagated, library):
+    endpoints = evaluate_endpoints(
+        design["timing_graph"], propagated, library, 0.04, 0.0, 0.3, 10.0, 0.1
+    )
+    paths_delay = extract_worst_paths(
+        design["timing_graph"], propagated, endpoints, top_k=2, analysis="early"
+    )
+    assert len(paths_delay) == 2
+    delays = paths_delay["path1"]
+    arrival = sum(list(delays.values())[:-1])
+    hold_slack = arrival - 0.1 - list(delays.values())[-1]
+    assert hold_slack == pytest.approx(endpoints["hold_slack"].min(), abs=1e-5)
+    assert np.all(endpoints["hold_arrival"] <= endpoints["arrival"])
+
+
+def test_setup_hold_checking(library):
+    setup = calculate_constraint_time(
+        "sky130_fd_sc_hd__dfrtp_1", "setup_checking", "D", library, 0.5, 0.04
+    )
+    hold = calculate_constraint_time(
+        "sky130_fd_sc_hd__dfrtp_1", "hold_checking", "D", library, 0.2, 0.04
+    )
+    both = calculate_constraint_time(
+        "sky130_fd_sc_hd__dfrtp_1", "setup_hold_checking", "D", library, (0.5, 0.2), 0.04
+    )
+    assert both == pytest.approx([setup, hold])
+
+
+def test_constrained_pin_of_check_arcs(design, library):
+    timing_graph = design["timing_graph"]
+    pins = {}
+    for arc, sink in enumerate(timing_graph["arc_to"]):
+        if timing_graph["sequential"][sink]:
+            pins.setdefault(timing_graph["arc_pin"][arc], set()).add(arc)
+    for arc in pins["Q_D"]:
+        assert get_constrained_pin(timing_graph, arc, library) == "D"
+    with pytest.raises(ValueError):
+        get_constrained_pin(timing_graph, min(pins["Q_CLK"]), library)
+
+
+def test_propagation_restricted_to_path_cone(design, library):
+    timing_graph = design["timing_graph"]
+    cone = select_path_cone(
+        timing_graph, build_reachability_index(timing_graph),
+        from_nodes=["_r2_"], through_nodes=["_u3_"], to_nodes=["_r3_"],
+    )
+    propagated = propagate_arrival_times(
+        timing_graph, design["fanout"], design["cell_pin_mapping"], library, 1.5, cone
+    )
+    endpoints = evaluate_endpoints(
+        timing_graph, propagated, library, 0.04, 0.0, 0.3, 10.0, cone=cone
+    )
+    assert len(endpoints["arc"]) == 1
+    delays = extract_worst_paths(timing_graph, propagated, endpoints)["path1"]
+    assert [key.split(",")[0] for key in delays] == [
+        "_r2_", "_u1_", "_u2_", "_u3_", "_u4_", "_u5_", "_r3_"
+    ]
+    path, attribute = next(
+        (path, attribute)
+        for path, attribute in zip(design["paths"], design["paths_attributes"])
+        if [stage.split(",")[0] for stage in path] == [key.split(",")[0] for key in delays]
+    )
+    assert sum(list(delays.values())[:-1]) == pytest.approx(
+        worst_edge_arrival(path, attribute, design), abs=1e-5
+    )
+
+
+def propagate_with_exceptions(design, sdc):
+    timing_graph, library = design["timing_graph"], design["library"]
+    exception_index = build_exception_index(timing_graph, parse_timing_exceptions(sdc))
+    propagated = propagate_arrival_times(
+        timing_graph, design["fanout"], design["cell_pin_mapping"], library, 1.5,
+        exception_index=exception_index,
+    )
+    return propagated, evaluate_endpoints(timing_graph, propagated, library, 0.04, 0.0, 0.3, 10.0)
+
+
+def test_false_path_is_not_reported(design, propagated, library):
+    timing_graph = design["timing_graph"]
+    baseline = evaluate_endpoints(timing_graph, propagated, library, 0.04, 0.0, 0.3, 10.0)
+    exception_propagated, endpoints = propagate_with_exceptions(
+        design, "set_false_path -from [get_cells _r1_]"
+    )
+    assert np.all(endpoints["slack"] >= baseline["slack"] - 1e-9)
+    for delays in extract_worst_paths(timing_graph, exception_propagated, endpoints).values():
+        assert next(iter(delays)).split(",")[0] == "_r2_"
+
+
+def test_multicycle_path_moves_the_capture_edge(design, propagated, library):
+    timing_graph = design["timing_graph"]
+    baseline = evaluate_endpoints(timing_graph, propagated, library, 0.04, 0.0, 0.3, 10.0)
+    _, endpoints = propagate_with_exceptions(
+        design, "set_multicycle_path 2 -setup -to [get_cells _r3_]"
+    )
+    captured = timing_graph["arc_to"][endpoints["arc"]] == timing_graph["index"]["_r3_"]
+    assert captured.any()
+    assert np.all(endpoints["capture_edge"][captured] == 20.0)
+    assert endpoints["slack"][captured] == pytest.approx(baseline["slack"][captured] + 10.0)
+    assert endpoints["slack"][~captured] == pytest.approx(baseline["slack"][~captured])
+    # the default hold multiplier keeps the hold check on the launch edge
+    assert np.all(endpoints["hold_capture_edge"][captured] == 10.0)
+
+
+def test_propagation_negative_transition(design, library):
+    with pytest.raises(ValueError):
+        propagate_arrival_times(
+            design["timing_graph"], design["fanout"], design["cell_pin_mapping"], library, -1.5
+        )
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+from boltsta.readers import parse_sdf, read_sdf
+from boltsta.model import (
+    propagate_arrival_times,
+    evaluate_endpoints,
+    annotate_sdf_delays,
+    new_delay_cache,
+    LATE,
+    EARLY,
+)
+
+
+@pytest.fixture(scope="module")
+def annotation(pipeline):
+    return annotate_sdf_delays(pipeline["timing_graph"], read_sdf("tests/pipeline.sdf"))
+
+
+def find_arc(timing_graph, source, sink):
+    index = timing_graph["index"]
+    arcs = (timing_graph["arc_from"] == index[source]) & (timing_graph["arc_to"] == index[sink])
+    return np.flatnonzero(arcs)[0]
+
+
+def test_annotate_sdf_delays(pipeline, annotation):
+    timing_graph = pipeline["timing_graph"]
+    index = timing_graph["index"]
+    arc = find_arc(timing_graph, "_r2_", "_u1_")
+    assert np.allclose(annotation["cell_delay"][:, :, arc], [[0.065, 0.055], [0.045, 0.035]])
+    assert np.allclose(annotation["wire_delay"][:, :, arc], [[0.003, 0.003], [0.001, 0.001]])
+    clk2q = annotation["launch_delay"][:, :, index["_r1_"]]
+    assert np.allclose(clk2q, [[0.36, 0.37], [0.30, 0.31]])
+    # the rising and falling data checks of _r3_ differ
+    arc = find_arc(timing_graph, "_u5_", "_r3_")
+    assert np.allclose(annotation["checks"][:, :, arc], [[0.07, 0.10], [-0.03, -0.04]])
+    # _u6_ is not annotated, its Liberty lookup needs the slew of _r3_
+    assert np.isnan(annotation["cell_delay"][:, :, find_arc(timing_graph, "_r3_", "_u6_")]).all()
+    assert annotation["needs_slew"][index["_r3_"]]
+    assert not annotation["needs_slew"][index["_u4_"]]
+
+
+def test_unannotated_arcs_use_liberty(pipeline, library, cell_pin_mapping):
+    timing_graph, fanout = pipeline["timing_graph"], pipeline["fanout"]
+    expected = propagate_arrival_times(timing_graph, fanout, cell_pin_mapping, library, 0.15)
+    annotation = annotate_sdf_delays(timing_graph, parse_sdf(["(DELAYFILE (DIVIDER /))"]))
+    propagated = propagate_arrival_times(timing_graph, fanout, cell_pin_mapping, library, 0.15,
+                                         sdf_delays=annotation)
+    assert annotation["annotated"] == 0
+    assert np.array_equal(propagated["arrival"], expected["arrival"])
+    assert np.array_equal(propagated["slew"], expected["slew"])
+
+
+def test_annotated_arcs_skip_lookups(pipeline, annotation, library, cell_pin_mapping):
+    timing_graph, fanout = pipeline["timing_graph"], pipeline["fanout"]
+    delay_cache = new_delay_cache()
+    propagated = propagate_arrival_times(timing_graph, fanout, cell_pin_mapping, library, 0.15,
+                                         delay_cache=delay_cache, sdf_delays=annotation)
+    # only the clk-to-q arc of _r3_ and the _u6_ arc are interpolated
+    assert {key[0] for key in delay_cache["entries"]} == {
+        "sky130_fd_sc_hd__dfrtp_1", "sky130_fd_sc_hd__buf_1"
+    }
+    index = timing_graph["index"]
+    assert propagated["arrival"][LATE, 0, index["_r1_"]] == pytest.approx(0.36)
+    assert propagated["arrival"][EARLY, 1, index["_r1_"]] == pytest.approx(0.31)
+    # the latest fall of the nand2 comes from B: 0.36 + 0.003 + 0.055
+    assert propagated["arrival"][LATE, 1, index["_u1_"]] == pytest.approx(0.418)
+    assert np.isfinite(propagated["arrival"][:, :, index["_u6_"]]).all()
+
+    endpoints = evaluate_endpoints(timing_graph, propagated, library, 0.14, 0, 0.25, 10.0)
+    arc = find_arc(timing_graph, "_u5_", "_r3_")
+    position = list(endpoints["arc"]).index(arc)
+    setup = annotation["checks"][0, endpoints["transition"][position], arc]
+    assert endpoints["setup"][position] == setup
@@ -0,0 +1,61 @@
+import importlib
+import pytest
+from boltsta import extract_cell_pin_mapping
+from boltsta.model import build_paths_delay_dict
+
+model_module = importlib.import_module("boltsta.model.model")
+
+
+@pytest.fixture(scope="module")
+def design(pipeline, library):
+    return {
+        "paths": pipeline["paths"],
+        "paths_attributes": pipeline["paths_attributes"],
+        "fanout": pipeline["fanout"],
+        "cell_pin_mapping": extract_cell_pin_mapping(library),
+        "library": library,
+    }
+
+
+def time_paths(design, paths, paths_attributes):
+    return build_paths_delay_dict(
+        paths=paths,
+        paths_attributes=paths_attributes,
+        fanout=design["fanout"],
+        cell_pin_mapping=design["cell_pin_mapping"],
+        library=design["library"],
+        related_pin_time=0.04,
+        input_transition_time=1.5,
+    )
+
+
+def test_shared_prefix_delays_identical(design):
+    paths_delay = time_paths(design, design["paths"], design["paths_attributes"])
+    for index, (path, path_attr) in enumerate(zip(design["paths"], design["paths_attributes"])):
+        single = time_paths(design, [path], [path_attr])
+        assert paths_delay[f"path{index + 1}"] == single["path1"]
+
+
+def test_shared_prefix_stages_evaluated_once(design, monkeypatch):
+    calls = []
+    original = model_module.calculate_combinational_delay
+
+    def counting_delay(**kwargs):
+        calls.append((kwargs["cell_name"], kwargs["input_pin_name"]))
+        return original(**kwargs)
+
+    monkeypatch.setattr(model_module, "calculate_combinational_delay", counting_delay)
+    time_paths(design, design["paths"], design["paths_attributes"])
+
+    # every distinct path prefix is evaluated at most once
+    total_stages = sum(len(path) - 2 for path in design["paths"])
+    prefixes = {
+        tuple(path[:index + 1])
+        for path in design["paths"]
+        for index in range(1, len(path) - 1)
+    }
+    assert len(calls) <= len(prefixes) < total_stages
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,40 @@
+import pytest
+from boltsta.readers.scd_reader import parse_clocks
+from boltsta.utils import extract_clock_pins
+from boltsta.network.graph_creator import graph_creation_func
+from boltsta.network.clock_domains import assign_clock_domains, group_clock_domains
+
+
+@pytest.fixture(scope="module")
+def clock_pins(library):
+    return extract_clock_pins(library)
+
+
+@pytest.fixture(scope="module")
+def clocks():
+    with open("tests/two_clock_pipeline.sdc") as sdc:
+        return parse_clocks(sdc.read())
+
+
+def test_extract_clock_pins(clock_pins):
+    assert clock_pins["sky130_fd_sc_hd__dfrtp_1"] == {"CLK"}
+
+
+def test_assign_clock_domains(clock_pins, clocks):
+    G = graph_creation_func("tests/two_clock_pipeline.v")
+    domains = assign_clock_domains(G, clock_pins, clocks)
+
+    # the clk_b flip-flops are clocked through the _c1_ clock buffer
+    assert domains == {"_r1_": "clk_a", "_r2_": "clk_a", "_r4_": "clk_a",
+                       "_r3_": "clk_b", "_r5_": "clk_b"}
+    groups = group_clock_domains(domains, clocks)
+    assert {clock: sorted(nodes) for clock, nodes in groups.items()} == {
+        "clk_a": ["_r1_", "_r2_", "_r4_"], "clk_b": ["_r3_", "_r5_"]
+    }
+
+
+def test_unclocked_flip_flops(clock_pins, clocks):
+    G = graph_creation_func("tests/two_clock_pipeline.v")
+    domains = assign_clock_domains(G, clock_pins, clocks[:1])
+    assert domains["_r3_"] is None
+    assert "clk_b" not in group_clock_domains(domains, clocks)
@@ -0,0 +1,67 @@
+import networkx as nx
+import pytest
+from boltsta.network.graph_creator import graph_creation_func
+from boltsta.network.path_detector import all_paths_info, create_adjacency_dict
+from boltsta.network.fanout import get_fanout_dict
+from boltsta.network.cone_extractor import (
+    extract_path_cone, fanout_cone_nodes, get_cone_fanout_dict
+)
+
+
+@pytest.fixture(scope="module")
+def design_graph():
+    return graph_creation_func("tests/pipeline.v")
+
+
+@pytest.fixture(scope="module")
+def reg_reg_paths(design_graph):
+    return all_paths_info(design_graph)[0]
+
+
+def path_names(paths):
+    return sorted([stage.split(",")[0] for stage in path] for path in paths)
+
+
+def test_cone_is_a_view(design_graph):
+    cone = extract_path_cone(design_graph, endpoints=["_r4_"])
+    assert nx.is_frozen(cone)
+    assert set(cone) == {"_r1_", "_r2_", "_u1_", "_u2_", "_u3_", "_r4_", "CLK", "RST_N"}
+    # the cone shares the node attributes of the design graph
+    assert cone.nodes["_u3_"] is design_graph.nodes["_u3_"]
+
+
+def test_fanout_cone_stops_at_flip_flops(design_graph):
+    assert fanout_cone_nodes(design_graph, ["_r3_"]) == {"_r3_", "_u6_", "OUT1"}
+
+
+@pytest.mark.parametrize("startpoints, endpoints", [
+    (None, ["_r4_"]),
+    (["_r2_"], None),
+    (["_r2_"], ["_r3_"]),
+    (["_r1_", "_r2_"], ["_r3_", "_r4_"]),
+])
+def test_cone_paths_match_full_enumeration(design_graph, reg_reg_paths, startpoints, endpoints):
+    cone = extract_path_cone(design_graph, startpoints, endpoints)
+    expected = [
+        path for path in path_names(reg_reg_paths)
+        if (startpoints is None or path[0] in startpoints)
+        and (endpoints is None or path[-1] in endpoints)
+    ]
+    assert expected
+    assert path_names(all_paths_info(cone)[0]) == expected
+
+
+def test_cone_fanout_dict_sees_the_whole_design(design_graph):
+    cone = extract_path_cone(design_graph, ["_r2_"], ["_r3_"])
+    full = get_fanout_dict(design_graph, create_adjacency_dict(design_graph, "cell"))
+    fanout_dict = get_cone_fanout_dict(design_graph, cone)
+    assert set(fanout_dict) == {f"{node},{cell}" for node, cell in cone.nodes(data="cell")}
+    for key, fanout in fanout_dict.items():
+        assert fanout == full[key]
+
+
+def test_cone_errors(design_graph):
+    with pytest.raises(ValueError):
+        extract_path_cone(design_graph)
+    with pytest.raises(ValueError):
+        extract_path_cone(design_graph, endpoints=["_missing_"])
@@ -0,0 +1,76 @@
+import pytest
+from boltsta.utils import extract_cell_functions, extract_scan_pins
+from boltsta.network.graph_creator import graph_creation_func
+from boltsta.network.levelizer import build_timing_graph
+from boltsta.network.scan_pruning import prune_scan_arcs
+from boltsta.network.constant_propagation import (
+    parse_function, evaluate_function, propagate_constants
+)
+
+
+@pytest.fixture(scope="module")
+def cell_functions(library):
+    return extract_cell_functions(library)
+
+
+@pytest.fixture(scope="module")
+def design_graph():
+    return graph_creation_func("tests/const_pipeline.v")
+
+
+def test_extract_cell_functions(cell_functions):
+    assert cell_functions["sky130_fd_sc_hd__conb_1"] == {"HI": "1", "LO": "0"}
+    assert cell_functions["sky130_fd_sc_hd__nand2_1"] == {"Y": "(!A) | (!B)"}
+    assert "sky130_fd_sc_hd__dfrtp_1" not in cell_functions
+
+
+@pytest.mark.parametrize("expression, values, expected", [
+    ("(!A) | (!B)", {"A": 0}, 1),
+    ("(!A) | (!B)", {"A": 1}, None),
+    ("(!A) | (!B)", {"A": 1, "B": 1}, 0),
+    ("(A&!B) | (!A&B)", {"A": 0}, None),
+    ("(A&!B) | (!A&B)", {"A": 1, "B": 0}, 1),
+    ("A B + C'", {"A": 0, "C": 1}, 0),
+    ("A^B^C", {"A": 1, "B": 1, "C": 0}, 0),
+    ("1", {}, 1),
+])
+def test_evaluate_function(expression, values, expected):
+    assert evaluate_function(parse_function(expression), values) == expected
+
+
+def test_parse_function_rejects_unbalanced_parentheses():
+    with pytest.raises(ValueError):
+        parse_function("(A&B")
+
+
+def test_tie_cells_disable_arcs(design_graph, cell_functions):
+    constants = propagate_constants(design_graph, cell_functions)
+
+    # the and2 with a tie low input drives a constant, the nand2 with a tie high follows _r2_
+    assert constants["nodes"] == {"_t1_": 0, "_t2_": 1, "_u1_": 0}
+    assert constants["arcs"] == {
+        ("_t1_", "_u1_"): 0, ("_t2_", "_u2_"): 1, ("_u1_", "_u3_"): 0, ("_u1_", "_r4_"): 0
+    }
+    assert ("_r1_", "_u1_") in constants["disabled"]
+    assert ("_r2_", "_u2_") not in constants["disabled"]
+
+
+def test_case_analysis_constants(design_graph, cell_functions):
+    constants = propagate_constants(design_graph, cell_functions, {"_u2_/A": 0})
+
+    # a 0 on the nand2 input forces its output high
+    assert constants["nodes"]["_u2_"] == 1
+    assert constants["arcs"][("_r2_", "_u2_")] == 0
+    assert ("_u2_", "_u3_") in constants["disabled"]
+
+
+def test_timing_graph_skips_constant_logic(design_graph, cell_functions, library):
+    constants = propagate_constants(design_graph, cell_functions)
+    G = prune_scan_arcs(design_graph, extract_scan_pins(library), constants=constants)
+    timing_graph = build_timing_graph(G)
+
+    index = timing_graph["index"]
+    arcs = set(zip(timing_graph["arc_from"].tolist(), timing_graph["arc_to"].tolist()))
+    assert (index["_r2_"], index["_u2_"]) in arcs
+    assert (index["_u1_"], index["_u3_"]) not in arcs
+    assert (index["_r1_"], index["_u1_"]) not in arcs
@@ -0,0 +1,42 @@
+import pytest
+from boltsta.network.exceptions import build_exception_index, match_path_exceptions
+from boltsta.readers.scd_reader import parse_timing_exceptions
+
+
+@pytest.fixture(scope="module")
+def timing_graph(pipeline):
+    return pipeline["timing_graph"]
+
+
+def match(timing_graph, sdc, path):
+    index = build_exception_index(timing_graph, parse_timing_exceptions(sdc))
+    matched = match_path_exceptions(index, [timing_graph["index"][name] for name in path])
+    return {check: exception and exception["type"] for check, exception in matched.items()}
+
+
+@pytest.mark.parametrize("sdc, path, expected", [
+    # -from, -to and wildcards
+    ("set_false_path -from [get_cells _r1_]", ["_r1_", "_u3_", "_r4_"],
+     {"setup": "false_path", "hold": "false_path"}),
+    ("set_false_path -from [get_cells _r1_]", ["_r2_", "_u1_", "_u2_", "_u3_", "_r4_"],
+     {"setup": None, "hold": None}),
+    ("set_multicycle_path 2 -setup -to [get_cells _r*]", ["_r2_", "_u1_", "_u4_", "_u5_", "_r3_"],
+     {"setup": "multicycle_path", "hold": None}),
+    # -through lists must be passed in order
+    ("set_max_delay 3 -through [get_cells _u2_] -through [get_cells _u3_]",
+     ["_r2_", "_u1_", "_u2_", "_u3_", "_r4_"], {"setup": "max_delay", "hold": None}),
+    ("set_max_delay 3 -through [get_cells _u2_] -through [get_cells _u3_]",
+     ["_r1_", "_u3_", "_r4_"], {"setup": None, "hold": None}),
+    # a false path wins over a multicycle path
+    ("set_multicycle_path 2 -to [get_cells _r4_]\nset_false_path -setup -through [get_cells _u3_]",
+     ["_r1_", "_u3_", "_r4_"], {"setup": "false_path", "hold": None}),
+])
+def test_match_path_exceptions(timing_graph, sdc, path, expected):
+    assert match(timing_graph, sdc, path) == expected
+
+
+def test_exception_matching_no_path_is_ignored(timing_graph):
+    index = build_exception_index(
+        timing_graph, parse_timing_exceptions("set_false_path -to [get_cells _missing_]")
+    )
+    assert index["exceptions"] == []
@@ -0,0 +1,57 @@
+import pytest
+from boltsta.readers.scd_reader import parse_ideal_networks
+from boltsta.utils import extract_ideal_pins
+from boltsta.network.graph_creator import graph_creation_func
+from boltsta.network.path_detector import all_paths_info
+from boltsta.network.cone_extractor import get_cone_fanout_dict
+from boltsta.network.ideal_networks import find_ideal_networks, hide_ideal_networks
+
+
+@pytest.fixture(scope="module")
+def ideal_pins(library):
+    return extract_ideal_pins(library)
+
+
+@pytest.fixture(scope="module")
+def design_graph():
+    return graph_creation_func("tests/ideal_pipeline.v")
+
+
+def path_names(paths):
+    return sorted([stage.split(",")[0] for stage in path] for path in paths)
+
+
+def test_extract_ideal_pins(ideal_pins):
+    assert ideal_pins["sky130_fd_sc_hd__dfrtp_1"] == {"CLK", "RESET_B"}
+    assert "sky130_fd_sc_hd__clkbuf_1" not in ideal_pins
+
+
+def test_parse_ideal_networks():
+    sdc = "set_ideal_network -no_propagate [get_ports {RST_N}]\nset_ideal_network [get_pins _b1_/X]"
+    assert parse_ideal_networks(sdc) == ["RST_N", "_b1_"]
+
+
+def test_clock_and_reset_trees_are_ideal(design_graph, ideal_pins):
+    # the clock and reset buffers only drive clock and reset pins
+    assert find_ideal_networks(design_graph, ideal_pins) == {
+        "CLK": 1, "_c1_": 3, "RST_N": 1, "_b1_": 3
+    }
+
+
+def test_ideal_networks_are_not_searched(design_graph, ideal_pins):
+    ideal_fanout = find_ideal_networks(design_graph, ideal_pins)
+    view = hide_ideal_networks(design_graph, ideal_fanout, ideal_pins)
+    reg_reg, _, in_reg, _, _, _, _ = all_paths_info(view)
+    assert path_names(reg_reg) == path_names(all_paths_info(design_graph)[0])
+    assert path_names(in_reg) == [["IN0", "_r1_"], ["IN1", "_r2_"]]
+    # the ideal networks keep their fanout count only
+    fanout_dict = get_cone_fanout_dict(design_graph, view, ideal_fanout)
+    assert fanout_dict["_c1_,sky130_fd_sc_hd__clkbuf_1"] == []
+    assert fanout_dict["_r1_,sky130_fd_sc_hd__dfrtp_1"] == ["_u1_,sky130_fd_sc_hd__nand2_1,Y_A"]
+
+
+def test_set_ideal_network_source(design_graph, ideal_pins):
+    ideal_fanout = find_ideal_networks(design_graph, ideal_pins, ["IN0", "_missing_"])
+    assert ideal_fanout["IN0"] == 1
+    view = hide_ideal_networks(design_graph, ideal_fanout, ideal_pins)
+    assert path_names(all_paths_info(view)[2]) == [["IN1", "_r2_"]]
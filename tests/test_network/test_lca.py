@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from boltsta.network.lca import build_lca_index, query_lca
+
+
+def naive_lca(parents, u, v):
+    ancestors = set()
+    while u >= 0:
+        ancestors.add(u)
+        u = parents[u]
+    while v >= 0 and v not in ancestors:
+        v = parents[v]
+    return v
+
+
+def test_small_forest():
+    #     0       5
+    #    / \      |
+    #   1   2     6
+    #  / \
+    # 3   4
+    parents = [-1, 0, 0, 1, 1, -1, 5]
+    index = build_lca_index(parents)
+    assert query_lca(index, 3, 4) == 1
+    assert query_lca(index, 3, 2) == 0
+    assert query_lca(index, 1, 4) == 1
+    assert query_lca(index, 4, 4) == 4
+    assert query_lca(index, 3, 6) == -1
+
+
+def test_random_trees_match_naive_walk():
+    rng = np.random.default_rng(7)
+    for size in (1, 2, 17, 200):
+        parents = [-1] + [int(rng.integers(0, node)) for node in range(1, size)]
+        index = build_lca_index(parents)
+        for u, v in rng.integers(0, size, (50, 2)):
+            assert query_lca(index, u, v) == naive_lca(parents, u, v)
+
+
+def test_cycle_is_rejected():
+    with pytest.raises(ValueError):
+        build_lca_index([1, 0])
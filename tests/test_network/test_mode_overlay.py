@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from boltsta.utils import extract_scan_pins
+from boltsta.network.graph_creator import graph_creation_func
+from boltsta.network.levelizer import build_timing_graph, load_sequential_names
+from boltsta.network.scan_pruning import prune_scan_arcs
+from boltsta.network.mode_overlay import build_mode_overlay, intersect_cones
+
+
+@pytest.fixture(scope="module")
+def design_graph():
+    return graph_creation_func("tests/scan_pipeline.v")
+
+
+@pytest.fixture(scope="module")
+def scan_pins(library):
+    return extract_scan_pins(library)
+
+
+def overlay_arcs(timing_graph, overlay):
+    names = timing_graph["names"]
+    return sorted((names[timing_graph["arc_from"][arc]], names[timing_graph["arc_to"][arc]])
+                  for arc in np.flatnonzero(overlay["arcs"]))
+
+
+@pytest.mark.parametrize("case_analysis", [{"SE": 0}, {"SE": 1}])
+def test_overlay_keeps_the_arcs_of_the_mode(design_graph, scan_pins, case_analysis):
+    timing_graph = build_timing_graph(design_graph, load_sequential_names())
+    G_mode = prune_scan_arcs(design_graph, scan_pins, case_analysis)
+    overlay = build_mode_overlay(timing_graph, G_mode)
+    expected = build_timing_graph(G_mode, load_sequential_names())
+
+    assert overlay_arcs(timing_graph, overlay) == sorted(
+        (expected["names"][u], expected["names"][v])
+        for u, v in zip(expected["arc_from"], expected["arc_to"])
+    )
+    assert overlay["nodes"].all() and overlay["endpoints"].all()
+
+
+def test_unconstrained_overlay_keeps_every_arc(design_graph):
+    timing_graph = build_timing_graph(design_graph, load_sequential_names())
+    assert build_mode_overlay(timing_graph, design_graph)["arcs"].all()
+
+
+def test_intersect_cones():
+    masks = ("nodes", "arcs", "startpoints", "endpoints")
+    cone = {name: np.array([True, True, False]) for name in masks}
+    other = {name: np.array([True, False, True]) for name in masks}
+
+    assert intersect_cones(None, None) is None
+    assert intersect_cones(cone, None) is cone
+    assert intersect_cones(None, other) is other
+    assert intersect_cones(cone, other)["arcs"].tolist() == [True, False, False]
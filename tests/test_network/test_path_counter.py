@@ -0,0 +1,66 @@
+import math
+import pytest
+from boltsta.network.path_detector import all_paths_info
+from boltsta.network.levelizer import build_timing_graph, load_sequential_names
+from boltsta.network.path_counter import (
+    count_paths, estimate_enumeration_cost, select_timing_algorithm
+)
+
+
+@pytest.fixture(scope="module")
+def design_graph(pipeline):
+    return pipeline["G"]
+
+
+@pytest.fixture(scope="module")
+def timing_graph(pipeline):
+    return pipeline["timing_graph"]
+
+
+def test_build_timing_graph_topological_order(design_graph, timing_graph):
+    index = timing_graph["index"]
+    for u, v in design_graph.edges():
+        if not timing_graph["sequential"][index[v]]:
+            assert index[u] < index[v]
+            assert timing_graph["level"][index[u]] < timing_graph["level"][index[v]]
+    sequential = [
+        name for name, seq in zip(timing_graph["names"], timing_graph["sequential"]) if seq
+    ]
+    assert sorted(sequential) == ["_r1_", "_r2_", "_r3_", "_r4_"]
+
+
+def test_count_paths_matches_enumeration(design_graph, timing_graph):
+    reg_reg = all_paths_info(design_graph)[0]
+    path_counts = count_paths(timing_graph)
+    assert path_counts["total_paths"] == len(reg_reg)
+    assert path_counts["total_stages"] == sum(len(path) for path in reg_reg)
+    assert path_counts["endpoint_counts"] == {
+        "_r3_,sky130_fd_sc_hd__dfrtp_1": 5,
+        "_r4_,sky130_fd_sc_hd__dfrtp_1": 3,
+    }
+    assert path_counts["log10_paths"] == pytest.approx(math.log10(8))
+
+
+def test_select_timing_algorithm(timing_graph):
+    path_counts = count_paths(timing_graph)
+    cost = estimate_enumeration_cost(path_counts)
+    assert cost["average_depth"] == pytest.approx(path_counts["total_stages"] / 8)
+    assert select_timing_algorithm(path_counts, cost) == "exhaustive"
+    assert select_timing_algorithm(path_counts, cost, max_paths=4) == "propagation"
+    assert select_timing_algorithm(path_counts, cost, max_memory=1) == "propagation"
+    assert select_timing_algorithm(path_counts, cost, unsupported=["hold"]) == "propagation"
+
+
+def test_build_timing_graph_combinational_loop():
+    import networkx as nx
+    G = nx.DiGraph()
+    G.add_node("a", cell="sky130_fd_sc_hd__inv_1")
+    G.add_node("b", cell="sky130_fd_sc_hd__inv_1")
+    G.add_edge("a", "b", input_pin="Y_A")
+    G.add_edge("b", "a", input_pin="Y_A")
+    with pytest.raises(ValueError):
+        build_timing_graph(G, load_sequential_names())
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+from boltsta.network.reachability import (
+    build_reachability_index, merge_ranges, ranges_to_mask, select_path_cone
+)
+
+
+@pytest.fixture(scope="module")
+def design_graph(pipeline):
+    return pipeline["G"]
+
+
+@pytest.fixture(scope="module")
+def timing_graph(pipeline):
+    return pipeline["timing_graph"]
+
+
+@pytest.fixture(scope="module")
+def reachability(timing_graph):
+    return build_reachability_index(timing_graph)
+
+
+@pytest.fixture(scope="module")
+def reg_reg_paths(pipeline):
+    return [[stage.split(",")[0] for stage in path] for path in pipeline["paths"]]
+
+
+def names_of(timing_graph, mask):
+    # the ports are part of the cones, but not of the reg-reg paths
+    ports = timing_graph["inputs"] | timing_graph["outputs"]
+    return {timing_graph["names"][node] for node in np.flatnonzero(mask & ~ports)}
+
+
+def test_cones_stop_at_flip_flops(timing_graph, reachability):
+    num_nodes = len(timing_graph["names"])
+    index = timing_graph["index"]
+    fanout = ranges_to_mask(reachability["fanout_cones"][index["_r1_"]], num_nodes)
+    assert names_of(timing_graph, fanout) == {"_u1_", "_u2_", "_u3_", "_u4_", "_u5_",
+                                              "_r3_", "_r4_"}
+    fanin = ranges_to_mask(reachability["fanin_cones"][index["_r3_"]], num_nodes)
+    assert names_of(timing_graph, fanin) == {"_u1_", "_u2_", "_u3_", "_u4_", "_u5_",
+                                             "_r1_", "_r2_"}
+
+
+def test_cones_are_sorted_disjoint_runs(reachability):
+    for cone in reachability["fanout_cones"] + reachability["fanin_cones"]:
+        assert (cone[:, 0] < cone[:, 1]).all()
+        assert (cone[1:, 0] > cone[:-1, 1]).all()
+
+
+def test_merge_ranges():
+    ranges = np.array([[7, 9], [0, 2], [2, 3], [1, 2], [5, 6]])
+    assert merge_ranges(ranges).tolist() == [[0, 3], [5, 6], [7, 9]]
+    assert ranges_to_mask(ranges, 10).tolist() == [True] * 3 + [False] * 2 + [True] \
+        + [False] + [True] * 2 + [False]
+
+
+@pytest.mark.parametrize("query", [
+    {"from_nodes": ["_r1_"]},
+    {"to_nodes": ["_r4_"]},
+    {"through_nodes": ["_u3_"]},
+    {"from_nodes": ["_r2_"], "through_nodes": ["_u2_"], "to_nodes": ["_r3_"]},
+    {"through_nodes": ["_u2_", "_u4_"]},
+])
+def test_cone_matches_enumerated_paths(timing_graph, reachability, reg_reg_paths, query):
+    cone = select_path_cone(timing_graph, reachability, **query)
+    matching = [
+        path for path in reg_reg_paths
+        if path[0] in query.get("from_nodes", [path[0]])
+        and path[-1] in query.get("to_nodes", [path[-1]])
+        and all(node in path for node in query.get("through_nodes", []))
+    ]
+    assert matching
+    assert names_of(timing_graph, cone["nodes"]) == {node for path in matching for node in path}
+    assert names_of(timing_graph, cone["startpoints"]) == {path[0] for path in matching}
+    assert names_of(timing_graph, cone["endpoints"]) == {path[-1] for path in matching}
+
+    # every arc of a matching path is kept
+    index = timing_graph["index"]
+    arcs = set(zip(timing_graph["arc_from"][cone["arcs"]], timing_graph["arc_to"][cone["arcs"]]))
+    for path in matching:
+        for u, v in zip(path, path[1:]):
+            assert (index[u], index[v]) in arcs
+
+
+def test_through_excludes_bypassing_arcs(timing_graph, reachability):
+    cone = select_path_cone(timing_graph, reachability, through_nodes=["_u3_"])
+    index = timing_graph["index"]
+    # _u1_ drives _u4_ directly, bypassing _u3_
+    bypass = (timing_graph["arc_from"] == index["_u1_"]) & (timing_graph["arc_to"] == index["_u4_"])
+    assert bypass.any()
+    assert not cone["arcs"][bypass].any()
+
+
+def test_unknown_node(timing_graph, reachability):
+    with pytest.raises(ValueError):
+        select_path_cone(timing_graph, reachability, from_nodes=["_missing_"])
@@ -0,0 +1,62 @@
+import pytest
+from boltsta.readers.scd_reader import parse_case_analysis
+from boltsta.utils import extract_scan_pins
+from boltsta.network.graph_creator import graph_creation_func
+from boltsta.network.path_detector import all_paths_info
+from boltsta.network.scan_pruning import prune_scan_arcs
+
+FUNCTIONAL_PATHS = [
+    ["_r1_", "_u1_", "_u2_", "_r3_"],
+    ["_r2_", "_u1_", "_u2_", "_r3_"],
+]
+SCAN_PATHS = [["_r1_", "_r2_"], ["_r2_", "_r3_"]]
+
+
+@pytest.fixture(scope="module")
+def scan_pins(library):
+    return extract_scan_pins(library)
+
+
+@pytest.fixture(scope="module")
+def design_graph():
+    return graph_creation_func("tests/scan_pipeline.v")
+
+
+def path_names(G):
+    return sorted([stage.split(",")[0] for stage in path] for path in all_paths_info(G)[0])
+
+
+def test_extract_scan_pins(scan_pins):
+    assert scan_pins == {
+        "sky130_fd_sc_hd__sdfrtp_1": {
+            "scan_in": {"SCD"}, "scan_enable": {"SCE": False}, "data": {"D"},
+        }
+    }
+
+
+def test_parse_case_analysis():
+    sdc = (
+        "set_case_analysis 0 [get_ports {SE}]\n"
+        "set_case_analysis one [get_pins _r3_/SCE]\n"
+        "set_case_analysis rising [get_ports CLK]\n"
+    )
+    assert parse_case_analysis(sdc) == {"SE": 0, "_r3_/SCE": 1}
+
+
+def test_scan_chains_add_reg_reg_paths(design_graph):
+    assert path_names(design_graph) == sorted(FUNCTIONAL_PATHS + SCAN_PATHS)
+
+
+@pytest.mark.parametrize("case_analysis, functional, expected", [
+    (None, True, FUNCTIONAL_PATHS),
+    ({"SE": 0}, False, FUNCTIONAL_PATHS),
+    # shift mode keeps the scan chain only
+    ({"SE": 1}, False, SCAN_PATHS),
+    ({"_r3_/SCE": 1}, False, [["_r1_", "_r2_"], ["_r2_", "_r3_"]]),
+    (None, False, sorted(FUNCTIONAL_PATHS + SCAN_PATHS)),
+])
+def test_prune_scan_arcs(design_graph, scan_pins, case_analysis, functional, expected):
+    pruned = prune_scan_arcs(design_graph, scan_pins, case_analysis, functional)
+    assert path_names(pruned) == sorted(expected)
+    # the design graph is left untouched
+    assert design_graph.number_of_edges() == 20
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from boltsta.readers.aocv_reader import parse_aocv_tables, aocv_table
+
+TABLES = """version: 1.0
+object_type: lib_cell
+rf_type: rise fall
+delay_type: cell
+derate_type: late
+object_spec: sky130_fd_sc_hd__tt/sky130_fd_sc_hd__*
+depth: 1 2 4
+distance: 0 1000
+table: 1.20 1.10 1.05 \\
+       1.30 1.20 1.10
+
+# nets are not modeled
+delay_type: net
+object_spec: sky130_fd_sc_hd__*
+table: 1.5
+
+delay_type: cell
+derate_type: early
+object_spec: sky130_fd_sc_hd__inv_*
+depth: 1 8
+distance: 0
+table: 0.90 0.97
+"""
+
+
+def test_parse_aocv_tables():
+    tables = parse_aocv_tables(TABLES)
+    assert len(tables) == 2
+    assert tables[0]["pattern"] == "sky130_fd_sc_hd__*"
+    assert tables[0]["derate_types"] == ("late",)
+    assert np.array_equal(tables[0]["table"], [[1.20, 1.10, 1.05], [1.30, 1.20, 1.10]])
+    assert np.array_equal(tables[1]["depth"], [1, 8])
+    assert np.array_equal(tables[1]["table"], [[0.90, 0.97]])
+
+
+def test_aocv_table_matches_analysis():
+    tables = parse_aocv_tables(TABLES)
+    assert aocv_table(tables, "sky130_fd_sc_hd__inv_1", "early") is tables[1]
+    assert aocv_table(tables, "sky130_fd_sc_hd__inv_1", "late") is tables[0]
+    assert aocv_table(tables, "sky130_fd_sc_hd__nand2_1", "early") is None
+
+
+@pytest.mark.parametrize("content", [
+    "depth: 1 2\ntable: 1.1 1.0\n",
+    "object_spec: inv\ndepth: 1 2\ntable: 1.1\n",
+    "object_spec: inv\ndepth: 2 1\ntable: 1.1 1.0\n",
+    "object_spec: inv\ntable: high\n",
+    "object_spec: inv\ndepth: 1 2\ndistance: 0 10\ntable: 1.1 1.0\n",
+])
+def test_invalid_aocv_tables(content):
+    with pytest.raises(ValueError):
+        parse_aocv_tables(content)
@@ -0,0 +1,16 @@
+import pytest
+from boltsta.readers.scd_reader import parse_clocks
+
+
+def test_parse_clocks():
+    sdc = ("create_clock [get_ports CLK_A] -name clk_a -period 10\n"
+           "create_clock -period 4 -waveform {1 3} \\\n    [get_pins _c1_/X]")
+    assert parse_clocks(sdc) == [
+        {"name": "clk_a", "period": 10.0, "waveform": (0.0, 5.0), "sources": ["CLK_A"]},
+        {"name": "_c1_/X", "period": 4.0, "waveform": (1.0, 3.0), "sources": ["_c1_/X"]},
+    ]
+
+
+def test_parse_clocks_requires_period():
+    with pytest.raises(ValueError):
+        parse_clocks("create_clock -name clk [get_ports CLK]")
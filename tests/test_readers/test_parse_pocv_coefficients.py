@@ -0,0 +1,40 @@
+import pytest
+from boltsta.readers.pocv_reader import parse_pocv_coefficients, pocv_coefficient
+
+COEFFICIENTS = """version: 4.0
+object_type: lib_cell
+rf_type: rise fall
+derate_type: late early
+object_spec: sky130_fd_sc_hd__tt/sky130_fd_sc_hd__*
+coefficient: 0.05
+
+# slower inverters on late paths only
+derate_type: late
+object_spec: sky130_fd_sc_hd__inv_*
+coefficient: 0.08
+"""
+
+
+def test_parse_pocv_coefficients():
+    assert parse_pocv_coefficients(COEFFICIENTS) == [
+        {"pattern": "sky130_fd_sc_hd__*", "coefficient": 0.05, "derate_types": ("late", "early")},
+        {"pattern": "sky130_fd_sc_hd__inv_*", "coefficient": 0.08, "derate_types": ("late",)},
+    ]
+
+
+def test_pocv_coefficient_last_match_wins():
+    coefficients = parse_pocv_coefficients(COEFFICIENTS)
+    assert pocv_coefficient(coefficients, "sky130_fd_sc_hd__inv_1", "late") == 0.08
+    assert pocv_coefficient(coefficients, "sky130_fd_sc_hd__inv_1", "early") == 0.05
+    assert pocv_coefficient(coefficients, "other_cell") is None
+    assert pocv_coefficient(None, "sky130_fd_sc_hd__inv_1") is None
+
+
+@pytest.mark.parametrize("content", [
+    "coefficient: 0.05\n",
+    "object_spec: inv\ncoefficient: -0.1\n",
+    "object_spec: inv\ncoefficient: high\n",
+])
+def test_invalid_pocv_coefficients(content):
+    with pytest.raises(ValueError):
+        parse_pocv_coefficients(content)
@@ -0,0 +1,73 @@
+import gzip
+import numpy as np
+import pytest
+from boltsta.readers import parse_sdf, read_sdf
+
+SDF = """(DELAYFILE
+  (SDFVERSION "3.0")
+  (DIVIDER /)
+  (TIMESCALE 100 ps)
+  /* a comment
+     over two lines */
+  (CELL (CELLTYPE "top") (INSTANCE)
+    (DELAY (ABSOLUTE
+      (INTERCONNECT u1/Y u2/A (1:2:3) (2:3:4))  // the rise and fall delays
+    ))
+  )
+  (CELL (CELLTYPE "nand2") (INSTANCE u1)
+    (DELAY
+      (ABSOLUTE
+        (COND B (IOPATH A Y (1:2:3) (1:1:1)))
+        (COND !B (IOPATH A Y (2:2:2) (0.5::0.8)))
+        (IOPATH B Y (4))
+      )
+      (INCREMENT (IOPATH A Y (10) (10)))
+    )
+  )
+  (CELL (CELLTYPE "dff") (INSTANCE r\\[0\\])
+    (DELAY (ABSOLUTE (IOPATH (posedge CLK) Q (3:4:5) ())))
+    (TIMINGCHECK
+      (SETUPHOLD (negedge D) (posedge CLK) (0.5:0.6:0.7) (-0.2:-0.1:0))
+      (SETUP (COND EN D) (posedge CLK) (0.8))
+    )
+  )
+)
+"""
+
+
+def test_parse_sdf():
+    sdf = parse_sdf(SDF.splitlines())
+    assert sdf["divider"] == "/"
+    # the late values are the max of the triples and the early ones the min, in ns
+    assert np.allclose(sdf["interconnect"][("u1/Y", "u2/A")], [[0.3, 0.4], [0.1, 0.2]])
+    # the conditional delays are merged into the worst ones, the increments ignored
+    assert np.allclose(sdf["iopath"][("u1", "A", "Y")], [[0.3, 0.1], [0.1, 0.05]])
+    assert np.allclose(sdf["iopath"][("u1", "B", "Y")], 0.4)
+    clk2q = sdf["iopath"][("r[0]", "CLK", "Q")]
+    assert np.allclose(clk2q[:, 0], [0.5, 0.3])
+    assert np.isnan(clk2q[:, 1]).all()
+
+
+def test_parse_sdf_checks():
+    sdf = parse_sdf(SDF.splitlines())
+    # a SETUP without edge sets both data transitions
+    assert np.allclose(sdf["setup"][("r[0]", "D")], [0.08, 0.08])
+    hold = sdf["hold"][("r[0]", "D")]
+    assert np.isnan(hold[0]) and hold[1] == pytest.approx(-0.02)
+
+
+def test_parse_sdf_errors():
+    with pytest.raises(ValueError):
+        parse_sdf(["(DELAYFILE (TIMESCALE 1 ms)"])
+    with pytest.raises(ValueError):
+        parse_sdf(["(DELAYFILE (TIMESCALE 1 xs))"])
+    with pytest.raises(ValueError):
+        parse_sdf(["(DELAYFILE))"])
+
+
+def test_read_sdf_gzip(tmp_path):
+    path = tmp_path / "top.sdf.gz"
+    with gzip.open(path, "wt") as file:
+        file.write(SDF)
+    sdf = read_sdf(str(path))
+    assert sdf["iopath"].keys() == parse_sdf(SDF.splitlines())["iopath"].keys()
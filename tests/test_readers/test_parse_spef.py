@@ -0,0 +1,70 @@
+import gzip
+import numpy as np
+import pytest
+from boltsta.readers import parse_spef, read_spef
+
+SPEF = """*SPEF "IEEE 1481-1998"
+*DESIGN "top"
+*DELIMITER :
+*C_UNIT 1 FF
+*R_UNIT 1 OHM
+
+*NAME_MAP
+*1 net\\[0\\]
+*2 u1
+*3 u2
+
+*D_NET *1 6.0
+*CONN
+*I *3:A I *L 0.002
+*I *2:Y O *L 0 *D inv
+*CAP
+1 *2:Y 1.0 // driver
+2 *1:1 2.0
+3 *3:A 1.0
+4 *1:1 other:1 2.0
+*RES
+1 *2:Y *1:1 100
+2 *1:1 *3:A 50
+3 *3:A *1:1 10
+*END
+
+*D_NET empty 0
+*END
+"""
+
+
+def test_parse_spef():
+    parasitics = parse_spef(SPEF.splitlines())
+    assert parasitics["nets"] == ["net[0]"]
+    pins = parasitics["pins"]
+    driver, load = pins["u1:Y"], pins["u2:A"]
+    assert parasitics["net_driver"].tolist() == [driver]
+    assert parasitics["parent"][driver] == -1
+    # the capacitances are in pF, the coupling capacitance grounded, the resistances in kohm
+    assert parasitics["cap"].sum() == pytest.approx(0.006)
+    assert parasitics["cap"][driver] == pytest.approx(0.001)
+    internal = parasitics["parent"][load]
+    assert parasitics["cap"][internal] == pytest.approx(0.004)
+    assert parasitics["resistance"][internal] == pytest.approx(0.1)
+    # the parallel resistor closing a loop is dropped
+    assert parasitics["parent"][internal] == driver
+    assert parasitics["resistance"][load] == pytest.approx(0.05)
+    assert parasitics["level"].tolist() == [0, 1, 2]
+    assert np.all(parasitics["net"] == 0)
+
+
+def test_parse_spef_units():
+    with pytest.raises(ValueError):
+        parse_spef(["*C_UNIT 1 XF"])
+    parasitics = parse_spef(SPEF.replace("*C_UNIT 1 FF", "*C_UNIT 1 PF").splitlines())
+    assert parasitics["cap"].sum() == pytest.approx(6.0)
+
+
+def test_read_spef_gzip(tmp_path):
+    path = tmp_path / "top.spef.gz"
+    with gzip.open(path, "wt") as file:
+        file.write(SPEF)
+    parasitics = read_spef(str(path))
+    assert parasitics["nets"] == ["net[0]"]
+    assert np.array_equal(parasitics["cap"], parse_spef(SPEF.splitlines())["cap"])
@@ -0,0 +1,36 @@
+import pytest
+from boltsta.readers.scd_reader import parse_timing_exceptions, split_tcl_words
+
+
+def test_split_tcl_words():
+    command = "set_false_path -from [get_cells {_r1_ _r2_}] -to [get_pins _r3_/D]"
+    assert split_tcl_words(command) == [
+        "set_false_path", "-from", "[get_cells {_r1_ _r2_}]", "-to", "[get_pins _r3_/D]"
+    ]
+
+
+@pytest.mark.parametrize("command, expected", [
+    ("set_false_path -from [get_cells _r1_]",
+     {"type": "false_path", "value": None, "from": ["_r1_"], "through": [], "to": None,
+      "setup": True, "hold": True}),
+    ("set_multicycle_path 2 -setup -to [get_pins {_r3_/D}]",
+     {"type": "multicycle_path", "value": 2.0, "from": None, "through": [], "to": ["_r3_"],
+      "setup": True, "hold": False}),
+    ("set_max_delay 4.5 -rise_from [get_cells _r2_] -through [get_cells {_u1_ _u2_}]"
+     " -through [get_cells _u3_]",
+     {"type": "max_delay", "value": 4.5, "from": ["_r2_"],
+      "through": [["_u1_", "_u2_"], ["_u3_"]], "to": None, "setup": True, "hold": False}),
+    ("set_min_delay 0.2 -to [get_cells _r4_]",
+     {"type": "min_delay", "value": 0.2, "from": None, "through": [], "to": ["_r4_"],
+      "setup": False, "hold": True}),
+])
+def test_parse_timing_exceptions(command, expected):
+    assert parse_timing_exceptions(command) == [expected]
+
+
+def test_parse_timing_exceptions_line_continuation():
+    content = ("create_clock [get_ports CLK] -period 10\n"
+               "set_false_path \\\n    -to [get_cells _r4_]\n")
+    exceptions = parse_timing_exceptions(content)
+    assert len(exceptions) == 1
+    assert exceptions[0]["to"] == ["_r4_"]
@@ -0,0 +1,70 @@
+import pytest
+import numpy as np
+from boltsta.model import calculate_arc_delays, calculate_constraint_time
+from boltsta.utils import (
+    extract_cell_pin_mapping, compile_cell_pin_mapping, compile_constraint_arcs,
+    calculate_rising_edge_delay, calculate_falling_edge_delay, interpolate_constraint_time,
+    get_constraint_timing,
+)
+
+
+@pytest.fixture(scope="module")
+def mappings(library):
+    raw = extract_cell_pin_mapping(library)
+    return raw, compile_cell_pin_mapping(raw)
+
+
+def test_compiled_tables_are_contiguous_float64(mappings):
+    """Every table of every arc is compiled into contiguous float64 arrays."""
+    _, compiled = mappings
+    for pins in compiled.values():
+        for arc in pins.values():
+            for name in ("cell_rise", "cell_fall", "rise_transition", "fall_transition",
+                         "rise_constraint", "fall_constraint"):
+                if name not in arc:
+                    continue
+                for array in arc[name].values():
+                    assert array.dtype == np.float64
+                    assert array.flags["C_CONTIGUOUS"]
+
+
+def test_compiled_arcs_match_liberty_groups(mappings):
+    """The compiled arcs give the delays of the Liberty timing groups."""
+    raw, compiled = mappings
+    for cell_name, pins in raw.items():
+        for pin, timing in pins.items():
+            arc = compiled[cell_name][pin]
+            assert arc["timing_sense"] == timing["timing_sense"]
+            assert arc["timing_type"] == timing["timing_type"]
+            if "cell_rise" not in arc:
+                continue
+            for edge_delay in (calculate_rising_edge_delay, calculate_falling_edge_delay):
+                assert edge_delay(arc, 0.1, 0.01) == edge_delay(timing, 0.1, 0.01)
+            sense = timing["timing_sense"] or "positive_unate"
+            assert calculate_arc_delays(arc, [("rise", 0.1), ("fall", 0.2)], 0.01, sense) == \
+                calculate_arc_delays(timing, [("rise", 0.1), ("fall", 0.2)], 0.01, sense)
+
+
+def test_compiled_constraints_match_liberty_groups(library):
+    """The compiled setup and hold tables are the ones get_constraint_timing selects."""
+    constraint_arcs = compile_constraint_arcs(library)
+    assert compile_constraint_arcs(library) is constraint_arcs
+
+    for cell_name, pins in constraint_arcs.items():
+        for pin, checks in pins.items():
+            for check, rising in (("setup_checking", "setup_rising"),
+                                  ("hold_checking", "hold_rising")):
+                timing = get_constraint_timing(pin, cell_name, library, check)
+                group = "rise_constraint" if timing["timing_type"] == rising else \
+                    "fall_constraint"
+                expected = interpolate_constraint_time(timing.get_group(group), 0.04, 0.3)
+                assert interpolate_constraint_time(checks[check], 0.04, 0.3) == expected
+                assert calculate_constraint_time(cell_name, check, pin, library, 0.3, 0.04) == \
+                    expected
+
+
+def test_constraint_time_unknown_pin(library):
+    """A pin without a setup / hold table raises a ValueError."""
+    cell_name = next(iter(compile_constraint_arcs(library)))
+    with pytest.raises(ValueError):
+        calculate_constraint_time(cell_name, "setup_checking", "NOT_A_PIN", library, 0.3, 0.04)
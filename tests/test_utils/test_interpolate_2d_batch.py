@@ -0,0 +1,31 @@
+import pytest
+import numpy as np
+from boltsta.utils import interpolate_2d_batch, interpolate_2d_formula
+
+
+def test_batch_matches_scalar_interpolation(random_table):
+    """Every table of the batch matches interpolate_2d_formula, across table shapes."""
+    rng = np.random.default_rng(3)
+    tables = [random_table(rng, 7, 7) for _ in range(5)] + [random_table(rng, 4, 6)]
+    x0 = rng.uniform(0.0, 2.0, len(tables))
+    y0 = rng.uniform(0.0, 0.3, len(tables))
+
+    values = interpolate_2d_batch(tables, x0, y0)
+
+    expected = [
+        interpolate_2d_formula(index_1, index_2, table, x, y).item()
+        for (index_1, index_2, table), x, y in zip(tables, x0, y0)
+    ]
+    assert values.shape == (len(tables),)
+    assert np.allclose(values, expected)
+
+
+def test_batch_broadcasts_scalar_point():
+    """A scalar target point is used for every table."""
+    index_1 = np.array([[1.0, 2.0, 3.0]])
+    index_2 = np.array([[4.0, 5.0, 6.0]])
+    table = np.array([[10, 15, 20], [20, 25, 30], [30, 35, 40]])
+
+    values = interpolate_2d_batch([(index_1, index_2, table)] * 2, 1.5, 4.7)
+
+    assert values == pytest.approx([18.5, 18.5])
@@ -0,0 +1,73 @@
+import time
+import pytest
+import numpy as np
+from boltsta.utils import interpolate_2d_points, interpolate_2d_formula
+
+
+def test_points_match_scalar_interpolation(random_table):
+    """The nearest index pairs reproduce interpolate_2d_formula, inside and outside the table."""
+    rng = np.random.default_rng(5)
+    index_1, index_2, table = random_table(rng, 7, 7)
+    x0 = rng.uniform(0.0, 2.0, 300)
+    y0 = rng.uniform(0.0, 0.3, 300)
+
+    values = interpolate_2d_points(index_1, index_2, table, x0, y0)
+
+    expected = [
+        interpolate_2d_formula(index_1, index_2, table, x, y).item() for x, y in zip(x0, y0)
+    ]
+    assert values.shape == (300,)
+    assert np.allclose(values, expected)
+
+
+def test_bracket_interpolation():
+    """With bracket=True the points are interpolated between the index values around them."""
+    index_1 = np.array([[1.0, 2.0, 2.2]])
+    index_2 = np.array([[4.0, 5.0, 6.0]])
+    table = np.array([[10, 15, 20], [20, 25, 30], [30, 35, 40]])
+
+    # 1.9 is nearer to 2.2 than to 1.0, but lies between 1.0 and 2.0
+    assert interpolate_2d_points(index_1, index_2, table, [1.9], [4.0], bracket=True) == \
+        pytest.approx([19.0])
+    assert interpolate_2d_points(index_1, index_2, table, [1.9], [4.0]) == pytest.approx([15.0])
+
+
+def test_stacked_tables(random_table):
+    """A stack of tables returns one row of values per table."""
+    rng = np.random.default_rng(11)
+    tables = [random_table(rng, 5, 6) for _ in range(3)]
+    x0 = rng.uniform(0.0, 2.0, 40)
+    y0 = rng.uniform(0.0, 0.3, 40)
+
+    values = interpolate_2d_points(
+        [t[0][0] for t in tables], [t[1][0] for t in tables], [t[2] for t in tables], x0, y0
+    )
+
+    assert values.shape == (3, 40)
+    for row, (index_1, index_2, table) in zip(values, tables):
+        assert np.allclose(row, interpolate_2d_points(index_1, index_2, table, x0, y0))
+
+
+@pytest.mark.benchmark
+def test_throughput_against_scalar_interpolation(random_table):
+    """Microbenchmark: the batched kernel is at least 50x faster per point."""
+    rng = np.random.default_rng(13)
+    index_1, index_2, table = random_table(rng, 7, 7)
+    x0 = rng.uniform(0.0, 2.0, 20000)
+    y0 = rng.uniform(0.0, 0.3, 20000)
+
+    start = time.perf_counter()
+    for x, y in zip(x0[:500], y0[:500]):
+        interpolate_2d_formula(index_1, index_2, table, x, y)
+    scalar = (time.perf_counter() - start) / 500
+
+    batched = min(
+        timed(lambda: interpolate_2d_points(index_1, index_2, table, x0, y0)) for _ in range(3)
+    ) / len(x0)
+    assert scalar / batched >= 50
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
@@ -0,0 +1,74 @@
+module two_clock_pipeline(CLK_A, CLK_B, RST_N, IN0, OUT0, OUT1);
+    input CLK_A;
+    input CLK_B;
+    input RST_N;
+    input IN0;
+    output OUT0;
+    output OUT1;
+    wire CLK_A;
+    wire CLK_B;
+    wire RST_N;
+    wire clk_b;
+    wire q1;
+    wire q2;
+    wire q3;
+    wire n1;
+    wire n2;
+    wire n3;
+
+    sky130_fd_sc_hd__clkbuf_1 _c1_ (
+        .A(CLK_B),
+        .X(clk_b)
+    );
+
+    sky130_fd_sc_hd__dfrtp_1 _r1_ (
+        .CLK(CLK_A),
+        .D(IN0),
+        .RESET_B(RST_N),
+        .Q(q1)
+    );
+
+    sky130_fd_sc_hd__dfrtp_1 _r2_ (
+        .CLK(CLK_A),
+        .D(q3),
+        .RESET_B(RST_N),
+        .Q(q2)
+    );
+
+    sky130_fd_sc_hd__nand2_1 _u1_ (
+        .A(q1),
+        .B(q2),
+        .Y(n1)
+    );
+
+    sky130_fd_sc_hd__inv_1 _u2_ (
+        .A(n1),
+        .Y(n2)
+    );
+
+    sky130_fd_sc_hd__dfrtp_1 _r3_ (
+        .CLK(clk_b),
+        .D(n2),
+        .RESET_B(RST_N),
+        .Q(q3)
+    );
+
+    sky130_fd_sc_hd__buf_1 _u3_ (
+        .A(q1),
+        .X(n3)
+    );
+
+    sky130_fd_sc_hd__dfrtp_1 _r4_ (
+        .CLK(CLK_A),
+        .D(n3),
+        .RESET_B(RST_N),
+        .Q(OUT0)
+    );
+
+    sky130_fd_sc_hd__dfrtp_1 _r5_ (
+        .CLK(clk_b),
+        .D(q3),
+        .RESET_B(RST_N),
+        .Q(OUT1)
+    );
+endmodule